@@ -12,6 +12,10 @@ from src.routes import ROUTE_HANDLERS
 from src.services import AppStateManager
 from src.services.states.refresh_session import refresh_dashboard_session
 from src.shared.config import get_theme_colors
+from src.shared.metrics.metrics_server import start_metrics_server
+from src.services.upload.upload_janitor import start_upload_janitor
+from src.services.jobs import start_job_runner
+from storage.data import clear_session_cost, firestore_cost_scope, get_session_cost
 
 logger = logging.getLogger(__name__)
 
@@ -159,6 +163,8 @@ def main(page: ft.Page):
 
         # Tratar casos especiais primeiro
         if e.route == '/logout':
+            logger.info(f"Custo Firestore da sessão {page.session_id}: {get_session_cost(page.session_id)}")
+            clear_session_cost(page.session_id)
             page.app_state.clear_states()  # type: ignore [attr-defined]
             page.go('/')  # Redireciona para a página inicial
             return  # Interrompe o processamento
@@ -167,7 +173,9 @@ def main(page: ft.Page):
         handler = ROUTE_HANDLERS.get(e.route)
 
         if handler:
-            pg_view = handler(page) # chama a função vinda o dict
+            # Contabiliza leituras/escritas do Firestore desta page view (relatório nos logs e em /metrics)
+            with firestore_cost_scope(route=e.route, session_id=page.session_id):
+                pg_view = handler(page) # chama a função vinda o dict
         else:
             # Rota não encontrada (page 404)
             pg_view = ft.View(
@@ -222,6 +230,12 @@ def main(page: ft.Page):
 if __name__ == '__main__':
     # A configuração de logging agora é feita centralmente através da importação
     # de src.shared.config.logging_config (que é importado por src.shared.config)
+    # Endpoint /metrics (Prometheus) em thread separada, se METRICS_PORT estiver no .env
+    start_metrics_server()
+    # Remove periodicamente uploads abandonados em uploads/ (idade e limite de tamanho)
+    start_upload_janitor()
+    # Fila persistente de jobs em segundo plano (emails, uploads e remoções no bucket)
+    start_job_runner()
     # Inicia o app Flet
     ft.app(
         target=main,
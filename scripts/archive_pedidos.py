@@ -0,0 +1,44 @@
+"""
+Arquivamento dos pedidos finalizados anteriores à janela de pedidos ativos (PEDIDOS_HOT_WINDOW_DAYS).
+
+Os pedidos são movidos em lotes atômicos para pedidos_arquivo/{empresa_id}_{AAAA-MM}. A execução
+pode ser interrompida (Ctrl+C, --max-batches) e retomada: a data de corte da execução inacabada
+fica gravada em pedidos_arquivo_status/{empresa_id}.
+
+Uso (na raiz do projeto, com o .env configurado):
+    python scripts/archive_pedidos.py <empresa_id> [--batch-size 200] [--max-batches N]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv  # noqa: E402
+
+load_dotenv()
+
+from src.domains.pedidos.controllers.pedidos_controllers import handle_archive_pedidos  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Arquiva pedidos finalizados fora da janela de pedidos ativos.")
+    parser.add_argument("empresa_id")
+    parser.add_argument("--batch-size", type=int, default=None, help="Pedidos por lote (padrão PEDIDOS_ARCHIVE_BATCH_SIZE)")
+    parser.add_argument("--max-batches", type=int, default=None, help="Para após N lotes (retomável)")
+    args = parser.parse_args()
+
+    result = handle_archive_pedidos(args.empresa_id, args.batch_size, args.max_batches,
+                                    on_progress=lambda archived: print(f"  {archived} pedido(s) arquivado(s)..."))
+    if result["status"] != "success":
+        print(result["message"], file=sys.stderr)
+        return 1
+
+    data = result["data"]
+    situacao = "concluído" if data["finished"] else "interrompido (execute novamente para continuar)"
+    print(f"Corte {data['cutoff']}: {data['archived']} pedido(s) arquivado(s), {situacao}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
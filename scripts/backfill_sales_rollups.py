@@ -0,0 +1,42 @@
+"""
+Carga dos resumos diários de vendas (vendas_diarias) com os pedidos gravados antes deles existirem.
+
+Os pedidos da empresa sem o marcador 'sales_rollup_applied' são somados aos resumos do dia e
+marcados, em transações: pedidos salvos durante a carga não são contados duas vezes. A execução
+pode ser interrompida e repetida: os pedidos já marcados são ignorados. Pedidos que já estavam
+no arquivo mensal (pedidos_arquivo) não são carregados; execute a carga antes do arquivamento.
+
+Uso (na raiz do projeto, com o .env configurado):
+    python scripts/backfill_sales_rollups.py <empresa_id> [--page-size 500]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv  # noqa: E402
+
+load_dotenv()
+
+from src.domains.pedidos.controllers.pedidos_controllers import handle_backfill_sales_rollups  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Soma aos resumos diários de vendas os pedidos ainda não contados.")
+    parser.add_argument("empresa_id")
+    parser.add_argument("--page-size", type=int, default=500, help="Pedidos lidos por página")
+    args = parser.parse_args()
+
+    result = handle_backfill_sales_rollups(args.empresa_id, args.page_size,
+                                           on_progress=lambda applied: print(f"  {applied} pedido(s) somado(s)..."))
+    if result["status"] != "success":
+        print(result["message"], file=sys.stderr)
+        return 1
+
+    print(f"{result['data']} pedido(s) somado(s) aos resumos de vendas.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
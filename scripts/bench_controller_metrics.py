@@ -0,0 +1,35 @@
+"""
+Benchmark do overhead por chamada do decorator instrument_controller.
+
+Compara uma função controller vazia com a mesma função instrumentada.
+Uso (na raiz do projeto):
+    python scripts/bench_controller_metrics.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.shared.metrics.controller_metrics import instrument_controller  # noqa: E402
+
+
+def handle_get_all(empresa_id: str, status_deleted: bool = False) -> dict:
+    return {"status": "success", "data": []}
+
+
+instrumented = instrument_controller("bench")(handle_get_all)
+
+if __name__ == "__main__":
+    iterations = 200_000
+    empresas = [f"emp_{i}" for i in range(100)]  # acima do limite padrão de 50 labels
+
+    baseline = min(timeit.repeat(lambda: handle_get_all("emp_1"), number=iterations, repeat=5))
+    single = min(timeit.repeat(lambda: instrumented("emp_1"), number=iterations, repeat=5))
+    counter = iter(range(10**9))
+    many = min(timeit.repeat(lambda: instrumented(empresas[next(counter) % 100]), number=iterations, repeat=5))
+
+    print(f"sem instrumentação:           {baseline / iterations * 1e9:8.0f} ns/chamada")
+    print(f"instrumentado (1 empresa):    {single / iterations * 1e9:8.0f} ns/chamada")
+    print(f"instrumentado (100 empresas): {many / iterations * 1e9:8.0f} ns/chamada")
+    print(f"overhead médio:               {(single - baseline) / iterations * 1e9:8.0f} ns/chamada")
@@ -0,0 +1,103 @@
+"""
+Benchmark da hidratação dos modelos lidos do Firestore: from_dict normal x trusted=True.
+
+Gera documentos sintéticos no formato gravado pelo to_dict_db() (Money como dict, datas como
+datetime, status como nome do enum) e mede quantos objetos por segundo cada modo constrói.
+
+Uso (na raiz do projeto):
+    python scripts/bench_hydration.py [quantidade_de_documentos] [itens_por_pedido]
+"""
+import os
+import random
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domains.clientes.models.clientes_model import Cliente  # noqa: E402
+from src.domains.pedidos.models.pedidos_model import Pedido  # noqa: E402
+from src.domains.produtos.models.produtos_model import Produto  # noqa: E402
+
+
+def _audit(now: datetime) -> dict:
+    return {"created_at": now, "created_by_id": "usu_1", "created_by_name": "Bench",
+            "updated_at": now, "activated_at": now, "activated_by_id": "usu_1", "activated_by_name": "Bench"}
+
+
+def make_pedidos(count: int, items_per_order: int) -> list[dict]:
+    now = datetime.now(UTC)
+    docs = []
+    for i in range(count):
+        items = []
+        for j in range(items_per_order):
+            price = random.randint(100, 10000)
+            quantity = random.randint(1, 5)
+            items.append({"id": f"pro_{j}", "description": f"Produto {j}", "quantity": quantity,
+                          "unit_of_measure": "UN",
+                          "unit_price": {"amount_cents": price, "currency_symbol": "R$"},
+                          "total": {"amount_cents": price * quantity, "currency_symbol": "R$"}})
+        docs.append({
+            "empresa_id": "emp_1", "forma_pagamento_id": "fp_1", "order_number": f"{i:06d}",
+            "order_date": now - timedelta(days=i % 365),
+            "total_amount": {"amount_cents": sum(it["total"]["amount_cents"] for it in items), "currency_symbol": "R$"},
+            "items": items, "total_items": len(items), "total_products": sum(it["quantity"] for it in items),
+            "client": {"name": "Maria Da Silva", "phone": "+5511999999999", "cpf": "12345678909"},
+            "status": "ACTIVE", "delivery_status": "DELIVERED", **_audit(now),
+        })
+    return docs
+
+
+def make_produtos(count: int) -> list[dict]:
+    now = datetime.now(UTC)
+    return [{
+        "empresa_id": "emp_1", "name": f"Produto {i}", "name_lowercase": f"produto {i}",
+        "categoria_id": "cat_1", "categoria_name": "Limpeza", "categoria_name_lower": "limpeza",
+        "description": "Descrição do produto", "internal_code": f"SKU{i}", "ean_code": "7891234567895",
+        "brand": "Marca", "sale_price": {"amount_cents": 1990, "currency_symbol": "R$"},
+        "cost_price": {"amount_cents": 990, "currency_symbol": "R$"}, "quantity_on_hand": 10,
+        "unit_of_measure": "UN", "minimum_stock_level": 1, "maximum_stock_level": 50,
+        "ncm": {"code": "34022000", "description": "Detergente", "full_description": "Detergente"},
+        "status": "ACTIVE", **_audit(now),
+    } for i in range(count)]
+
+
+def make_clientes(count: int) -> list[dict]:
+    now = datetime.now(UTC)
+    return [{
+        "empresa_id": "emp_1", "name": {"first_name": "Maria", "first_name_lower": "maria",
+                                      "last_name": f"da Silva {i}", "last_name_lower": f"da silva {i}"},
+        "phone": "+5511999999999", "is_whatsapp": True, "cpf": "12345678909",
+        "email": f"cliente{i}@exemplo.com", "status": "ACTIVE", **_audit(now),
+    } for i in range(count)]
+
+
+def bench(label: str, docs: list[dict], build, rounds: int = 5) -> None:
+    best = {False: float("inf"), True: float("inf")}
+    for _ in range(rounds):
+        # Rodadas alternadas, melhor tempo de cada modo: reduz o ruído da máquina
+        for trusted in (False, True):
+            # from_dict altera o dicionário recebido (ex.: Cliente remove chaves): cada rodada usa cópias
+            copies = [dict(doc) for doc in docs]
+            started = time.perf_counter()
+            for doc in copies:
+                build(doc, trusted)
+            best[trusted] = min(best[trusted], time.perf_counter() - started)
+    normal, fast = best[False], best[True]
+    print(f"{label:<8} normal: {len(docs) / normal:>10,.0f}/s   trusted: {len(docs) / fast:>10,.0f}/s   "
+          f"({normal / fast:.2f}x)")
+
+
+def main(count: int, items_per_order: int) -> None:
+    random.seed(42)
+    print(f"{count} documentos, pedidos com {items_per_order} itens")
+    bench("Pedido", make_pedidos(count, items_per_order),
+          lambda doc, trusted: Pedido.from_dict(doc, "ped_1", trusted=trusted))
+    bench("Produto", make_produtos(count), lambda doc, trusted: Produto.from_dict(doc, "pro_1", trusted=trusted))
+    bench("Cliente", make_clientes(count), lambda doc, trusted: Cliente.from_dict(doc, trusted=trusted))
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    items = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    main(total, items)
@@ -0,0 +1,110 @@
+"""
+Benchmark da importação de produtos em massa (ProdutosImportServices).
+
+Gera uma planilha CSV sintética e importa com um repositório em memória que simula a
+latência de um commit do Firestore por escrita (save individual com releitura) ou por lote
+(WriteBatch de 500). Compara o caminho antigo (um save + um get por produto, serial) com
+a importação em lotes paralelos.
+
+Uso (na raiz do projeto):
+    python scripts/bench_produtos_import.py [quantidade_de_produtos] [latencia_ms]
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domains.produtos.models import Produto  # noqa: E402
+from src.domains.produtos.repositories import ProdutosRepository  # noqa: E402
+from src.domains.produtos.services.produtos_import_services import ProdutosImportServices  # noqa: E402
+from src.domains.shared import NomePessoa  # noqa: E402
+from src.shared.utils.money_numpy import Money  # noqa: E402
+
+CATEGORIAS = [{"id": f"cat_{i}", "name": name} for i, name in enumerate(("Limpeza", "Bebidas", "Higiene", "Mercearia"))]
+
+
+class LatencyRepository(ProdutosRepository):
+    """Repositório em memória: cada ida ao banco custa `latency` segundos."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.saved = 0
+
+    def save(self, produto: Produto) -> str | None:
+        time.sleep(self.latency * 2)  # set + releitura dos timestamps
+        self.saved += 1
+        return produto.id
+
+    def save_batch(self, produtos: list[Produto]) -> None:
+        time.sleep(self.latency * 3)  # Commit de um WriteBatch: mais lento que uma escrita, mas um só
+        self.saved += len(produtos)
+
+    def get_by_id(self, produto_id: str) -> Produto | None:
+        return None
+
+    def get_all(self, status_deleted: bool = False) -> tuple[list[Produto], int]:
+        return [], 0
+
+    def get_low_stock_count(self) -> int:
+        return 0
+
+    def get_projection(self, updated_since: datetime | None = None) -> list[dict]:
+        return []
+
+    def iter_export_pages(self, page_size: int = 500):
+        return iter(())
+
+    def bulk_update_status(self, produto_ids, status, current_user_id, current_user_name, on_progress=None) -> int:
+        return 0
+
+    def bulk_hard_delete(self, produto_ids, on_progress=None) -> int:
+        return 0
+
+
+def make_csv(path: str, count: int) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file, delimiter=";")
+        writer.writerow(["Nome", "Categoria", "Preço Venda", "Preço Custo", "Estoque", "Unidade", "EAN", "Código"])
+        for i in range(count):
+            writer.writerow([f"Produto {i}", CATEGORIAS[i % len(CATEGORIAS)]["name"], f"{10 + i % 90},90", "5,00",
+                             i % 50, "UN", f"789{i:010d}", f"SKU{i}"])
+
+
+def main(count: int, latency_ms: float) -> None:
+    latency = latency_ms / 1000
+    # A importação usa somente o ID e o nome do usuário (auditoria)
+    user = SimpleNamespace(id="usu_bench", name=NomePessoa("Bench", "Import"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "produtos.csv")
+        make_csv(path, count)
+
+        # Caminho antigo: cada produto é um save (set + get), um de cada vez
+        sample = min(count, 200)
+        repository = LatencyRepository(latency)
+        started = time.perf_counter()
+        for i in range(sample):
+            repository.save(Produto(empresa_id="emp", name=f"Produto {i}", name_lowercase="", categoria_id="cat_0",
+                                    categoria_name="Limpeza", categoria_name_lower="", ncm={},
+                                    sale_price=Money(1990, "R$"), id=f"pro_{i}"))
+        per_item = (time.perf_counter() - started) / sample
+        print(f"save individual: {1 / per_item:>10,.0f} produtos/s  (estimado {count * per_item / 60:,.1f} min "
+              f"para {count:,})")
+
+        repository = LatencyRepository(latency)
+        started = time.perf_counter()
+        report = ProdutosImportServices(repository).import_file(path, "emp", user, CATEGORIAS)  # type: ignore [arg-type]
+        elapsed = time.perf_counter() - started
+        print(f"importação:      {report.imported / elapsed:>10,.0f} produtos/s  ({elapsed:,.1f} s para "
+              f"{report.imported:,}; {report.rejected} rejeitado(s))")
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 30
+    main(total, latency_ms)
@@ -0,0 +1,135 @@
+"""
+Benchmark de vazão do S3FileManager contra um S3 local (moto server ou MinIO).
+
+Compara:
+- legado: um cliente boto3 novo por upload, TransferConfig padrão, envio serial;
+- cliente compartilhado, envio serial;
+- cliente compartilhado, upload_async concorrente (executor do S3);
+- arquivo grande com multipart (TransferConfig do s3_client_pool);
+- delete individual x delete_many (DeleteObjects em lote).
+
+Uso (na raiz do projeto):
+    pip install "moto[server]"
+    python scripts/bench_s3_transfers.py [quantidade_de_arquivos] [tamanho_kb]
+
+Sem o moto, informe um endpoint S3 local (ex.: MinIO) em AWS_S3_ENDPOINT_URL,
+com AWS_S3_BUCKET_NAME, AWS_ACCESS_KEY_ID e AWS_SECRET_ACCESS_KEY.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import boto3  # noqa: E402
+
+
+def start_local_s3() -> object | None:
+    """Sobe um moto server em thread, se AWS_S3_ENDPOINT_URL não estiver definido."""
+    if os.getenv('AWS_S3_ENDPOINT_URL'):
+        return None
+    try:
+        from moto.server import ThreadedMotoServer
+    except ImportError:
+        sys.exit("Instale moto[server] ou defina AWS_S3_ENDPOINT_URL com um S3 local (MinIO).")
+
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=5055)
+    server.start()
+    os.environ['AWS_S3_ENDPOINT_URL'] = "http://127.0.0.1:5055"
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', "bench")
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', "bench")
+    os.environ.setdefault('AWS_DEFAULT_REGION', "us-east-1")
+    os.environ.setdefault('AWS_S3_BUCKET_NAME', "estoquerapido-bench")
+    return server
+
+
+def new_client():
+    return boto3.client(
+        's3',
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+        region_name=os.getenv('AWS_DEFAULT_REGION'),
+        endpoint_url=os.getenv('AWS_S3_ENDPOINT_URL'),
+    )
+
+
+def make_files(directory: str, count: int, size: int) -> list[str]:
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"bench_{i}.bin")
+        with open(path, "wb") as f:
+            f.write(os.urandom(size))
+        paths.append(path)
+    return paths
+
+
+def report(label: str, elapsed: float, count: int, total_bytes: int) -> None:
+    mb = total_bytes / (1024 * 1024)
+    print(f"{label:<42} {elapsed:7.2f}s  {count / elapsed:8.1f} arq/s  {mb / elapsed:8.1f} MB/s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    size = (int(sys.argv[2]) if len(sys.argv) > 2 else 64) * 1024
+
+    server = start_local_s3()
+    # Importado após definir o endpoint: o cliente compartilhado lê o .env na primeira utilização
+    from src.services.aws.s3_file_manager import S3FileManager
+
+    bucket = os.environ['AWS_S3_BUCKET_NAME']
+    try:
+        new_client().create_bucket(Bucket=bucket)
+    except Exception:
+        pass  # Bucket já existe
+
+    manager = S3FileManager()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_files(tmp, count, size)
+        total = count * size
+
+        started = time.perf_counter()
+        for i, path in enumerate(paths):
+            new_client().upload_file(path, bucket, f"{manager.prefix}/bench/legacy_{i}.bin")
+        report("legado (cliente por upload, serial)", time.perf_counter() - started, count, total)
+
+        started = time.perf_counter()
+        for i, path in enumerate(paths):
+            manager.upload(path, f"bench/serial_{i}.bin")
+        report("cliente compartilhado, serial", time.perf_counter() - started, count, total)
+
+        async def upload_all():
+            await asyncio.gather(*(manager.upload_async(path, f"bench/async_{i}.bin")
+                                   for i, path in enumerate(paths)))
+
+        started = time.perf_counter()
+        asyncio.run(upload_all())
+        report("cliente compartilhado, upload_async", time.perf_counter() - started, count, total)
+
+        big_size = 64 * 1024 * 1024
+        big = make_files(tmp, 1, big_size)[0]
+        started = time.perf_counter()
+        new_client().upload_file(big, bucket, f"{manager.prefix}/bench/big_default.bin")
+        report("64 MB, TransferConfig padrão", time.perf_counter() - started, 1, big_size)
+        started = time.perf_counter()
+        manager.upload(big, "bench/big_tuned.bin")
+        report("64 MB, TransferConfig do pool", time.perf_counter() - started, 1, big_size)
+
+        started = time.perf_counter()
+        for i in range(count):
+            manager.delete(f"bench/serial_{i}.bin")
+        report("delete individual", time.perf_counter() - started, count, 0)
+
+        started = time.perf_counter()
+        results = manager.delete_many([f"bench/async_{i}.bin" for i in range(count)]
+                                      + [f"bench/legacy_{i}.bin" for i in range(count)]
+                                      + ["bench/big_default.bin", "bench/big_tuned.bin"])
+        report("delete_many (em lote)", time.perf_counter() - started, len(results), 0)
+
+    if server is not None:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
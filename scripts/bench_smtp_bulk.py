@@ -0,0 +1,113 @@
+"""
+Benchmark do envio em lote do ModernEmailSender contra um SMTP local (aiosmtpd).
+
+Compara:
+- legado: uma sessão SMTP nova (connect + LOGIN) por email, todas disparadas com gather;
+- pool: send_bulk_emails_async com sessões reaproveitadas e concorrência limitada.
+
+O servidor local conta as sessões abertas e pode recusar temporariamente (451) uma
+fração das mensagens, para exercitar as novas tentativas.
+
+Uso (na raiz do projeto):
+    pip install aiosmtpd
+    python scripts/bench_smtp_bulk.py [quantidade_de_emails] [latencia_ms] [taxa_falhas]
+"""
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aiosmtplib  # noqa: E402
+
+try:
+    from aiosmtpd.controller import Controller
+except ImportError:
+    sys.exit("Instale aiosmtpd: pip install aiosmtpd")
+
+from src.services.emails.send_email import EmailConfig, EmailMessage, ModernEmailSender  # noqa: E402
+from src.services.emails.smtp_pool import SmtpConnectionPool  # noqa: E402
+
+HOST, PORT = "127.0.0.1", 8025
+
+
+class CountingHandler:
+    """Handler do aiosmtpd que simula a latência do provedor e falhas temporárias."""
+
+    def __init__(self, latency: float, failure_rate: float):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.sessions = 0
+        self.delivered = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.sessions += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        await asyncio.sleep(self.latency)
+        if random.random() < self.failure_rate:
+            return "451 Falha temporaria simulada"
+        self.delivered += 1
+        return "250 OK"
+
+
+def make_messages(count: int) -> list[EmailMessage]:
+    return [
+        EmailMessage(subject=f"Bench {i}", recipients=[f"cliente{i}@exemplo.com"], body_text="Olá!")
+        for i in range(count)
+    ]
+
+
+async def send_legacy(config: EmailConfig, messages: list[EmailMessage], sender: ModernEmailSender) -> int:
+    async def send(msg: EmailMessage) -> bool:
+        try:
+            async with aiosmtplib.SMTP(hostname=config.smtp_server, port=config.smtp_port, start_tls=False) as smtp:
+                await smtp.send_message(sender._create_mime_message(msg), sender=config.sender_email,
+                                        recipients=msg.recipients)
+            return True
+        except Exception:
+            return False
+
+    results = await asyncio.gather(*(send(m) for m in messages))
+    return sum(results)
+
+
+async def main(count: int, latency: float, failure_rate: float) -> None:
+    logging.getLogger("mail.log").setLevel(logging.WARNING)
+    handler = CountingHandler(latency, failure_rate)
+    controller = Controller(handler, hostname=HOST, port=PORT)
+    controller.start()
+    config = EmailConfig(smtp_server=HOST, smtp_port=PORT, username="", password="",
+                         sender_email="bench@estoquerapido.com", use_tls=False, use_auth=False)
+    try:
+        sender = ModernEmailSender(config, pool=SmtpConnectionPool(config, max_size=4, health_check_after_seconds=1))
+
+        started = time.perf_counter()
+        delivered = await send_legacy(config, make_messages(count), sender)
+        elapsed = time.perf_counter() - started
+        print(f"legado: {delivered}/{count} em {elapsed:.2f}s ({delivered / elapsed:.1f}/s), "
+              f"{handler.sessions} sessões SMTP")
+
+        handler.sessions = 0
+        started = time.perf_counter()
+        results = await sender.send_bulk_emails_async(make_messages(count), max_attempts=3)
+        elapsed = time.perf_counter() - started
+        delivered = sum(1 for r in results if r['success'])
+        retried = sum(1 for r in results if r.get('attempts', 1) > 1)
+        print(f"pool:   {delivered}/{count} em {elapsed:.2f}s ({delivered / elapsed:.1f}/s), "
+              f"{handler.sessions} sessões SMTP, {retried} emails reenviados")
+        await sender.pool.close()
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    failures = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    asyncio.run(main(total, latency_ms / 1000, failures))
@@ -0,0 +1,72 @@
+"""
+Verifica a conversão das configurações do sistema (app_config) entre o modelo e o Firestore.
+
+Lê a configuração gravada (somente leitura), passa por _config_to_dict e _doc_to_config e
+confere que o token e o vencimento voltam iguais. Com --write, grava a mesma configuração
+em um documento temporário, relê pelo repositório e o remove: o vencimento passa pelo
+Timestamp real do Firestore (lido como DatetimeWithNanoseconds).
+
+Uso (na raiz do projeto, com o .env configurado):
+    python scripts/check_app_config_roundtrip.py [--config-id app_settings] [--write]
+"""
+import argparse
+import dataclasses
+import os
+import sys
+from datetime import UTC
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv  # noqa: E402
+
+load_dotenv()
+
+from src.domains.app_config.repositories.implementations.firebase_app_config_repository import (  # noqa: E402
+    FirebaseAppConfigRepository,
+)
+
+SCRATCH_ID = "app_config_roundtrip_check"
+
+
+def _same(label: str, expected, actual) -> bool:
+    ok = (expected.dfe_api_token == actual.dfe_api_token
+          and expected.dfe_api_token_expires_in == actual.dfe_api_token_expires_in
+          and actual.dfe_api_token_expires_in.tzinfo is not None)
+    status = "ok" if ok else "DIVERGENTE"
+    print(f"{label}: {status} (vencimento {actual.dfe_api_token_expires_in.astimezone(UTC).isoformat()})")
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Confere a conversão da configuração do sistema ida e volta.")
+    parser.add_argument("--config-id", default="app_settings", help="Documento da coleção app_config")
+    parser.add_argument("--write", action="store_true", help="Também grava e relê um documento temporário")
+    args = parser.parse_args()
+
+    repository = FirebaseAppConfigRepository()
+    config = repository.get(args.config_id)
+    if config is None:
+        print(f"Configuração '{args.config_id}' não encontrada.", file=sys.stderr)
+        return 1
+
+    data = repository._config_to_dict(config)
+    ok = _same("Conversão em memória", config, repository._doc_to_config(data))
+
+    if args.write:
+        scratch = dataclasses.replace(config, id=SCRATCH_ID)
+        try:
+            repository.save(scratch)
+            stored = repository.get(SCRATCH_ID)
+            if stored is None:
+                print("Gravação no Firestore: documento temporário não encontrado", file=sys.stderr)
+                ok = False
+            else:
+                ok = _same("Gravação no Firestore", config, stored) and ok
+        finally:
+            repository.delete(SCRATCH_ID)
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
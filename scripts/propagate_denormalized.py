@@ -0,0 +1,52 @@
+"""
+Propagação de campos desnormalizados após renomear a origem.
+
+    categoria_name: nome da categoria nos produtos (categoria_name, categoria_name_lower)
+    usuario_name:   nome do usuário nos campos de auditoria (created_by_name, updated_by_name...)
+
+Normalmente a propagação é enfileirada ao salvar a categoria ou o usuário e roda no runner de
+jobs. Este script a executa na hora (ex.: fila desabilitada ou dados antigos) e é retomável: o
+checkpoint fica em propagacoes_status/{tipo}_{id}.
+
+Uso (na raiz do projeto, com o .env configurado):
+    python scripts/propagate_denormalized.py <categoria_name|usuario_name> <id> [--page-size 500] [--writes-per-second 250]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv  # noqa: E402
+
+load_dotenv()
+
+from src.controllers.propagation_controllers import handle_propagate  # noqa: E402
+from src.domains.shared.models.denormalized_propagation import PROPAGATION_KINDS  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Regrava campos desnormalizados a partir do valor atual da origem.")
+    parser.add_argument("kind", choices=PROPAGATION_KINDS)
+    parser.add_argument("source_id", help="ID da categoria ou do usuário")
+    parser.add_argument("--page-size", type=int, default=None, help="Documentos por página (padrão PROPAGATION_PAGE_SIZE)")
+    parser.add_argument("--writes-per-second", type=float, default=None,
+                        help="Limite de escritas (padrão PROPAGATION_WRITES_PER_SECOND; 0 desliga)")
+    args = parser.parse_args()
+
+    result = handle_propagate(args.kind, args.source_id, args.page_size, args.writes_per_second,
+                              on_progress=lambda updated: print(f"  {updated} documento(s) atualizado(s)..."))
+    if result["status"] != "success":
+        print(result["message"], file=sys.stderr)
+        return 1
+
+    data = result["data"]
+    if data["skipped"]:
+        print("Nada a propagar: valores já atualizados ou origem não encontrada.")
+    else:
+        print(f"{data['updated']} documento(s) atualizado(s) de {data['scanned']} lido(s).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
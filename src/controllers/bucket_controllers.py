@@ -1,22 +1,35 @@
 import logging
+import os
 
 from src.services import BucketServices
+from src.services.aws.s3_file_manager import PRIVATE_PREFIX
 from storage.buckets.implementations.aws_s3_storage import AmazonS3Adapter
 import boto3
+from src.shared.metrics import instrument_controller
 
 logger = logging.getLogger(__name__)
 
-def handle_upload_bucket(local_path: str, key: str) -> str:
+@instrument_controller("bucket")
+def handle_upload_bucket(local_path: str, key: str, content_type: str | None = None,
+                         cache_control: str | None = None, skip_if_exists: bool = False) -> str:
     """
     Este handle utiliza o adaptador AmazonS3Adapter para o BucketService,
     posteriormente se quiser mudar o storage para Azure ou Google, é só trocar o adaptador
     que deverá seguir o contrato da classe abstrata BucketStorage.
+
+    Com skip_if_exists=True (chaves endereçadas por conteúdo), o upload é omitido se a
+    chave já existir no bucket e a url existente é retornada.
     """
     adapter = AmazonS3Adapter()
     bucket_services = BucketServices(adapter)
 
     try:
-        storage_url: str = bucket_services.upload(local_path, key)
+        if skip_if_exists and bucket_services.exists(key):
+            storage_url = bucket_services.get_url(key)
+            logger.info(f"Arquivo já existe no bucket, upload omitido: {storage_url}")
+            return storage_url
+
+        storage_url: str = bucket_services.upload(local_path, key, content_type=content_type, cache_control=cache_control)
         logger.info(f"Arquivo enviado com sucesso para o bucket: {storage_url}")
         return storage_url
     except FileNotFoundError:
@@ -26,6 +39,30 @@ def handle_upload_bucket(local_path: str, key: str) -> str:
     except Exception as e:
         raise RuntimeError(f"Erro inesperado ao fazer upload: {str(e)}")
 
+@instrument_controller("bucket")
+def handle_upload_private_bucket(local_path: str, key: str, download_name: str | None = None,
+                                 content_type: str | None = None, expires_in: int = 3600) -> str:
+    """
+    Envia o arquivo para a área privada do bucket e retorna uma url temporária de download
+    (pré-assinada, válida por expires_in segundos). Usado para arquivos com dados da empresa
+    (ex.: exportações), que não podem ficar na área pública.
+    """
+    adapter = AmazonS3Adapter(prefix=PRIVATE_PREFIX)
+    bucket_services = BucketServices(adapter)
+
+    try:
+        bucket_services.upload(local_path, key, content_type=content_type)
+        logger.info(f"Arquivo enviado para a área privada do bucket: {key}")
+        return bucket_services.get_download_url(key, expires_in=expires_in, download_name=download_name)
+    except FileNotFoundError:
+        raise ValueError(f"O arquivo {local_path} não foi encontrado.")
+    except boto3.exceptions.S3UploadFailedError as e: # type: ignore
+        raise RuntimeError(f"Falha ao fazer upload para o Bucket de armazenamento: {str(e)}")
+    except Exception as e:
+        raise RuntimeError(f"Erro inesperado ao fazer upload: {str(e)}")
+
+
+@instrument_controller("bucket")
 def handle_delete_bucket(key: str) -> bool:
     adapter = AmazonS3Adapter()
     bucket_services = BucketServices(adapter)
@@ -36,3 +73,92 @@ def handle_delete_bucket(key: str) -> bool:
         return is_deleted
     except Exception as e:
         raise RuntimeError(f"Ocorreu um erro: {e}")
+
+
+@instrument_controller("bucket")
+def handle_delete_many_bucket(keys: list[str]) -> dict[str, bool]:
+    """Remove vários arquivos do bucket em lote. Retorna, para cada chave, True se foi deletada."""
+    adapter = AmazonS3Adapter()
+    bucket_services = BucketServices(adapter)
+
+    try:
+        results = bucket_services.delete_many(keys)
+        failed = [key for key, is_deleted in results.items() if not is_deleted]
+        logger.info(f"{len(results) - len(failed)} arquivo(s) deletado(s) do bucket em lote")
+        if failed:
+            logger.warning(f"Arquivos que não puderam ser deletados do bucket: {failed}")
+        return results
+    except Exception as e:
+        raise RuntimeError(f"Ocorreu um erro: {e}")
+
+
+@instrument_controller("bucket")
+async def handle_upload_bucket_async(local_path: str, key: str, content_type: str | None = None,
+                                     cache_control: str | None = None, skip_if_exists: bool = False) -> str:
+    """
+    Versão assíncrona de handle_upload_bucket, para handlers async do Flet.
+    As chamadas ao S3 rodam no executor dedicado, sem bloquear o event loop.
+    """
+    adapter = AmazonS3Adapter()
+    bucket_services = BucketServices(adapter)
+
+    try:
+        if skip_if_exists and await bucket_services.exists_async(key):
+            storage_url = bucket_services.get_url(key)
+            logger.info(f"Arquivo já existe no bucket, upload omitido: {storage_url}")
+            return storage_url
+
+        storage_url: str = await bucket_services.upload_async(
+            local_path, key, content_type=content_type, cache_control=cache_control)
+        logger.info(f"Arquivo enviado com sucesso para o bucket: {storage_url}")
+        return storage_url
+    except FileNotFoundError:
+        raise ValueError(f"O arquivo {local_path} não foi encontrado.")
+    except boto3.exceptions.S3UploadFailedError as e: # type: ignore
+        raise RuntimeError(f"Falha ao fazer upload para o Bucket de armazenamento: {str(e)}")
+    except Exception as e:
+        raise RuntimeError(f"Erro inesperado ao fazer upload: {str(e)}")
+
+
+@instrument_controller("bucket")
+async def handle_delete_bucket_async(key: str) -> bool:
+    """Versão assíncrona de handle_delete_bucket."""
+    adapter = AmazonS3Adapter()
+    bucket_services = BucketServices(adapter)
+
+    try:
+        is_deleted: bool = await bucket_services.delete_async(key)
+        logger.info(f"Arquivo {'deletado' if is_deleted else 'não pode ser deletado'} do bucket: {key}")
+        return is_deleted
+    except Exception as e:
+        raise RuntimeError(f"Ocorreu um erro: {e}")
+
+
+@instrument_controller("bucket")
+def handle_enqueue_upload_bucket(local_path: str, key: str, content_type: str | None = None,
+                                 cache_control: str | None = None, skip_if_exists: bool = False) -> str:
+    """
+    Enfileira o upload em segundo plano e retorna, sem aguardar o envio, a url final do arquivo.
+    O arquivo local é movido para a fila; a url passa a responder quando o job concluir.
+    """
+    from src.services.jobs import enqueue_bucket_upload
+
+    if not os.path.exists(local_path):
+        raise ValueError(f"O arquivo {local_path} não foi encontrado.")
+
+    bucket_services = BucketServices(AmazonS3Adapter())
+    storage_url = bucket_services.get_url(key)
+    job_id = enqueue_bucket_upload(local_path, key, content_type=content_type, cache_control=cache_control,
+                                   skip_if_exists=skip_if_exists)
+    logger.info(f"Upload enfileirado (job {job_id}): {storage_url}")
+    return storage_url
+
+
+@instrument_controller("bucket")
+def handle_enqueue_delete_bucket(key: str) -> str:
+    """Enfileira a remoção do arquivo no bucket e retorna o id do job."""
+    from src.services.jobs import enqueue_bucket_delete
+
+    job_id = enqueue_bucket_delete(key)
+    logger.info(f"Remoção do arquivo {key} do bucket enfileirada (job {job_id})")
+    return job_id
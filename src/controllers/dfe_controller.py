@@ -8,9 +8,11 @@ import logging
 from src.domains.empresas import Environment
 from src.services.providers.nuvemfiscal_provider import NuvemFiscalDFeProvider
 from src.services.apis.dfe_services import DFeServices
+from src.shared.metrics import instrument_controller
 
 logger = logging.getLogger(__name__)
 
+@instrument_controller("dfe")
 async def handle_upload_certificate_a1(
         cpf_cnpj: str, certificate_content: bytes,
         a1_password: str, ambiente: Environment) -> dict:
@@ -0,0 +1,102 @@
+"""
+Exportação de produtos, clientes e pedidos para CSV ou Parquet.
+
+Os documentos são lidos do Firestore página a página e gravados incrementalmente em um
+arquivo temporário, que é enviado à área privada do bucket; a UI recebe uma URL temporária
+de download (pré-assinada).
+"""
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Callable, Iterator
+
+from src.services.export import EXPORT_DATASETS, EXPORT_FORMATS, ExportServices
+from src.shared.metrics import instrument_controller
+from src.shared.utils import get_uuid
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _pages(source: str, empresa_id: str, page_size: int) -> Iterator[list[tuple[str, dict[str, Any]]]]:
+    """Páginas de documentos brutos da coleção de origem da exportação."""
+    # Imports tardios: somente o repositório da coleção exportada é carregado
+    if source == "produtos":
+        from src.domains.produtos.repositories import FirebaseProdutosRepository
+        return FirebaseProdutosRepository(company_id=empresa_id).iter_export_pages(page_size)
+    if source == "clientes":
+        from src.domains.clientes.repositories.implementations.firebase_clientes_repository import FirebaseClientesRepository
+        return FirebaseClientesRepository(empresa_id).iter_export_pages(page_size)
+    if source == "pedidos":
+        from src.domains.pedidos.repositories.implementations.firebase_pedidos_repository import FirebasePedidosRepository
+        return FirebasePedidosRepository().iter_export_pages(empresa_id, page_size)
+    raise ValueError(f"Origem de exportação desconhecida: {source}")
+
+
+@instrument_controller("export")
+def handle_export(dataset_name: str, empresa_id: str, export_format: str = "csv",
+                  on_progress: Callable[[int], None] | None = None) -> dict:
+    """
+    Exporta um conjunto de dados da empresa ('produtos', 'clientes', 'pedidos' ou 'pedido_itens').
+
+    Args:
+        dataset_name (str): Nome do conjunto de dados (ver EXPORT_DATASETS)
+        empresa_id (str): ID da empresa logada
+        export_format (str): 'csv' ou 'parquet'
+        on_progress (Callable | None): Recebe o total de linhas gravadas após cada página lida
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (dict): 'url' (download temporário), 'filename' e 'rows' (linhas exportadas).
+    """
+    # Import tardio: bucket_controllers importa src.services (S3), desnecessário até o envio
+    import src.controllers.bucket_controllers as bucket_controllers
+
+    response = {}
+    path = None
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa logada não pode ser nulo ou vazio")
+        dataset = EXPORT_DATASETS.get(dataset_name)
+        if not dataset:
+            raise ValueError(f"Exportação desconhecida: {dataset_name}")
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Formato de exportação não suportado: {export_format}")
+
+        page_size = int(os.getenv('EXPORT_PAGE_SIZE', '500'))
+        fd, path = tempfile.mkstemp(prefix=f"export_{dataset.name}_", suffix=f".{export_format}")
+        os.close(fd)
+
+        rows = ExportServices().export(dataset, _pages(dataset.source, empresa_id, page_size), export_format,
+                                       path, on_progress=on_progress)
+
+        filename = f"{dataset.name}_{time.strftime('%Y%m%d_%H%M%S')}.{export_format}"
+        url = bucket_controllers.handle_upload_private_bucket(
+            local_path=path,
+            key=f"{empresa_id}/exports/{get_uuid()}/{filename}",
+            download_name=filename,
+            content_type=CONTENT_TYPES[export_format],
+            expires_in=int(os.getenv('EXPORT_URL_EXPIRES_SECONDS', '3600')),
+        )
+
+        response["status"] = "success"
+        response["data"] = {"url": url, "filename": filename, "rows": rows}
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+        logger.error(f"export_controllers.handle_export(ValueError). {response['message']}")
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = f"Erro ao exportar: {str(e)}"
+        logger.error(response["message"])
+    finally:
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    return response
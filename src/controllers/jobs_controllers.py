@@ -0,0 +1,61 @@
+"""
+Consulta da situação dos jobs em segundo plano (emails, uploads e remoções no bucket).
+A UI enfileira o trabalho e pode acompanhar o job pelo id retornado no enfileiramento.
+"""
+import logging
+
+from src.services.jobs import job_runner
+from src.shared.metrics import instrument_controller
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_controller("jobs")
+def handle_get_job_status(job_id: str) -> dict:
+    """
+    Retorna a situação de um job.
+
+    Args:
+        job_id (str): Id retornado pelo enfileiramento.
+
+    Returns:
+        dict: {"status": "success", "data": {"job": {...}}} com o estado do job (pending, running,
+              succeeded ou dead), tentativas, último erro e resultado; ou {"status": "error", "message": ...}.
+
+    Exemplo:
+        >>> response = handle_get_job_status(job_id)
+        >>> response["data"]["job"]["status"]
+        'succeeded'
+    """
+    response: dict = {}
+
+    try:
+        job = job_runner.status(job_id)
+        if job is None:
+            response["status"] = "error"
+            response["message"] = f"Job não encontrado: {job_id}"
+        else:
+            response["status"] = "success"
+            response["data"] = {"job": job}
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+        logger.error(response["message"])
+
+    return response
+
+
+@instrument_controller("jobs")
+def handle_get_jobs_stats() -> dict:
+    """Retorna a quantidade de jobs por tipo e estado ({"email.send": {"pending": 2, ...}})."""
+    response: dict = {}
+
+    try:
+        response["status"] = "success"
+        response["data"] = {"stats": job_runner.stats(), "running": job_runner.running}
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+        logger.error(response["message"])
+
+    return response
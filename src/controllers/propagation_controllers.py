@@ -0,0 +1,57 @@
+"""
+Propagação de campos desnormalizados (nome da categoria nos produtos, nome do usuário nos
+campos de auditoria '<prefixo>_by_name').
+
+Ao renomear a origem, o handler de salvamento enfileira a propagação (job denormalized.propagate),
+que roda em segundo plano no runner de jobs; scripts/propagate_denormalized.py executa (ou retoma)
+uma propagação na hora.
+"""
+import logging
+from typing import Callable
+
+from src.domains.shared.models.denormalized_propagation import PROPAGATION_KINDS
+from src.shared.metrics import instrument_controller
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_controller("propagation")
+def handle_propagate(kind: str, source_id: str, page_size: int | None = None,
+                     writes_per_second: float | None = None,
+                     on_progress: Callable[[int], None] | None = None) -> dict:
+    """
+    Executa (ou retoma do checkpoint) a propagação de um campo desnormalizado.
+
+    Args:
+        kind (str): 'categoria_name' ou 'usuario_name'
+        source_id (str): ID da categoria ou do usuário renomeado
+        page_size (int | None): Documentos lidos por página (padrão PROPAGATION_PAGE_SIZE)
+        writes_per_second (float | None): Limite de escritas (padrão PROPAGATION_WRITES_PER_SECOND)
+        on_progress (Callable | None): Recebe o total de documentos atualizados após cada página
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (dict): 'updated', 'scanned' e 'skipped'.
+    """
+    from src.domains.shared.repositories.implementations.firebase_propagation_repository import FirebasePropagationRepository
+    from src.domains.shared.services.propagation_services import PropagationServices
+
+    response = {}
+    try:
+        if kind not in PROPAGATION_KINDS:
+            raise ValueError(f"Tipo de propagação desconhecido: {kind}")
+        services = PropagationServices(FirebasePropagationRepository())
+        response["status"] = "success"
+        response["data"] = services.propagate(kind, source_id, page_size=page_size,
+                                              writes_per_second=writes_per_second, on_progress=on_progress)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+        logger.error(f"propagation_controllers.handle_propagate(ValueError). {response['message']}")
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = f"Erro ao propagar {kind}: {str(e)}"
+        logger.error(response["message"])
+
+    return response
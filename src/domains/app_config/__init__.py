@@ -1,4 +1,4 @@
-from .controllers.app_config_controllers import handle_save_config, handle_get_config
+from .controllers.app_config_controllers import handle_save_config, handle_get_config, handle_update_config
 
 from .models.app_config_model import AppConfig
 
@@ -6,3 +6,4 @@ from .repositories.contracts.app_config_repository import AppConfigRepository
 from .repositories.implementations.firebase_app_config_repository import FirebaseAppConfigRepository
 
 from .services.app_config_services import AppConfigServices
+from .services.app_config_cache import AppConfigCache, app_config_cache
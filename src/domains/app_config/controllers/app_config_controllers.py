@@ -5,14 +5,16 @@ Isso promove uma arquitetura mais limpa e modular, facilitando manutenção e es
 """
 
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from src.domains.app_config.models.app_config_model import AppConfig
 from src.domains.app_config.repositories.implementations.firebase_app_config_repository import FirebaseAppConfigRepository
 from src.domains.app_config.services.app_config_services import AppConfigServices
+from src.shared.metrics import instrument_controller
 
 logger = logging.getLogger(__name__)
 
+@instrument_controller("app_config")
 def handle_save_config(settings: AppConfig, create_new: bool) -> dict:
     """
     Manipula a operação de salvar Configuração do sistema.
@@ -69,6 +71,7 @@ def handle_save_config(settings: AppConfig, create_new: bool) -> dict:
     return response
 
 
+@instrument_controller("app_config")
 def handle_get_config(config_id: str) -> dict:
     """
     Manipula a operação de buscar uma configuração.
@@ -100,8 +103,8 @@ def handle_get_config(config_id: str) -> dict:
 
         app_config = None
 
-        # Busca configuração do sistema pelo config_id
-        app_config = settings_services.find_config_by_id(config_id)
+        # Busca configuração do sistema pelo config_id (em memória após a primeira leitura)
+        app_config = settings_services.get_cached(config_id)
 
         if app_config:
             response["status"] = "success"
@@ -121,3 +124,43 @@ def handle_get_config(config_id: str) -> dict:
         logger.error(response["message"])
 
     return response
+
+
+@instrument_controller("app_config")
+def handle_update_config(config_id: str, mutator: Callable[[AppConfig | None], AppConfig]) -> dict:
+    """
+    Manipula a atualização atômica (leitura-modificação-escrita) de uma configuração.
+
+    Args:
+        config_id (str): O ID da configuração.
+        mutator (Callable): Recebe a configuração atual (ou None) e retorna a nova. Pode ser
+            executado mais de uma vez em caso de conflito; não deve ter efeitos colaterais.
+
+    Returns:
+        dict: Um dicionário contendo o status da operação, uma mensagem de sucesso ou erro e a configuração gravada.
+
+    Exemplo:
+        >>> response = handle_update_config("app_settings", lambda cfg: dataclasses.replace(cfg, timeout=60))
+        >>> print(response)
+    """
+    response: dict = {}
+
+    try:
+        repository = FirebaseAppConfigRepository()
+        settings_services = AppConfigServices(repository)
+
+        app_config = settings_services.update_atomic(config_id, mutator)
+
+        response["status"] = "success"
+        response["data"] = {"settings": app_config, "message": "Configuração alterada com sucessso!"}
+
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+        logger.error(response["message"])
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+        logger.error(response["message"])
+
+    return response
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, Callable
 
 from src.domains.app_config.models.app_config_model import AppConfig
 
@@ -20,3 +21,22 @@ class AppConfigRepository(ABC):
     def delete(self, id: str) -> bool:
         """Exclui as configurações do aplicativo."""
         raise NotImplementedError("Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def update_atomic(self, config_id: str, mutator: Callable[[AppConfig | None], AppConfig]) -> AppConfig:
+        """
+        Leitura-modificação-escrita atômica: mutator recebe a configuração atual (ou None)
+        e retorna a nova, que é gravada na mesma transação.
+        """
+        raise NotImplementedError("Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def watch(self, config_id: str, callback: Callable[[AppConfig | None], None]) -> Any:
+        """
+        Registra um listener para a configuração. O callback recebe a configuração atual
+        (ou None se o documento não existir) a cada alteração.
+
+        Returns:
+            Any: Handle do listener; use unsubscribe() para cancelá-lo.
+        """
+        raise NotImplementedError("Este método deve ser implementado pela subclasse")
@@ -1,10 +1,12 @@
 import logging
+from datetime import UTC
+from typing import Any, Callable
 
 from src.domains.app_config.models.app_config_model import AppConfig
 from src.domains.app_config.repositories.contracts.app_config_repository import AppConfigRepository
 from src.shared.utils import deepl_translator
 
-from storage.data import get_firebase_app
+from storage.data import get_firebase_app, get_firestore_client
 from firebase_admin import firestore
 from firebase_admin import exceptions
 
@@ -26,7 +28,7 @@ class FirebaseAppConfigRepository(AppConfigRepository):
 
         get_firebase_app()
 
-        self.db = firestore.client()
+        self.db = get_firestore_client()
         self.collection = self.db.collection('app_config')
 
     def get(self, config_id: str) -> AppConfig | None:
@@ -117,25 +119,85 @@ class FirebaseAppConfigRepository(AppConfigRepository):
                 f"Erro inesperado ao deletar configuração de sistema com id '{config_id}': {str(e)}")
 
 
+    def update_atomic(self, config_id: str, mutator: Callable[[AppConfig | None], AppConfig]) -> AppConfig:
+        """
+        Atualiza a configuração em uma transação do Firestore.
+
+        A transação relê o documento e reexecuta o mutator se outro processo o alterar
+        antes do commit, então mutator não deve ter efeitos colaterais.
+
+        Args:
+            config_id (str): O identificador único do app_config.
+            mutator (Callable): Recebe a configuração atual (ou None) e retorna a nova.
+
+        Returns:
+            AppConfig: A configuração gravada.
+        """
+        doc_ref = self.collection.document(config_id)
+
+        @firestore.transactional
+        def run(transaction) -> AppConfig:
+            snapshot = doc_ref.get(transaction=transaction)
+            current = None
+            if snapshot.exists:
+                data = snapshot.to_dict()
+                data['id'] = snapshot.id
+                current = self._doc_to_config(data)
+
+            updated = mutator(current)
+            updated.id = config_id
+            transaction.set(doc_ref, self._config_to_dict(updated), merge=True)
+            return updated
+
+        try:
+            return run(self.db.transaction())
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro ao atualizar configuração do sistema '{config_id}': {e}")
+            raise
+
+    def watch(self, config_id: str, callback: Callable[[AppConfig | None], None]) -> Any:
+        """
+        Registra um listener (on_snapshot) para o documento da configuração.
+
+        Returns:
+            Watch: Handle do listener; use unsubscribe() para cancelá-lo.
+        """
+        def on_snapshot(docs, changes, read_time):
+            # Uma exceção aqui encerraria o listener: um documento inválido só é registrado no log
+            try:
+                config = None
+                for doc in docs:
+                    if doc.exists:
+                        data = doc.to_dict()
+                        data['id'] = doc.id
+                        config = self._doc_to_config(data)
+                callback(config)
+            except Exception as e:
+                logger.error(f"Erro ao processar alteração da configuração '{config_id}': {e}")
+
+        return self.collection.document(config_id).on_snapshot(on_snapshot)
+
     def _config_to_dict(self, config: AppConfig) -> dict:
-        # Converte o objeto datetime do python para o Timestamp do Firestore
-        timestamp_expires_in = firestore.Timestamp.from_datetime(config.dfe_api_token_expires_in) # type: ignore
+        # O Firestore grava datetime como Timestamp; sem fuso, o horário é considerado UTC
+        expires_in = config.dfe_api_token_expires_in
+        if expires_in.tzinfo is None:
+            expires_in = expires_in.replace(tzinfo=UTC)
 
         config_dict = {
             'id': config.id,
             'dfe_api_token': config.dfe_api_token,
-            'dfe_api_token_expires_in': timestamp_expires_in,
+            'dfe_api_token_expires_in': expires_in,
         }
 
         return config_dict
 
     def _doc_to_config(self, doc: dict) -> AppConfig:
-        # Converte o Timestamp do Firestore para o objeto datetime do Python
-        timestamp_expires_in = doc['dfe_api_token_expires_in']
-        datetime_expires_in = timestamp_expires_in.to_datetime()
+        # O Timestamp do Firestore é lido como DatetimeWithNanoseconds (subclasse de datetime, em UTC)
+        expires_in = doc['dfe_api_token_expires_in']
+        expires_in = expires_in.replace(tzinfo=UTC) if expires_in.tzinfo is None else expires_in.astimezone(UTC)
 
         return AppConfig(
             id=doc['id'],
             dfe_api_token=doc['dfe_api_token'],
-            dfe_api_token_expires_in=datetime_expires_in,
+            dfe_api_token_expires_in=expires_in,
         )
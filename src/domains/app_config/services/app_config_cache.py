@@ -0,0 +1,146 @@
+# app_config_cache.py
+"""
+Configurações do sistema (coleção app_config) em memória, compartilhadas pelo processo.
+
+Cada documento é lido uma única vez: um listener do Firestore (on_snapshot) mantém a cópia
+em memória atualizada, e as leituras seguintes não acessam o banco. Componentes interessados
+registram callbacks com subscribe() e são notificados quando a configuração muda, seja por
+gravação deste processo ou de outra instância.
+"""
+import dataclasses
+import logging
+import threading
+from typing import Any, Callable
+
+from src.domains.app_config.models.app_config_model import AppConfig
+from src.domains.app_config.repositories.contracts.app_config_repository import AppConfigRepository
+
+logger = logging.getLogger(__name__)
+
+# Tempo máximo de espera pelo primeiro snapshot antes de recorrer à leitura direta
+SNAPSHOT_WAIT_SECONDS = 10
+
+Listener = Callable[[AppConfig | None], None]
+
+
+class _ConfigEntry:
+    __slots__ = ("lock", "config", "loaded", "watch", "listeners")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.config: AppConfig | None = None
+        self.loaded = False
+        self.watch: Any = None
+        self.listeners: list[Listener] = []
+
+
+class AppConfigCache:
+    """Cache de configurações com listener de snapshot e notificação de alterações."""
+
+    def __init__(self):
+        self._entries: dict[str, _ConfigEntry] = {}
+        self._lock = threading.Lock()
+
+    def _get_entry(self, config_id: str) -> _ConfigEntry:
+        with self._lock:
+            entry = self._entries.get(config_id)
+            if entry is None:
+                entry = _ConfigEntry()
+                self._entries[config_id] = entry
+            return entry
+
+    def get(self, config_id: str, repository: AppConfigRepository) -> AppConfig | None:
+        """
+        Retorna uma cópia da configuração. Somente a primeira chamada do processo acessa o banco.
+
+        Args:
+            config_id (str): ID do documento em app_config.
+            repository (AppConfigRepository): Repositório usado na primeira leitura.
+
+        Returns:
+            AppConfig | None: Cópia da configuração, ou None se o documento não existir.
+        """
+        entry = self._get_entry(config_id)
+        if not entry.loaded:
+            self._load(config_id, entry, repository)
+        return self._copy(entry.config)
+
+    def _load(self, config_id: str, entry: _ConfigEntry, repository: AppConfigRepository) -> None:
+        with entry.lock:
+            if entry.loaded:
+                return
+            ready = threading.Event()
+
+            def on_change(config: AppConfig | None) -> None:
+                self._apply(config_id, entry, config)
+                ready.set()
+
+            try:
+                entry.watch = repository.watch(config_id, on_change)
+            except Exception as e:
+                logger.warning(f"Erro ao registrar listener da configuração '{config_id}': {e}")
+
+            if entry.watch is not None and ready.wait(SNAPSHOT_WAIT_SECONDS):
+                return
+
+            logger.warning(f"Snapshot da configuração '{config_id}' indisponível. Usando leitura direta.")
+            entry.config = repository.get(config_id)
+            entry.loaded = True
+
+    def _apply(self, config_id: str, entry: _ConfigEntry, config: AppConfig | None) -> None:
+        changed = entry.loaded and entry.config != config
+        entry.config = config
+        entry.loaded = True
+        if not changed:
+            return
+        for listener in list(entry.listeners):
+            try:
+                listener(self._copy(config))
+            except Exception as e:
+                logger.error(f"Erro ao notificar alteração da configuração '{config_id}': {e}")
+
+    def set_local(self, config_id: str, config: AppConfig | None) -> None:
+        """
+        Aplica em memória uma configuração recém-gravada por este processo, sem aguardar o
+        snapshot (que trará o mesmo valor e não gerará nova notificação).
+        """
+        entry = self._get_entry(config_id)
+        self._apply(config_id, entry, self._copy(config))
+
+    def subscribe(self, config_id: str, listener: Listener) -> Callable[[], None]:
+        """
+        Registra um callback chamado com a nova configuração a cada alteração.
+        O callback pode rodar na thread do listener do Firestore.
+
+        Returns:
+            Callable[[], None]: Função que cancela a inscrição.
+        """
+        entry = self._get_entry(config_id)
+        entry.listeners.append(listener)
+
+        def unsubscribe() -> None:
+            if listener in entry.listeners:
+                entry.listeners.remove(listener)
+
+        return unsubscribe
+
+    def close(self) -> None:
+        """Cancela os listeners de snapshot e limpa o cache."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            if entry.watch is not None:
+                try:
+                    entry.watch.unsubscribe()
+                except Exception as e:
+                    logger.warning(f"Erro ao cancelar listener de configuração: {e}")
+
+    @staticmethod
+    def _copy(config: AppConfig | None) -> AppConfig | None:
+        # Cópia rasa: quem altera o objeto retornado não altera o cache
+        return dataclasses.replace(config) if config is not None else None
+
+
+# Cache global do processo, compartilhado por todas as sessões Flet
+app_config_cache = AppConfigCache()
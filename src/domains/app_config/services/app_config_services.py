@@ -4,8 +4,11 @@ organizando e validando os dados antes de delegar a execução das operações a
 Isso promove uma arquitetura mais limpa e modular, facilitando manutenção e escalabilidade do sistema.
 """
 
+from typing import Callable
+
 from src.domains.app_config.models.app_config_model import AppConfig
 from src.domains.app_config.repositories.contracts.app_config_repository import AppConfigRepository
+from src.domains.app_config.services.app_config_cache import app_config_cache
 from src.shared.utils import get_uuid
 
 
@@ -65,7 +68,9 @@ class AppConfigServices:
         # Gera por padrão um uuid raw (sem os hífens) com prefixo 'app_'
         config.id = 'app_' + get_uuid()
        # Envia para o repositório selecionado em app_config_controllrer salvar
-        return self.repository.save(config)
+        config_id = self.repository.save(config)
+        app_config_cache.set_local(config_id, config)
+        return config_id
 
 
     def update(self, config: AppConfig) -> str:
@@ -93,7 +98,31 @@ class AppConfigServices:
         if not config.id:
             raise ValueError(
                 "ID da configuração é necessário para atualização")
-        return self.repository.save(config)
+        config_id = self.repository.save(config)
+        app_config_cache.set_local(config_id, config)
+        return config_id
+
+    def update_atomic(self, config_id: str, mutator: Callable[[AppConfig | None], AppConfig]) -> AppConfig:
+        """Leitura-modificação-escrita atômica da configuração (transação no repositório).
+
+        Use no lugar de find_config_by_id + update quando o novo valor depende do atual:
+        gravações concorrentes de outras sessões ou instâncias não se sobrescrevem.
+
+        Args:
+            config_id (str): ID da configuração.
+            mutator (Callable): Recebe a configuração atual (ou None) e retorna a nova. Pode ser
+                executado mais de uma vez se houver conflito, portanto não deve ter efeitos colaterais.
+
+        Returns:
+            AppConfig: Configuração gravada.
+        """
+        config = self.repository.update_atomic(config_id, mutator)
+        app_config_cache.set_local(config_id, config)
+        return config
+
+    def get_cached(self, config_id: str) -> AppConfig | None:
+        """Retorna a configuração em memória (o banco é lido apenas uma vez por processo)."""
+        return app_config_cache.get(config_id, self.repository)
 
     def find_config_by_id(self, id: str) -> AppConfig|None:
         """Busca uma configuração no banco de dados utilizando o ID.
@@ -1,15 +1,19 @@
 import logging
 
-from typing import Any
+from typing import Any, Callable
 from src.domains.shared import RegistrationStatus
 from src.domains.categorias.models import ProdutoCategorias
 from src.domains.categorias.repositories import FirebaseCategoriasRepository
 from src.domains.categorias.services import CategoriasServices
+from src.domains.shared.models.denormalized_propagation import CATEGORIA_NAME
 from src.domains.usuarios.models.usuarios_model import Usuario
+from src.services.jobs import enqueue_denormalized_propagation
+from src.shared.metrics import instrument_controller
 
 logger = logging.getLogger(__name__)
 
 
+@instrument_controller("categorias")
 def handle_save(categoria: ProdutoCategorias, current_user: Usuario) -> dict[str, Any]:
     """Salva ou atualiza uma categoria de produto."""
     response = {}
@@ -21,7 +25,15 @@ def handle_save(categoria: ProdutoCategorias, current_user: Usuario) -> dict[str
         operation = "atualizada"
 
         if categoria.id:
+            previous = categorias_services.get_by_id(categoria.id)
             id = categorias_services.update(categoria, current_user)
+            if previous and previous.name != categoria.name:
+                # Categoria renomeada: o nome desnormalizado nos produtos é atualizado em segundo plano
+                try:
+                    enqueue_denormalized_propagation(CATEGORIA_NAME, categoria.id)
+                except Exception as e:
+                    # O salvamento já foi concluído: a propagação pode ser executada depois pelo script
+                    logger.error(f"Não foi possível enfileirar a propagação do nome da categoria {categoria.id}: {e}")
         else:
             id = categorias_services.create(categoria, current_user)
             operation = "criada"
@@ -41,6 +53,7 @@ def handle_save(categoria: ProdutoCategorias, current_user: Usuario) -> dict[str
     return response
 
 
+@instrument_controller("categorias")
 def handle_update_status(categoria: ProdutoCategorias, current_user: Usuario, status: RegistrationStatus) -> dict[str, Any]:
     """Manipula o status para ativo, inativo ou deletada de uma categoria de produto."""
     response = {}
@@ -86,6 +99,7 @@ def handle_update_status(categoria: ProdutoCategorias, current_user: Usuario, st
     return response
 
 
+@instrument_controller("categorias")
 def handle_get_all(empresa_id: str, status_deleted: bool = False) -> dict[str, Any]:
     """
     Busca todas as categorias do usuário logado que sejam ativa ou não, dependendo do status_active desejado.
@@ -139,6 +153,7 @@ def handle_get_all(empresa_id: str, status_deleted: bool = False) -> dict[str, A
     return response
 
 
+@instrument_controller("categorias")
 def handle_get_active_categorias_summary(empresa_id: str) -> dict[str, Any]:
     """
     Obtém um resumo (ID, nome, descrição) de todas as categorias ativas
@@ -178,6 +193,7 @@ def handle_get_active_categorias_summary(empresa_id: str) -> dict[str, Any]:
 
     return response
 
+@instrument_controller("categorias")
 def handle_get_active_id(empresa_id: str, nome: str) -> str | None:
     """Obtem o ID da categoria pelo nome da categoria"""
     try:
@@ -196,3 +212,80 @@ def handle_get_active_id(empresa_id: str, nome: str) -> str | None:
         raise ValueError(f"categorias_controllers.handle_get_active_id ValueError: Erro de validação: {str(e)}")
     except Exception as e:
         raise Exception(str(e))
+
+
+@instrument_controller("categorias")
+def handle_bulk_update_status(empresa_id: str, categoria_ids: list[str], current_user: Usuario, status: RegistrationStatus,
+                              on_progress: Callable[[int], None] | None = None) -> dict[str, Any]:
+    """
+    Muda em lote o status de várias categorias (envio à lixeira ou restauração em massa).
+
+    Args:
+        empresa_id (str): ID da empresa logada
+        categoria_ids (list[str]): IDs das categorias
+        current_user (Usuario): Usuário logado, gravado nos campos de auditoria
+        status (RegistrationStatus): Novo status
+        on_progress (Callable | None): Recebe o total de registros processados após cada lote gravado
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (int): Quantidade de categorias atualizadas.
+    """
+    response = {}
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa logada não pode ser nulo ou vazio")
+        if not isinstance(current_user, Usuario) or not current_user.id:
+            raise ValueError("Usuário logado é necessário para alterar o status")
+        if not isinstance(status, RegistrationStatus):
+            raise ValueError("Status não é do tipo RegistrationStatus")
+
+        repository = FirebaseCategoriasRepository()
+        services = CategoriasServices(repository)
+
+        response["status"] = "success"
+        response["data"] = services.bulk_update_status(empresa_id, categoria_ids, current_user, status, on_progress)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+        logger.error("categorias_controllers.handle_bulk_update_status(ValueError). " + response["message"])
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+        logger.error(response["message"])
+
+    return response
+
+
+@instrument_controller("categorias")
+def handle_bulk_hard_delete(empresa_id: str, categoria_ids: list[str],
+                            on_progress: Callable[[int], None] | None = None) -> dict[str, Any]:
+    """
+    Exclui definitivamente, em lote, as categorias da lixeira (status 'DELETED').
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (int): Quantidade de categorias excluídas.
+    """
+    response = {}
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa logada não pode ser nulo ou vazio")
+
+        repository = FirebaseCategoriasRepository()
+        services = CategoriasServices(repository)
+
+        response["status"] = "success"
+        response["data"] = services.bulk_hard_delete(empresa_id, categoria_ids, on_progress)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+        logger.error("categorias_controllers.handle_bulk_hard_delete(ValueError). " + response["message"])
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+        logger.error(response["message"])
+
+    return response
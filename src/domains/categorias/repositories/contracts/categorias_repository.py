@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 
 from src.domains.categorias.models import ProdutoCategorias
+from src.domains.shared import RegistrationStatus
 
 
 class CategoriasRepository(ABC):
@@ -53,6 +54,17 @@ class CategoriasRepository(ABC):
         raise NotImplementedError(
         "Este método deve ser implementado pela subclasse")
 
+    @abstractmethod
+    def watch_active_categorias_summary(self, empresa_id: str, callback: Callable[[list[dict[str, Any]]], None]) -> Any:
+        """
+        Registra um listener para o resumo das categorias ativas de uma empresa.
+
+        O callback recebe o resumo completo (mesmo formato de get_active_categorias_summary)
+        a cada alteração. Retorna o handle do listener, que possui o método unsubscribe().
+        """
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
     @abstractmethod
     def get_active_id_by_name(self, company_id: str, name: str) -> str | None:
         """
@@ -72,3 +84,16 @@ class CategoriasRepository(ABC):
             Exception: Para erros de Firebase ou outros erros inesperados (re-lançados).
         """
         raise NotImplementedError("Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def bulk_update_status(self, empresa_id: str, categoria_ids: list[str], status: RegistrationStatus, current_user_id: str,
+                           current_user_name: str, on_progress: Callable[[int], None] | None = None) -> int:
+        """Muda o status de várias categorias em lote, com auditoria. Retorna a quantidade de categorias atualizadas."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def bulk_hard_delete(self, empresa_id: str, categoria_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """Exclui definitivamente, em lote, as categorias que estão na lixeira. Retorna a quantidade de categorias excluídas."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
@@ -1,17 +1,18 @@
 import logging
 from datetime import datetime, UTC
-from typing import Any
+from typing import Any, Callable
 
 from google.cloud.firestore_v1.base_query import FieldFilter
 from google.api_core import exceptions as google_api_exceptions
-from firebase_admin import exceptions, firestore
+from firebase_admin import exceptions
 
 from src.domains.shared import RegistrationStatus
 from src.domains.categorias.models import ProdutoCategorias
 from src.domains.categorias.repositories import CategoriasRepository
 from src.shared.utils import deepl_translator
-from src.domains.shared.repositories.utils import set_audit_timestamps
-from storage.data import get_firebase_app
+from src.domains.shared.repositories.utils import (hard_delete_in_batches, set_audit_timestamps, status_change_data,
+                                                 update_status_in_batches)
+from storage.data import get_firebase_app, get_firestore_client, record_returned
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +29,7 @@ class FirebaseCategoriasRepository(CategoriasRepository):
         # fb_app = get_firebase_app()
         get_firebase_app()
 
-        self.db = firestore.client()
+        self.db = get_firestore_client()
         # self.transaction = self.db.transaction()
         self.collection = self.db.collection('produto_categorias')
 
@@ -205,6 +206,7 @@ class FirebaseCategoriasRepository(CategoriasRepository):
                 if status_deleted or (status_value != RegistrationStatus.DELETED.name):
                     categorias.append(ProdutoCategorias.from_dict(categoria_data_dict))
 
+            record_returned(len(categorias))
             return categorias, quantidade_deletados
         except google_api_exceptions.FailedPrecondition as e:
             # Esta é a exceção específica para erros de "índice ausente".
@@ -281,17 +283,7 @@ class FirebaseCategoriasRepository(CategoriasRepository):
 
             docs = query.get() # Alterado para .get()
 
-            categorias_summary_list: list[dict[str, Any]] = [] # Alterado para list nativo
-            for doc in docs:
-                data = doc.to_dict()
-                if data: # Boa prática verificar se data não é None
-                    categorias_summary_list.append({
-                        "id": doc.id,
-                        "name": data.get("name"),
-                        "description": data.get("description")
-                    })
-
-            return categorias_summary_list
+            return self._summary_from_docs(docs)
         except google_api_exceptions.FailedPrecondition as e:
             # Esta é a exceção específica para erros de "índice ausente".
             # A mensagem de erro 'e' já contém o link para criar o índice.
@@ -334,6 +326,40 @@ class FirebaseCategoriasRepository(CategoriasRepository):
             )
             raise
 
+    @staticmethod
+    def _summary_from_docs(docs) -> list[dict[str, Any]]:
+        """Converte os documentos de categorias no resumo (ID, nome, descrição)."""
+        categorias_summary_list: list[dict[str, Any]] = []
+        for doc in docs:
+            data = doc.to_dict()
+            if data: # Boa prática verificar se data não é None
+                categorias_summary_list.append({
+                    "id": doc.id,
+                    "name": data.get("name"),
+                    "description": data.get("description")
+                })
+        return categorias_summary_list
+
+    def watch_active_categorias_summary(self, empresa_id: str, callback: Callable[[list[dict[str, Any]]], None]):
+        """
+        Registra um listener (on_snapshot) para o resumo das categorias ativas da empresa.
+
+        O callback recebe o resumo completo, ordenado por nome, a cada alteração.
+        Listeners não suportam field mask (select), por isso os documentos vêm completos.
+
+        Returns:
+            Watch: Handle do listener; use unsubscribe() para cancelá-lo.
+        """
+        query = (self.collection
+                 .where(filter=FieldFilter("empresa_id", "==", empresa_id))
+                 .where(filter=FieldFilter("status", "==", RegistrationStatus.ACTIVE.name))
+                 .order_by("name"))
+
+        def on_snapshot(docs, changes, read_time):
+            callback(self._summary_from_docs(docs))
+
+        return query.on_snapshot(on_snapshot)
+
     def get_active_id_by_name(self, company_id: str, name: str) -> str | None:
         """
         Obtém o ID de uma categoria ativa com base em seu nome (case-insensitive), de uma empresa.
@@ -427,3 +453,37 @@ class FirebaseCategoriasRepository(CategoriasRepository):
                     f"Detalhe original: {str(e)}"
                 )
             raise
+
+    def bulk_update_status(self, empresa_id: str, categoria_ids: list[str], status: RegistrationStatus, current_user_id: str,
+                           current_user_name: str, on_progress: Callable[[int], None] | None = None) -> int:
+        """
+        Muda o status de várias categorias (lixeira, restauração) em transações de até 500 documentos,
+        com os campos de auditoria do novo status e timestamps do servidor, sem reler os documentos.
+
+        Returns:
+            int: Quantidade de categorias atualizadas.
+        """
+        refs = [self.collection.document(categoria_id) for categoria_id in categoria_ids]
+        try:
+            return update_status_in_batches(self.db, refs, status_change_data(status, current_user_id, current_user_name),
+                                            empresa_id=empresa_id, on_progress=on_progress)
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao atualizar o status de {len(refs)} categorias: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            translated_error = deepl_translator(str(e))
+            raise Exception(f"Erro ao atualizar o status das categorias: {translated_error}")
+
+    def bulk_hard_delete(self, empresa_id: str, categoria_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """
+        Exclui definitivamente, em transações de até 500 documentos, as categorias informadas que
+        estão na lixeira (status 'DELETED'); os demais são ignorados.
+
+        Returns:
+            int: Quantidade de categorias excluídas.
+        """
+        refs = [self.collection.document(categoria_id) for categoria_id in categoria_ids]
+        try:
+            return hard_delete_in_batches(self.db, refs, empresa_id=empresa_id, on_progress=on_progress)
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao excluir {len(refs)} categorias: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            translated_error = deepl_translator(str(e))
+            raise Exception(f"Erro ao excluir definitivamente as categorias: {translated_error}")
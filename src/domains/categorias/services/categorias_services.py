@@ -1,11 +1,15 @@
-from typing import Any
+from typing import Any, Callable
 from src.domains.shared import RegistrationStatus
 from src.domains.categorias.models import ProdutoCategorias
 from src.domains.categorias.repositories import CategoriasRepository
 from src.domains.shared import NomePessoa
 from src.domains.usuarios.models.usuarios_model import Usuario
+from src.shared.cache import ReferenceDataCache
 from src.shared.utils import get_uuid
 
+# Resumo das categorias ativas por empresa, compartilhado por todas as sessões do processo
+categorias_summary_cache = ReferenceDataCache("categorias_summary")
+
 
 class CategoriasServices:
     """Serviço de gerenciamento de categorias de produtos."""
@@ -27,7 +31,9 @@ class CategoriasServices:
         categoria.created_by_name = current_user.name.nome_completo
 
         # Envia para o repositório selecionado em empresas_controllrer salvar
-        return self.repository.save(categoria)
+        categoria_id = self.repository.save(categoria)
+        categorias_summary_cache.invalidate(categoria.empresa_id)
+        return categoria_id
 
     def update(self, categoria: ProdutoCategorias, current_user: Usuario) -> str:
         """Atualiza os dados de uma categoria existente"""
@@ -42,7 +48,9 @@ class CategoriasServices:
         categoria.updated_by_name = current_user.name.nome_completo
 
         # Envia para o repositório selecionado em empresas_controllrer salvar
-        return self.repository.save(categoria)
+        categoria_id = self.repository.save(categoria)
+        categorias_summary_cache.invalidate(categoria.empresa_id)
+        return categoria_id
 
     def update_status(self, categoria: ProdutoCategorias, current_user: Usuario, status: RegistrationStatus) -> bool:
         """Atualiza o status de uma categoria existente"""
@@ -69,6 +77,7 @@ class CategoriasServices:
                 categoria.deleted_by_name = current_user.name.nome_completo
 
         id = self.repository.save(categoria)
+        categorias_summary_cache.invalidate(categoria.empresa_id)
         return True if id else False
 
     def get_by_id(self, categoria_id: str) -> ProdutoCategorias | None:
@@ -82,7 +91,7 @@ class CategoriasServices:
     def get_summary(self, empresa_id: str) -> list[dict[str, Any]]:
         """
         Obtém um resumo (ID, nome, descrição) de todas as categorias ativas
-        de uma empresa, ordenadas por nome.
+        de uma empresa, ordenadas por nome. O resultado é mantido em cache por empresa.
 
         Somente as categorias com status "ACTIVE" são incluídas.
 
@@ -98,9 +107,29 @@ class CategoriasServices:
             ValueError: Se empresa_id for nulo ou vazio.
             Exception: Para erros de Firebase ou outros erros inesperados (re-lançados).
         """
-        return self.repository.get_active_categorias_summary(empresa_id)
+        return categorias_summary_cache.get(
+            empresa_id,
+            loader=lambda: self.repository.get_active_categorias_summary(empresa_id),
+            watcher=lambda callback: self.repository.watch_active_categorias_summary(empresa_id, callback),
+        )
 
     def get_active_id(self, company_id: str, name: str) -> str | None:
         """Obtem o ID da categoria pelo nome da categoria"""
         name = name.strip().lower()
         return self.repository.get_active_id_by_name(company_id=company_id, name=name)
+
+    def bulk_update_status(self, empresa_id: str, categoria_ids: list[str], current_user: Usuario, status: RegistrationStatus,
+                           on_progress: Callable[[int], None] | None = None) -> int:
+        """Muda o status de várias categorias em lote (envio à lixeira ou restauração em massa)."""
+        if not current_user.id:
+            raise ValueError("ID do usuário é necessário")
+        count = self.repository.bulk_update_status(empresa_id, categoria_ids, status, current_user.id,
+                                                   current_user.name.nome_completo, on_progress)
+        categorias_summary_cache.invalidate(empresa_id)
+        return count
+
+    def bulk_hard_delete(self, empresa_id: str, categoria_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """Exclui definitivamente, em lote, as categorias que estão na lixeira."""
+        count = self.repository.bulk_hard_delete(empresa_id, categoria_ids, on_progress)
+        categorias_summary_cache.invalidate(empresa_id)
+        return count
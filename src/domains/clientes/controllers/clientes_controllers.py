@@ -1,15 +1,18 @@
 import logging
+from typing import Callable
 
 from src.domains.clientes.models.clientes_model import Cliente
 from src.domains.clientes.repositories.implementations.firebase_clientes_repository import FirebaseClientesRepository
 from src.domains.clientes.services.clientes_services import ClientesServices
 from src.domains.shared.models.registration_status import RegistrationStatus
 from src.domains.usuarios.models.usuarios_model import Usuario
+from src.shared.metrics import instrument_controller
 
 
 logger = logging.getLogger(__name__)
 
 
+@instrument_controller("clientes")
 def handle_save(cliente: Cliente, current_user: Usuario) -> dict:
     """Salva ou atualiza um cliente.
 
@@ -50,6 +53,7 @@ def handle_save(cliente: Cliente, current_user: Usuario) -> dict:
     return response
 
 
+@instrument_controller("clientes")
 def handle_get_by_id(cliente_id: str, empresa_logada: str) -> dict:
     """
     Obtém um cliente pelo seu ID.
@@ -92,6 +96,7 @@ def handle_get_by_id(cliente_id: str, empresa_logada: str) -> dict:
     return response
 
 
+@instrument_controller("clientes")
 def handle_get_all(empresa_logada: str, status_deleted: bool = False) -> dict:
     """
     Obtém todos os clientes da empresa logada.
@@ -128,6 +133,7 @@ def handle_get_all(empresa_logada: str, status_deleted: bool = False) -> dict:
     return response
 
 
+@instrument_controller("clientes")
 def handle_update_status(cliente: Cliente, current_user: Usuario, status: RegistrationStatus) -> dict:
     """Manipula o status para ativo, inativo ou deletado de um cliente."""
     response = {}
@@ -170,6 +176,7 @@ def handle_update_status(cliente: Cliente, current_user: Usuario, status: Regist
     return response
 
 
+@instrument_controller("clientes")
 def handle_get_by_name_cpf_or_phone(empresa_id: str, research_data: str) -> dict:
     """
     Obtém uma lista de clientes ativos pelo nome, CPF ou telefone.
@@ -209,3 +216,80 @@ def handle_get_by_name_cpf_or_phone(empresa_id: str, research_data: str) -> dict
         response["message"] = str(e)
 
     return response
+
+
+@instrument_controller("clientes")
+def handle_bulk_update_status(empresa_id: str, cliente_ids: list[str], current_user: Usuario, status: RegistrationStatus,
+                              on_progress: Callable[[int], None] | None = None) -> dict:
+    """
+    Muda em lote o status de vários clientes (envio à lixeira ou restauração em massa).
+
+    Args:
+        empresa_id (str): ID da empresa logada
+        cliente_ids (list[str]): IDs dos clientes
+        current_user (Usuario): Usuário logado, gravado nos campos de auditoria
+        status (RegistrationStatus): Novo status
+        on_progress (Callable | None): Recebe o total de registros processados após cada lote gravado
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (int): Quantidade de clientes atualizados.
+    """
+    response = {}
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa logada não pode ser nulo ou vazio")
+        if not isinstance(current_user, Usuario) or not current_user.id:
+            raise ValueError("Usuário logado é necessário para alterar o status")
+        if not isinstance(status, RegistrationStatus):
+            raise ValueError("Status não é do tipo RegistrationStatus")
+
+        repository = FirebaseClientesRepository(empresa_id)
+        services = ClientesServices(repository)
+
+        response["status"] = "success"
+        response["data"] = services.bulk_update_status(cliente_ids, current_user, status, on_progress)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+        logger.error("clientes_controllers.handle_bulk_update_status(ValueError). " + response["message"])
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+        logger.error(response["message"])
+
+    return response
+
+
+@instrument_controller("clientes")
+def handle_bulk_hard_delete(empresa_id: str, cliente_ids: list[str],
+                            on_progress: Callable[[int], None] | None = None) -> dict:
+    """
+    Exclui definitivamente, em lote, os clientes da lixeira (status 'DELETED').
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (int): Quantidade de clientes excluídos.
+    """
+    response = {}
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa logada não pode ser nulo ou vazio")
+
+        repository = FirebaseClientesRepository(empresa_id)
+        services = ClientesServices(repository)
+
+        response["status"] = "success"
+        response["data"] = services.bulk_hard_delete(cliente_ids, on_progress)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+        logger.error("clientes_controllers.handle_bulk_hard_delete(ValueError). " + response["message"])
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+        logger.error(response["message"])
+
+    return response
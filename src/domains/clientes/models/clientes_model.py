@@ -5,7 +5,7 @@ import logging
 from babel.dates import format_date
 from babel.core import Locale # Import para formatação de data localizada
 
-from src.domains.shared import Address, NomePessoa, PhoneNumber, RegistrationStatus
+from src.domains.shared import Address, NomePessoa, PhoneNumber, RegistrationStatus, hydrate
 from src.shared.utils.time_zone import format_datetime_to_utc_minus_3
 
 
@@ -167,9 +167,12 @@ class Cliente:
         return {k: v for k, v in dict_db.items() if v is not None}
 
     @classmethod
-    def from_dict(cls, data: dict) -> 'Cliente':
+    def from_dict(cls, data: dict, trusted: bool = False) -> 'Cliente':
         """
         Cria uma instância de Cliente a partir de um dicionário (geralmente do Firestore).
+
+        Com trusted=True (leituras do repositório), as validações e normalizações do __post_init__
+        (CPF, e-mail, auditoria) não são repetidas: o documento já foi validado quando foi gravado.
         """
         # Converte enums
         status_data = data.get("status", RegistrationStatus.ACTIVE)
@@ -191,7 +194,7 @@ class Cliente:
         try:
             name_data = data.get("name")
             if isinstance(name_data, dict):
-                name_obj = NomePessoa.from_dict(name_data)
+                name_obj = NomePessoa.from_dict(name_data, trusted=trusted)
             elif isinstance(name_data, NomePessoa):
                 name_obj = name_data
             else:
@@ -228,6 +231,9 @@ class Cliente:
         for key in ["name", "phone", "delivery_address", "status"]:
             data.pop(key, None)
 
+        if trusted:
+            return hydrate(cls, {**data, "name": name_obj, "phone": phone_obj,
+                                 "delivery_address": address_obj, "status": status})
         return cls(
             name=name_obj,
             phone=phone_obj,
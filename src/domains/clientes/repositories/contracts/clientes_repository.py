@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterator
 
 from src.domains.clientes.models.clientes_model import Cliente
+from src.domains.shared.models.registration_status import RegistrationStatus
 
 
 class ClientesRepository(ABC):
@@ -37,3 +39,22 @@ class ClientesRepository(ABC):
         """
         raise NotImplementedError(
             "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def iter_export_pages(self, page_size: int = 500) -> Iterator[list[tuple[str, dict[str, Any]]]]:
+        """Percorre todos os clientes da empresa logada em páginas de (ID, documento bruto), para exportação."""
+        raise NotImplementedError(
+            "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def bulk_update_status(self, cliente_ids: list[str], status: RegistrationStatus, current_user_id: str,
+                           current_user_name: str, on_progress: Callable[[int], None] | None = None) -> int:
+        """Muda o status de vários clientes em lote, com auditoria. Retorna a quantidade de clientes atualizados."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def bulk_hard_delete(self, cliente_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """Exclui definitivamente, em lote, os clientes que estão na lixeira. Retorna a quantidade de clientes excluídos."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
@@ -1,4 +1,5 @@
 import logging
+from typing import Any, Callable, Iterator
 
 from google.cloud.firestore_v1.base_query import FieldFilter
 from google.api_core import exceptions as google_api_exceptions
@@ -7,8 +8,9 @@ from src.domains.shared import RegistrationStatus
 
 from src.domains.clientes.models.clientes_model import Cliente
 from src.domains.clientes.repositories.contracts.clientes_repository import ClientesRepository
+from src.domains.shared.repositories.utils import hard_delete_in_batches, status_change_data, update_status_in_batches
 from src.shared.utils.deep_translator import deepl_translator
-from storage.data import get_firebase_app
+from storage.data import get_firebase_app, get_firestore_client, iter_query_pages, record_returned
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +33,7 @@ class FirebaseClientesRepository(ClientesRepository):
         Returns: None
         """
         get_firebase_app()
-        self.db = firestore.client()
+        self.db = get_firestore_client()
         self.collection = self.db.collection('clientes')
         self.empresa_id = empresa_id
 
@@ -82,7 +84,7 @@ class FirebaseClientesRepository(ClientesRepository):
 
                 cliente_data_from_db["id"] = doc_snapshot.id  # type: ignore
 
-                updated_cliente_obj = Cliente.from_dict(cliente_data_from_db)
+                updated_cliente_obj = Cliente.from_dict(cliente_data_from_db, trusted=True)
 
                 cliente.created_at = updated_cliente_obj.created_at
                 cliente.updated_at = updated_cliente_obj.updated_at
@@ -143,7 +145,7 @@ class FirebaseClientesRepository(ClientesRepository):
 
             cliente_data["id"] = doc_ref.id
 
-            return Cliente.from_dict(cliente_data)
+            return Cliente.from_dict(cliente_data, trusted=True)
         except exceptions.FirebaseError as e:
             logger.error(
                 f"Erro do Firebase ao buscar cliente por ID {cliente_id}: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
@@ -169,10 +171,11 @@ class FirebaseClientesRepository(ClientesRepository):
             Exception: Em caso de erro na operação de banco de dados.
         """
         try:
-            query = (self.collection
-                     .where(filter=FieldFilter("empresa_id", "==", self.empresa_id))
-                     .order_by("name.first_name_lower")
-                     .order_by("name.last_name_lower"))
+            query = self.collection.where(filter=FieldFilter("empresa_id", "==", self.empresa_id))
+            if status_deleted:
+                # Lixeira: lê somente os deletados (índice empresa_id, status, nome — ver firestore.indexes.json)
+                query = query.where(filter=FieldFilter("status", "==", RegistrationStatus.DELETED.name))
+            query = query.order_by("name.first_name_lower").order_by("name.last_name_lower")
 
             # ToDo: Após versão beta test, verificar se há necessidade de implementar leitura de 300 registros por vez
             docs = query.stream()
@@ -183,7 +186,7 @@ class FirebaseClientesRepository(ClientesRepository):
                 clientes_data = doc.to_dict()
                 if clientes_data:
                     clientes_data["id"] = doc.id
-                    cliente_obj = Cliente.from_dict(clientes_data)
+                    cliente_obj = Cliente.from_dict(clientes_data, trusted=True)
 
                     if cliente_obj.status == RegistrationStatus.DELETED:
                         quantidade_deletados += 1
@@ -198,6 +201,7 @@ class FirebaseClientesRepository(ClientesRepository):
                 else:
                     logger.warning(f"Documento {doc.id} está vazio. Talvez os campos não existam na base de dados.")
 
+            record_returned(len(clientes_result))
             return clientes_result, quantidade_deletados
 
         except google_api_exceptions.FailedPrecondition as e:
@@ -298,7 +302,7 @@ class FirebaseClientesRepository(ClientesRepository):
                                 clientes_data = doc.to_dict()
                                 if clientes_data:
                                     clientes_data["id"] = doc.id
-                                    cliente_obj = Cliente.from_dict(clientes_data)
+                                    cliente_obj = Cliente.from_dict(clientes_data, trusted=True)
                                     clientes_result.append(cliente_obj)
                                     found_ids.add(doc.id)
                     except Exception as query_error:
@@ -322,7 +326,7 @@ class FirebaseClientesRepository(ClientesRepository):
                                 if (research_clean in cliente_phone and
                                         len(research_clean) >= 3):  # Mínimo 3 dígitos para busca
                                     clientes_data["id"] = doc.id
-                                    cliente_obj = Cliente.from_dict(clientes_data)
+                                    cliente_obj = Cliente.from_dict(clientes_data, trusted=True)
                                     clientes_result.append(cliente_obj)
                                     found_ids.add(doc.id)
                 except Exception as phone_error:
@@ -334,6 +338,7 @@ class FirebaseClientesRepository(ClientesRepository):
                 x.name.last_name if x.name and x.name.last_name else ''
             ))
 
+            record_returned(len(clientes_result))
             return clientes_result
 
         except google_api_exceptions.FailedPrecondition as e:
@@ -369,3 +374,45 @@ class FirebaseClientesRepository(ClientesRepository):
             logger.error(
                 f"Erro inesperado (Tipo: {type(e)}) ao consultar lista de cliente da empresa logada: {e}")
             raise
+
+    def iter_export_pages(self, page_size: int = 500) -> Iterator[list[tuple[str, dict[str, Any]]]]:
+        """
+        Percorre todos os clientes da empresa logada (inclusive excluídos) em páginas de documentos
+        brutos, sem montar objetos Cliente: usado pela exportação, com memória limitada a uma página.
+        """
+        query = self.collection.where(filter=FieldFilter("empresa_id", "==", self.empresa_id))
+        yield from iter_query_pages(query, page_size)
+
+    def bulk_update_status(self, cliente_ids: list[str], status: RegistrationStatus, current_user_id: str,
+                           current_user_name: str, on_progress: Callable[[int], None] | None = None) -> int:
+        """
+        Muda o status de vários clientes (lixeira, restauração) em transações de até 500 documentos,
+        com os campos de auditoria do novo status e timestamps do servidor, sem reler os documentos.
+
+        Returns:
+            int: Quantidade de clientes atualizados.
+        """
+        refs = [self.collection.document(cliente_id) for cliente_id in cliente_ids]
+        try:
+            return update_status_in_batches(self.db, refs, status_change_data(status, current_user_id, current_user_name),
+                                            empresa_id=self.empresa_id, on_progress=on_progress)
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao atualizar o status de {len(refs)} clientes: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            translated_error = deepl_translator(str(e))
+            raise Exception(f"Erro ao atualizar o status dos clientes: {translated_error}")
+
+    def bulk_hard_delete(self, cliente_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """
+        Exclui definitivamente, em transações de até 500 documentos, os clientes informados que
+        estão na lixeira (status 'DELETED'); os demais são ignorados.
+
+        Returns:
+            int: Quantidade de clientes excluídos.
+        """
+        refs = [self.collection.document(cliente_id) for cliente_id in cliente_ids]
+        try:
+            return hard_delete_in_batches(self.db, refs, empresa_id=self.empresa_id, on_progress=on_progress)
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao excluir {len(refs)} clientes: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            translated_error = deepl_translator(str(e))
+            raise Exception(f"Erro ao excluir definitivamente os clientes: {translated_error}")
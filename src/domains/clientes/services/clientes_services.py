@@ -1,3 +1,5 @@
+from typing import Callable
+
 from src.domains.clientes.models.clientes_model import Cliente
 from src.domains.clientes.repositories.contracts.clientes_repository import ClientesRepository
 from src.domains.shared.models.nome_pessoa import NomePessoa
@@ -112,3 +114,17 @@ class ClientesServices:
             # Status não foi alterado, retorna o status anterior ao objeto
             cliente.status = previous_status
         return id is not None
+
+
+    def bulk_update_status(self, cliente_ids: list[str], current_user: Usuario, status: RegistrationStatus,
+                           on_progress: Callable[[int], None] | None = None) -> int:
+        """Muda o status de vários clientes em lote (envio à lixeira ou restauração em massa)."""
+        if not current_user.id:
+            raise ValueError("ID do usuário é necessário")
+        return self.repository.bulk_update_status(cliente_ids, status, current_user.id,
+                                                  current_user.name.nome_completo, on_progress)
+
+
+    def bulk_hard_delete(self, cliente_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """Exclui definitivamente, em lote, os clientes que estão na lixeira."""
+        return self.repository.bulk_hard_delete(cliente_ids, on_progress)
@@ -69,6 +69,12 @@ class ClienteGridUI:
             on_click=self._on_add_clicked
         )
 
+        self.fab_export = ft.FloatingActionButton(
+            tooltip="Exportar clientes (CSV/Parquet)",
+            icon=ft.Icons.DOWNLOAD,
+            on_click=self._on_export_clicked
+        )
+
         self.fab_trash = ft.FloatingActionButton(
             content=ft.Image(
                 src="icons/recycle_empy_1771.png",
@@ -82,7 +88,7 @@ class ClienteGridUI:
         )
 
         return ft.Column(
-            controls=[self.fab_add, self.fab_trash],
+            controls=[self.fab_add, self.fab_export, self.fab_trash],
             alignment=ft.MainAxisAlignment.END,
         )
 
@@ -158,6 +164,9 @@ class ClienteGridUI:
     def _on_add_clicked(self, e):
         self.controller.execute_action_async("INSERT", None)
 
+    def _on_export_clicked(self, e):
+        self.controller.execute_action_async("EXPORT", None)
+
     def _apply_filters(self):
         """Aplica filtros e atualiza a UI"""
         self.controller.state.search_text = self.search_field.value or ""
@@ -13,10 +13,12 @@ from src.domains.shared import RegistrationStatus
 from src.domains.empresas.repositories.implementations.firebase_empresas_repository import FirebaseEmpresasRepository
 from src.domains.empresas.services.empresas_services import EmpresasServices
 from src.domains.usuarios.models.usuarios_model import Usuario
+from src.shared.metrics import instrument_controller
 
 logger = logging.getLogger(__name__)
 
 
+@instrument_controller("empresas")
 def handle_save_empresas(empresa: Empresa, current_user: Usuario) -> dict:
     """
     Manipula a operação de salvar empresa.
@@ -74,6 +76,7 @@ def handle_save_empresas(empresa: Empresa, current_user: Usuario) -> dict:
     return response
 
 
+@instrument_controller("empresas")
 def handle_get_empresas_by_id(id: str) -> dict:
     """
     Manipula a operação de buscar empresa.
@@ -130,6 +133,7 @@ def handle_get_empresas_by_id(id: str) -> dict:
     return response
 
 
+@instrument_controller("empresas")
 def handle_get_empresas_by_cnpj(cnpj: CNPJ) -> dict:
     """
     Manipula a operação de buscar empresa.
@@ -188,6 +192,7 @@ def handle_get_empresas_by_cnpj(cnpj: CNPJ) -> dict:
     return response
 
 
+@instrument_controller("empresas")
 def handle_get_empresas(ids_empresas: set[str]|list[str], empresas_inativas: bool = False) -> dict[str, Any]:
     """
     Busca todas as empresas do usuário logado que sejam ativa ou não, dependendo do empresas_inativas desejado.
@@ -245,6 +250,7 @@ def handle_get_empresas(ids_empresas: set[str]|list[str], empresas_inativas: boo
     return response
 
 
+@instrument_controller("empresas")
 def handle_update_status_empresas(empresa: Empresa, current_user: Usuario, status: RegistrationStatus) -> dict:
     """
     Manipula a operação de status para ativo, deletedo ou arquivado de uma empresa no banco de dados.
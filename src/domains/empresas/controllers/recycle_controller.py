@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Optional
 
@@ -26,11 +27,14 @@ class RecycleController:
             return
 
         self.ui.show_loading()
+        if self.page.client_storage:
+            self.page.update()  # Recarga: exibe o esqueleto enquanto a lixeira é relida
         set_empresas = get_current_user(self.page).empresas or set()
 
         try:
             if set_empresas:
-                result = company_controllers.handle_get_empresas(ids_empresas=set_empresas, empresas_inativas=True)
+                result = await asyncio.to_thread(company_controllers.handle_get_empresas,
+                                                 ids_empresas=set_empresas, empresas_inativas=True)
                 if result["status"] == "success":
                     self._empresas_data = result['data']['empresas']
                     self._empresas_inactivated = result['data']['inactivated']
@@ -9,7 +9,7 @@ from src.domains.empresas.models.cnpj import CNPJ  # Importação direta
 from src.domains.empresas.models.empresas_model import Empresa  # Importação direta
 from src.domains.empresas.repositories.contracts.empresas_repository import EmpresasRepository
 from src.shared.utils import deepl_translator
-from storage.data import get_firebase_app
+from storage.data import get_firebase_app, get_firestore_client
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ class FirebaseEmpresasRepository(EmpresasRepository):
         # fb_app = get_firebase_app()
         get_firebase_app()
 
-        self.db = firestore.client()
+        self.db = get_firestore_client()
         # self.transaction = self.db.transaction()
         self.collection = self.db.collection('empresas')
 
@@ -282,13 +282,13 @@ class FirebaseEmpresasRepository(EmpresasRepository):
             # Se o argumento ids_empresas for um conjunto (set), converte para lista
             ids_empresas_list = list(ids_empresas)
 
-            # Buscar documentos diretamente pelos IDs
+            # Buscar documentos diretamente pelos IDs, em uma única chamada (get_all)
             empresas = []
             quantidade_nao_ativas = 0
 
-            for empresa_id in ids_empresas_list:
-                doc_ref = self.collection.document(empresa_id)
-                doc = doc_ref.get()
+            doc_refs = [self.collection.document(empresa_id) for empresa_id in ids_empresas_list]
+            for doc in (self.db.get_all(doc_refs) if doc_refs else []):
+                empresa_id = doc.id
                 if doc.exists:
                     empresa_data = doc.to_dict()
                     if empresa_data.get('status') != 'ACTIVE':
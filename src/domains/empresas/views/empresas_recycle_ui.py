@@ -2,7 +2,7 @@ import flet as ft
 from typing import TYPE_CHECKING
 
 from src.pages.partials.app_bars.appbar import create_appbar_back
-from src.pages.shared.components import create_recycle_bin_card
+from src.pages.shared.components import create_recycle_bin_card, create_recycle_bin_skeleton
 from src.shared.utils import format_datetime_to_utc_minus_3
 
 if TYPE_CHECKING:
@@ -15,8 +15,8 @@ class EmpresasRecycleUI:
         self.controller = controller
 
         self.loading_container = ft.Container(
-            content=ft.ProgressRing(width=32, height=32, stroke_width=3),
-            alignment=ft.alignment.center,
+            content=create_recycle_bin_skeleton(),
+            alignment=ft.alignment.top_center,
             expand=True,
             visible=True
         )
@@ -1,11 +1,12 @@
 import logging
-from typing import Any
+from typing import Any, Callable
 
 from firebase_admin import exceptions
 from src.domains.formas_pagamento.models.formas_pagamento_model import FormaPagamento
 from src.domains.formas_pagamento.services.formas_pagamento_service import FormasPagamentoService
 from src.domains.shared.models.registration_status import RegistrationStatus
 from src.domains.usuarios.models.usuarios_model import Usuario
+from src.shared.metrics import instrument_controller
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ class FormasPagamentoController:
         """
         self.service = service
 
+    @instrument_controller("formas_pagamento")
     def get_formas_pagamento(self, empresa_id: str, status_deleted: bool = False) -> tuple[list[FormaPagamento], int]:
         """
         Obtém todas as formas de pagamento para uma empresa, com tratamento de status.
@@ -38,6 +40,7 @@ class FormasPagamentoController:
                 f"Erro no controller ao obter formas de pagamento: {e}")
             raise  # Re-lança para ser tratado em uma camada superior (ex: API)
 
+    @instrument_controller("formas_pagamento")
     def get_formas_pagamento_summary(self, empresa_id: str) -> dict[str, Any]:
         """
         Obtém um resumo das formas de pagamento para uma empresa.
@@ -69,6 +72,7 @@ class FormasPagamentoController:
         return response
 
 
+    @instrument_controller("formas_pagamento")
     def get_forma_pagamento(self, empresa_id: str, forma_pagamento_id: str) -> FormaPagamento | None:
         """
         Obtém uma forma de pagamento específica pelo ID.
@@ -87,6 +91,7 @@ class FormasPagamentoController:
                 f"Erro no controller ao obter forma de pagamento por ID: {e}")
             raise
 
+    @instrument_controller("formas_pagamento")
     def save_forma_pagamento(self, forma_pagamento: FormaPagamento, current_user: Usuario) -> dict[str,str]:
         """
         Cria uma nova forma de pagamento.
@@ -115,6 +120,7 @@ class FormasPagamentoController:
             logger.error(f"Erro inesperado ao salvar forma de pagamento: {e}")
             return {"status": "error", "message": "Erro inesperado. Consulte o suporte técnico."}
 
+    @instrument_controller("formas_pagamento")
     def delete_forma_pagamento(self, forma_pagamento: FormaPagamento, current_user: Usuario) -> dict[str,str]:
         if not forma_pagamento.id:
             logger.error("ID da forma de pagamento não encontrado.")
@@ -133,6 +139,7 @@ class FormasPagamentoController:
             logger.error(f"Erro inesperado no 'SOFT DELETE' forma de pagamento: {e}")
             return {"status": "error", "message": "Erro inesperado. Consulte o suporte técnico."}
 
+    @instrument_controller("formas_pagamento")
     def restore_from_trash_forma_pagamento(self, forma_pagamento: FormaPagamento, current_user: Usuario) -> dict[str,str]:
         if not forma_pagamento.id:
             logger.error("ID da forma de pagamento não encontrado.")
@@ -150,3 +157,36 @@ class FormasPagamentoController:
         except Exception as e:
             logger.error(f"Erro inesperado no 'SOFT DELETE' forma de pagamento: {e}")
             return {"status": "error", "message": "Erro inesperado. Consulte o suporte técnico."}
+
+    @instrument_controller("formas_pagamento")
+    def bulk_update_status(self, empresa_id: str, forma_pagamento_ids: list[str], current_user: Usuario,
+                           status: RegistrationStatus, on_progress: Callable[[int], None] | None = None) -> dict[str, Any]:
+        """Muda em lote o status de várias formas de pagamento; 'data' é a quantidade atualizada."""
+        if not current_user or not current_user.id:
+            return {"status": "error", "message": "Usuário logado é necessário para alterar o status."}
+        try:
+            count = self.service.bulk_update_status(empresa_id, forma_pagamento_ids, current_user, status, on_progress)
+            return {"status": "success", "data": count}
+        except ValueError as ve:
+            logger.error(f"Erro de validação na mudança de status em lote das formas de pagamento: {ve}")
+            return {"status": "error", "message": f"Erro de validação: {str(ve)}"}
+        except exceptions.FirebaseError as fe:
+            logger.error(f"Erro do Firebase na mudança de status em lote das formas de pagamento: {fe}")
+            return {"status": "error", "message": "Falha ao alterar o status. Tente novamente mais tarde."}
+        except Exception as e:
+            logger.error(f"Erro inesperado na mudança de status em lote das formas de pagamento: {e}")
+            return {"status": "error", "message": "Erro inesperado. Consulte o suporte técnico."}
+
+    @instrument_controller("formas_pagamento")
+    def bulk_hard_delete(self, empresa_id: str, forma_pagamento_ids: list[str],
+                         on_progress: Callable[[int], None] | None = None) -> dict[str, Any]:
+        """Exclui definitivamente, em lote, as formas de pagamento da lixeira; 'data' é a quantidade excluída."""
+        try:
+            count = self.service.bulk_hard_delete(empresa_id, forma_pagamento_ids, on_progress)
+            return {"status": "success", "data": count}
+        except exceptions.FirebaseError as fe:
+            logger.error(f"Erro do Firebase na exclusão em lote das formas de pagamento: {fe}")
+            return {"status": "error", "message": "Falha ao excluir. Tente novamente mais tarde."}
+        except Exception as e:
+            logger.error(f"Erro inesperado na exclusão em lote das formas de pagamento: {e}")
+            return {"status": "error", "message": "Erro inesperado. Consulte o suporte técnico."}
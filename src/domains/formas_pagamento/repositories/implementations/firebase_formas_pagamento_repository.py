@@ -1,13 +1,14 @@
 import logging
 
-from typing import Any
+from typing import Any, Callable
 from firebase_admin import firestore, exceptions
 from google.api_core import exceptions as google_api_exceptions
 from google.cloud.firestore_v1.base_query import FieldFilter
 
 from src.domains.formas_pagamento.models.formas_pagamento_model import FormaPagamento
 from src.domains.shared import RegistrationStatus
-from storage.data import get_firebase_app
+from src.domains.shared.repositories.utils import hard_delete_in_batches, status_change_data, update_status_in_batches
+from storage.data import get_firebase_app, get_firestore_client, record_returned
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +23,7 @@ class FirebaseFormasPagamentoRepository:
 
     def __init__(self):
         get_firebase_app()
-        self.db = firestore.client()
+        self.db = get_firestore_client()
         self.empresas_collection = self.db.collection('empresas')
 
     def _get_subcollection_ref(self, empresa_id: str):
@@ -137,8 +138,11 @@ class FirebaseFormasPagamentoRepository:
         quantity_deleted: int = 0
 
         try:
-            query = self._get_subcollection_ref(
-                empresa_id).order_by("order").order_by("name_lower")
+            query = self._get_subcollection_ref(empresa_id)
+            if status_deleted:
+                # Lixeira: lê somente os deletados (mesmo índice status, order, name_lower do resumo)
+                query = query.where(filter=FieldFilter("status", "==", RegistrationStatus.DELETED.name))
+            query = query.order_by("order").order_by("name_lower")
 
             docs = query.get()
 
@@ -160,6 +164,7 @@ class FirebaseFormasPagamentoRepository:
                     # Filtro: Não deletados [Ativos&Inativos] (padrão)
                     formas_pagamentos.append(fp)
 
+            record_returned(len(formas_pagamentos))
             return formas_pagamentos, quantity_deleted
         except google_api_exceptions.FailedPrecondition as e:
             logger.error(
@@ -188,12 +193,7 @@ class FirebaseFormasPagamentoRepository:
                      .order_by("order").order_by("name_lower"))
             docs = query.get()
 
-            return [{
-                "id": doc.id,
-                "name": doc.get("name"),
-                "percentage": doc.get("percentage"),
-                "percentage_type": doc.get("percentage_type")
-            } for doc in docs]
+            return self._summary_from_docs(docs)
         except google_api_exceptions.FailedPrecondition as e:
             # Esta é a exceção específica para erros de "índice ausente".
             # A mensagem de erro 'e' já contém o link para criar o índice.
@@ -235,3 +235,66 @@ class FirebaseFormasPagamentoRepository:
                 f"Erro inesperado (Tipo: {type(e)}, empresa_id {empresa_id}) ao consultar lista de resumo formas de pagamento: {e}"
             )
             raise
+
+    @staticmethod
+    def _summary_from_docs(docs) -> list[dict[str, Any]]:
+        """Converte os documentos de formas de pagamento no resumo (ID, name, percentage e percentage_type)."""
+        return [{
+            "id": doc.id,
+            "name": doc.get("name"),
+            "percentage": doc.get("percentage"),
+            "percentage_type": doc.get("percentage_type")
+        } for doc in docs]
+
+    def watch_summary(self, empresa_id: str, callback: Callable[[list[dict[str, Any]]], None]):
+        """
+        Registra um listener (on_snapshot) para o resumo das formas de pagamento ativas da empresa.
+
+        O callback recebe o resumo completo, na mesma ordem de get_summary, a cada alteração.
+        Listeners não suportam field mask (select), por isso os documentos vêm completos.
+
+        Returns:
+            Watch: Handle do listener; use unsubscribe() para cancelá-lo.
+        """
+        query = (self._get_subcollection_ref(empresa_id)
+                 .where(filter=FieldFilter("status", "==", RegistrationStatus.ACTIVE.name))
+                 .order_by("order").order_by("name_lower"))
+
+        def on_snapshot(docs, changes, read_time):
+            callback(self._summary_from_docs(docs))
+
+        return query.on_snapshot(on_snapshot)
+
+    def bulk_update_status(self, empresa_id: str, forma_pagamento_ids: list[str], status: RegistrationStatus, current_user_id: str,
+                           current_user_name: str, on_progress: Callable[[int], None] | None = None) -> int:
+        """
+        Muda o status de várias formas de pagamento (lixeira, restauração) em transações de até 500 documentos,
+        com os campos de auditoria do novo status e timestamps do servidor, sem reler os documentos.
+
+        Returns:
+            int: Quantidade de formas de pagamento atualizadas.
+        """
+        refs = [self._get_subcollection_ref(empresa_id).document(forma_pagamento_id) for forma_pagamento_id in forma_pagamento_ids]
+        try:
+            return update_status_in_batches(self.db, refs, status_change_data(status, current_user_id, current_user_name),
+                                            on_progress=on_progress)
+        except exceptions.FirebaseError as e:
+            logger.error(
+                f"Erro do Firebase ao atualizar o status de {len(refs)} formas de pagamento da empresa {empresa_id}: {e}")
+            raise
+
+    def bulk_hard_delete(self, empresa_id: str, forma_pagamento_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """
+        Exclui definitivamente, em transações de até 500 documentos, as formas de pagamento informadas que
+        estão na lixeira (status 'DELETED'); os demais são ignorados.
+
+        Returns:
+            int: Quantidade de formas de pagamento excluídas.
+        """
+        refs = [self._get_subcollection_ref(empresa_id).document(forma_pagamento_id) for forma_pagamento_id in forma_pagamento_ids]
+        try:
+            return hard_delete_in_batches(self.db, refs, on_progress=on_progress)
+        except exceptions.FirebaseError as e:
+            logger.error(
+                f"Erro do Firebase ao excluir {len(refs)} formas de pagamento da empresa {empresa_id}: {e}")
+            raise
@@ -1,15 +1,19 @@
 import logging
 
-from typing import Any
+from typing import Any, Callable
 
 from src.domains.formas_pagamento.models.formas_pagamento_model import FormaPagamento
 from src.domains.formas_pagamento.repositories.implementations import FirebaseFormasPagamentoRepository
 from src.domains.shared.models.registration_status import RegistrationStatus
 from src.domains.usuarios.models.usuarios_model import Usuario
+from src.shared.cache import ReferenceDataCache
 from src.shared.utils import get_uuid
 
 logger = logging.getLogger(__name__)
 
+# Resumo das formas de pagamento ativas por empresa, compartilhado por todas as sessões do processo
+formas_pagamento_summary_cache = ReferenceDataCache("formas_pagamento_summary")
+
 
 class FormasPagamentoService:
     def __init__(self, repository: FirebaseFormasPagamentoRepository):
@@ -42,6 +46,7 @@ class FormasPagamentoService:
     def get_summary(self, empresa_id: str) -> list[dict[str, Any]]:
         """
         Obtém um resumo das formas de pagamento ativas para uma determinada empresa.
+        O resultado é mantido em cache por empresa.
 
         Args:
             empresa_id (str): ID da empresa.
@@ -50,7 +55,11 @@ class FormasPagamentoService:
             list[dict[str, Any]]: Resumo das formas de pagamento.
         """
         try:
-            return self.repository.get_summary(empresa_id)
+            return formas_pagamento_summary_cache.get(
+                empresa_id,
+                loader=lambda: self.repository.get_summary(empresa_id),
+                watcher=lambda callback: self.repository.watch_summary(empresa_id, callback),
+            )
         except Exception as e:
             logger.error(
                 f"Erro ao obter resumo formas de pagamento para empresa {empresa_id}: {e}")
@@ -93,7 +102,9 @@ class FormasPagamentoService:
         forma_pagamento.created_by_id = current_user.id
         forma_pagamento.created_by_name = current_user.name.nome_completo
 
-        return self.repository.save(forma_pagamento)
+        forma_pagamento_id = self.repository.save(forma_pagamento)
+        formas_pagamento_summary_cache.invalidate(forma_pagamento.empresa_id)
+        return forma_pagamento_id
 
     def update_forma_pagamento(self, forma_pagamento: FormaPagamento, current_user: Usuario) -> str:
         """
@@ -109,7 +120,9 @@ class FormasPagamentoService:
         forma_pagamento.updated_by_id = current_user.id
         forma_pagamento.updated_by_name = current_user.name.nome_completo
 
-        return self.repository.save(forma_pagamento)
+        forma_pagamento_id = self.repository.save(forma_pagamento)
+        formas_pagamento_summary_cache.invalidate(forma_pagamento.empresa_id)
+        return forma_pagamento_id
 
     def delete_forma_pagamento(self, forma_pagamento: FormaPagamento, current_user: Usuario) -> str:
         """
@@ -129,7 +142,9 @@ class FormasPagamentoService:
         forma_pagamento.deleted_by_name = current_user.name.nome_completo
 
         try:
-            return self.repository.save(forma_pagamento)
+            forma_pagamento_id = self.repository.save(forma_pagamento)
+            formas_pagamento_summary_cache.invalidate(forma_pagamento.empresa_id)
+            return forma_pagamento_id
         except Exception as e:
             forma_pagamento.status = previous_status
             forma_pagamento.deleted_at = None
@@ -159,10 +174,28 @@ class FormasPagamentoService:
         forma_pagamento.updated_by_name = current_user.name.nome_completo
 
         try:
-            return self.repository.save(forma_pagamento)
+            forma_pagamento_id = self.repository.save(forma_pagamento)
+            formas_pagamento_summary_cache.invalidate(forma_pagamento.empresa_id)
+            return forma_pagamento_id
         except Exception as e:
             forma_pagamento.status = RegistrationStatus.DELETED
             forma_pagamento.updated_at = None
             forma_pagamento.updated_by_id = None
             forma_pagamento.updated_by_name = None
             raise
+
+    def bulk_update_status(self, empresa_id: str, forma_pagamento_ids: list[str], current_user: Usuario, status: RegistrationStatus,
+                           on_progress: Callable[[int], None] | None = None) -> int:
+        """Muda o status de várias formas de pagamento em lote (envio à lixeira ou restauração em massa)."""
+        if not current_user.id:
+            raise ValueError("ID do usuário é necessário")
+        count = self.repository.bulk_update_status(empresa_id, forma_pagamento_ids, status, current_user.id,
+                                                   current_user.name.nome_completo, on_progress)
+        formas_pagamento_summary_cache.invalidate(empresa_id)
+        return count
+
+    def bulk_hard_delete(self, empresa_id: str, forma_pagamento_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """Exclui definitivamente, em lote, as formas de pagamento que estão na lixeira."""
+        count = self.repository.bulk_hard_delete(empresa_id, forma_pagamento_ids, on_progress)
+        formas_pagamento_summary_cache.invalidate(empresa_id)
+        return count
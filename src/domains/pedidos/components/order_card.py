@@ -1,6 +1,6 @@
 import flet as ft
 
-from src.domains.pedidos.models import Pedido
+from src.domains.pedidos.models import PedidoHeader
 from src.domains.pedidos.models.pedidos_subclass import DeliveryStatus
 from src.domains.shared.models.registration_status import RegistrationStatus
 from src.shared.utils.time_zone import format_datetime_to_utc_minus_3
@@ -9,7 +9,7 @@ class OrderCard:
     """Componente reutilizável para card de pedido"""
 
     @staticmethod
-    def create(pedido: Pedido, on_action_callback) -> ft.Card:
+    def create(pedido: PedidoHeader, on_action_callback) -> ft.Card:
         """Cria um card individual do pedido"""
         return ft.Card(
             content=ft.Container(
@@ -32,7 +32,7 @@ class OrderCard:
         )
 
     @staticmethod
-    def _create_card_header(pedido: Pedido, on_action_callback) -> ft.Row:
+    def _create_card_header(pedido: PedidoHeader, on_action_callback) -> ft.Row:
         """Cria o cabeçalho do card com imagem e menu"""
         return ft.Row(
             [
@@ -51,7 +51,7 @@ class OrderCard:
         )
 
     @staticmethod
-    def _create_action_menu(pedido: Pedido, on_action_callback) -> ft.Container:
+    def _create_action_menu(pedido: PedidoHeader, on_action_callback) -> ft.Container:
         """Cria o menu de ações do pedido"""
         return ft.Container(
             content=ft.PopupMenuButton(
@@ -78,7 +78,7 @@ class OrderCard:
         )
 
     @staticmethod
-    def _create_status_row(pedido: Pedido) -> ft.Row:
+    def _create_status_row(pedido: PedidoHeader) -> ft.Row:
         """Cria a linha com status"""
         return ft.Row([
             ft.Text(
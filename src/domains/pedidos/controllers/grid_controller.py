@@ -1,7 +1,7 @@
 from typing import Callable, TYPE_CHECKING, Optional
 import asyncio
 import flet as ft
-from src.domains.pedidos.models import OrdGridState, Pedido
+from src.domains.pedidos.models import OrdGridState, PedidoHeader
 from src.domains.pedidos.models.pedidos_subclass import DeliveryStatus, OrderFilterType
 from src.domains.pedidos.controllers import pedidos_controllers as order_controllers
 from src.domains.shared import RegistrationStatus
@@ -19,12 +19,12 @@ class PedidoGridController:
         self.on_action = on_action
         self.ui_components: Optional['PedidoGridUI'] = None
 
-    def execute_action_async(self, action: str, pedido: Pedido | None):
+    def execute_action_async(self, action: str, pedido: PedidoHeader | None):
         """Executa a ação de forma assíncrona usando page.run_task."""
         if self.on_action: # self.on_action é o handle_action async
             self.page.run_task(self.on_action, action, pedido)
 
-    def _search_in_pedido(self, pedido: Pedido, search_lower: str) -> bool:
+    def _search_in_pedido(self, pedido: PedidoHeader, search_lower: str) -> bool:
         if pedido.order_number and search_lower in pedido.order_number:
             return True
         if pedido.client:
@@ -34,7 +34,7 @@ class PedidoGridController:
                 return True
         return False
 
-    def filter_pedidos(self) -> list[Pedido]:
+    def filter_pedidos(self) -> list[PedidoHeader]:
         """Aplica todos os filtros aos pedidos"""
         filtered = self.state.pedidos if self.state.pedidos else []
 
@@ -93,8 +93,8 @@ class PedidoGridController:
                 self.ui_components.render_grid(self.filter_pedidos())
 
     async def _fetch_pedidos_async(self, empresa_id: str) -> dict:
-        """Wrapper async para a chamada síncrona do controller"""
+        """Wrapper async para a chamada síncrona do controller (somente cabeçalhos, sem itens)"""
         return await asyncio.to_thread(
-            order_controllers.handle_get_pedidos_by_empresa_id,
+            order_controllers.handle_get_pedido_headers_by_empresa_id,
             empresa_id=empresa_id
         )
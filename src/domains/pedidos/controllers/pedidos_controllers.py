@@ -1,10 +1,17 @@
-from src.domains.pedidos.models.pedidos_model import Pedido
+from datetime import date
+from typing import Any, Callable
+
+from src.domains.pedidos.models.pedidos_model import Pedido, PedidoHeader
+from src.domains.pedidos.repositories.implementations.firebase_pedidos_archive_repository import FirebasePedidosArchiveRepository
 from src.domains.pedidos.repositories.implementations.firebase_pedidos_repository import FirebasePedidosRepository
+from src.domains.pedidos.services.pedidos_archive_services import PedidosArchiveServices
 from src.domains.pedidos.services.pedidos_services import PedidosServices
 from src.domains.shared.models.registration_status import RegistrationStatus
 from src.domains.usuarios.models.usuarios_model import Usuario
+from src.shared.metrics import instrument_controller
 
 
+@instrument_controller("pedidos")
 def handle_save_pedido(pedido: Pedido, current_user: Usuario) -> dict:
     """Cria ou atualiza um pedido."""
     response = {}
@@ -38,6 +45,7 @@ def handle_save_pedido(pedido: Pedido, current_user: Usuario) -> dict:
     return response
 
 
+@instrument_controller("pedidos")
 def handle_get_pedido_by_id(pedido_id: str) -> dict:
     """Busca um pedido pelo seu ID."""
     response = {}
@@ -66,6 +74,7 @@ def handle_get_pedido_by_id(pedido_id: str) -> dict:
     return response
 
 
+@instrument_controller("pedidos")
 def handle_get_pedidos_by_empresa_id(empresa_id: str, status: RegistrationStatus | None = None) -> dict:
     """Busca todos os pedidos de uma empresa."""
     response = {}
@@ -93,7 +102,65 @@ def handle_get_pedidos_by_empresa_id(empresa_id: str, status: RegistrationStatus
     return response
 
 
-def handle_delete_pedido(pedido: Pedido, current_user: Usuario) -> dict:
+@instrument_controller("pedidos")
+def handle_get_pedido_headers_by_empresa_id(empresa_id: str, status: RegistrationStatus | None = None) -> dict:
+    """Busca os cabeçalhos (sem itens) dos pedidos de uma empresa, para as listagens."""
+    response = {}
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa é necessário para busca.")
+
+        repository = FirebasePedidosRepository()
+        services = PedidosServices(repository)
+
+        pedidos, quantidade_deletados = services.get_pedido_headers_by_empresa_id(empresa_id, status)
+
+        response["status"] = "success"
+        response["data"] = {
+            "pedidos": pedidos,
+            "quantidade_deletados": quantidade_deletados
+        }
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = f"Erro ao buscar pedidos: {str(e)}"
+
+    return response
+
+
+@instrument_controller("pedidos")
+def handle_get_pedido_items(pedido_id: str) -> dict:
+    """Busca somente os itens de um pedido (carregados sob demanda pela listagem)."""
+    response = {}
+    try:
+        if not pedido_id:
+            raise ValueError("ID do pedido é necessário para busca.")
+
+        repository = FirebasePedidosRepository()
+        services = PedidosServices(repository)
+
+        items = services.get_pedido_items(pedido_id)
+
+        if items is not None:
+            response["status"] = "success"
+            response["data"] = items
+        else:
+            response["status"] = "error"
+            response["message"] = "Pedido não encontrado."
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = f"Erro ao buscar itens do pedido: {str(e)}"
+
+    return response
+
+
+@instrument_controller("pedidos")
+def handle_delete_pedido(pedido: Pedido | PedidoHeader, current_user: Usuario) -> dict:
     """Realiza um soft delete em um pedido, definindo deleted_at."""
     response = {}
     try:
@@ -122,7 +189,8 @@ def handle_delete_pedido(pedido: Pedido, current_user: Usuario) -> dict:
 
     return response
 
-def handle_restore_pedido_from_trash(pedido: Pedido, current_user: Usuario) -> dict:
+@instrument_controller("pedidos")
+def handle_restore_pedido_from_trash(pedido: Pedido | PedidoHeader, current_user: Usuario) -> dict:
     """Restaura um pedido da lixeira."""
     response = {}
     try:
@@ -150,3 +218,252 @@ def handle_restore_pedido_from_trash(pedido: Pedido, current_user: Usuario) -> d
         response["message"] = f"Erro ao restaurar pedido: {str(e)}"
 
     return response
+
+
+@instrument_controller("pedidos")
+def handle_archive_pedidos(empresa_id: str, batch_size: int | None = None, max_batches: int | None = None,
+                           on_progress: Callable[[int], None] | None = None) -> dict:
+    """
+    Move para o arquivo mensal os pedidos finalizados anteriores à janela de pedidos ativos
+    (PEDIDOS_HOT_WINDOW_DAYS). Em lotes e retomável: pode ser chamado novamente após uma interrupção.
+    """
+    response = {}
+    try:
+        repository = FirebasePedidosArchiveRepository()
+        services = PedidosArchiveServices(repository)
+
+        result = services.archive_old_pedidos(empresa_id, batch_size, max_batches, on_progress)
+
+        response["status"] = "success"
+        response["data"] = result
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = f"Erro ao arquivar pedidos: {str(e)}"
+
+    return response
+
+
+@instrument_controller("pedidos")
+def handle_get_archive_months(empresa_id: str) -> dict:
+    """Busca os meses arquivados da empresa com a quantidade e o total de pedidos de cada mês."""
+    response = {}
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa é necessário para busca.")
+
+        repository = FirebasePedidosArchiveRepository()
+        services = PedidosArchiveServices(repository)
+
+        response["status"] = "success"
+        response["data"] = services.get_archive_months(empresa_id)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = f"Erro ao buscar meses arquivados: {str(e)}"
+
+    return response
+
+
+@instrument_controller("pedidos")
+def handle_search_pedidos_archive(empresa_id: str, start_date: date | None = None, end_date: date | None = None,
+                                  page_size: int = 50, cursor: dict[str, Any] | None = None) -> dict:
+    """
+    Busca paginada nos pedidos arquivados (fora da janela de pedidos ativos).
+
+    Para a próxima página, chame novamente com o 'cursor' retornado; 'cursor' None indica a última página.
+    """
+    response = {}
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa é necessário para busca.")
+
+        repository = FirebasePedidosArchiveRepository()
+        services = PedidosArchiveServices(repository)
+
+        pedidos, next_cursor = services.search_archive(empresa_id, start_date, end_date, page_size, cursor)
+
+        response["status"] = "success"
+        response["data"] = {
+            "pedidos": pedidos,
+            "cursor": next_cursor
+        }
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = f"Erro ao buscar pedidos arquivados: {str(e)}"
+
+    return response
+
+
+@instrument_controller("pedidos")
+def handle_get_archived_pedido(empresa_id: str, pedido_id: str, order_date: date) -> dict:
+    """Busca um pedido arquivado completo (com itens), somente para consulta."""
+    response = {}
+    try:
+        if not empresa_id or not pedido_id:
+            raise ValueError("ID da empresa e do pedido são necessários para busca.")
+
+        repository = FirebasePedidosArchiveRepository()
+        services = PedidosArchiveServices(repository)
+
+        pedido = services.get_archived_pedido(empresa_id, pedido_id, order_date)
+
+        if pedido:
+            response["status"] = "success"
+            response["data"] = pedido
+        else:
+            response["status"] = "error"
+            response["message"] = "Pedido arquivado não encontrado."
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = f"Erro ao buscar pedido arquivado: {str(e)}"
+
+    return response
+
+
+@instrument_controller("pedidos")
+def handle_get_monthly_sales_report(empresa_id: str, year: int, month: int) -> dict:
+    """
+    Relatório de vendas do mês (totais, vendas por dia e por produto), lido dos resumos diários
+    mantidos a cada gravação de pedido.
+
+    Args:
+        empresa_id (str): ID da empresa logada
+        year (int): Ano
+        month (int): Mês (1 a 12)
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (dict): 'month', 'order_count', 'revenue_cents', 'items_sold', 'days' e 'products'.
+    """
+    response = {}
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa é necessário para o relatório de vendas.")
+
+        repository = FirebasePedidosRepository()
+        services = PedidosServices(repository)
+
+        response["status"] = "success"
+        response["data"] = services.get_monthly_sales_report(empresa_id, year, month)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = f"Erro ao gerar o relatório de vendas: {str(e)}"
+
+    return response
+
+
+@instrument_controller("pedidos")
+def handle_backfill_sales_rollups(empresa_id: str, page_size: int = 500,
+                                  on_progress: Callable[[int], None] | None = None) -> dict:
+    """
+    Soma aos resumos diários de vendas os pedidos da empresa gravados antes deles existirem.
+    Pode ser executado novamente após uma interrupção: os pedidos já somados são ignorados.
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (int): Quantidade de pedidos somados.
+    """
+    response = {}
+    try:
+        repository = FirebasePedidosRepository()
+        services = PedidosServices(repository)
+
+        response["status"] = "success"
+        response["data"] = services.backfill_sales_rollups(empresa_id, page_size, on_progress)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = f"Erro ao carregar os resumos de vendas: {str(e)}"
+
+    return response
+
+
+@instrument_controller("pedidos")
+def handle_bulk_update_status(empresa_id: str, pedido_ids: list[str], current_user: Usuario, status: RegistrationStatus,
+                              on_progress: Callable[[int], None] | None = None) -> dict:
+    """
+    Muda em lote o status de vários pedidos (envio à lixeira ou restauração em massa).
+
+    Args:
+        empresa_id (str): ID da empresa logada
+        pedido_ids (list[str]): IDs dos pedidos
+        current_user (Usuario): Usuário logado, gravado nos campos de auditoria
+        status (RegistrationStatus): Novo status
+        on_progress (Callable | None): Recebe o total de registros processados após cada lote gravado
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (int): Quantidade de pedidos atualizados.
+    """
+    response = {}
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa logada não pode ser nulo ou vazio")
+        if not isinstance(current_user, Usuario) or not current_user.id:
+            raise ValueError("Usuário logado é necessário para alterar o status")
+        if not isinstance(status, RegistrationStatus):
+            raise ValueError("Status não é do tipo RegistrationStatus")
+
+        repository = FirebasePedidosRepository()
+        services = PedidosServices(repository)
+
+        response["status"] = "success"
+        response["data"] = services.bulk_update_status(empresa_id, pedido_ids, current_user, status, on_progress)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = f"Erro ao alterar o status dos pedidos: {str(e)}"
+
+    return response
+
+
+@instrument_controller("pedidos")
+def handle_bulk_hard_delete(empresa_id: str, pedido_ids: list[str],
+                            on_progress: Callable[[int], None] | None = None) -> dict:
+    """
+    Exclui definitivamente, em lote, os pedidos da lixeira (status 'DELETED').
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (int): Quantidade de pedidos excluídos.
+    """
+    response = {}
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa logada não pode ser nulo ou vazio")
+
+        repository = FirebasePedidosRepository()
+        services = PedidosServices(repository)
+
+        response["status"] = "success"
+        response["data"] = services.bulk_hard_delete(empresa_id, pedido_ids, on_progress)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = f"Erro ao excluir os pedidos: {str(e)}"
+
+    return response
@@ -1,2 +1,3 @@
-from .pedidos_model import Pedido
-from .grid_model import OrdGridState
\ No newline at end of file
+from .pedidos_model import Pedido, PedidoHeader
+from .grid_model import OrdGridState
+from .order_draft import DraftLine, OrderDraft
\ No newline at end of file
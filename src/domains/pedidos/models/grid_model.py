@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 from enum import Enum
-from src.domains.pedidos.models import Pedido
+from src.domains.pedidos.models import PedidoHeader
 from src.domains.pedidos.models.pedidos_subclass import OrderFilterType
 
 @dataclass
 class OrdGridState:
     """Estado do grid de pedidos"""
-    pedidos: list[Pedido] | None = None
+    pedidos: list[PedidoHeader] | None = None
     inactive_count: int = 0
     filter_type: OrderFilterType = OrderFilterType.ALL
     search_text: str = ""
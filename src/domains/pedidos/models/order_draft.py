@@ -0,0 +1,184 @@
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Any, Iterable, Iterator
+
+from src.domains.pedidos.models.pedidos_model import PedidoItem, get_money_from_dict
+from src.shared.utils.money_numpy import Money
+
+
+def parse_cents(value: str | float | Decimal | None) -> int:
+    """
+    Converte um valor digitado na UI ('12,34', '12.34') para centavos.
+
+    Raises:
+        ValueError: Se o valor não for numérico.
+    """
+    if value is None or value == "":
+        return 0
+    try:
+        amount = Decimal(str(value).strip().replace(',', '.'))
+    except InvalidOperation:
+        raise ValueError(f"Valor inválido: {value}")
+    return int(amount.quantize(Decimal("0.01")) * 100)
+
+
+def format_cents(cents: int) -> str:
+    """Formata centavos para exibição no padrão brasileiro (1234 -> '12,34')."""
+    return f"{Decimal(cents) / 100:.2f}".replace('.', ',')
+
+
+@dataclass
+class DraftLine:
+    """Item do rascunho do pedido, com valores em centavos."""
+    product_id: str
+    description: str
+    quantity: int
+    unit_price_cents: int
+    unit_of_measure: str = "UN"
+
+    @property
+    def total_cents(self) -> int:
+        return self.quantity * self.unit_price_cents
+
+    def to_pedido_item(self, currency_symbol: str = "R$") -> PedidoItem:
+        return PedidoItem(
+            id=self.product_id,
+            description=self.description,
+            quantity=self.quantity,
+            unit_price=Money(self.unit_price_cents, currency_symbol),
+            total=Money(self.total_cents, currency_symbol),
+            unit_of_measure=self.unit_of_measure or "UN",
+        )
+
+
+class OrderDraft:
+    """
+    Rascunho dos itens de um pedido em edição.
+
+    Os itens são indexados pelo id do produto e os totais (valor em centavos, quantidade de
+    produtos) são mantidos incrementalmente: incluir, alterar e remover um item custam O(1),
+    independentemente do tamanho do pedido. A ordem de inclusão é preservada.
+    """
+
+    def __init__(self, currency_symbol: str = "R$"):
+        self.currency_symbol = currency_symbol
+        self._lines: dict[str, DraftLine] = {}
+        self._total_cents = 0
+        self._total_quantity = 0
+
+    def __contains__(self, product_id: object) -> bool:
+        return product_id in self._lines
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __iter__(self) -> Iterator[DraftLine]:
+        return iter(self._lines.values())
+
+    def get(self, product_id: str) -> DraftLine | None:
+        return self._lines.get(product_id)
+
+    def add(self, line: DraftLine) -> DraftLine:
+        """
+        Inclui um item.
+
+        Raises:
+            ValueError: Se o produto já estiver no pedido ou a quantidade/preço forem inválidos.
+        """
+        if line.product_id in self._lines:
+            raise ValueError("Produto já adicionado")
+        if line.quantity <= 0:
+            raise ValueError("Quantidade deve ser maior que zero")
+        if line.unit_price_cents <= 0:
+            raise ValueError("Valor unitário deve ser maior que zero")
+        self._lines[line.product_id] = line
+        self._total_cents += line.total_cents
+        self._total_quantity += line.quantity
+        return line
+
+    def update(self, product_id: str, quantity: int | None = None, unit_price_cents: int | None = None) -> DraftLine:
+        """Altera quantidade e/ou preço de um item, ajustando os totais pela diferença."""
+        line = self._lines[product_id]
+        new_quantity = line.quantity if quantity is None else quantity
+        new_price = line.unit_price_cents if unit_price_cents is None else unit_price_cents
+        if new_quantity <= 0:
+            raise ValueError("Quantidade deve ser maior que zero")
+        if new_price <= 0:
+            raise ValueError("Valor unitário deve ser maior que zero")
+        self._total_cents -= line.total_cents
+        self._total_quantity -= line.quantity
+        line.quantity = new_quantity
+        line.unit_price_cents = new_price
+        self._total_cents += line.total_cents
+        self._total_quantity += line.quantity
+        return line
+
+    def remove(self, product_id: str) -> DraftLine | None:
+        """Remove um item e retorna-o (None se não estava no pedido)."""
+        line = self._lines.pop(product_id, None)
+        if line is not None:
+            self._total_cents -= line.total_cents
+            self._total_quantity -= line.quantity
+        return line
+
+    def clear(self) -> None:
+        self._lines.clear()
+        self._total_cents = 0
+        self._total_quantity = 0
+
+    def load(self, items: Iterable[PedidoItem | dict[str, Any]]) -> None:
+        """
+        Substitui os itens pelos de um pedido salvo (PedidoItem ou dicts com Money, dict ou float).
+
+        O rascunho tem uma linha por produto: um produto repetido no pedido salvo tem a quantidade
+        somada à linha já carregada (com o preço unitário dela).
+        """
+        self.clear()
+        for item in items:
+            if isinstance(item, dict):
+                unit_price = get_money_from_dict(item.get("unit_price"))
+                line = DraftLine(
+                    product_id=item["id"],
+                    description=item.get("description", ""),
+                    quantity=int(item.get("quantity", 0)),
+                    unit_price_cents=unit_price.amount_cents,
+                    unit_of_measure=item.get("unit_of_measure") or "UN",
+                )
+            else:
+                unit_price = item.unit_price
+                line = DraftLine(item.id, item.description, item.quantity, unit_price.amount_cents,
+                                 item.unit_of_measure)
+            self.currency_symbol = unit_price.currency_symbol
+            # Sem as validações de add(): o pedido salvo é carregado como está
+            existing = self._lines.get(line.product_id)
+            if existing is not None:
+                self._total_cents -= existing.total_cents
+                self._total_quantity -= existing.quantity
+                existing.quantity += line.quantity
+                line = existing
+            self._lines[line.product_id] = line
+            self._total_cents += line.total_cents
+            self._total_quantity += line.quantity
+
+    @property
+    def total_cents(self) -> int:
+        return self._total_cents
+
+    @property
+    def total(self) -> Money:
+        """Valor total do pedido."""
+        return Money(self._total_cents, self.currency_symbol)
+
+    @property
+    def total_items(self) -> int:
+        """Número de itens (linhas) do pedido."""
+        return len(self._lines)
+
+    @property
+    def total_products(self) -> int:
+        """Soma das quantidades de todos os itens."""
+        return self._total_quantity
+
+    def to_pedido_items(self) -> list[PedidoItem]:
+        """Itens no formato do modelo Pedido, prontos para salvar."""
+        return [line.to_pedido_item(self.currency_symbol) for line in self._lines.values()]
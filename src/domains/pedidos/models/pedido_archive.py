@@ -0,0 +1,125 @@
+import os
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from src.domains.pedidos.models.pedidos_model import (
+    Pedido, PedidoHeader, PedidoItem, get_money_from_dict, parse_order_date, to_datetime,
+)
+from src.domains.pedidos.models.pedidos_subclass import DeliveryStatus
+from src.domains.shared import RegistrationStatus, hydrate
+from src.shared.utils.money_numpy import Money
+
+# Campos do cliente mantidos no arquivo (o restante, como endereço, não é usado na consulta)
+_ARCHIVE_CLIENT_FIELDS = ("name", "phone", "cpf", "email")
+
+
+def hot_window_cutoff(today: date | None = None) -> date | None:
+    """
+    Data inicial da janela de pedidos ativos (PEDIDOS_HOT_WINDOW_DAYS, padrão 365 dias).
+
+    Data de corte de uma nova execução do arquivamento: pedidos finalizados anteriores a ela vão
+    para o arquivo. A listagem padrão usa o corte do último arquivamento concluído (checkpoint),
+    não esta data. Retorna None se a janela estiver desabilitada (PEDIDOS_HOT_WINDOW_DAYS=0).
+    """
+    days = int(os.getenv('PEDIDOS_HOT_WINDOW_DAYS', '365'))
+    if days <= 0:
+        return None
+    return (today or date.today()) - timedelta(days=days)
+
+
+def archive_month(order_date: date) -> str:
+    """Mês de arquivamento do pedido, no formato 'AAAA-MM'."""
+    return f"{order_date.year:04d}-{order_date.month:02d}"
+
+
+def to_archive_dict(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Converte o documento de um pedido (como gravado por to_dict_db) para a forma compacta do arquivo.
+
+    Os valores ficam em centavos (int) e cada item vira uma lista
+    [id, descrição, quantidade, preço unitário em centavos, unidade]; o total do item e os
+    totais de itens/produtos são derivados na leitura.
+    """
+    order_date = parse_order_date(data.get("order_date"))
+    total_amount = get_money_from_dict(data.get("total_amount"))
+    client = data.get("client") or {}
+
+    items = []
+    for item in data.get("items", []):
+        unit_price = get_money_from_dict(item.get("unit_price"))
+        items.append([item["id"], item.get("description", ""), int(item.get("quantity", 0)),
+                      unit_price.amount_cents, item.get("unit_of_measure") or "UN"])
+
+    return {
+        "empresa_id": data["empresa_id"],
+        "order_number": data.get("order_number"),
+        "order_date": datetime.combine(order_date, datetime.min.time()),
+        "forma_pagamento_id": data.get("forma_pagamento_id"),
+        "total_cents": total_amount.amount_cents,
+        "currency_symbol": total_amount.currency_symbol,
+        "client": {k: client[k] for k in _ARCHIVE_CLIENT_FIELDS if client.get(k)},
+        "items": items,
+        "status": data.get("status", RegistrationStatus.ACTIVE.name),
+        "delivery_status": data.get("delivery_status", DeliveryStatus.DELIVERED.name),
+        "stock_reduction": data.get("stock_reduction", False),
+        "created_at": data.get("created_at"),
+        "created_by_id": data.get("created_by_id"),
+        "created_by_name": data.get("created_by_name"),
+        "updated_at": data.get("updated_at"),
+    }
+
+
+def _archive_items(data: dict[str, Any], currency_symbol: str) -> list[PedidoItem]:
+    return [
+        PedidoItem(id=product_id, description=description, quantity=quantity,
+                   unit_price=Money(unit_cents, currency_symbol),
+                   total=Money(unit_cents * quantity, currency_symbol), unit_of_measure=unit_of_measure)
+        for product_id, description, quantity, unit_cents, unit_of_measure in data.get("items", [])
+    ]
+
+
+def header_from_archive_dict(data: dict[str, Any], doc_id: str) -> PedidoHeader:
+    """Cabeçalho de um pedido arquivado (mesmo tipo usado pelas listagens do pedido ativo)."""
+    items = data.get("items", [])
+    return PedidoHeader(
+        id=doc_id,
+        empresa_id=data["empresa_id"],
+        order_number=data.get("order_number"),
+        order_date=parse_order_date(data.get("order_date")),
+        total_amount=Money(int(data.get("total_cents", 0)), data.get("currency_symbol", "R$")),
+        total_items=len(items),
+        total_products=sum(item[2] for item in items),
+        client=data.get("client") or {},
+        status=RegistrationStatus[data.get("status", RegistrationStatus.ACTIVE.name)],
+        delivery_status=DeliveryStatus[data.get("delivery_status", DeliveryStatus.DELIVERED.name)],
+        created_at=to_datetime(data.get("created_at")),
+        created_by_id=data.get("created_by_id"),
+        created_by_name=data.get("created_by_name"),
+        updated_at=to_datetime(data.get("updated_at")),
+    )
+
+
+def pedido_from_archive_dict(data: dict[str, Any], doc_id: str) -> Pedido:
+    """Pedido completo (com itens) a partir da forma compacta, para consulta. Não é regravado no arquivo."""
+    currency_symbol = data.get("currency_symbol", "R$")
+    items = _archive_items(data, currency_symbol)
+    # Dados já validados quando o pedido estava ativo: hidratação sem __post_init__
+    return hydrate(Pedido, {
+        "id": doc_id,
+        "empresa_id": data["empresa_id"],
+        "forma_pagamento_id": data.get("forma_pagamento_id"),
+        "order_number": data.get("order_number"),
+        "order_date": parse_order_date(data.get("order_date")),
+        "total_amount": Money(int(data.get("total_cents", 0)), currency_symbol),
+        "items": items,
+        "total_items": len(items),
+        "total_products": sum(item.quantity for item in items),
+        "stock_reduction": data.get("stock_reduction", False),
+        "client": dict(data.get("client") or {}),
+        "status": RegistrationStatus[data.get("status", RegistrationStatus.ACTIVE.name)],
+        "delivery_status": DeliveryStatus[data.get("delivery_status", DeliveryStatus.DELIVERED.name)],
+        "created_at": to_datetime(data.get("created_at")),
+        "created_by_id": data.get("created_by_id"),
+        "created_by_name": data.get("created_by_name"),
+        "updated_at": to_datetime(data.get("updated_at")),
+    })
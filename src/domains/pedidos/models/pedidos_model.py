@@ -3,12 +3,12 @@ from datetime import datetime, date, UTC, timedelta
 from typing import Any
 
 from src.domains.pedidos.models.pedidos_subclass import DeliveryStatus
-from src.domains.shared import Address
+from src.domains.shared import Address, hydrate
 from src.domains.shared.models.registration_status import RegistrationStatus
 from src.shared.utils.money_numpy import Money
 
 
-def _get_money_from_dict(value: Any) -> Money:
+def get_money_from_dict(value: Any) -> Money:
     """Converte um valor (dict, int, float) para um objeto Money."""
     if isinstance(value, Money):
         return value
@@ -22,6 +22,28 @@ def _get_money_from_dict(value: Any) -> Money:
     return Money.mint("0.00")  # Fallback para outros tipos
 
 
+def parse_order_date(value: Any) -> date:
+    """Converte a data do pedido vinda do banco (Timestamp, datetime, date ou ISO string) para date."""
+    if hasattr(value, 'to_datetime'):  # Timestamp do Firestore
+        return value.to_datetime().date()
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        # Parse de string no formato ISO (YYYY-MM-DD)
+        try:
+            return datetime.fromisoformat(value).date()
+        except ValueError:
+            pass
+    return date.today()  # Fallback
+
+
+def to_datetime(value: Any) -> Any:
+    """Converte Timestamp do Firestore para datetime; outros valores são mantidos."""
+    return value.to_datetime() if hasattr(value, 'to_datetime') else value
+
+
 @dataclass
 class PedidoItem:
     """
@@ -51,8 +73,8 @@ class PedidoItem:
             description=data["description"],
             quantity=data["quantity"],
             unit_of_measure=data["unit_of_measure"],
-            unit_price=_get_money_from_dict(data["unit_price"]),
-            total=_get_money_from_dict(data["total"]),
+            unit_price=get_money_from_dict(data["unit_price"]),
+            total=get_money_from_dict(data["total"]),
         )
 
 @dataclass
@@ -271,10 +293,15 @@ class Pedido:
         return {k: v for k, v in dict_db.items() if v is not None}
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any] | None, doc_id: str | None = None) -> "Pedido":
+    def from_dict(cls, data: dict[str, Any] | None, doc_id: str | None = None, trusted: bool = False) -> "Pedido":
         """
         Cria uma instância de Pedido a partir de um dicionário (geralmente do Firestore).
         Utiliza desempacotamento de dicionário (**) para maior manutenibilidade.
+
+        Args:
+            trusted (bool): Leitura de documento já gravado pelo sistema. As conversões de tipo são
+                feitas, mas as validações e normalizações do __post_init__ (recálculo do total,
+                dados do cliente, auditoria) não são repetidas. Use apenas nos repositórios.
         """
         if not data:
             raise ValueError("Dados inválidos para criar Pedido.")
@@ -298,28 +325,19 @@ class Pedido:
 
         # Timestamps do Firestore para datetime
         for key in ['created_at', 'updated_at', 'activated_at', 'inactivated_at', 'deleted_at']:
-            if key in processed_data and hasattr(processed_data[key], 'to_datetime'):
-                processed_data[key] = processed_data[key].to_datetime()
+            if key in processed_data:
+                processed_data[key] = to_datetime(processed_data[key])
 
         # Conversão da data do pedido
-        if 'order_date' in processed_data:
-            order_date = processed_data['order_date']
-            if hasattr(order_date, 'to_datetime'):  # Timestamp do Firestore
-                processed_data['order_date'] = order_date.to_datetime().date()
-            elif isinstance(order_date, datetime):
-                processed_data['order_date'] = order_date.date()
-            elif isinstance(order_date, str):
-                # Parse de string no formato ISO (YYYY-MM-DD)
-                try:
-                    processed_data['order_date'] = datetime.fromisoformat(order_date).date()
-                except ValueError:
-                    processed_data['order_date'] = date.today()  # Fallback
-        elif 'order_date' not in processed_data:
-            processed_data['order_date'] = date.today()
+        processed_data['order_date'] = parse_order_date(processed_data.get('order_date'))
 
         # Objetos aninhados
         if 'items' in processed_data:
-            processed_data['items'] = [PedidoItem.from_dict(item) for item in processed_data.get('items', [])]
+            # Itens já no formato do modelo (ex.: OrderDraft.to_pedido_items()) são usados como estão
+            processed_data['items'] = [
+                item if isinstance(item, PedidoItem) else PedidoItem.from_dict(item)
+                for item in processed_data.get('items', [])
+            ]
 
         if client := processed_data.get("client"):
             if address_data := client.get("address"):
@@ -327,7 +345,7 @@ class Pedido:
                     client["address"] = Address(**address_data)
 
         if 'total_amount' in processed_data:
-            processed_data['total_amount'] = _get_money_from_dict(processed_data['total_amount'])
+            processed_data['total_amount'] = get_money_from_dict(processed_data['total_amount'])
 
         # O Firestore armazena 'date' como um 'datetime', então convertemos de volta para 'date'.
         if client := processed_data.get("client"):
@@ -336,7 +354,8 @@ class Pedido:
                     client["birthday"] = birthday.date()
 
         # 3. Instancia a classe usando o dicionário processado
-        # O dataclass irá ignorar chaves extras que não são campos definidos.
+        if trusted:
+            return hydrate(cls, processed_data)
         return cls(**processed_data)
 
     def calcular_total(self) -> Money:
@@ -355,4 +374,68 @@ class Pedido:
         """
         self.total_amount = self.calcular_total()
         self.total_items = len(self.items)
-        self.total_products = sum(item.quantity for item in self.items)
\ No newline at end of file
+        self.total_products = sum(item.quantity for item in self.items)
+
+
+@dataclass
+class PedidoHeader:
+    """
+    Cabeçalho de um Pedido para as listagens (grid e lixeira).
+
+    Lido do banco com field mask, sem o array de itens: o custo de carregar a lista cresce com o
+    número de pedidos, não com o número de itens. Os itens são buscados sob demanda ao abrir ou
+    editar o pedido (ver handle_get_pedido_items e handle_get_pedido_by_id).
+    """
+    id: str
+    empresa_id: str
+    order_number: str | None
+    order_date: date
+    total_amount: Money
+    total_items: int = 0
+    total_products: int = 0
+    client: dict = field(default_factory=dict)  # Apenas 'name' e 'phone'
+    status: RegistrationStatus = RegistrationStatus.ACTIVE
+    delivery_status: DeliveryStatus = DeliveryStatus.PENDING
+
+    # Auditoria usada pelas ações da listagem (exclusão e restauração)
+    created_at: datetime | None = None
+    created_by_id: str | None = None
+    created_by_name: str | None = None
+    updated_at: datetime | None = None
+    activated_by_id: str | None = None
+    activated_by_name: str | None = None
+    deleted_at: datetime | None = None
+    deleted_by_id: str | None = None
+    deleted_by_name: str | None = None
+
+    @property
+    def client_name(self) -> str | None:
+        return self.client.get("name")
+
+    @property
+    def client_phone(self) -> str | None:
+        return self.client.get("phone")
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], doc_id: str) -> "PedidoHeader":
+        """Cria o cabeçalho a partir da projeção do documento (ver HEADER_FIELDS no repositório)."""
+        status = data.get("status")
+        delivery_status = data.get("delivery_status")
+        return cls(
+            id=doc_id,
+            empresa_id=data.get("empresa_id", ""),
+            order_number=data.get("order_number"),
+            order_date=parse_order_date(data.get("order_date")),
+            total_amount=get_money_from_dict(data.get("total_amount")),
+            total_items=data.get("total_items", 0),
+            total_products=data.get("total_products", 0),
+            client=data.get("client") or {},
+            status=RegistrationStatus[status] if isinstance(status, str) else RegistrationStatus.ACTIVE,
+            delivery_status=DeliveryStatus[delivery_status] if isinstance(delivery_status, str) else DeliveryStatus.PENDING,
+            created_at=to_datetime(data.get("created_at")),
+            created_by_id=data.get("created_by_id"),
+            created_by_name=data.get("created_by_name"),
+            updated_at=to_datetime(data.get("updated_at")),
+            deleted_at=to_datetime(data.get("deleted_at")),
+            deleted_by_name=data.get("deleted_by_name"),
+        )
@@ -0,0 +1,164 @@
+"""
+Resumos diários de vendas por empresa (rollups).
+
+Cada dia com vendas tem um documento em vendas_diarias/{empresa_id}_{AAAA-MM-DD} com a quantidade
+de pedidos, a receita em centavos, os itens vendidos e a quantidade/receita por produto. O
+repositório de pedidos mantém esses documentos a cada gravação de pedido: a contribuição antiga
+do pedido é subtraída e a nova é somada (incrementos atômicos), na mesma transação ou batch que
+grava o pedido. Um relatório mensal lê no máximo 31 documentos em vez de todos os pedidos do mês.
+
+Um pedido entra nas vendas do dia da sua data (order_date) enquanto não estiver na lixeira
+(status 'DELETED') nem cancelado (delivery_status 'CANCELED'). O arquivamento mensal não altera
+os resumos: pedidos arquivados continuam contados.
+
+Toda gravação que atualiza os resumos marca o pedido com SALES_ROLLUP_MARKER: a contribuição
+antiga só é subtraída de pedidos marcados. Pedidos gravados antes dos resumos existirem não
+estão contados e não são descontados; scripts/backfill_sales_rollups.py os soma e marca.
+"""
+import calendar
+from datetime import date
+from typing import Any
+
+from src.domains.pedidos.models.pedidos_model import get_money_from_dict, parse_order_date
+from src.domains.pedidos.models.pedidos_subclass import DeliveryStatus
+from src.domains.shared.models.registration_status import RegistrationStatus
+
+SALES_ROLLUP_COLLECTION = "vendas_diarias"
+
+# Campo do pedido que indica que a versão gravada está refletida nos resumos diários
+SALES_ROLLUP_MARKER = "sales_rollup_applied"
+
+# Campos do pedido lidos para calcular a contribuição (field mask)
+SALES_FIELDS = ("empresa_id", "order_date", "status", "delivery_status", "total_amount", "items", SALES_ROLLUP_MARKER)
+
+# Contadores do dia (o mapa 'products' tem quantity e revenue_cents por produto)
+SALES_COUNTERS = ("order_count", "revenue_cents", "items_sold")
+
+
+def sales_day_id(empresa_id: str, day: date) -> str:
+    """ID do documento de resumo da empresa no dia: '{empresa_id}_{AAAA-MM-DD}'."""
+    return f"{empresa_id}_{day.isoformat()}"
+
+
+def sales_contribution(data: dict[str, Any] | None) -> dict[str, Any] | None:
+    """
+    Contribuição de um pedido (documento como gravado por to_dict_db) para o resumo do seu dia.
+
+    Returns:
+        dict | None: 'empresa_id', 'day' (date), os contadores e 'products'
+            ({id: {'description', 'quantity', 'revenue_cents'}}); None se o pedido não conta como venda.
+    """
+    if not data or not data.get("empresa_id"):
+        return None
+    if data.get("status") == RegistrationStatus.DELETED.name:
+        return None
+    if data.get("delivery_status") == DeliveryStatus.CANCELED.name:
+        return None
+
+    products: dict[str, dict[str, Any]] = {}
+    for item in data.get("items") or []:
+        product = products.setdefault(item["id"], {"description": item.get("description", ""),
+                                                   "quantity": 0, "revenue_cents": 0})
+        product["quantity"] += int(item.get("quantity", 0))
+        product["revenue_cents"] += get_money_from_dict(item.get("total")).amount_cents
+
+    return {
+        "empresa_id": data["empresa_id"],
+        "day": parse_order_date(data.get("order_date")),
+        "order_count": 1,
+        "revenue_cents": get_money_from_dict(data.get("total_amount")).amount_cents,
+        "items_sold": sum(product["quantity"] for product in products.values()),
+        "products": products,
+    }
+
+
+def sales_deltas(old: dict[str, Any] | None, new: dict[str, Any] | None) -> dict[tuple[str, date], dict[str, Any]]:
+    """
+    Diferença entre as contribuições nova e antiga de um pedido, por (empresa_id, dia).
+
+    Uma alteração que não muda as vendas (ex.: só o cliente) não gera deltas; uma mudança de data
+    gera dois: o dia antigo perde e o novo ganha. Os contadores e produtos com delta zero são omitidos.
+
+    A versão antiga só é subtraída se estiver marcada (SALES_ROLLUP_MARKER): um pedido que nunca foi
+    somado aos resumos entra neles com a versão nova, sem descontar o que não foi contado.
+
+    Returns:
+        dict: {(empresa_id, dia): {contador: delta, 'products': {id: {'description', 'quantity', 'revenue_cents'}}}}
+    """
+    deltas: dict[tuple[str, date], dict[str, Any]] = {}
+    applied_old = old if old and old.get(SALES_ROLLUP_MARKER) else None
+    for contribution, sign in ((sales_contribution(applied_old), -1), (sales_contribution(new), 1)):
+        if not contribution:
+            continue
+        delta = deltas.setdefault((contribution["empresa_id"], contribution["day"]),
+                                  {**{counter: 0 for counter in SALES_COUNTERS}, "products": {}})
+        for counter in SALES_COUNTERS:
+            delta[counter] += sign * contribution[counter]
+        for product_id, values in contribution["products"].items():
+            product = delta["products"].setdefault(product_id, {"quantity": 0, "revenue_cents": 0})
+            product["description"] = values["description"]
+            product["quantity"] += sign * values["quantity"]
+            product["revenue_cents"] += sign * values["revenue_cents"]
+
+    result = {}
+    for key, delta in deltas.items():
+        products = {product_id: values for product_id, values in delta["products"].items()
+                    if values["quantity"] or values["revenue_cents"]}
+        counters = {counter: delta[counter] for counter in SALES_COUNTERS if delta[counter]}
+        if counters or products:
+            result[key] = {**counters, "products": products}
+    return result
+
+
+def merge_sales_deltas(target: dict[tuple[str, date], dict[str, Any]],
+                       deltas: dict[tuple[str, date], dict[str, Any]]) -> None:
+    """Soma `deltas` (ver sales_deltas) em `target`, para gravar um único incremento por dia em um lote."""
+    for key, delta in deltas.items():
+        total = target.setdefault(key, {"products": {}})
+        for counter in SALES_COUNTERS:
+            if counter in delta:
+                total[counter] = total.get(counter, 0) + delta[counter]
+        for product_id, values in delta["products"].items():
+            product = total["products"].setdefault(product_id, {"quantity": 0, "revenue_cents": 0})
+            product["description"] = values["description"]
+            product["quantity"] += values["quantity"]
+            product["revenue_cents"] += values["revenue_cents"]
+
+
+def month_days(year: int, month: int) -> list[date]:
+    """Dias do mês (para montar os IDs dos resumos diários)."""
+    return [date(year, month, day) for day in range(1, calendar.monthrange(year, month)[1] + 1)]
+
+
+def build_sales_report(year: int, month: int, daily: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Relatório de vendas do mês a partir dos resumos diários.
+
+    Returns:
+        dict: 'month' ('AAAA-MM'), os totais do mês (contadores), 'days' (um item por dia com vendas,
+            em ordem de data) e 'products' (vendidos no mês, do maior para o menor faturamento).
+    """
+    totals = {counter: 0 for counter in SALES_COUNTERS}
+    days = []
+    products: dict[str, dict[str, Any]] = {}
+    for data in sorted(daily, key=lambda d: d.get("date", "")):
+        day = {counter: int(data.get(counter, 0)) for counter in SALES_COUNTERS}
+        if not any(day.values()):
+            continue
+        days.append({"date": date.fromisoformat(data["date"]), **day})
+        for counter in SALES_COUNTERS:
+            totals[counter] += day[counter]
+        for product_id, values in (data.get("products") or {}).items():
+            product = products.setdefault(product_id, {"id": product_id, "description": "",
+                                                       "quantity": 0, "revenue_cents": 0})
+            product["description"] = values.get("description") or product["description"]
+            product["quantity"] += int(values.get("quantity", 0))
+            product["revenue_cents"] += int(values.get("revenue_cents", 0))
+
+    return {
+        "month": f"{year:04d}-{month:02d}",
+        **totals,
+        "days": days,
+        "products": sorted((p for p in products.values() if p["quantity"] or p["revenue_cents"]),
+                           key=lambda p: (-p["revenue_cents"], -p["quantity"], p["description"])),
+    }
@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any
+
+from src.domains.pedidos.models.pedidos_model import Pedido, PedidoHeader
+
+
+class PedidosArchiveRepository(ABC):
+    """Contrato do arquivo mensal de pedidos antigos (fora da coleção de pedidos ativos)."""
+
+    @abstractmethod
+    def archive_batch(self, empresa_id: str, cutoff: date, batch_size: int) -> int:
+        """
+        Move para o arquivo até `batch_size` pedidos finalizados com data anterior a `cutoff`.
+        A cópia para o arquivo e a remoção da coleção ativa são atômicas (uma transação por lote).
+        Retorna a quantidade de pedidos movidos (0 quando não há mais pedidos a arquivar).
+        """
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+
+    @abstractmethod
+    def get_checkpoint(self, empresa_id: str) -> dict[str, Any] | None:
+        """Situação da última execução do arquivamento da empresa (data de corte, totais, término)."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+
+    @abstractmethod
+    def save_checkpoint(self, empresa_id: str, checkpoint: dict[str, Any]) -> None:
+        """Grava (merge) a situação do arquivamento da empresa."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+
+    @abstractmethod
+    def get_archive_months(self, empresa_id: str) -> list[dict[str, Any]]:
+        """Meses arquivados da empresa ('month', 'count', 'total_cents'), do mais recente ao mais antigo."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+
+    @abstractmethod
+    def search(self, empresa_id: str, start_date: date | None = None, end_date: date | None = None,
+               page_size: int = 50, cursor: dict[str, Any] | None = None) -> tuple[list[PedidoHeader], dict[str, Any] | None]:
+        """
+        Busca paginada nos pedidos arquivados, do mais recente ao mais antigo.
+        Retorna a página e o cursor da próxima página (None na última).
+        """
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+
+    @abstractmethod
+    def get_archived_pedido(self, empresa_id: str, pedido_id: str, order_date: date) -> Pedido | None:
+        """Busca um pedido arquivado completo (com itens)."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
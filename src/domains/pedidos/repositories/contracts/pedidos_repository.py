@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, Callable, Iterator
 
-from src.domains.pedidos.models.pedidos_model import Pedido
+from src.domains.pedidos.models.pedidos_model import Pedido, PedidoHeader, PedidoItem
 from src.domains.shared.models.registration_status import RegistrationStatus
 
 
@@ -38,6 +40,20 @@ class PedidosRepository(ABC):
         "Este método deve ser implementado pela subclasse")
 
 
+    @abstractmethod
+    def get_pedido_headers_by_empresa_id(self, empresa_id: str, status: RegistrationStatus | None = None) -> tuple[list[PedidoHeader], int]:
+        """Busca os cabeçalhos (sem itens) dos pedidos de uma empresa, opcionalmente filtrando por status."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+
+    @abstractmethod
+    def get_pedido_items(self, pedido_id: str) -> list[PedidoItem] | None:
+        """Busca somente os itens de um pedido. Retorna None se o pedido não existir."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+
     # @abstractmethod
     # def update_pedido(self, pedido: Pedido) -> Pedido:
     #     """Atualiza um pedido existente no Firestore."""
@@ -46,7 +62,7 @@ class PedidosRepository(ABC):
 
 
     @abstractmethod
-    def delete_pedido(self, pedido: Pedido) -> bool:
+    def delete_pedido(self, pedido: Pedido | PedidoHeader) -> bool:
         """Realiza um soft delete em um pedido, definindo deleted_at."""
         raise NotImplementedError(
         "Este método deve ser implementado pela subclasse")
@@ -60,7 +76,45 @@ class PedidosRepository(ABC):
 
 
     @abstractmethod
-    def restore_pedido(self, pedido: Pedido) -> bool:
+    def restore_pedido(self, pedido: Pedido | PedidoHeader) -> bool:
         """Restaura um pedido da lixeira."""
         raise NotImplementedError(
         "Este método deve ser implementado pela subclasse")
+
+
+    @abstractmethod
+    def iter_export_pages(self, empresa_id: str, page_size: int = 500) -> Iterator[list[tuple[str, dict[str, Any]]]]:
+        """Percorre todos os pedidos ativos da empresa em páginas de (ID, documento bruto), para exportação."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def bulk_update_status(self, empresa_id: str, pedido_ids: list[str], status: RegistrationStatus, current_user_id: str,
+                           current_user_name: str, on_progress: Callable[[int], None] | None = None) -> int:
+        """Muda o status de vários pedidos em lote, com auditoria. Retorna a quantidade de pedidos atualizados."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def bulk_hard_delete(self, empresa_id: str, pedido_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """Exclui definitivamente, em lote, os pedidos que estão na lixeira. Retorna a quantidade de pedidos excluídos."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def iter_unapplied_sales_pages(self, empresa_id: str, page_size: int = 500) -> Iterator[list[str]]:
+        """Percorre os pedidos da empresa em páginas de IDs dos pedidos ainda não somados aos resumos de vendas."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def apply_sales_rollups(self, empresa_id: str, pedido_ids: list[str]) -> int:
+        """Soma aos resumos de vendas os pedidos ainda não contados e os marca. Retorna a quantidade somada."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def get_daily_sales(self, empresa_id: str, days: list[date]) -> list[dict[str, Any]]:
+        """Busca os resumos diários de vendas da empresa nos dias informados (somente os dias com resumo)."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
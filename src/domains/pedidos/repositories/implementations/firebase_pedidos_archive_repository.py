@@ -0,0 +1,186 @@
+import logging
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any
+
+from firebase_admin import exceptions, firestore
+from google.api_core import exceptions as google_api_exceptions
+from google.cloud.firestore_v1.base_query import FieldFilter
+
+from src.domains.pedidos.models.pedido_archive import (
+    archive_month, header_from_archive_dict, pedido_from_archive_dict, to_archive_dict,
+)
+from src.domains.pedidos.models.pedidos_model import Pedido, PedidoHeader
+from src.domains.pedidos.models.pedidos_subclass import DeliveryStatus
+from src.domains.pedidos.repositories.contracts.pedidos_archive_repository import PedidosArchiveRepository
+from src.domains.shared.models.registration_status import RegistrationStatus
+from storage.data import get_firebase_app, get_firestore_client, record_returned
+
+logger = logging.getLogger(__name__)
+
+# Estrutura do arquivo:
+#   pedidos_arquivo/{empresa_id}_{AAAA-MM}                      -> resumo do mês (count, total_cents)
+#   pedidos_arquivo/{empresa_id}_{AAAA-MM}/pedidos_arquivados/{pedido_id} -> pedido compacto
+#   pedidos_arquivo_status/{empresa_id}                         -> checkpoint do arquivamento
+#
+# Índices compostos necessários (em firestore.indexes.json):
+#   pedidos: empresa_id ASC, status ASC, delivery_status ASC, order_date ASC     (arquivamento)
+#   pedidos: empresa_id ASC, status ASC, order_date DESC, order_number DESC      (listagem: janela e anteriores não arquivados)
+#   pedidos_arquivados (collection group): empresa_id ASC, order_date DESC, order_number DESC
+ARCHIVE_COLLECTION = "pedidos_arquivo"
+ARCHIVED_ORDERS_SUBCOLLECTION = "pedidos_arquivados"
+CHECKPOINT_COLLECTION = "pedidos_arquivo_status"
+
+# Pedidos que podem ir para o arquivo: os em aberto (PENDING, IN_TRANSIT) continuam ativos
+FINISHED_DELIVERY_STATUSES = [DeliveryStatus.DELIVERED.name, DeliveryStatus.CANCELED.name]
+
+# Status arquivados: os mesmos da listagem padrão (ativos e inativos); os da lixeira ficam na coleção ativa
+ARCHIVABLE_STATUSES = [RegistrationStatus.ACTIVE.name, RegistrationStatus.INACTIVE.name]
+
+# Até 500 escritas por transação: 2 por pedido (cópia + remoção) e 1 por mês
+MAX_BATCH_SIZE = 240
+
+
+class FirebasePedidosArchiveRepository(PedidosArchiveRepository):
+    """Arquivo mensal de pedidos no Firestore."""
+    def __init__(self):
+        get_firebase_app()  # Garante que o aplicativo Firebase esteja inicializado
+        self.db = get_firestore_client()
+        self.pedidos_collection = self.db.collection("pedidos")
+        self.archive_collection = self.db.collection(ARCHIVE_COLLECTION)
+        self.checkpoint_collection = self.db.collection(CHECKPOINT_COLLECTION)
+
+    def _month_ref(self, empresa_id: str, month: str):
+        return self.archive_collection.document(f"{empresa_id}_{month}")
+
+    def archive_batch(self, empresa_id: str, cutoff: date, batch_size: int) -> int:
+        """
+        Move um lote de pedidos finalizados (ativos ou inativos, entregues ou cancelados) anteriores a `cutoff`.
+
+        Cada lote é uma transação: a consulta, a cópia compacta, a remoção do pedido ativo e o
+        incremento dos resumos mensais são aplicados juntos ou não são aplicados. Um pedido alterado
+        entre a consulta e o commit (ex.: reaberto ou enviado à lixeira) faz a transação ser repetida,
+        e a cópia arquivada é sempre a versão removida. Uma execução interrompida pode ser
+        simplesmente repetida: os pedidos já movidos não estão mais na coleção ativa e nenhum pedido
+        é contado duas vezes.
+        """
+        batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+        query = (self.pedidos_collection
+                 .where(filter=FieldFilter("empresa_id", "==", empresa_id))
+                 .where(filter=FieldFilter("status", "in", ARCHIVABLE_STATUSES))
+                 .where(filter=FieldFilter("delivery_status", "in", FINISHED_DELIVERY_STATUSES))
+                 .where(filter=FieldFilter("order_date", "<", datetime.combine(cutoff, datetime.min.time())))
+                 .order_by("order_date")
+                 .limit(batch_size))
+
+        @firestore.transactional  # type: ignore [attr-defined]
+        def archive_transaction(transaction) -> dict[str, list[int]]:
+            months: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+            for doc in transaction.get(query):
+                compact = to_archive_dict(doc.to_dict() or {})
+                month = archive_month(compact["order_date"])
+                compact["archived_at"] = firestore.SERVER_TIMESTAMP  # type: ignore [attr-defined]
+                transaction.set(self._month_ref(empresa_id, month).collection(ARCHIVED_ORDERS_SUBCOLLECTION).document(doc.id),
+                                compact)
+                transaction.delete(doc.reference)
+                months[month][0] += 1
+                months[month][1] += compact["total_cents"]
+
+            for month, (count, total_cents) in months.items():
+                transaction.set(self._month_ref(empresa_id, month), {
+                    "empresa_id": empresa_id,
+                    "month": month,
+                    "count": firestore.Increment(count),  # type: ignore [attr-defined]
+                    "total_cents": firestore.Increment(total_cents),  # type: ignore [attr-defined]
+                    "updated_at": firestore.SERVER_TIMESTAMP,  # type: ignore [attr-defined]
+                }, merge=True)
+            return months
+
+        try:
+            months = archive_transaction(self.db.transaction())
+            moved = sum(count for count, _ in months.values())
+            if moved:
+                logger.info(f"{moved} pedido(s) da empresa {empresa_id} arquivado(s) em {', '.join(sorted(months))}")
+            return moved
+        except google_api_exceptions.FailedPrecondition as e:
+            logger.error(f"Erro de pré-condição ao arquivar pedidos (provavelmente índice ausente): {e}")
+            raise Exception(
+                "Erro ao arquivar pedidos: Um índice necessário não foi encontrado no banco de dados. "
+                f"Detalhe original: {str(e)}"
+            )
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao arquivar pedidos da empresa {empresa_id}: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Erro inesperado ao arquivar pedidos da empresa {empresa_id}: {e}")
+            raise
+
+    def get_checkpoint(self, empresa_id: str) -> dict[str, Any] | None:
+        doc = self.checkpoint_collection.document(empresa_id).get()
+        return doc.to_dict() if doc.exists else None
+
+    def save_checkpoint(self, empresa_id: str, checkpoint: dict[str, Any]) -> None:
+        data = dict(checkpoint)
+        data["updated_at"] = firestore.SERVER_TIMESTAMP  # type: ignore [attr-defined]
+        self.checkpoint_collection.document(empresa_id).set(data, merge=True)
+
+    def get_archive_months(self, empresa_id: str) -> list[dict[str, Any]]:
+        try:
+            query = (self.archive_collection
+                     .where(filter=FieldFilter("empresa_id", "==", empresa_id))
+                     .select(["month", "count", "total_cents"]))
+            months = [doc.to_dict() for doc in query.stream()]
+            months.sort(key=lambda m: m.get("month", ""), reverse=True)
+            return months
+        except Exception as e:
+            logger.error(f"Erro ao consultar meses arquivados da empresa {empresa_id}: {e}")
+            raise
+
+    def search(self, empresa_id: str, start_date: date | None = None, end_date: date | None = None,
+               page_size: int = 50, cursor: dict[str, Any] | None = None) -> tuple[list[PedidoHeader], dict[str, Any] | None]:
+        """
+        Busca paginada (collection group) nos pedidos arquivados da empresa, ordenada por data e
+        número do pedido (decrescentes). O intervalo [start_date, end_date] é opcional.
+        """
+        try:
+            query = (self.db.collection_group(ARCHIVED_ORDERS_SUBCOLLECTION)
+                     .where(filter=FieldFilter("empresa_id", "==", empresa_id)))
+            if start_date:
+                query = query.where(filter=FieldFilter("order_date", ">=", datetime.combine(start_date, datetime.min.time())))
+            if end_date:
+                query = query.where(filter=FieldFilter("order_date", "<=", datetime.combine(end_date, datetime.max.time())))
+            query = (query
+                     .order_by("order_date", direction=firestore.Query.DESCENDING)  # type: ignore [attr-defined]
+                     .order_by("order_number", direction=firestore.Query.DESCENDING))  # type: ignore [attr-defined]
+            if cursor:
+                query = query.start_after(cursor)
+
+            docs = list(query.limit(page_size).stream())
+            headers = [header_from_archive_dict(doc.to_dict() or {}, doc.id) for doc in docs]
+            record_returned(len(headers))
+
+            next_cursor = None
+            if len(docs) == page_size:
+                last = docs[-1].to_dict() or {}
+                next_cursor = {"order_date": last.get("order_date"), "order_number": last.get("order_number")}
+            return headers, next_cursor
+        except google_api_exceptions.FailedPrecondition as e:
+            logger.error(f"Erro de pré-condição ao buscar no arquivo de pedidos (provavelmente índice ausente): {e}")
+            raise Exception(
+                "Erro ao buscar pedidos arquivados: Um índice necessário não foi encontrado no banco de dados. "
+                f"Detalhe original: {str(e)}"
+            )
+        except Exception as e:
+            logger.error(f"Erro inesperado ao buscar no arquivo de pedidos da empresa {empresa_id}: {e}")
+            raise
+
+    def get_archived_pedido(self, empresa_id: str, pedido_id: str, order_date: date) -> Pedido | None:
+        try:
+            doc = (self._month_ref(empresa_id, archive_month(order_date))
+                   .collection(ARCHIVED_ORDERS_SUBCOLLECTION).document(pedido_id).get())
+            if not doc.exists:
+                return None
+            return pedido_from_archive_dict(doc.to_dict() or {}, doc.id)
+        except Exception as e:
+            logger.error(f"Erro inesperado ao consultar pedido arquivado '{pedido_id}': {e}")
+            raise
@@ -1,28 +1,60 @@
 import logging
 import datetime
+from typing import Any, Callable, Iterator
 
 from google.cloud.firestore_v1.base_query import FieldFilter
 from firebase_admin import exceptions, firestore
 from google.api_core import exceptions as google_api_exceptions
 
-from src.domains.pedidos.models.pedidos_model import Pedido
+from src.domains.pedidos.models.pedidos_model import Pedido, PedidoHeader, PedidoItem
 from src.domains.pedidos.models.pedidos_subclass import DeliveryStatus
+from src.domains.pedidos.models.sales_rollup import (
+    SALES_FIELDS, SALES_ROLLUP_COLLECTION, SALES_ROLLUP_MARKER, merge_sales_deltas, sales_day_id, sales_deltas,
+)
 from src.domains.pedidos.repositories.contracts.pedidos_repository import PedidosRepository
+from src.domains.pedidos.repositories.implementations.firebase_pedidos_archive_repository import (
+    CHECKPOINT_COLLECTION as ARCHIVE_CHECKPOINT_COLLECTION,
+)
 from src.domains.shared.models.registration_status import RegistrationStatus
 from src.domains.shared.models.sequential_number import SequentialNumber
 from src.shared.utils.deep_translator import deepl_translator
-from src.domains.shared.repositories.utils import set_audit_timestamps
-from storage.data import get_firebase_app
+from src.domains.shared.repositories.utils import hard_delete_in_batches, set_audit_timestamps, status_change_data
+from storage.data import get_firebase_app, get_firestore_client, iter_query_pages, record_returned
 
 logger = logging.getLogger(__name__)
 
+# Campos lidos nas listagens (field mask): o array de itens não é transferido
+HEADER_FIELDS = (
+    "empresa_id",
+    "order_number",
+    "order_date",
+    "total_amount",
+    "total_items",
+    "total_products",
+    "client.name",
+    "client.phone",
+    "status",
+    "delivery_status",
+    "created_at",
+    "created_by_id",
+    "created_by_name",
+    "updated_at",
+    "deleted_at",
+    "deleted_by_name",
+)
+
+# Pedidos por batch/transação na mudança de status em lote e na carga dos resumos de vendas: até 2
+# escritas por pedido (o pedido e o resumo do dia), dentro do limite de 500 escritas do Firestore
+STATUS_BATCH_SIZE = 250
+
 
 class FirebasePedidosRepository(PedidosRepository):
     """Repositorio de pedidos do Firestore."""
     def __init__(self):
         get_firebase_app()  # Garante que o aplicativo Firebase esteja inicializado
-        self.db = firestore.client()
+        self.db = get_firestore_client()
         self.pedidos_collection = self.db.collection("pedidos")
+        self.sales_collection = self.db.collection(SALES_ROLLUP_COLLECTION)
         self.numbers_collection_name = "numbers"  # Sub-coleção dentro de empresa
 
     def _get_empresa_numbers_collection(self, empresa_id: str):
@@ -114,10 +146,16 @@ class FirebasePedidosRepository(PedidosRepository):
 
     def _save_pedido_with_stock_reduction(self, pedido: Pedido) -> Pedido | None:
         """
-        Salva o pedido e realiza baixa de estoque em uma transação atômica.
+        Salva o pedido, realiza baixa de estoque e atualiza os resumos diários de vendas em uma
+        transação atômica.
         """
+        pedido_ref = self.pedidos_collection.document(pedido.id)
+
         @firestore.transactional  # type: ignore [attr-defined]
         def save_with_stock_transaction(transaction):
+            # Versão gravada do pedido (se houver), para os deltas dos resumos de vendas
+            previous_data = self._get_sales_data(pedido_ref, transaction)
+
             # 1. Verifica disponibilidade de estoque para todos os itens antes de qualquer alteração
             produtos_refs = {}
             produtos_data = {}
@@ -171,10 +209,10 @@ class FirebasePedidosRepository(PedidosRepository):
             # 3. Marca que a baixa de estoque foi realizada
             pedido.stock_reduction = True
 
-            # 4. Salva o pedido
+            # 4. Salva o pedido e atualiza os resumos de vendas
             pedido_data = self._prepare_pedido_data_for_save(pedido)
-            pedido_ref = self.pedidos_collection.document(pedido.id)
             transaction.set(pedido_ref, pedido_data, merge=False)
+            self._write_sales_deltas(transaction, sales_deltas(previous_data, pedido_data))
 
             return pedido_ref
 
@@ -195,14 +233,20 @@ class FirebasePedidosRepository(PedidosRepository):
 
     def _save_pedido_only(self, pedido: Pedido) -> Pedido | None:
         """
-        Salva apenas o pedido, sem alteração de estoque.
+        Salva o pedido, sem alteração de estoque, e atualiza os resumos diários de vendas na mesma transação.
         """
         # Prepara os dados do pedido para salvamento
         pedido_data = self._prepare_pedido_data_for_save(pedido)
+        pedido_ref = self.pedidos_collection.document(pedido.id)
+
+        @firestore.transactional  # type: ignore [attr-defined]
+        def save_transaction(transaction):
+            previous_data = self._get_sales_data(pedido_ref, transaction)
+            transaction.set(pedido_ref, pedido_data, merge=False)
+            self._write_sales_deltas(transaction, sales_deltas(previous_data, pedido_data))
 
         # Salva o pedido no Firestore
-        pedido_ref = self.pedidos_collection.document(pedido.id)
-        pedido_ref.set(pedido_data, merge=False)
+        save_transaction(self.db.transaction())
 
         # Relê o pedido salvo para obter os timestamps atualizados
         return self._read_saved_pedido(pedido_ref, pedido)
@@ -230,8 +274,45 @@ class FirebasePedidosRepository(PedidosRepository):
         # Centraliza a lógica de timestamps de auditoria
         pedido_data = set_audit_timestamps(pedido_data)
 
+        # O salvamento aplica os deltas aos resumos de vendas na mesma transação (ver sales_deltas)
+        pedido_data[SALES_ROLLUP_MARKER] = True
+
         return pedido_data
 
+    def _get_sales_data(self, pedido_ref, transaction) -> dict[str, Any] | None:
+        """Lê na transação somente os campos do pedido que entram nos resumos de vendas (None se não existe)."""
+        doc = pedido_ref.get(field_paths=list(SALES_FIELDS), transaction=transaction)
+        return doc.to_dict() if doc.exists else None
+
+    def _write_sales_deltas(self, writer, deltas: dict[tuple[str, datetime.date], dict[str, Any]]) -> None:
+        """
+        Aplica aos resumos diários de vendas os deltas (ver sales_deltas) entre a versão antiga e a nova de pedidos.
+
+        Os contadores são incrementos atômicos (Increment) gravados com set/merge pela transação ou
+        batch (`writer`) que grava o pedido: o documento do dia não é lido, então pedidos do mesmo
+        dia gravados ao mesmo tempo não disputam a transação. O documento é criado no primeiro pedido do dia.
+        """
+        for (empresa_id, day), delta in deltas.items():
+            data: dict[str, Any] = {
+                "empresa_id": empresa_id,
+                "date": day.isoformat(),
+                "month": day.isoformat()[:7],
+                "updated_at": firestore.SERVER_TIMESTAMP,  # type: ignore [attr-defined]
+            }
+            for counter, value in delta.items():
+                if counter != "products":
+                    data[counter] = firestore.Increment(value)  # type: ignore [attr-defined]
+            if delta["products"]:
+                data["products"] = {
+                    product_id: {
+                        "description": values["description"],
+                        "quantity": firestore.Increment(values["quantity"]),  # type: ignore [attr-defined]
+                        "revenue_cents": firestore.Increment(values["revenue_cents"]),  # type: ignore [attr-defined]
+                    }
+                    for product_id, values in delta["products"].items()
+                }
+            writer.set(self.sales_collection.document(sales_day_id(empresa_id, day)), data, merge=True)
+
     def _read_saved_pedido(self, pedido_ref, original_pedido: Pedido) -> Pedido | None:
         """
         Relê o pedido salvo para obter os timestamps atualizados.
@@ -255,7 +336,7 @@ class FirebasePedidosRepository(PedidosRepository):
             # Cria um novo objeto Pedido a partir dos dados do DB
             # e transfere os timestamps reais para o objeto 'pedido' original
             # que foi passado para o método 'save'.
-            updated_pedido_obj = Pedido.from_dict(pedido_data_from_db)
+            updated_pedido_obj = Pedido.from_dict(pedido_data_from_db, trusted=True)
             return updated_pedido_obj
 
         except Exception as e_read:
@@ -274,7 +355,7 @@ class FirebasePedidosRepository(PedidosRepository):
         try:
             doc = self.pedidos_collection.document(pedido_id).get()
             if doc.exists:
-                return Pedido.from_dict(doc.to_dict(), doc.id)
+                return Pedido.from_dict(doc.to_dict(), doc.id, trusted=True)
             return None
         except exceptions.FirebaseError as e:
             if e.code == 'permission-denied':
@@ -299,32 +380,17 @@ class FirebasePedidosRepository(PedidosRepository):
     def get_pedidos_by_empresa_id(self, empresa_id: str, status: RegistrationStatus | None = None) -> tuple[list[Pedido], int]:
         """Busca todos os pedidos de uma empresa, opcionalmente filtrando por status."""
         try:
-            # 1. Contar os pedidos deletados separadamente para simplificar a lógica.
-            deleted_count_query = (self.pedidos_collection
-                                   .where(filter=FieldFilter("empresa_id", "==", empresa_id))
-                                   .where(filter=FieldFilter("status", "==", RegistrationStatus.DELETED.name)))
-            # Usar .stream() com um campo chave (`__name__`) é uma forma eficiente de contar documentos.
-            quantidade_deletados = len(list(deleted_count_query.select(["__name__"]).stream()))
-
-            # 2. Construir a query principal para buscar os pedidos.
-            query = self.pedidos_collection.where(filter=FieldFilter("empresa_id", "==", empresa_id))
-
-            if status:
-                # Se um status específico for fornecido (ex: DELETED), filtra por ele.
-                query = query.where(filter=FieldFilter("status", "==", status.name))
-            else:
-                # Caso contrário, busca todos os que NÃO são DELETED (padrão).
-                query = query.where(filter=FieldFilter("status", "!=", RegistrationStatus.DELETED.name))
-
-            # Ordena os resultados.
-            docs = query.order_by("order_number", direction="DESCENDING").stream()
+            query, quantidade_deletados = self._empresa_query(empresa_id, status)
+            docs = query.stream()
 
             pedidos_result: list[Pedido] = []
             for doc in docs:
                 pedido_data = doc.to_dict()
                 if pedido_data:
-                    pedidos_result.append(Pedido.from_dict(pedido_data, doc.id))
+                    pedidos_result.append(Pedido.from_dict(pedido_data, doc.id, trusted=True))
 
+            if quantidade_deletados is None:
+                quantidade_deletados = len(pedidos_result)
             return pedidos_result, quantidade_deletados
 
         except google_api_exceptions.FailedPrecondition as e:
@@ -369,7 +435,131 @@ class FirebasePedidosRepository(PedidosRepository):
             )
             raise
 
-    def delete_pedido(self, pedido: Pedido) -> bool:
+    def _empresa_query(self, empresa_id: str, status: RegistrationStatus | None, since: datetime.date | None = None):
+        """
+        Query ordenada dos pedidos da empresa e a quantidade de pedidos na lixeira.
+
+        Com `since`, a query fica limitada aos pedidos com order_date a partir desta data (janela
+        de pedidos ativos) e é ordenada por data e número do pedido.
+
+        Na lixeira (status DELETED) a quantidade é None: é o próprio tamanho do resultado, e os
+        deletados não são lidos duas vezes.
+        """
+        # 1. Contar os pedidos deletados separadamente para simplificar a lógica.
+        quantidade_deletados = None
+        if status != RegistrationStatus.DELETED:
+            deleted_count_query = (self.pedidos_collection
+                                   .where(filter=FieldFilter("empresa_id", "==", empresa_id))
+                                   .where(filter=FieldFilter("status", "==", RegistrationStatus.DELETED.name)))
+            # Usar .stream() com um campo chave (`__name__`) é uma forma eficiente de contar documentos.
+            quantidade_deletados = len(list(deleted_count_query.select(["__name__"]).stream()))
+
+        # 2. Construir a query principal para buscar os pedidos.
+        query = self.pedidos_collection.where(filter=FieldFilter("empresa_id", "==", empresa_id))
+
+        if status:
+            # Se um status específico for fornecido (ex: DELETED), filtra por ele.
+            query = query.where(filter=FieldFilter("status", "==", status.name))
+        elif since:
+            # Janela de pedidos ativos: a única desigualdade da query é a data do pedido
+            query = (query
+                     .where(filter=FieldFilter("status", "in", [RegistrationStatus.ACTIVE.name, RegistrationStatus.INACTIVE.name]))
+                     .where(filter=FieldFilter("order_date", ">=", datetime.datetime.combine(since, datetime.time.min))))
+            return (query.order_by("order_date", direction="DESCENDING").order_by("order_number", direction="DESCENDING"),
+                    quantidade_deletados)
+        else:
+            # Caso contrário, busca todos os que NÃO são DELETED (padrão).
+            query = query.where(filter=FieldFilter("status", "!=", RegistrationStatus.DELETED.name))
+
+        # Ordena os resultados.
+        return query.order_by("order_number", direction="DESCENDING"), quantidade_deletados
+
+    def _archived_cutoff(self, empresa_id: str) -> datetime.date | None:
+        """
+        Data de corte do último arquivamento concluído da empresa (checkpoint do arquivamento), ou
+        None se nunca houve um. O corte vem do arquivamento e não do relógio: os pedidos finalizados
+        anteriores a ele foram movidos para o arquivo, os posteriores continuam na coleção ativa.
+        """
+        doc = self.db.collection(ARCHIVE_CHECKPOINT_COLLECTION).document(empresa_id).get(field_paths=["archived_cutoff"])
+        archived_cutoff = (doc.to_dict() or {}).get("archived_cutoff") if doc.exists else None
+        return datetime.date.fromisoformat(archived_cutoff) if archived_cutoff else None
+
+    def _unarchived_pedidos_before(self, empresa_id: str, before: datetime.date):
+        """
+        Pedidos anteriores à janela que continuam na coleção ativa (o arquivamento remove os que
+        move): os em aberto, os finalizados ou restaurados da lixeira depois do último arquivamento
+        e os que tiveram a data alterada para antes do corte. São poucos e aparecem na listagem até
+        o próximo arquivamento. Mesmos filtros e ordem (e índice) da janela.
+        """
+        return (self.pedidos_collection
+                .where(filter=FieldFilter("empresa_id", "==", empresa_id))
+                .where(filter=FieldFilter("status", "in", [RegistrationStatus.ACTIVE.name, RegistrationStatus.INACTIVE.name]))
+                .where(filter=FieldFilter("order_date", "<", datetime.datetime.combine(before, datetime.time.min)))
+                .order_by("order_date", direction="DESCENDING")
+                .order_by("order_number", direction="DESCENDING"))
+
+    def get_pedido_headers_by_empresa_id(self, empresa_id: str, status: RegistrationStatus | None = None) -> tuple[list[PedidoHeader], int]:
+        """
+        Busca os cabeçalhos dos pedidos de uma empresa para as listagens.
+
+        Usa field mask (HEADER_FIELDS): os itens não são lidos, então bytes transferidos e memória
+        crescem com o número de pedidos e não com o número de itens.
+
+        Sem status (listagem padrão), depois que um arquivamento da empresa foi concluído, lê apenas
+        os pedidos a partir do corte desse arquivamento mais os anteriores a ele que ainda não foram
+        arquivados; os demais estão no arquivo (ver FirebasePedidosArchiveRepository.search). Todo
+        pedido fora da lixeira está em um dos dois.
+        Enquanto a empresa não tem arquivamento concluído, todos os pedidos são listados.
+        """
+        try:
+            since = self._archived_cutoff(empresa_id) if status is None else None
+            query, quantidade_deletados = self._empresa_query(empresa_id, status, since)
+
+            headers: list[PedidoHeader] = []
+            for doc in query.select(HEADER_FIELDS).stream():
+                data = doc.to_dict()
+                if data:
+                    headers.append(PedidoHeader.from_dict(data, doc.id))
+
+            if since:
+                for doc in self._unarchived_pedidos_before(empresa_id, since).select(HEADER_FIELDS).stream():
+                    data = doc.to_dict()
+                    if data:
+                        headers.append(PedidoHeader.from_dict(data, doc.id))
+
+            if quantidade_deletados is None:
+                quantidade_deletados = len(headers)
+            record_returned(len(headers))
+            return headers, quantidade_deletados
+        except google_api_exceptions.FailedPrecondition as e:
+            logger.error(f"Erro de pré-condição ao consultar cabeçalhos de pedidos (provavelmente índice ausente): {e}")
+            raise Exception(
+                "Erro ao buscar pedidos: Um índice necessário não foi encontrado no banco de dados. "
+                f"Detalhe original: {str(e)}"
+            )
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao consultar cabeçalhos de pedidos: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Erro inesperado ao consultar cabeçalhos de pedidos: {e}")
+            raise
+
+    def get_pedido_items(self, pedido_id: str) -> list[PedidoItem] | None:
+        """Busca somente os itens de um pedido (field mask 'items'), ao abrir a lista de itens."""
+        try:
+            doc = self.pedidos_collection.document(pedido_id).get(field_paths=["items"])
+            if not doc.exists:
+                return None
+            data = doc.to_dict() or {}
+            return [PedidoItem.from_dict(item) for item in data.get("items", [])]
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao consultar itens do pedido '{pedido_id}': Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Erro inesperado ao consultar itens do pedido '{pedido_id}': {e}")
+            raise
+
+    def delete_pedido(self, pedido: Pedido | PedidoHeader) -> bool:
         """Realiza um soft delete em um pedido, definindo deleted_at."""
         try:
             if not pedido.id:
@@ -382,7 +572,7 @@ class FirebasePedidosRepository(PedidosRepository):
                 "deleted_by_name": pedido.created_by_name,
                 "status": RegistrationStatus.DELETED.name
             }
-            self.pedidos_collection.document(pedido.id).update(updates)
+            self._update_status_with_sales(pedido.id, updates)
             logger.info(
                 f"Pedido {pedido.id} marcado como deletado (soft delete).")
             return True
@@ -393,15 +583,41 @@ class FirebasePedidosRepository(PedidosRepository):
 
     def hard_delete_pedido(self, pedido_id: str) -> bool:
         """Remove um pedido completamente do Firestore (uso cauteloso)."""
+        pedido_ref = self.pedidos_collection.document(pedido_id)
+
+        @firestore.transactional  # type: ignore [attr-defined]
+        def delete_transaction(transaction):
+            # Um pedido fora da lixeira ainda conta nas vendas do dia: a contribuição é removida
+            previous_data = self._get_sales_data(pedido_ref, transaction)
+            transaction.delete(pedido_ref)
+            self._write_sales_deltas(transaction, sales_deltas(previous_data, None))
+
         try:
-            self.pedidos_collection.document(pedido_id).delete()
+            delete_transaction(self.db.transaction())
             logger.info(f"Pedido {pedido_id} removido permanentemente.")
             return True
         except Exception as e:
             logger.error(f"Erro ao remover pedido {pedido_id}: {e}")
             raise Exception(f"Erro inesperado ao remover pedido: {e}")
 
-    def restore_pedido(self, pedido: Pedido) -> bool:
+    def _update_status_with_sales(self, pedido_id: str, updates: dict[str, Any]) -> None:
+        """
+        Muda o status de um pedido e aplica aos resumos de vendas o delta correspondente (o pedido
+        sai das vendas do dia ao ir para a lixeira e volta ao ser restaurado), na mesma transação.
+        """
+        pedido_ref = self.pedidos_collection.document(pedido_id)
+
+        @firestore.transactional  # type: ignore [attr-defined]
+        def update_transaction(transaction):
+            previous_data = self._get_sales_data(pedido_ref, transaction)
+            if previous_data is None:
+                raise ValueError(f"Pedido {pedido_id} não encontrado.")
+            transaction.update(pedido_ref, {**updates, SALES_ROLLUP_MARKER: True})
+            self._write_sales_deltas(transaction, sales_deltas(previous_data, {**previous_data, "status": updates["status"]}))
+
+        update_transaction(self.db.transaction())
+
+    def restore_pedido(self, pedido: Pedido | PedidoHeader) -> bool:
         """Restaura um pedido da lixeira."""
         try:
             if not pedido.id:
@@ -413,7 +629,7 @@ class FirebasePedidosRepository(PedidosRepository):
                 "activated_by_name": pedido.activated_by_name,
                 "status": RegistrationStatus.ACTIVE.name
             }
-            self.pedidos_collection.document(pedido.id).update(updates)
+            self._update_status_with_sales(pedido.id, updates)
             logger.info(
                 f"Pedido {pedido.id} marcado como ACTIVE.")
             return True
@@ -421,3 +637,135 @@ class FirebasePedidosRepository(PedidosRepository):
             logger.error(f"Erro ao restaurar pedido {pedido.id}: {e}")
             raise Exception(
                 f"Erro inesperado ao restaurar pedido #'{pedido.order_number}': {e}")
+
+    def iter_export_pages(self, empresa_id: str, page_size: int = 500) -> Iterator[list[tuple[str, dict[str, Any]]]]:
+        """
+        Percorre todos os pedidos da empresa na coleção ativa (inclusive excluídos) em páginas de
+        documentos brutos, sem montar objetos Pedido: usado pela exportação, com memória limitada a
+        uma página. Os pedidos arquivados não são incluídos.
+        """
+        query = self.pedidos_collection.where(filter=FieldFilter("empresa_id", "==", empresa_id))
+        yield from iter_query_pages(query, page_size)
+
+    def bulk_update_status(self, empresa_id: str, pedido_ids: list[str], status: RegistrationStatus, current_user_id: str,
+                           current_user_name: str, on_progress: Callable[[int], None] | None = None) -> int:
+        """
+        Muda o status de vários pedidos (lixeira, restauração), com os campos de auditoria do novo
+        status e timestamps do servidor, em uma transação por bloco de STATUS_BATCH_SIZE pedidos.
+
+        Como em update_status_in_batches, pedidos inexistentes, de outra empresa ou já no novo status
+        são ignorados, mas os pedidos são lidos na transação com os campos de vendas: os deltas dos
+        resumos diários são calculados da versão que está sendo alterada (um pedido editado entre a
+        leitura e a gravação faz a transação ser repetida) e gravados na mesma transação.
+
+        Returns:
+            int: Quantidade de pedidos atualizados.
+        """
+        refs = [self.pedidos_collection.document(pedido_id) for pedido_id in pedido_ids]
+        data = {**status_change_data(status, current_user_id, current_user_name), SALES_ROLLUP_MARKER: True}
+
+        @firestore.transactional  # type: ignore [attr-defined]
+        def update_transaction(transaction, chunk):
+            deltas: dict[tuple[str, datetime.date], dict[str, Any]] = {}
+            pending = 0
+            for snapshot in self.db.get_all(chunk, field_paths=list(SALES_FIELDS), transaction=transaction):
+                previous_data = snapshot.to_dict() if snapshot.exists else None
+                if previous_data is None or previous_data.get("empresa_id") != empresa_id:
+                    continue
+                if previous_data.get("status") == data["status"]:
+                    continue
+                transaction.update(snapshot.reference, data)
+                merge_sales_deltas(deltas, sales_deltas(previous_data, {**previous_data, "status": data["status"]}))
+                pending += 1
+            # Um incremento por dia: pedidos do mesmo dia no bloco somam no mesmo documento
+            self._write_sales_deltas(transaction, deltas)
+            return pending
+
+        try:
+            processed = updated = 0
+            for start in range(0, len(refs), STATUS_BATCH_SIZE):
+                chunk = refs[start:start + STATUS_BATCH_SIZE]
+                updated += update_transaction(self.db.transaction(), chunk)
+                processed += len(chunk)
+                if on_progress:
+                    on_progress(processed)
+            return updated
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao atualizar o status de {len(refs)} pedidos: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            translated_error = deepl_translator(str(e))
+            raise Exception(f"Erro ao atualizar o status dos pedidos: {translated_error}")
+
+    def iter_unapplied_sales_pages(self, empresa_id: str, page_size: int = 500) -> Iterator[list[str]]:
+        """
+        Percorre os pedidos da empresa em páginas e devolve, de cada página, os IDs dos pedidos
+        ainda não somados aos resumos de vendas (sem SALES_ROLLUP_MARKER). Somente o marcador é
+        lido (field mask); o filtro por empresa usa o índice de campo único.
+        """
+        query = (self.pedidos_collection
+                 .where(filter=FieldFilter("empresa_id", "==", empresa_id))
+                 .select([SALES_ROLLUP_MARKER]))
+        for page in iter_query_pages(query, page_size):
+            yield [doc_id for doc_id, data in page if not data.get(SALES_ROLLUP_MARKER)]
+
+    def apply_sales_rollups(self, empresa_id: str, pedido_ids: list[str]) -> int:
+        """
+        Soma aos resumos de vendas os pedidos ainda não contados e os marca (SALES_ROLLUP_MARKER),
+        em uma transação por bloco: os pedidos são relidos na transação, então um pedido salvo
+        (e marcado) por outro usuário nesse meio tempo não é somado duas vezes. O updated_at não é
+        alterado: a carga não é uma edição do pedido.
+
+        Returns:
+            int: Quantidade de pedidos somados e marcados.
+        """
+        @firestore.transactional  # type: ignore [attr-defined]
+        def apply_transaction(transaction, chunk):
+            deltas: dict[tuple[str, datetime.date], dict[str, Any]] = {}
+            applied = 0
+            for snapshot in self.db.get_all(chunk, field_paths=list(SALES_FIELDS), transaction=transaction):
+                data = snapshot.to_dict() if snapshot.exists else None
+                if data is None or data.get("empresa_id") != empresa_id or data.get(SALES_ROLLUP_MARKER):
+                    continue
+                transaction.update(snapshot.reference, {SALES_ROLLUP_MARKER: True})
+                merge_sales_deltas(deltas, sales_deltas(None, data))
+                applied += 1
+            self._write_sales_deltas(transaction, deltas)
+            return applied
+
+        refs = [self.pedidos_collection.document(pedido_id) for pedido_id in pedido_ids]
+        try:
+            return sum(apply_transaction(self.db.transaction(), refs[start:start + STATUS_BATCH_SIZE])
+                       for start in range(0, len(refs), STATUS_BATCH_SIZE))
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao somar {len(refs)} pedidos aos resumos de vendas: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            translated_error = deepl_translator(str(e))
+            raise Exception(f"Erro ao somar os pedidos aos resumos de vendas: {translated_error}")
+
+    def get_daily_sales(self, empresa_id: str, days: list[datetime.date]) -> list[dict[str, Any]]:
+        """
+        Lê os resumos diários de vendas pelo ID ({empresa_id}_{AAAA-MM-DD}) em uma única chamada
+        (get_all): um mês são no máximo 31 leituras, sem query nem índice composto. Dias sem
+        vendas não têm documento e não são retornados.
+        """
+        refs = [self.sales_collection.document(sales_day_id(empresa_id, day)) for day in days]
+        try:
+            return [doc.to_dict() for doc in self.db.get_all(refs) if doc.exists]
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao consultar os resumos de vendas da empresa {empresa_id}: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            translated_error = deepl_translator(str(e))
+            raise Exception(f"Erro ao consultar os resumos de vendas: {translated_error}")
+
+    def bulk_hard_delete(self, empresa_id: str, pedido_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """
+        Exclui definitivamente, em transações de até 500 documentos, os pedidos informados que
+        estão na lixeira (status 'DELETED'); os demais são ignorados.
+
+        Returns:
+            int: Quantidade de pedidos excluídos.
+        """
+        refs = [self.pedidos_collection.document(pedido_id) for pedido_id in pedido_ids]
+        try:
+            return hard_delete_in_batches(self.db, refs, empresa_id=empresa_id, on_progress=on_progress)
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao excluir {len(refs)} pedidos: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            translated_error = deepl_translator(str(e))
+            raise Exception(f"Erro ao excluir definitivamente os pedidos: {translated_error}")
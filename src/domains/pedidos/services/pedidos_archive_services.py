@@ -0,0 +1,100 @@
+import logging
+import os
+from datetime import UTC, date, datetime
+from typing import Any, Callable
+
+from src.domains.pedidos.models.pedido_archive import hot_window_cutoff
+from src.domains.pedidos.models.pedidos_model import Pedido, PedidoHeader
+from src.domains.pedidos.repositories.contracts.pedidos_archive_repository import PedidosArchiveRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PedidosArchiveServices:
+    def __init__(self, repository: PedidosArchiveRepository):
+        self.repository = repository
+
+    def archive_old_pedidos(self, empresa_id: str, batch_size: int | None = None, max_batches: int | None = None,
+                            on_progress: Callable[[int], None] | None = None) -> dict[str, Any]:
+        """
+        Move para o arquivo mensal os pedidos finalizados anteriores à janela de pedidos ativos.
+
+        A migração é feita em lotes atômicos e pode ser interrompida a qualquer momento: uma
+        execução não concluída fica registrada no checkpoint e a próxima execução continua com a
+        mesma data de corte, mesmo que tenha virado o dia.
+
+        Args:
+            empresa_id (str): ID da empresa
+            batch_size (int | None): Pedidos por lote (padrão PEDIDOS_ARCHIVE_BATCH_SIZE ou 200)
+            max_batches (int | None): Limite de lotes nesta execução (None: até terminar)
+            on_progress (Callable | None): Recebe o total de pedidos arquivados nesta execução após cada lote
+
+        Returns:
+            dict: 'cutoff', 'archived' (nesta execução) e 'finished' (False se parou por max_batches)
+        """
+        if not empresa_id:
+            raise ValueError("ID da empresa é necessário para arquivar pedidos.")
+
+        checkpoint = self.repository.get_checkpoint(empresa_id) or {}
+        if checkpoint.get("cutoff") and not checkpoint.get("finished"):
+            # Retoma a execução interrompida com a mesma data de corte
+            cutoff = date.fromisoformat(checkpoint["cutoff"])
+            previously_archived = int(checkpoint.get("archived", 0))
+            logger.info(f"Retomando o arquivamento de pedidos da empresa {empresa_id} (corte {cutoff})")
+        else:
+            cutoff = hot_window_cutoff()
+            if cutoff is None:
+                raise ValueError("Arquivamento desabilitado: PEDIDOS_HOT_WINDOW_DAYS=0.")
+            self.repository.save_checkpoint(empresa_id, {
+                "cutoff": cutoff.isoformat(),
+                "finished": False,
+                "started_at": datetime.now(UTC),
+                "archived": 0,
+            })
+            previously_archived = 0
+
+        batch_size = batch_size or int(os.getenv('PEDIDOS_ARCHIVE_BATCH_SIZE', '200'))
+        archived = 0
+        batches = 0
+        finished = False
+        while max_batches is None or batches < max_batches:
+            moved = self.repository.archive_batch(empresa_id, cutoff, batch_size)
+            batches += 1
+            archived += moved
+            if moved:
+                self.repository.save_checkpoint(empresa_id, {"archived": previously_archived + archived})
+                if on_progress:
+                    on_progress(archived)
+            if moved < batch_size:
+                finished = True
+                break
+
+        if finished:
+            # archived_cutoff: corte da última execução concluída. A listagem padrão de pedidos só
+            # aplica a janela a partir dele (antes disso nenhum pedido foi movido para o arquivo)
+            self.repository.save_checkpoint(empresa_id, {"finished": True, "finished_at": datetime.now(UTC),
+                                                         "archived_cutoff": cutoff.isoformat()})
+        logger.info(f"Arquivamento de pedidos da empresa {empresa_id}: {archived} pedido(s) em {batches} lote(s), "
+                    f"{'concluído' if finished else 'interrompido por max_batches'}")
+        return {"cutoff": cutoff, "archived": archived, "finished": finished}
+
+    def get_archive_months(self, empresa_id: str) -> list[dict[str, Any]]:
+        """Meses arquivados da empresa com quantidade e total (centavos) de pedidos."""
+        return self.repository.get_archive_months(empresa_id)
+
+    def search_archive(self, empresa_id: str, start_date: date | None = None, end_date: date | None = None,
+                       page_size: int = 50, cursor: dict[str, Any] | None = None) -> tuple[list[PedidoHeader], dict[str, Any] | None]:
+        """
+        Busca paginada nos pedidos arquivados.
+
+        Returns:
+            tuple: (cabeçalhos da página, cursor da próxima página ou None)
+        """
+        if start_date and end_date and start_date > end_date:
+            raise ValueError("A data inicial deve ser anterior à data final.")
+        page_size = max(1, min(page_size, 200))
+        return self.repository.search(empresa_id, start_date, end_date, page_size, cursor)
+
+    def get_archived_pedido(self, empresa_id: str, pedido_id: str, order_date: date) -> Pedido | None:
+        """Pedido arquivado completo (com itens), somente para consulta."""
+        return self.repository.get_archived_pedido(empresa_id, pedido_id, order_date)
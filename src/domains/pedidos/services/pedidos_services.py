@@ -1,5 +1,8 @@
-from src.domains.pedidos.models.pedidos_model import Pedido
+from typing import Any, Callable
+
+from src.domains.pedidos.models.pedidos_model import Pedido, PedidoHeader, PedidoItem
 from src.domains.pedidos.models.pedidos_subclass import DeliveryStatus
+from src.domains.pedidos.models.sales_rollup import build_sales_report, month_days
 from src.domains.pedidos.repositories.contracts.pedidos_repository import PedidosRepository
 from src.domains.shared.models.registration_status import RegistrationStatus
 from src.domains.usuarios.models.usuarios_model import Usuario
@@ -80,7 +83,33 @@ class PedidosServices:
         """
         return self.repository.get_pedidos_by_empresa_id(empresa_id, status)
 
-    def delete_pedido(self, pedido: Pedido, current_user: Usuario) -> bool:
+    def get_pedido_headers_by_empresa_id(self, empresa_id: str, status: RegistrationStatus | None = None) -> tuple[list[PedidoHeader], int]:
+        """
+        Busca os cabeçalhos (sem itens) dos pedidos de uma empresa, para as listagens.
+
+        Args:
+            empresa_id (str): ID da empresa a ser buscada
+            status (RegistrationStatus | None, optional): Se passado, filtra os pedidos pelo seu status
+
+        Returns:
+            pedidos (list[PedidoHeader]): Cabeçalhos dos pedidos encontrados ou lista vazia
+            int: Quantidade de pedidos deletados na empresa
+        """
+        return self.repository.get_pedido_headers_by_empresa_id(empresa_id, status)
+
+    def get_pedido_items(self, pedido_id: str) -> list[PedidoItem] | None:
+        """
+        Busca somente os itens de um pedido.
+
+        Args:
+            pedido_id (str): ID do pedido
+
+        Returns:
+            items (list[PedidoItem] | None): Itens do pedido ou None se o pedido não existir
+        """
+        return self.repository.get_pedido_items(pedido_id)
+
+    def delete_pedido(self, pedido: Pedido | PedidoHeader, current_user: Usuario) -> bool:
         """
         Realiza um soft delete em um pedido, definindo deleted_at.
 
@@ -98,7 +127,7 @@ class PedidosServices:
 
         return self.repository.delete_pedido(pedido)
 
-    def restore_pedido(self, pedido: Pedido, current_user: Usuario) -> bool:
+    def restore_pedido(self, pedido: Pedido | PedidoHeader, current_user: Usuario) -> bool:
         """
         Restaura um pedido da lixeira.
 
@@ -115,3 +144,59 @@ class PedidosServices:
         pedido.activated_by_name = current_user.name.nome_completo
 
         return self.repository.restore_pedido(pedido)
+
+    def bulk_update_status(self, empresa_id: str, pedido_ids: list[str], current_user: Usuario, status: RegistrationStatus,
+                           on_progress: Callable[[int], None] | None = None) -> int:
+        """Muda o status de vários pedidos em lote (envio à lixeira ou restauração em massa)."""
+        if not current_user.id:
+            raise ValueError("ID do usuário é necessário")
+        return self.repository.bulk_update_status(empresa_id, pedido_ids, status, current_user.id,
+                                                  current_user.name.nome_completo, on_progress)
+
+    def bulk_hard_delete(self, empresa_id: str, pedido_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """Exclui definitivamente, em lote, os pedidos que estão na lixeira."""
+        return self.repository.bulk_hard_delete(empresa_id, pedido_ids, on_progress)
+
+    def get_monthly_sales_report(self, empresa_id: str, year: int, month: int) -> dict[str, Any]:
+        """
+        Relatório de vendas do mês a partir dos resumos diários (no máximo 31 documentos lidos).
+
+        Args:
+            empresa_id (str): ID da empresa
+            year (int): Ano
+            month (int): Mês (1 a 12)
+
+        Returns:
+            dict: Totais do mês (order_count, revenue_cents, items_sold), vendas por dia ('days') e
+                por produto ('products'), ver build_sales_report.
+        """
+        if not 1 <= month <= 12:
+            raise ValueError(f"Mês inválido: {month}")
+        daily = self.repository.get_daily_sales(empresa_id, month_days(year, month))
+        return build_sales_report(year, month, daily)
+
+    def backfill_sales_rollups(self, empresa_id: str, page_size: int = 500,
+                               on_progress: Callable[[int], None] | None = None) -> int:
+        """
+        Soma aos resumos diários de vendas os pedidos gravados antes deles existirem (sem o marcador
+        SALES_ROLLUP_MARKER) e os marca. Idempotente: pedidos já marcados, inclusive por uma execução
+        anterior interrompida, são ignorados.
+
+        Args:
+            empresa_id (str): ID da empresa
+            page_size (int): Pedidos lidos por página
+            on_progress (Callable | None): Recebe o total de pedidos somados após cada página
+
+        Returns:
+            int: Quantidade de pedidos somados nesta execução.
+        """
+        if not empresa_id:
+            raise ValueError("ID da empresa é necessário para carregar os resumos de vendas.")
+        applied = 0
+        for pedido_ids in self.repository.iter_unapplied_sales_pages(empresa_id, page_size):
+            if not pedido_ids:
+                continue
+            applied += self.repository.apply_sales_rollups(empresa_id, pedido_ids)
+            if on_progress:
+                on_progress(applied)
+        return applied
@@ -3,7 +3,7 @@ import flet as ft
 from src.domains.pedidos.components import FilterComponents
 from src.domains.pedidos.components.order_card import OrderCard
 from src.domains.pedidos.models.pedidos_subclass import OrderFilterType
-from src.domains.pedidos.models.pedidos_model import Pedido
+from src.domains.pedidos.models.pedidos_model import PedidoHeader
 from src.pages.partials.app_bars.appbar import create_appbar_menu
 
 if TYPE_CHECKING:
@@ -66,6 +66,12 @@ class PedidoGridUI:
             on_click=self._on_add_clicked
         )
 
+        self.fab_export = ft.FloatingActionButton(
+            tooltip="Exportar pedidos (CSV/Parquet)",
+            icon=ft.Icons.DOWNLOAD,
+            on_click=self._on_export_clicked
+        )
+
         self.fab_trash = ft.FloatingActionButton(
             content=ft.Image(
                 src="icons/recycle_empy_1771.png",
@@ -79,7 +85,7 @@ class PedidoGridUI:
         )
 
         return ft.Column(
-            controls=[self.fab_add, self.fab_trash],
+            controls=[self.fab_add, self.fab_export, self.fab_trash],
             alignment=ft.MainAxisAlignment.END,
         )
 
@@ -90,7 +96,7 @@ class PedidoGridUI:
         if self.controller.page.client_storage:
             self.controller.page.update()
 
-    def render_grid(self, pedidos: list[Pedido]):
+    def render_grid(self, pedidos: list[PedidoHeader]):
         """Renderiza o grid com os pedidos filtrados"""
         self.content_area.controls.clear()
 
@@ -117,7 +123,7 @@ class PedidoGridUI:
             alignment=ft.alignment.center,
         )
 
-    def _create_orders_grid(self, pedidos: list[Pedido]) -> ft.ResponsiveRow:
+    def _create_orders_grid(self, pedidos: list[PedidoHeader]) -> ft.ResponsiveRow:
         """Cria o grid responsivo de pedidos"""
         cards = []
         for pedido in pedidos:
@@ -154,6 +160,9 @@ class PedidoGridUI:
     def _on_add_clicked(self, e):
         self.controller.execute_action_async("INSERT", None)
 
+    def _on_export_clicked(self, e):
+        self.controller.execute_action_async("EXPORT", None)
+
     def _apply_filters(self):
         """Aplica filtros e atualiza a UI"""
         self.controller.state.search_text = self.search_field.value or ""
@@ -164,7 +173,7 @@ class PedidoGridUI:
 
         self.render_grid(filtered_pedidos)
 
-    def _update_search_field_visual(self, filtered_pedidos: list[Pedido]):
+    def _update_search_field_visual(self, filtered_pedidos: list[PedidoHeader]):
         """Atualiza o visual do campo de busca baseado nos resultados"""
         suffix = self.search_field.suffix
         if not isinstance(suffix, ft.IconButton):
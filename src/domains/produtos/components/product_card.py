@@ -53,7 +53,7 @@ class ProductCard:
         """Cria o container da imagem do produto"""
         image_content = (
             ft.Image(
-                src=produto.image_url,
+                src=produto.get_image_url("thumb"),
                 fit=ft.ImageFit.COVER,
                 width=100, height=100,
                 border_radius=ft.border_radius.all(10),
@@ -1,16 +1,18 @@
 import logging
 
-from typing import Any
+from typing import Any, Callable
 from src.domains.produtos.models import Produto
 from src.domains.shared import RegistrationStatus
 from src.domains.produtos.repositories import FirebaseProdutosRepository
-from src.domains.produtos.services import ProdutosServices
+from src.domains.produtos.services import ProdutosImportServices, ProdutosServices
 from src.domains.usuarios.models.usuarios_model import Usuario
+from src.shared.metrics import instrument_controller
 
 
 logger = logging.getLogger(__name__)
 
 
+@instrument_controller("produtos")
 def handle_save(produto: Produto, current_user: Usuario) -> dict[str, Any]:
     """Salva ou atualiza um produto."""
     response = {}
@@ -42,6 +44,7 @@ def handle_save(produto: Produto, current_user: Usuario) -> dict[str, Any]:
     return response
 
 
+@instrument_controller("produtos")
 def handle_update_status(produto: Produto, current_user: Usuario, status: RegistrationStatus) -> dict[str, Any]:
     """Manipula o status para ativo, inativo ou deletado de um produto."""
     response = {}
@@ -86,6 +89,7 @@ def handle_update_status(produto: Produto, current_user: Usuario, status: Regist
     return response
 
 
+@instrument_controller("produtos")
 def handle_get_by_id(empresa_id: str, produto_id: str) -> dict | None:
     """Busca uma produto de produto pelo seu ID."""
     response = {}
@@ -119,6 +123,7 @@ def handle_get_by_id(empresa_id: str, produto_id: str) -> dict | None:
     return response
 
 
+@instrument_controller("produtos")
 def handle_get_all(empresa_id: str, status_deleted: bool = False) -> dict[str, Any]:
     """
     Busca todos os produtos da empresa logada que sejam ativa ou não, dependendo do status_active desejado.
@@ -172,6 +177,40 @@ def handle_get_all(empresa_id: str, status_deleted: bool = False) -> dict[str, A
     return response
 
 
+@instrument_controller("produtos")
+def handle_get_projection(empresa_id: str) -> dict[str, Any]:
+    """
+    Busca a projeção compacta dos produtos não excluídos da empresa logada, para seleção
+    de produtos no formulário de pedidos.
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (list[dict]): Dicionários com 'id', 'name', 'sale_price_cents', 'quantity_on_hand',
+                           'unit_of_measure', 'ean_code', 'internal_code', ordenados por nome.
+    """
+    response = {}
+
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa logada não pode ser nulo ou vazio")
+
+        repository = FirebaseProdutosRepository(company_id=empresa_id)
+        produtos_services = ProdutosServices(repository)
+
+        response["status"] = "success"
+        response["data"] = produtos_services.get_projection(empresa_id)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"produtos_controllers.handle_get_projection ValueError: Erro de validação: {str(e)}"
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+
+    return response
+
+
+@instrument_controller("produtos")
 def handle_get_low_stock_count(empresa_id: str) -> dict[str, Any]:
     """
     Obtém a quantidade de produtos ativos que necessitam de reposição no estoque.
@@ -201,3 +240,133 @@ def handle_get_low_stock_count(empresa_id: str) -> dict[str, Any]:
         response["message"] = str(e)
 
     return response
+
+
+@instrument_controller("produtos")
+def handle_import_produtos(file_path: str, empresa_id: str, current_user: Usuario,
+                           on_progress: Callable[[int, int], None] | None = None) -> dict[str, Any]:
+    """
+    Importa produtos em massa de uma planilha CSV ou XLSX.
+
+    Args:
+        file_path (str): Caminho local da planilha
+        empresa_id (str): ID da empresa logada
+        current_user (Usuario): Usuário logado
+        on_progress (Callable | None): Recebe (linhas processadas, produtos gravados) após cada lote
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (ImportReport): Totais da importação e linhas rejeitadas (com o motivo).
+    """
+    # Import tardio: categorias_controllers não é usado nas demais operações de produtos
+    from src.domains.categorias.controllers import categorias_controllers
+
+    response = {}
+
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa logada não pode ser nulo ou vazio")
+        if not isinstance(current_user, Usuario):
+            raise ValueError("O argumento current_user não é do tipo 'Usuario'")
+
+        # Resumo das categorias ativas (em cache): o nome da categoria da planilha é resolvido em memória
+        categorias_result = categorias_controllers.handle_get_active_categorias_summary(empresa_id)
+        if categorias_result["status"] == "error":
+            raise Exception(categorias_result["message"])
+
+        repository = FirebaseProdutosRepository(company_id=empresa_id)
+        import_services = ProdutosImportServices(repository)
+
+        report = import_services.import_file(file_path, empresa_id, current_user, categorias_result["data"],
+                                             on_progress=on_progress)
+
+        response["status"] = "success"
+        response["data"] = report
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+        logger.error("produtos_controllers.handle_import_produtos(ValueError). " + response["message"])
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+        logger.error(response["message"])
+
+    return response
+
+
+@instrument_controller("produtos")
+def handle_bulk_update_status(empresa_id: str, produto_ids: list[str], current_user: Usuario, status: RegistrationStatus,
+                              on_progress: Callable[[int], None] | None = None) -> dict[str, Any]:
+    """
+    Muda em lote o status de vários produtos (envio à lixeira ou restauração em massa).
+
+    Args:
+        empresa_id (str): ID da empresa logada
+        produto_ids (list[str]): IDs dos produtos
+        current_user (Usuario): Usuário logado, gravado nos campos de auditoria
+        status (RegistrationStatus): Novo status
+        on_progress (Callable | None): Recebe o total de registros processados após cada lote gravado
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (int): Quantidade de produtos atualizados.
+    """
+    response = {}
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa logada não pode ser nulo ou vazio")
+        if not isinstance(current_user, Usuario) or not current_user.id:
+            raise ValueError("Usuário logado é necessário para alterar o status")
+        if not isinstance(status, RegistrationStatus):
+            raise ValueError("Status não é do tipo RegistrationStatus")
+
+        repository = FirebaseProdutosRepository(company_id=empresa_id)
+        services = ProdutosServices(repository)
+
+        response["status"] = "success"
+        response["data"] = services.bulk_update_status(produto_ids, current_user, status, on_progress)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+        logger.error("produtos_controllers.handle_bulk_update_status(ValueError). " + response["message"])
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+        logger.error(response["message"])
+
+    return response
+
+
+@instrument_controller("produtos")
+def handle_bulk_hard_delete(empresa_id: str, produto_ids: list[str],
+                            on_progress: Callable[[int], None] | None = None) -> dict[str, Any]:
+    """
+    Exclui definitivamente, em lote, os produtos da lixeira (status 'DELETED').
+
+    Returns (dict):
+        status (str): "success" ou "error"
+        message (str): Uma mensagem de erro.
+        data (int): Quantidade de produtos excluídos.
+    """
+    response = {}
+    try:
+        if not empresa_id:
+            raise ValueError("ID da empresa logada não pode ser nulo ou vazio")
+
+        repository = FirebaseProdutosRepository(company_id=empresa_id)
+        services = ProdutosServices(repository)
+
+        response["status"] = "success"
+        response["data"] = services.bulk_hard_delete(produto_ids, on_progress)
+    except ValueError as e:
+        response["status"] = "error"
+        response["message"] = f"Erro de validação: {str(e)}"
+        logger.error("produtos_controllers.handle_bulk_hard_delete(ValueError). " + response["message"])
+    except Exception as e:
+        response["status"] = "error"
+        response["message"] = str(e)
+        logger.error(response["message"])
+
+    return response
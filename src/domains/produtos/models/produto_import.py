@@ -0,0 +1,191 @@
+import csv
+import unicodedata
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from src.domains.produtos.models.produtos_model import Produto
+from src.domains.shared import RegistrationStatus
+from src.shared.utils.money_numpy import Money
+
+# Nomes de coluna aceitos na planilha (normalizados: minúsculas, sem acentos, espaços -> '_')
+COLUMN_ALIASES: dict[str, tuple[str, ...]] = {
+    "name": ("nome", "produto", "name"),
+    "categoria": ("categoria", "categoria_name", "category"),
+    "sale_price": ("preco_venda", "preco", "valor", "sale_price"),
+    "cost_price": ("preco_custo", "custo", "cost_price"),
+    "quantity_on_hand": ("estoque", "quantidade", "quantity_on_hand"),
+    "unit_of_measure": ("unidade", "un", "unit_of_measure"),
+    "ean_code": ("ean", "codigo_barras", "gtin", "ean_code"),
+    "internal_code": ("codigo", "codigo_interno", "sku", "internal_code"),
+    "brand": ("marca", "brand"),
+    "description": ("descricao", "description"),
+    "ncm": ("ncm",),
+    "minimum_stock_level": ("estoque_minimo", "minimum_stock_level"),
+    "maximum_stock_level": ("estoque_maximo", "maximum_stock_level"),
+}
+REQUIRED_COLUMNS = ("name", "categoria", "sale_price")
+
+_ALIAS_TO_FIELD = {alias: name for name, aliases in COLUMN_ALIASES.items() for alias in aliases}
+
+
+def normalize_header(header: Any) -> str:
+    """'Preço Venda' -> 'preco_venda'."""
+    text = unicodedata.normalize("NFKD", str(header or "")).encode("ascii", "ignore").decode()
+    return "_".join(text.strip().lower().split())
+
+
+def map_columns(headers: list[Any]) -> dict[int, str]:
+    """
+    Relaciona as colunas da planilha (posição) aos campos do produto.
+
+    Raises:
+        ValueError: Se faltar alguma coluna obrigatória (nome, categoria, preço de venda).
+    """
+    columns: dict[int, str] = {}
+    for index, header in enumerate(headers):
+        field_name = _ALIAS_TO_FIELD.get(normalize_header(header))
+        if field_name and field_name not in columns.values():
+            columns[index] = field_name
+    missing = [name for name in REQUIRED_COLUMNS if name not in columns.values()]
+    if missing:
+        expected = ", ".join(COLUMN_ALIASES[name][0] for name in missing)
+        raise ValueError(f"Coluna(s) obrigatória(s) ausente(s) na planilha: {expected}")
+    return columns
+
+
+def parse_price_cents(value: Any) -> int:
+    """
+    Converte o preço da planilha para centavos: aceita número ou texto ('19,90', '1.234,56', 'R$ 19.90').
+
+    Raises:
+        ValueError: Se o valor não for numérico ou for negativo.
+    """
+    if value is None or value == "":
+        return 0
+    if isinstance(value, (int, float, Decimal)):
+        amount = Decimal(str(value))
+    else:
+        text = str(value).replace("R$", "").strip().replace(" ", "")
+        if "," in text:
+            text = text.replace(".", "").replace(",", ".")
+        try:
+            amount = Decimal(text)
+        except InvalidOperation:
+            raise ValueError(f"Preço inválido: {value}")
+    if amount < 0:
+        raise ValueError(f"Preço negativo: {value}")
+    return int(amount.quantize(Decimal("0.01")) * 100)
+
+
+def _parse_int(value: Any, label: str) -> int:
+    if value is None or value == "":
+        return 0
+    try:
+        return int(Decimal(str(value).strip().replace(",", ".")))
+    except (InvalidOperation, ValueError):
+        raise ValueError(f"{label} inválido: {value}")
+
+
+def _text(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)  # EAN/código lidos do XLSX como número
+    text = str(value).strip()
+    return text or None
+
+
+@dataclass
+class ImportRowError:
+    """Linha rejeitada na importação (número da linha na planilha, motivo e valores lidos)."""
+    line: int
+    message: str
+    values: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ImportReport:
+    """Resultado da importação de produtos."""
+    total_rows: int = 0
+    imported: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+
+    @property
+    def rejected(self) -> int:
+        return len(self.errors)
+
+    def write_errors_csv(self, path: str) -> None:
+        """Grava o relatório de erros (linha, motivo e colunas lidas) em CSV com ';' (padrão do Excel pt-BR)."""
+        columns = list(COLUMN_ALIASES)
+        with open(path, "w", newline="", encoding="utf-8-sig") as file:
+            writer = csv.writer(file, delimiter=";")
+            writer.writerow(["linha", "erro", *[COLUMN_ALIASES[name][0] for name in columns]])
+            for error in self.errors:
+                writer.writerow([error.line, error.message, *[error.values.get(name, "") for name in columns]])
+
+
+class ProdutoRowParser:
+    """
+    Valida as linhas da planilha e monta os produtos a importar.
+
+    As categorias são resolvidas pelo nome em um dicionário montado uma única vez
+    (nome em minúsculas -> (id, nome)), sem uma consulta ao banco por linha.
+    """
+
+    def __init__(self, empresa_id: str, categorias: dict[str, tuple[str, str]], user_id: str, user_name: str):
+        self.empresa_id = empresa_id
+        self.categorias = categorias
+        self.user_id = user_id
+        self.user_name = user_name
+
+    def parse(self, values: dict[str, Any], produto_id: str) -> Produto:
+        """
+        Raises:
+            ValueError: Com o motivo da rejeição da linha.
+        """
+        name = _text(values.get("name"))
+        if not name:
+            raise ValueError("Nome do produto não informado")
+
+        categoria_name = _text(values.get("categoria"))
+        if not categoria_name:
+            raise ValueError("Categoria não informada")
+        categoria = self.categorias.get(categoria_name.lower())
+        if not categoria:
+            raise ValueError(f"Categoria '{categoria_name}' não encontrada ou inativa")
+        categoria_id, categoria_name = categoria
+
+        sale_cents = parse_price_cents(values.get("sale_price"))
+        if not sale_cents:
+            raise ValueError("Preço de venda não informado")
+
+        ncm_code = _text(values.get("ncm"))
+        ncm = {"code": ncm_code.replace(".", ""), "description": None, "full_description": None} if ncm_code else {}
+
+        return Produto(
+            id=produto_id,
+            empresa_id=self.empresa_id,
+            name=name,
+            name_lowercase="",
+            categoria_id=categoria_id,
+            categoria_name=categoria_name,
+            categoria_name_lower="",
+            ncm=ncm,
+            sale_price=Money(sale_cents, "R$"),
+            cost_price=Money(parse_price_cents(values.get("cost_price")), "R$"),
+            internal_code=_text(values.get("internal_code")),
+            ean_code=_text(values.get("ean_code")),
+            description=_text(values.get("description")),
+            brand=_text(values.get("brand")),
+            quantity_on_hand=_parse_int(values.get("quantity_on_hand"), "Estoque"),
+            unit_of_measure=_text(values.get("unit_of_measure")) or "UN",
+            minimum_stock_level=_parse_int(values.get("minimum_stock_level"), "Estoque mínimo"),
+            maximum_stock_level=_parse_int(values.get("maximum_stock_level"), "Estoque máximo"),
+            status=RegistrationStatus.ACTIVE,
+            created_at=None,  # SERVER_TIMESTAMP na gravação
+            created_by_id=self.user_id,
+            created_by_name=self.user_name,
+            activated_by_id=self.user_id,
+            activated_by_name=self.user_name,
+        )
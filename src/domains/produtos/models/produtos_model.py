@@ -3,7 +3,7 @@ from datetime import datetime, UTC
 from typing import Any
 
 # Supondo que RegistrationStatus esteja no mesmo local ou acessível
-from src.domains.shared import RegistrationStatus
+from src.domains.shared import RegistrationStatus, hydrate
 from src.shared.utils import Money
 
 
@@ -32,6 +32,8 @@ class Produto:
     # --- Campos Descritivos ---
     description: str | None = None
     image_url: str | None = None
+    # URLs das rendições geradas pelo pipeline de imagens: {"thumb": ..., "medium": ..., "large": ...}
+    image_renditions: dict[str, str] | None = None
     brand: str | None = None          # Marca do produto
 
     # --- Campos de Estoque ---
@@ -126,6 +128,15 @@ class Produto:
         if not self.ncm or not isinstance(self.ncm, dict) or self.ncm.get("code") is None:
             self.ncm = {"code": None, "description": None, "full_description": None}
 
+    def get_image_url(self, rendition: str = "thumb") -> str | None:
+        """
+        Retorna a URL da rendição da imagem do produto ("thumb", "medium" ou "large").
+        Imagens sem rendições (URL externa ou enviadas antes do pipeline) retornam image_url.
+        """
+        if self.image_renditions and self.image_renditions.get(rendition):
+            return self.image_renditions[rendition]
+        return self.image_url
+
     def to_dict(self) -> dict[str, Any]:
         """Retorna um dicionário representando o objeto Produto."""
         # Converte Money para dicionário
@@ -150,6 +161,7 @@ class Produto:
             "ncm": self.ncm,  # Nomenclatura Comum do Mercosul
             "status": self.status,  # Armazena o nome do enum
             "image_url": self.image_url,
+            "image_renditions": self.image_renditions,
             "created_at": self.created_at,
             "created_by_id": self.created_by_id,
             "created_by_name": self.created_by_name,
@@ -194,6 +206,7 @@ class Produto:
             "status": self.status.name,  # Salva o nome do enum no DB
             "ncm": self.ncm,  # Nomenclatura Comum do Mercosul
             "image_url": self.image_url,
+            "image_renditions": self.image_renditions,
             "created_at": self.created_at if self.created_at else datetime.now(UTC),
             "created_by_id": self.created_by_id,
             "created_by_name": self.created_by_name,
@@ -214,8 +227,13 @@ class Produto:
         return {k: v for k, v in dict_db.items() if v is not None}
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any], doc_id: str | None = None) -> "Produto":
-        """Cria uma instância de Produto a partir de um dicionário (ex: do Firestore)."""
+    def from_dict(cls, data: dict[str, Any], doc_id: str | None = None, trusted: bool = False) -> "Produto":
+        """
+        Cria uma instância de Produto a partir de um dicionário (ex: do Firestore).
+
+        Com trusted=True (leituras do repositório), as normalizações do __post_init__ não são
+        repetidas: o documento já foi normalizado quando foi gravado.
+        """
         # Converte enums
         status_data = data.get("status", RegistrationStatus.ACTIVE)
         status = status_data # Por padrão status é do tipo RegistrationStatus
@@ -269,7 +287,7 @@ class Produto:
         currency_symbol: str = cost_price_data["currency_symbol"]
         cost_price: Money = Money.from_dict({"amount_cents": amount_cents, "currency_symbol": currency_symbol})
 
-        return cls(
+        values = dict(
             # Usa doc_id se fornecido (ID do documento Firestore)
             id=doc_id or data.get("id"),
             empresa_id=data["empresa_id"],
@@ -291,6 +309,7 @@ class Produto:
             ncm=data.get("ncm", {"code": None, "description": None, "full_description": None}),
             status=status,
             image_url=data.get("image_url"),
+            image_renditions=data.get("image_renditions"),
             created_at=created_at,
             created_by_id=data.get("created_by_id"),
             created_by_name=data.get("created_by_name"),
@@ -307,3 +326,6 @@ class Produto:
             deleted_by_id=data.get("deleted_by_id"),
             deleted_by_name=data.get("deleted_by_name"),
         )
+        if trusted:
+            return hydrate(cls, values)
+        return cls(**values)
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from datetime import datetime
+from typing import Any, Callable, Iterator
 
 from src.domains.produtos.models import Produto
+from src.domains.shared import RegistrationStatus
 
 
 class ProdutosRepository(ABC):
@@ -13,6 +15,12 @@ class ProdutosRepository(ABC):
         raise NotImplementedError(
         "Este método deve ser implementado pela subclasse")
 
+    @abstractmethod
+    def save_batch(self, produtos: list[Produto]) -> None:
+        """Grava novos produtos em um único lote atômico, sem reler os documentos (importação em massa)"""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
     @abstractmethod
     def get_by_id(self, produto_id: str) -> Produto | None:
         """Encontra um produto pelo ID no repositório"""
@@ -38,3 +46,33 @@ class ProdutosRepository(ABC):
         """
         raise NotImplementedError(
         "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def get_projection(self, updated_since: datetime | None = None) -> list[dict[str, Any]]:
+        """
+        Obtém uma projeção compacta dos produtos (id, name, sale_price_cents, quantity_on_hand,
+        unit_of_measure, ean_code, internal_code, status, updated_at).
+
+        Se updated_since for informado, retorna somente os produtos alterados após essa data.
+        """
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def iter_export_pages(self, page_size: int = 500) -> Iterator[list[tuple[str, dict[str, Any]]]]:
+        """Percorre todos os produtos da empresa em páginas de (ID, documento bruto), para exportação."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def bulk_update_status(self, produto_ids: list[str], status: RegistrationStatus, current_user_id: str,
+                           current_user_name: str, on_progress: Callable[[int], None] | None = None) -> int:
+        """Muda o status de vários produtos em lote, com auditoria. Retorna a quantidade de produtos atualizados."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def bulk_hard_delete(self, produto_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """Exclui definitivamente, em lote, os produtos que estão na lixeira. Retorna a quantidade de produtos excluídos."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
@@ -1,5 +1,6 @@
 import logging
-from typing import Any, Tuple, List # Usar List explicitamente para type hints
+from datetime import datetime
+from typing import Any, Callable, Iterator, Tuple, List # Usar List explicitamente para type hints
 
 # from google.cloud.firestore_v1.base_query import FieldFilter
 from google.cloud.firestore_v1.base_query import FieldFilter
@@ -10,10 +11,26 @@ from src.domains.produtos.models import Produto
 from src.domains.shared import RegistrationStatus
 from src.domains.produtos.repositories import ProdutosRepository
 from src.shared.utils import deepl_translator
-from storage.data import get_firebase_app
+from src.domains.shared.repositories.utils import hard_delete_in_batches, status_change_data, update_status_in_batches
+from storage.data import get_firebase_app, get_firestore_client, iter_query_pages, record_returned
 
 logger = logging.getLogger(__name__)
 
+# Campos lidos pela projeção compacta (field mask); o restante do documento não é transferido
+PROJECTION_FIELDS = (
+    "name",
+    "sale_price.amount_cents",
+    "quantity_on_hand",
+    "unit_of_measure",
+    "ean_code",
+    "internal_code",
+    "status",
+    "updated_at",
+)
+
+# Limite de escritas de um WriteBatch do Firestore
+MAX_WRITE_BATCH_SIZE = 500
+
 class FirebaseProdutosRepository(ProdutosRepository):
     def __init__(self, company_id: str):
         """
@@ -24,11 +41,35 @@ class FirebaseProdutosRepository(ProdutosRepository):
             company_id (str): O ID do documento da empresa pai na coleção 'empresas'.
         """
         get_firebase_app() # Garante que o aplicativo Firebase esteja inicializado
-        self.db = firestore.client()
+        self.db = get_firestore_client()
         self.products_collection_ref = (self.db.collection('empresas')
                                         .document(company_id)
                                         .collection('produtos'))
 
+    @staticmethod
+    def _to_db_with_timestamps(produto: Produto) -> dict[str, Any]:
+        """Dicionário do produto para gravação, com os timestamps atribuídos pelo servidor."""
+        data_to_save = produto.to_dict_db()
+
+        # Define created_at apenas na criação inicial
+        if not data_to_save.get("created_at"):
+            data_to_save['created_at'] = firestore.SERVER_TIMESTAMP # type: ignore [attr-defined]
+
+        # updated_at é sempre definido/atualizado com o timestamp do servidor
+        data_to_save['updated_at'] = firestore.SERVER_TIMESTAMP # type: ignore [attr-defined]
+
+        # Gerencia os timestamps de status (ACTIVE, DELETED, INACTIVE)
+        if data_to_save.get("status") == RegistrationStatus.ACTIVE.name and not data_to_save.get("activated_at"):
+            data_to_save['activated_at'] = firestore.SERVER_TIMESTAMP # type: ignore [attr-defined]
+
+        if data_to_save.get("status") == RegistrationStatus.DELETED.name and not data_to_save.get("deleted_at"):
+            data_to_save['deleted_at'] = firestore.SERVER_TIMESTAMP # type: ignore [attr-defined]
+
+        if data_to_save.get("status") == RegistrationStatus.INACTIVE.name and not data_to_save.get("inactivated_at"):
+            data_to_save['inactivated_at'] = firestore.SERVER_TIMESTAMP # type: ignore [attr-defined]
+
+        return data_to_save
+
     def save(self, produto: Produto) -> str | None:
         """
         Salva um produto no banco de dados Firestore.
@@ -45,24 +86,7 @@ class FirebaseProdutosRepository(ProdutosRepository):
                  ou a subsequente releitura dos timestamps falhar.
         """
         try:
-            data_to_save = produto.to_dict_db()
-
-            # Define created_at apenas na criação inicial
-            if not data_to_save.get("created_at"):
-                data_to_save['created_at'] = firestore.SERVER_TIMESTAMP # type: ignore [attr-defined]
-
-            # updated_at é sempre definido/atualizado com o timestamp do servidor
-            data_to_save['updated_at'] = firestore.SERVER_TIMESTAMP # type: ignore [attr-defined]
-
-            # Gerencia os timestamps de status (ACTIVE, DELETED, INACTIVE)
-            if data_to_save.get("status") == RegistrationStatus.ACTIVE.name and not data_to_save.get("activated_at"):
-                data_to_save['activated_at'] = firestore.SERVER_TIMESTAMP # type: ignore [attr-defined]
-
-            if data_to_save.get("status") == RegistrationStatus.DELETED.name and not data_to_save.get("deleted_at"):
-                data_to_save['deleted_at'] = firestore.SERVER_TIMESTAMP # type: ignore [attr-defined]
-
-            if data_to_save.get("status") == RegistrationStatus.INACTIVE.name and not data_to_save.get("inactivated_at"):
-                data_to_save['inactivated_at'] = firestore.SERVER_TIMESTAMP # type: ignore [attr-defined]
+            data_to_save = self._to_db_with_timestamps(produto)
 
             doc_ref = self.products_collection_ref.document(produto.id)
             doc_ref.set(data_to_save, merge=True) # Chamada síncrona
@@ -87,7 +111,7 @@ class FirebaseProdutosRepository(ProdutosRepository):
                     # Cria um novo objeto Produto a partir dos dados do DB
                     # e transfere os timestamps reais para o objeto 'produto' original
                     # que foi passado para o método 'save'.
-                    updated_produto_obj = Produto.from_dict(product_data_from_db)
+                    updated_produto_obj = Produto.from_dict(product_data_from_db, trusted=True)
 
                     produto.created_at = updated_produto_obj.created_at
                     produto.updated_at = updated_produto_obj.updated_at
@@ -132,6 +156,34 @@ class FirebaseProdutosRepository(ProdutosRepository):
 
         return produto.id
 
+    def save_batch(self, produtos: list[Produto]) -> None:
+        """
+        Grava novos produtos em um único WriteBatch (atômico, até MAX_WRITE_BATCH_SIZE produtos).
+
+        Diferente de save(), não relê os documentos: os timestamps ficam com o servidor e os
+        objetos em memória não são atualizados (usado pela importação em massa).
+
+        Raises:
+            ValueError: Se o lote exceder o limite do Firestore ou houver produto sem ID.
+            Exception: Para erros de Firebase ou outros erros inesperados (re-lançados).
+        """
+        if len(produtos) > MAX_WRITE_BATCH_SIZE:
+            raise ValueError(f"Lote com {len(produtos)} produtos excede o limite de {MAX_WRITE_BATCH_SIZE} escritas.")
+        try:
+            batch = self.db.batch()
+            for produto in produtos:
+                if not produto.id:
+                    raise ValueError("ID do produto é necessário para gravação em lote")
+                batch.set(self.products_collection_ref.document(produto.id), self._to_db_with_timestamps(produto))
+            batch.commit()
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao gravar lote de {len(produtos)} produtos: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            translated_error = deepl_translator(str(e))
+            raise Exception(f"Erro ao gravar lote de produtos: {translated_error}")
+        except Exception as e:
+            logger.error(f"Erro inesperado ao gravar lote de {len(produtos)} produtos: {e}")
+            raise
+
     def get_by_id(self, produto_id: str) -> Produto | None:
         """
         Encontra um produto pelo ID no repositório.
@@ -160,7 +212,7 @@ class FirebaseProdutosRepository(ProdutosRepository):
 
             product_data['id'] = doc_snapshot.id # Inclui o ID no dicionário
 
-            return Produto.from_dict(product_data)
+            return Produto.from_dict(product_data, trusted=True)
         except exceptions.FirebaseError as e:
             logger.error(f"Erro do Firebase ao buscar produto por ID {produto_id}: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
             raise # Re-lança para tratamento em camadas superiores
@@ -186,13 +238,14 @@ class FirebaseProdutosRepository(ProdutosRepository):
             Exception: Se ocorrer um erro inesperado durante a operação.
         """
         try:
-            # Modificação 1: Adicionar ordenação à consulta do Firestore
-            # Esta consulta buscará todos os produtos e os ordenará pelo nome da categoria
-            # e, em seguida, pelo nome do produto.
-            # Certifique-se de ter um índice composto (categoria_name ASC, name ASC) no Firestore.
-            query = (self.products_collection_ref
-                     .order_by("categoria_name")
-                     .order_by("name"))
+            # Ordena pelo nome da categoria e, em seguida, pelo nome do produto.
+            # A lixeira consulta somente os deletados (índice composto status ASC,
+            # categoria_name ASC, name ASC — ver firestore.indexes.json); a listagem ativa lê
+            # todos para também contar os deletados do tooltip da lixeira.
+            query = self.products_collection_ref
+            if status_deleted:
+                query = query.where(filter=FieldFilter("status", "==", RegistrationStatus.DELETED.name))
+            query = query.order_by("categoria_name").order_by("name")
             query_snapshot = query.get() # Chamada síncrona
 
             produtos_result: List[Produto] = []
@@ -202,7 +255,7 @@ class FirebaseProdutosRepository(ProdutosRepository):
                 product_data = doc.to_dict()
                 if product_data: # Garante que o documento não esteja vazio
                     product_data['id'] = doc.id
-                    product_obj = Produto.from_dict(product_data)
+                    product_obj = Produto.from_dict(product_data, trusted=True)
 
                     # Modificação 4: Corrigir comparação de status
                     # Conta todos os produtos deletados, independentemente do filtro principal
@@ -220,6 +273,7 @@ class FirebaseProdutosRepository(ProdutosRepository):
             # Modificação 2: Remover ordenação em memória, pois o Firestore já fez isso.
             # produtos_result.sort(key=lambda produto: produto.categoria_name) # REMOVIDO
 
+            record_returned(len(produtos_result))
             return produtos_result, quantity_deleted
         except google_api_exceptions.FailedPrecondition as e:
             # Esta é a exceção específica para erros de "índice ausente".
@@ -309,4 +363,96 @@ class FirebaseProdutosRepository(ProdutosRepository):
         except Exception as e:
             logger.error(f"Erro inesperado ao contar produtos com baixo estoque: {e}")
             raise
-    
\ No newline at end of file
+    
+
+    def get_projection(self, updated_since: datetime | None = None) -> list[dict[str, Any]]:
+        """
+        Obtém uma projeção compacta dos produtos usando field mask (select).
+
+        Inclui os produtos com status "DELETED" para que o chamador possa removê-los de
+        um cache em atualizações incrementais.
+
+        Args:
+            updated_since (datetime | None): Se informado, retorna somente os produtos com
+                                             'updated_at' posterior a esta data.
+
+        Returns:
+            list[dict[str, Any]]: Dicionários com 'id', 'name', 'sale_price_cents', 'quantity_on_hand',
+                                  'unit_of_measure', 'ean_code', 'internal_code', 'status' e 'updated_at'.
+
+        Raises:
+            Exception: Para erros de Firebase ou outros erros inesperados (re-lançados).
+        """
+        try:
+            query = self.products_collection_ref
+            if updated_since:
+                query = query.where(filter=FieldFilter("updated_at", ">", updated_since))
+            query = query.select(PROJECTION_FIELDS)
+
+            projection: list[dict[str, Any]] = []
+            for doc in query.stream():
+                data = doc.to_dict()
+                if not data:
+                    continue
+                sale_price = data.get("sale_price") or {}
+                projection.append({
+                    "id": doc.id,
+                    "name": data.get("name"),
+                    "sale_price_cents": int(sale_price.get("amount_cents") or 0),
+                    "quantity_on_hand": int(data.get("quantity_on_hand") or 0),
+                    "unit_of_measure": data.get("unit_of_measure"),
+                    "ean_code": data.get("ean_code"),
+                    "internal_code": data.get("internal_code"),
+                    "status": data.get("status"),
+                    "updated_at": data.get("updated_at"),
+                })
+
+            record_returned(len(projection))
+            return projection
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao obter projeção de produtos: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Erro inesperado ao obter projeção de produtos: {e}")
+            raise
+
+    def iter_export_pages(self, page_size: int = 500) -> Iterator[list[tuple[str, dict[str, Any]]]]:
+        """
+        Percorre todos os produtos da empresa (inclusive excluídos) em páginas de documentos brutos,
+        sem montar objetos Produto: usado pela exportação, com memória limitada a uma página.
+        """
+        yield from iter_query_pages(self.products_collection_ref, page_size)
+
+    def bulk_update_status(self, produto_ids: list[str], status: RegistrationStatus, current_user_id: str,
+                           current_user_name: str, on_progress: Callable[[int], None] | None = None) -> int:
+        """
+        Muda o status de vários produtos (lixeira, restauração) em transações de até 500 documentos,
+        com os campos de auditoria do novo status e timestamps do servidor, sem reler os documentos.
+
+        Returns:
+            int: Quantidade de produtos atualizados.
+        """
+        refs = [self.products_collection_ref.document(produto_id) for produto_id in produto_ids]
+        try:
+            return update_status_in_batches(self.db, refs, status_change_data(status, current_user_id, current_user_name),
+                                            on_progress=on_progress)
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao atualizar o status de {len(refs)} produtos: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            translated_error = deepl_translator(str(e))
+            raise Exception(f"Erro ao atualizar o status dos produtos: {translated_error}")
+
+    def bulk_hard_delete(self, produto_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """
+        Exclui definitivamente, em transações de até 500 documentos, os produtos informados que
+        estão na lixeira (status 'DELETED'); os demais são ignorados.
+
+        Returns:
+            int: Quantidade de produtos excluídos.
+        """
+        refs = [self.products_collection_ref.document(produto_id) for produto_id in produto_ids]
+        try:
+            return hard_delete_in_batches(self.db, refs, on_progress=on_progress)
+        except exceptions.FirebaseError as e:
+            logger.error(f"Erro do Firebase ao excluir {len(refs)} produtos: Código: {getattr(e, 'code', 'N/A')}, Detalhes: {e}")
+            translated_error = deepl_translator(str(e))
+            raise Exception(f"Erro ao excluir definitivamente os produtos: {translated_error}")
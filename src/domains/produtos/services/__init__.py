@@ -1 +1,3 @@
 from .produtos_services import ProdutosServices
+from .produtos_projection_cache import produtos_projection_cache, ProdutosProjectionCache
+from .produtos_import_services import ProdutosImportServices
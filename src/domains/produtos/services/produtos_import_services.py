@@ -0,0 +1,197 @@
+import csv
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterator
+
+from src.domains.produtos.models import Produto
+from src.domains.produtos.models.produto_import import (
+    ImportReport, ImportRowError, ProdutoRowParser, map_columns,
+)
+from src.domains.produtos.repositories import ProdutosRepository
+from src.domains.produtos.repositories.implementations.firebase_produtos_repository import MAX_WRITE_BATCH_SIZE
+from src.domains.produtos.services.produtos_projection_cache import produtos_projection_cache
+from src.domains.usuarios.models.usuarios_model import Usuario
+from src.shared.utils import get_uuid
+
+logger = logging.getLogger(__name__)
+
+IMPORT_EXTENSIONS = ("csv", "xlsx")
+
+
+class _ExcelPtBr(csv.excel):
+    """CSV do Excel em português: separador ';'."""
+    delimiter = ";"
+
+
+def count_data_rows(path: str) -> int:
+    """Quantidade aproximada de linhas de dados (sem o cabeçalho), para a barra de progresso."""
+    if path.lower().endswith(".xlsx"):
+        workbook = _open_workbook(path)
+        try:
+            return max((workbook.active.max_row or 1) - 1, 0)
+        finally:
+            workbook.close()
+    with open(path, "rb") as file:
+        lines = sum(chunk.count(b"\n") for chunk in iter(lambda: file.read(1 << 20), b""))
+    return max(lines - 1, 0)
+
+
+def _open_workbook(path: str):
+    try:
+        import openpyxl
+    except ImportError:
+        raise ValueError("Importação de XLSX indisponível: instale o pacote 'openpyxl' ou envie a planilha em CSV.")
+    # read_only: as linhas são lidas sob demanda, sem carregar a planilha inteira na memória
+    return openpyxl.load_workbook(path, read_only=True, data_only=True)
+
+
+def iter_rows(path: str) -> Iterator[tuple[int, list[Any]]]:
+    """
+    Lê a planilha (CSV ou XLSX) linha a linha: (número da linha, valores). A linha 1 é o cabeçalho.
+    O separador do CSV (';', ',' ou tab) é detectado automaticamente.
+    """
+    extension = path.rsplit(".", 1)[-1].lower()
+    if extension not in IMPORT_EXTENSIONS:
+        raise ValueError(f"Formato não suportado: .{extension} (use CSV ou XLSX)")
+
+    if extension == "xlsx":
+        workbook = _open_workbook(path)
+        try:
+            for line, values in enumerate(workbook.active.iter_rows(values_only=True), start=1):
+                yield line, list(values)
+        finally:
+            workbook.close()
+        return
+
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        sample = file.read(64 * 1024)
+        file.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=";,\t")
+        except csv.Error:
+            dialect = _ExcelPtBr
+        for line, values in enumerate(csv.reader(file, dialect), start=1):
+            yield line, values
+
+
+class ProdutosImportServices:
+    """
+    Importação em massa de produtos a partir de planilhas CSV/XLSX.
+
+    A planilha é lida em streaming e validada linha a linha; os produtos válidos são
+    agrupados em lotes de até 500 (limite do WriteBatch) e gravados com um número limitado
+    de lotes em paralelo (PRODUTOS_IMPORT_CONCURRENCY, padrão 4). Linhas com EAN ou código
+    interno já cadastrados são rejeitadas, o que torna seguro repetir uma importação.
+    """
+
+    def __init__(self, repository: ProdutosRepository):
+        self.repository = repository
+
+    def import_file(self, path: str, empresa_id: str, current_user: Usuario, categorias: list[dict[str, Any]],
+                    on_progress: Callable[[int, int], None] | None = None,
+                    batch_size: int = MAX_WRITE_BATCH_SIZE) -> ImportReport:
+        """
+        Importa os produtos da planilha.
+
+        Args:
+            path (str): Caminho local do arquivo CSV ou XLSX
+            empresa_id (str): ID da empresa
+            current_user (Usuario): Usuário que está importando (auditoria)
+            categorias (list[dict]): Resumo das categorias ativas ('id', 'name')
+            on_progress (Callable | None): Recebe (linhas processadas, produtos gravados) após cada lote
+            batch_size (int): Produtos por lote (máximo 500)
+
+        Returns:
+            ImportReport: Totais e linhas rejeitadas
+
+        Raises:
+            ValueError: Arquivo em formato inválido ou sem as colunas obrigatórias.
+        """
+        if not current_user.id:
+            raise ValueError("ID do usuário é necessário")
+        batch_size = max(1, min(batch_size, MAX_WRITE_BATCH_SIZE))
+        concurrency = max(1, int(os.getenv('PRODUTOS_IMPORT_CONCURRENCY', '4')))
+
+        parser = ProdutoRowParser(
+            empresa_id=empresa_id,
+            categorias={c["name"].lower(): (c["id"], c["name"]) for c in categorias if c.get("name")},
+            user_id=current_user.id,
+            user_name=current_user.name.nome_completo,
+        )
+
+        # Códigos já cadastrados, da projeção em cache (sem uma consulta por linha)
+        known_eans: set[str] = set()
+        known_codes: set[str] = set()
+        for item in produtos_projection_cache.get(empresa_id, self.repository):
+            if item.get("ean_code"):
+                known_eans.add(item["ean_code"])
+            if item.get("internal_code"):
+                known_codes.add(item["internal_code"])
+
+        report = ImportReport()
+        rows = iter_rows(path)
+        try:
+            _, headers = next(rows)
+        except StopIteration:
+            raise ValueError("A planilha está vazia.")
+        columns = map_columns(headers)
+
+        pending: dict[Future, list[tuple[int, Produto]]] = {}
+        chunk: list[tuple[int, Produto]] = []
+
+        def collect(done: set[Future]) -> None:
+            for future in done:
+                lines = pending.pop(future)
+                try:
+                    future.result()
+                    report.imported += len(lines)
+                except Exception as e:
+                    logger.error(f"Lote de importação (linhas {lines[0][0]}-{lines[-1][0]}) não gravado: {e}")
+                    report.errors.extend(ImportRowError(line, f"Lote não gravado: {e}", {"name": produto.name})
+                                         for line, produto in lines)
+            if on_progress:
+                on_progress(report.total_rows, report.imported)
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="produtos-import") as executor:
+            def submit(lines: list[tuple[int, Produto]]) -> None:
+                # No máximo `concurrency` lotes em voo: a leitura da planilha acompanha a gravação
+                if len(pending) >= concurrency:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending[executor.submit(self.repository.save_batch, [p for _, p in lines])] = lines
+
+            for line, raw in rows:
+                if not any(value not in (None, "") for value in raw):
+                    continue  # Linha em branco
+                report.total_rows += 1
+                values = {name: raw[index] for index, name in columns.items() if index < len(raw)}
+                try:
+                    produto = parser.parse(values, produto_id="pro_" + get_uuid())
+                    if produto.ean_code and produto.ean_code in known_eans:
+                        raise ValueError(f"EAN {produto.ean_code} já cadastrado")
+                    if produto.internal_code and produto.internal_code in known_codes:
+                        raise ValueError(f"Código {produto.internal_code} já cadastrado")
+                except ValueError as e:
+                    report.errors.append(ImportRowError(line, str(e), values))
+                    continue
+
+                if produto.ean_code:
+                    known_eans.add(produto.ean_code)
+                if produto.internal_code:
+                    known_codes.add(produto.internal_code)
+                chunk.append((line, produto))
+                if len(chunk) >= batch_size:
+                    submit(chunk)
+                    chunk = []
+
+            if chunk:
+                submit(chunk)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        report.errors.sort(key=lambda error: error.line)
+        logger.info(f"Importação de produtos da empresa {empresa_id}: {report.imported} gravado(s), "
+                    f"{report.rejected} rejeitado(s) de {report.total_rows} linha(s)")
+        return report
@@ -0,0 +1,112 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Lock
+from typing import Any
+
+from src.domains.produtos.repositories import ProdutosRepository
+from src.domains.shared import RegistrationStatus
+from src.shared.env import env_int
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _EmpresaFeed:
+    """Projeção de produtos em cache para uma empresa."""
+    products: dict[str, dict[str, Any]] = field(default_factory=dict)
+    sorted_products: list[dict[str, Any]] = field(default_factory=list)
+    last_updated_at: datetime | None = None
+    last_full_refresh: float = 0.0
+    lock: Lock = field(default_factory=Lock)
+
+
+class ProdutosProjectionCache:
+    """
+    Cache, por empresa, da projeção compacta de produtos usada no formulário de pedidos.
+
+    Compartilhado por todas as sessões do processo. A primeira chamada faz a leitura
+    completa; as seguintes buscam somente os produtos com 'updated_at' posterior ao
+    maior 'updated_at' já visto (edições, mudanças de status e baixas de estoque dos
+    pedidos atualizam esse campo). Periodicamente é feita uma leitura completa, que
+    também descarta produtos excluídos definitivamente.
+    """
+
+    def __init__(self, full_refresh_seconds: int | None = None):
+        # None: PRODUCTS_FEED_FULL_REFRESH_SECONDS, intervalo entre leituras completas do feed
+        self._full_refresh_seconds = full_refresh_seconds
+        self._feeds: dict[str, _EmpresaFeed] = {}
+        self._lock = Lock()
+
+    @property
+    def full_refresh_seconds(self) -> int:
+        if self._full_refresh_seconds is None:
+            self._full_refresh_seconds = env_int('PRODUCTS_FEED_FULL_REFRESH_SECONDS', 900)
+        return self._full_refresh_seconds
+
+    def _get_feed(self, empresa_id: str) -> _EmpresaFeed:
+        with self._lock:
+            feed = self._feeds.get(empresa_id)
+            if feed is None:
+                feed = _EmpresaFeed()
+                self._feeds[empresa_id] = feed
+            return feed
+
+    def get(self, empresa_id: str, repository: ProdutosRepository) -> list[dict[str, Any]]:
+        """
+        Retorna a projeção dos produtos não excluídos da empresa, ordenada por nome.
+
+        Args:
+            empresa_id (str): ID da empresa.
+            repository (ProdutosRepository): Repositório de produtos da empresa.
+
+        Returns:
+            list[dict[str, Any]]: Projeção dos produtos (ver ProdutosRepository.get_projection).
+        """
+        feed = self._get_feed(empresa_id)
+
+        # Um lock por empresa: sessões simultâneas aguardam a mesma atualização
+        with feed.lock:
+            full_refresh = (not feed.last_full_refresh
+                            or time.monotonic() - feed.last_full_refresh > self.full_refresh_seconds)
+
+            if full_refresh:
+                rows = repository.get_projection()
+                feed.products.clear()
+                feed.last_full_refresh = time.monotonic()
+            else:
+                rows = repository.get_projection(updated_since=feed.last_updated_at)
+
+            if full_refresh or rows:
+                self._apply(feed, rows)
+                logger.debug(
+                    f"Projeção de produtos da empresa {empresa_id}: {len(rows)} documento(s) lido(s) "
+                    f"({'completa' if full_refresh else 'incremental'}), {len(feed.products)} em cache"
+                )
+
+            return feed.sorted_products
+
+    @staticmethod
+    def _apply(feed: _EmpresaFeed, rows: list[dict[str, Any]]) -> None:
+        for row in rows:
+            updated_at = row.get("updated_at")
+            if updated_at and (feed.last_updated_at is None or updated_at > feed.last_updated_at):
+                feed.last_updated_at = updated_at
+
+            if row.get("status") == RegistrationStatus.DELETED.name:
+                feed.products.pop(row["id"], None)
+            else:
+                feed.products[row["id"]] = row
+
+        # Lista nova a cada alteração: chamadores podem manter a referência anterior com segurança
+        feed.sorted_products = sorted(feed.products.values(), key=lambda p: (p.get("name") or "").casefold())
+
+    def invalidate(self, empresa_id: str) -> None:
+        """Descarta o cache da empresa; a próxima chamada fará uma leitura completa."""
+        with self._lock:
+            self._feeds.pop(empresa_id, None)
+
+
+# Cache global do processo, compartilhado por todas as sessões Flet
+produtos_projection_cache = ProdutosProjectionCache()
@@ -1,6 +1,9 @@
+from typing import Callable
+
 from src.domains.produtos.models import Produto
 from src.domains.shared import RegistrationStatus
 from src.domains.produtos.repositories import ProdutosRepository
+from src.domains.produtos.services.produtos_projection_cache import produtos_projection_cache
 from src.domains.shared import NomePessoa
 from src.domains.usuarios.models.usuarios_model import Usuario
 from src.shared.utils import get_uuid
@@ -79,4 +82,23 @@ class ProdutosServices:
 
     def get_low_stock_count(self) -> int:
         """Obtém a quantidade de produtos ativos que necessitam de reposição no estoque."""
-        return self.repository.get_low_stock_count()
\ No newline at end of file
+        return self.repository.get_low_stock_count()
+
+
+    def get_projection(self, empresa_id: str) -> list[dict]:
+        """Obtém a projeção compacta dos produtos da empresa (em cache, atualizada incrementalmente)."""
+        return produtos_projection_cache.get(empresa_id, self.repository)
+
+
+    def bulk_update_status(self, produto_ids: list[str], current_user: Usuario, status: RegistrationStatus,
+                           on_progress: Callable[[int], None] | None = None) -> int:
+        """Muda o status de vários produtos em lote (envio à lixeira ou restauração em massa)."""
+        if not current_user.id:
+            raise ValueError("ID do usuário é necessário")
+        return self.repository.bulk_update_status(produto_ids, status, current_user.id,
+                                                  current_user.name.nome_completo, on_progress)
+
+
+    def bulk_hard_delete(self, produto_ids: list[str], on_progress: Callable[[int], None] | None = None) -> int:
+        """Exclui definitivamente, em lote, os produtos que estão na lixeira."""
+        return self.repository.bulk_hard_delete(produto_ids, on_progress)
@@ -66,6 +66,18 @@ class ProdutoGridUI:
             on_click=self._on_add_clicked
         )
 
+        self.fab_import = ft.FloatingActionButton(
+            tooltip="Importar produtos (CSV/XLSX)",
+            icon=ft.Icons.UPLOAD_FILE,
+            on_click=self._on_import_clicked
+        )
+
+        self.fab_export = ft.FloatingActionButton(
+            tooltip="Exportar produtos (CSV/Parquet)",
+            icon=ft.Icons.DOWNLOAD,
+            on_click=self._on_export_clicked
+        )
+
         self.fab_trash = ft.FloatingActionButton(
             content=ft.Image(
                 src="icons/recycle_empy_1771.png",
@@ -78,7 +90,7 @@ class ProdutoGridUI:
         )
 
         return ft.Column(
-            controls=[self.fab_add, self.fab_trash],
+            controls=[self.fab_add, self.fab_import, self.fab_export, self.fab_trash],
             alignment=ft.MainAxisAlignment.END,
         )
 
@@ -157,6 +169,12 @@ class ProdutoGridUI:
     def _on_add_clicked(self, e):
         self.controller.execute_action_async("INSERT", None)
 
+    def _on_export_clicked(self, e):
+        self.controller.execute_action_async("EXPORT", None)
+
+    def _on_import_clicked(self, e):
+        self.controller.execute_action_async("IMPORT", None)
+
     def _apply_filters(self):
         """Aplica filtros e atualiza a UI"""
         self.controller.state.search_text = self.search_field.value or ""
@@ -1,4 +1,5 @@
 from .models.address import Address
+from .models.hydration import hydrate
 from .controllers.domain_exceptions import DomainException, AuthenticationException, UserNotFoundException, InvalidCredentialsException
 from .models.nome_pessoa import NomePessoa
 from .models.password import Password
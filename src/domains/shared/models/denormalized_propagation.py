@@ -0,0 +1,114 @@
+"""
+Propagação de campos desnormalizados.
+
+Alguns documentos guardam cópias de dados de outras entidades para ordenar e exibir sem
+leituras extras: o produto guarda o nome da categoria (categoria_name, categoria_name_lower) e
+todas as entidades guardam o nome de quem as criou/alterou (created_by_name, updated_by_name...).
+Quando a origem muda (categoria ou usuário renomeado), a propagação regrava essas cópias.
+
+A propagação é descrita por uma lista de passos (PropagationStep): cada passo é uma coleção,
+filtros de igualdade que selecionam os documentos afetados e os valores que os campos
+desnormalizados devem ter. Os passos são determinísticos para a mesma origem, o que permite
+retomar uma execução interrompida a partir do passo e do último documento gravado.
+"""
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.domains.shared.models.nome_pessoa import NomePessoa
+
+# Tipos de propagação (origem do dado desnormalizado)
+CATEGORIA_NAME = "categoria_name"
+USUARIO_NAME = "usuario_name"
+
+PROPAGATION_KINDS = (CATEGORIA_NAME, USUARIO_NAME)
+
+# Prefixos dos campos de auditoria '<prefixo>_by_id' / '<prefixo>_by_name'
+AUDIT_PREFIXES = ("created", "updated", "activated", "inactivated", "deleted", "archived")
+
+# Coleções com campos de auditoria, por empresa. (caminho, filtra por empresa_id)
+# Os pedidos arquivados (pedidos_arquivo) não entram: são o registro histórico do pedido.
+_EMPRESA_AUDITED_COLLECTIONS = (
+    (("clientes",), True),
+    (("produto_categorias",), True),
+    (("pedidos",), True),
+    (("empresas", "{empresa_id}", "produtos"), False),
+    (("empresas", "{empresa_id}", "formas_pagamento"), False),
+)
+
+# Coleções globais com campos de auditoria
+_GLOBAL_AUDITED_COLLECTIONS = (("empresas",), ("usuarios",))
+
+
+@dataclass(frozen=True)
+class PropagationStep:
+    """
+    Um passo da propagação.
+
+    Attributes:
+        key (str): Identificador estável do passo (usado no checkpoint)
+        path (tuple[str, ...]): Caminho da coleção (ex.: ('empresas', 'emp_1', 'produtos'))
+        filters (tuple[tuple[str, Any], ...]): Filtros de igualdade (campo, valor) dos documentos afetados
+        values (dict[str, Any]): Valores que os campos desnormalizados devem ter
+        touch_updated_at (bool): Atualiza também o updated_at (caches incrementais por updated_at)
+    """
+    key: str
+    path: tuple[str, ...]
+    filters: tuple[tuple[str, Any], ...]
+    values: dict[str, Any] = field(default_factory=dict)
+    touch_updated_at: bool = False
+
+    def changes(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Campos do documento que ainda não têm o valor propagado (vazio: nada a gravar)."""
+        return {name: value for name, value in self.values.items() if data.get(name) != value}
+
+
+def categoria_name_values(name: str) -> dict[str, Any]:
+    """Nome da categoria como o Produto o normaliza (ver Produto.__post_init__)."""
+    categoria_name = name.strip().capitalize() if name and name.strip() else "Categoria não definida"
+    return {"categoria_name": categoria_name, "categoria_name_lower": categoria_name.lower()}
+
+
+def categoria_name_steps(categoria_id: str, empresa_id: str, name: str) -> list[PropagationStep]:
+    """Produtos da empresa que pertencem à categoria."""
+    return [PropagationStep(
+        key="produtos",
+        path=("empresas", empresa_id, "produtos"),
+        filters=(("categoria_id", categoria_id),),
+        values=categoria_name_values(name),
+        touch_updated_at=True,
+    )]
+
+
+def usuario_full_name(name_data: dict[str, Any] | None) -> str | None:
+    """Nome completo gravado nos campos '<prefixo>_by_name' a partir do 'name' do documento do usuário."""
+    if not isinstance(name_data, dict):
+        return None
+    try:
+        return NomePessoa.from_dict(name_data).nome_completo
+    except ValueError:
+        return None
+
+
+def usuario_name_steps(usuario_id: str, full_name: str, empresas: list[str] | set[str]) -> list[PropagationStep]:
+    """Todos os documentos criados/alterados pelo usuário, nas empresas às quais ele pertence."""
+    steps: list[PropagationStep] = []
+    for prefix in AUDIT_PREFIXES:
+        by_id, by_name = f"{prefix}_by_id", f"{prefix}_by_name"
+        for path in _GLOBAL_AUDITED_COLLECTIONS:
+            steps.append(PropagationStep(
+                key=f"{'/'.join(path)}:{prefix}",
+                path=path,
+                filters=((by_id, usuario_id),),
+                values={by_name: full_name},
+            ))
+        for empresa_id in sorted(empresas):
+            for template, by_empresa in _EMPRESA_AUDITED_COLLECTIONS:
+                path = tuple(segment.format(empresa_id=empresa_id) for segment in template)
+                filters = ((("empresa_id", empresa_id),) if by_empresa else ()) + ((by_id, usuario_id),)
+                steps.append(PropagationStep(
+                    key=f"{'/'.join(path)}:{empresa_id}:{prefix}",
+                    path=path,
+                    filters=filters,
+                    values={by_name: full_name},
+                ))
+    return steps
@@ -0,0 +1,52 @@
+from dataclasses import MISSING, fields
+from functools import cache
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@cache
+def _field_spec(cls: type) -> tuple[frozenset[str], dict[str, Any], dict[str, Any], tuple[str, ...]]:
+    """Nomes, defaults, default_factories e campos obrigatórios do dataclass, calculados uma vez por classe."""
+    names, defaults, factories, required = set(), {}, {}, []
+    for f in fields(cls):
+        if not f.init:
+            continue
+        names.add(f.name)
+        if f.default is not MISSING:
+            defaults[f.name] = f.default
+        elif f.default_factory is not MISSING:
+            factories[f.name] = f.default_factory
+        else:
+            required.append(f.name)
+    return frozenset(names), defaults, factories, tuple(required)
+
+
+def hydrate(cls: type[T], values: dict[str, Any]) -> T:
+    """
+    Instancia um dataclass a partir de valores já convertidos, sem executar __init__ nem __post_init__.
+
+    Uso exclusivo das leituras do banco (modo confiável): os dados foram validados e normalizados
+    pelo __post_init__ quando foram gravados, então repetir as validações só gasta CPU. Objetos
+    criados a partir da entrada do usuário devem continuar usando o construtor normal.
+
+    Campos ausentes recebem o default do dataclass; chaves que não são campos são ignoradas.
+
+    Raises:
+        TypeError: Se faltar um campo obrigatório (sem default).
+    """
+    names, defaults, factories, required = _field_spec(cls)
+    for name in required:
+        if name not in values:
+            raise TypeError(f"{cls.__name__}: campo obrigatório ausente: '{name}'")
+
+    attrs = {**defaults, **values}
+    for name in attrs.keys() - names:
+        del attrs[name]
+    for name, factory in factories.items():
+        if name not in values:
+            attrs[name] = factory()
+
+    obj = object.__new__(cls)
+    obj.__dict__.update(attrs)
+    return obj
@@ -50,13 +50,15 @@ class NomePessoa:
                 "O primeiro nome (first_name) é obrigatório e não pode ser vazio.")
 
     @classmethod
-    def from_dict(cls, data: dict) -> 'NomePessoa':
+    def from_dict(cls, data: dict, trusted: bool = False) -> 'NomePessoa':
         """
         Cria uma instância de NomePessoa a partir de um dicionário.
 
         Args:
             data (dict): Dicionário contendo 'first_name' e opcionalmente 'last_name'.
                 Exemplo: {'first_name': 'João', 'last_name': 'Silva'}
+            trusted (bool): Dicionário gravado por to_dict() (leitura do banco). Os nomes já estão
+                formatados e as versões em minúsculo já existem, então a formatação não é repetida.
 
         Returns:
             NomePessoa: Nova instância de NomePessoa.
@@ -70,6 +72,14 @@ class NomePessoa:
         first_name = data.get('first_name', '')
         last_name = data.get('last_name', '')
 
+        if trusted and first_name and data.get('first_name_lower'):
+            nome = cls.__new__(cls)
+            nome.first_name = first_name
+            nome.last_name = last_name or None
+            nome.first_name_lower = data['first_name_lower']
+            nome.last_name_lower = data.get('last_name_lower') or None
+            return nome
+
         return cls(first_name, last_name)
 
     def to_dict(self) -> dict | None:
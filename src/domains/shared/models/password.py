@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 from typing import Any
 from cryptography.fernet import Fernet
 from dotenv import load_dotenv
@@ -124,6 +126,20 @@ class Password:
         return instance
 
 
+def password_fingerprint(value: str) -> str:
+    """
+    Identificador de uma senha para chaves de idempotência (ex.: um email por senha temporária).
+
+    HMAC-SHA256 com a FERNET_KEY: sem a chave, o identificador não permite testar senhas
+    candidatas, ao contrário de um hash simples da senha.
+    """
+    load_dotenv()
+    key = os.getenv("FERNET_KEY")
+    if not key:
+        raise ValueError("FERNET_KEY não encontrada no ambiente.")
+    return hmac.new(key.encode(), value.encode(), hashlib.sha256).hexdigest()
+
+
 """
 # Exemplo de uso
 >>> if __name__ == "__main__":
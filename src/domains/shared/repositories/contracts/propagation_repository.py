@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterator
+
+from src.domains.shared.models.denormalized_propagation import PropagationStep
+
+
+class PropagationRepository(ABC):
+    """Contrato da propagação de campos desnormalizados (leitura das origens, varredura e gravação)."""
+
+    @abstractmethod
+    def get_source(self, collection: str, document_id: str, field_paths: list[str]) -> dict[str, Any] | None:
+        """Campos `field_paths` do documento de origem (categoria, usuário) ou None se não existir."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+
+    @abstractmethod
+    def iter_step_pages(self, step: PropagationStep, page_size: int,
+                        start_after_id: str | None = None) -> Iterator[list[tuple[str, dict[str, Any]]]]:
+        """
+        Páginas (ID do documento, campos desnormalizados) dos documentos afetados pelo passo, em
+        ordem de ID, a partir do documento seguinte a `start_after_id`.
+        """
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+
+    @abstractmethod
+    def update_documents(self, step: PropagationStep, updates: list[tuple[str, dict[str, Any]]]) -> None:
+        """Grava as alterações (ID do documento, campos) em um único batch (até 500 documentos)."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+
+    @abstractmethod
+    def get_checkpoint(self, key: str) -> dict[str, Any] | None:
+        """Situação da última execução da propagação (valor, passo, último documento, término)."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
+
+
+    @abstractmethod
+    def save_checkpoint(self, key: str, checkpoint: dict[str, Any]) -> None:
+        """Grava (merge) a situação da propagação."""
+        raise NotImplementedError(
+        "Este método deve ser implementado pela subclasse")
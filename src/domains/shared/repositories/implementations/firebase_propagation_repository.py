@@ -0,0 +1,58 @@
+from typing import Any, Iterator
+
+from firebase_admin import firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
+
+from src.domains.shared.models.denormalized_propagation import PropagationStep
+from src.domains.shared.repositories.contracts.propagation_repository import PropagationRepository
+from storage.data import get_firebase_app, get_firestore_client, iter_query_pages
+
+#   propagacoes_status/{tipo}_{id da origem} -> checkpoint da propagação
+CHECKPOINT_COLLECTION = "propagacoes_status"
+
+
+class FirebasePropagationRepository(PropagationRepository):
+    """Propagação de campos desnormalizados no Firestore."""
+    def __init__(self):
+        get_firebase_app()  # Garante que o aplicativo Firebase esteja inicializado
+        self.db = get_firestore_client()
+        self.checkpoint_collection = self.db.collection(CHECKPOINT_COLLECTION)
+
+    def get_source(self, collection: str, document_id: str, field_paths: list[str]) -> dict[str, Any] | None:
+        doc = self.db.collection(collection).document(document_id).get(field_paths=field_paths)
+        return doc.to_dict() if doc.exists else None
+
+    def iter_step_pages(self, step: PropagationStep, page_size: int,
+                        start_after_id: str | None = None) -> Iterator[list[tuple[str, dict[str, Any]]]]:
+        """
+        Os filtros do passo são somente de igualdade: os índices de campo único (automáticos)
+        atendem a query. Somente os campos desnormalizados são lidos (field mask).
+        """
+        query = self.db.collection(*step.path)
+        for field_path, value in step.filters:
+            query = query.where(filter=FieldFilter(field_path, "==", value))
+        query = query.select(list(step.values))
+        return iter_query_pages(query, page_size, start_after_id=start_after_id)
+
+    def update_documents(self, step: PropagationStep, updates: list[tuple[str, dict[str, Any]]]) -> None:
+        """
+        Usa update (e não set com merge): um documento removido depois da leitura faz o batch
+        falhar em vez de ser recriado só com os campos propagados; a nova tentativa do job relê a página.
+        """
+        collection = self.db.collection(*step.path)
+        batch = self.db.batch()
+        for document_id, fields in updates:
+            data = dict(fields)
+            if step.touch_updated_at:
+                data["updated_at"] = firestore.SERVER_TIMESTAMP  # type: ignore [attr-defined]
+            batch.update(collection.document(document_id), data)
+        batch.commit()
+
+    def get_checkpoint(self, key: str) -> dict[str, Any] | None:
+        doc = self.checkpoint_collection.document(key).get()
+        return doc.to_dict() if doc.exists else None
+
+    def save_checkpoint(self, key: str, checkpoint: dict[str, Any]) -> None:
+        data = dict(checkpoint)
+        data["updated_at"] = firestore.SERVER_TIMESTAMP  # type: ignore [attr-defined]
+        self.checkpoint_collection.document(key).set(data, merge=True)
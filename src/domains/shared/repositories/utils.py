@@ -1,3 +1,5 @@
+from typing import Callable
+
 from firebase_admin import firestore
 
 from src.domains.shared import RegistrationStatus
@@ -33,3 +35,119 @@ def set_audit_timestamps(data: dict) -> dict:
         data['inactivated_at'] = firestore.SERVER_TIMESTAMP # type: ignore
 
     return data
+
+
+# Limite de escritas de um WriteBatch do Firestore (também o tamanho dos blocos em transação)
+MAX_WRITE_BATCH_SIZE = 500
+
+# Prefixo dos campos de auditoria gravados em cada mudança de status
+_STATUS_AUDIT_PREFIX = {
+    RegistrationStatus.ACTIVE: "activated",
+    RegistrationStatus.INACTIVE: "inactivated",
+    RegistrationStatus.DELETED: "deleted",
+}
+
+
+def status_change_data(status: RegistrationStatus, current_user_id: str, current_user_name: str) -> dict:
+    """
+    Campos gravados na mudança de status de um documento: o status, os campos de auditoria
+    do novo status (`<prefixo>_at`, `<prefixo>_by_id`, `<prefixo>_by_name`) e `updated_at`,
+    com os timestamps atribuídos pelo servidor.
+    """
+    prefix = _STATUS_AUDIT_PREFIX.get(status)
+    if not prefix:
+        raise ValueError(f"Status não suportado na mudança em lote: {status.name}")
+    return {
+        "status": status.name,
+        f"{prefix}_at": firestore.SERVER_TIMESTAMP, # type: ignore
+        f"{prefix}_by_id": current_user_id,
+        f"{prefix}_by_name": current_user_name,
+        "updated_at": firestore.SERVER_TIMESTAMP, # type: ignore
+    }
+
+
+def _apply_in_transactions(db, refs: list, empresa_id: str | None,
+                           write: Callable[[object, object, str | None], bool],
+                           on_progress: Callable[[int], None] | None) -> int:
+    """
+    Percorre os documentos em blocos de MAX_WRITE_BATCH_SIZE, uma transação por bloco: o status
+    (e a empresa) de cada documento é lido na transação (field mask) e `write(transaction, ref,
+    status)` decide e agenda a escrita, retornando se escreveu. Um documento alterado entre a
+    leitura e o commit faz a transação do bloco ser repetida com o valor novo.
+    Com `empresa_id`, documentos de outra empresa são descartados (coleções na raiz do banco).
+    """
+    field_paths = ["status", "empresa_id"] if empresa_id else ["status"]
+
+    @firestore.transactional  # type: ignore [attr-defined]
+    def run(transaction, chunk) -> int:
+        written = 0
+        for snapshot in db.get_all(chunk, field_paths=field_paths, transaction=transaction):
+            data = snapshot.to_dict() if snapshot.exists else None
+            if data is None or (empresa_id and data.get("empresa_id") != empresa_id):
+                continue
+            if write(transaction, snapshot.reference, data.get("status")):
+                written += 1
+        return written
+
+    processed = written = 0
+    for start in range(0, len(refs), MAX_WRITE_BATCH_SIZE):
+        chunk = refs[start:start + MAX_WRITE_BATCH_SIZE]
+        written += run(db.transaction(), chunk)
+        processed += len(chunk)
+        if on_progress:
+            on_progress(processed)
+    return written
+
+
+def update_status_in_batches(db, refs: list, data: dict, empresa_id: str | None = None,
+                             on_progress: Callable[[int], None] | None = None) -> int:
+    """
+    Aplica a mudança de status `data` (ver status_change_data) aos documentos, em uma transação
+    por bloco de até MAX_WRITE_BATCH_SIZE documentos.
+
+    Os status atuais são lidos na transação de cada bloco: documentos que não existem mais (ex.:
+    já excluídos pela rotina dos 90 dias) ou que já estão no novo status são ignorados, para que
+    um único documento não derrube o bloco inteiro, e uma mudança concorrente não é sobrescrita.
+
+    Args:
+        db: Cliente do Firestore
+        refs (list[DocumentReference]): Documentos a atualizar
+        data (dict): Campos da mudança de status
+        empresa_id (str | None): Se informado, ignora documentos de outra empresa
+        on_progress (Callable | None): Recebe o total de documentos processados após cada bloco
+
+    Returns:
+        int: Quantidade de documentos efetivamente atualizados.
+    """
+    def write(transaction, ref, status) -> bool:
+        if status == data["status"]:
+            return False
+        transaction.update(ref, data)
+        return True
+
+    return _apply_in_transactions(db, refs, empresa_id, write, on_progress)
+
+
+def hard_delete_in_batches(db, refs: list, empresa_id: str | None = None,
+                           on_progress: Callable[[int], None] | None = None) -> int:
+    """
+    Exclui definitivamente, em uma transação por bloco de até MAX_WRITE_BATCH_SIZE documentos,
+    os documentos que estão na lixeira (status 'DELETED'); os demais são ignorados. O status é
+    lido na transação: um documento restaurado da lixeira enquanto isso não é excluído.
+
+    Args:
+        db: Cliente do Firestore
+        refs (list[DocumentReference]): Documentos a excluir
+        empresa_id (str | None): Se informado, ignora documentos de outra empresa
+        on_progress (Callable | None): Recebe o total de documentos processados após cada bloco
+
+    Returns:
+        int: Quantidade de documentos excluídos.
+    """
+    def write(transaction, ref, status) -> bool:
+        if status != RegistrationStatus.DELETED.name:
+            return False
+        transaction.delete(ref)
+        return True
+
+    return _apply_in_transactions(db, refs, empresa_id, write, on_progress)
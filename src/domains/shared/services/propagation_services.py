@@ -0,0 +1,148 @@
+import logging
+import os
+import time
+from datetime import UTC, datetime
+from typing import Any, Callable
+
+from src.domains.shared.models.denormalized_propagation import (
+    CATEGORIA_NAME, PROPAGATION_KINDS, USUARIO_NAME, PropagationStep, categoria_name_steps, usuario_full_name,
+    usuario_name_steps,
+)
+from src.domains.shared.repositories.contracts.propagation_repository import PropagationRepository
+from src.domains.shared.repositories.utils import MAX_WRITE_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class WriteThrottle:
+    """
+    Limita a taxa de escritas (documentos por segundo).
+
+    O Firestore recomenda começar com no máximo 500 escritas/s em um conjunto de documentos e
+    aumentar gradualmente; a propagação divide a cota com o uso normal do sistema.
+    """
+
+    def __init__(self, writes_per_second: float):
+        self.writes_per_second = writes_per_second
+        self._next_at = 0.0
+
+    def acquire(self, writes: int) -> None:
+        """Aguarda, se necessário, antes de gravar `writes` documentos."""
+        if self.writes_per_second <= 0:
+            return
+        now = time.monotonic()
+        self._next_at = max(self._next_at, now)
+        wait = self._next_at - now
+        self._next_at += writes / self.writes_per_second
+        if wait > 0:
+            time.sleep(wait)
+
+
+class PropagationServices:
+    def __init__(self, repository: PropagationRepository):
+        self.repository = repository
+
+    def _plan(self, kind: str, source_id: str) -> tuple[Any, list[PropagationStep]] | None:
+        """Valor atual da origem e os passos da propagação (None se a origem não existe mais)."""
+        if kind == CATEGORIA_NAME:
+            categoria = self.repository.get_source("produto_categorias", source_id, ["empresa_id", "name"])
+            if not categoria or not categoria.get("empresa_id"):
+                return None
+            steps = categoria_name_steps(source_id, categoria["empresa_id"], categoria.get("name") or "")
+            return steps[0].values, steps
+        if kind == USUARIO_NAME:
+            usuario = self.repository.get_source("usuarios", source_id, ["name", "empresas"])
+            full_name = usuario_full_name(usuario.get("name")) if usuario else None
+            if not full_name:
+                return None
+            return full_name, usuario_name_steps(source_id, full_name, usuario.get("empresas") or [])  # type: ignore [union-attr]
+        raise ValueError(f"Tipo de propagação desconhecido: {kind}")
+
+    def propagate(self, kind: str, source_id: str, page_size: int | None = None,
+                  writes_per_second: float | None = None,
+                  on_progress: Callable[[int], None] | None = None) -> dict[str, Any]:
+        """
+        Regrava os campos desnormalizados a partir do valor atual da origem.
+
+        - Idempotente: o valor é sempre relido da origem (não vem do enfileiramento) e somente os
+          documentos com valor diferente são gravados. Jobs repetidos ou fora de ordem convergem
+          para o valor atual; uma execução já concluída para o mesmo valor termina sem varredura.
+        - Retomável: após cada página gravada, o checkpoint guarda o passo e o último documento; uma
+          execução interrompida para o mesmo valor continua de onde parou.
+        - Limitada: lotes de até 500 documentos (WriteBatch) e no máximo `writes_per_second`.
+
+        Args:
+            kind (str): CATEGORIA_NAME ou USUARIO_NAME
+            source_id (str): ID da categoria ou do usuário
+            page_size (int | None): Documentos lidos por página (padrão PROPAGATION_PAGE_SIZE ou 500)
+            writes_per_second (float | None): Limite de escritas (padrão PROPAGATION_WRITES_PER_SECOND ou 250; 0 desliga)
+            on_progress (Callable | None): Recebe o total de documentos atualizados nesta execução após cada página
+
+        Returns:
+            dict: 'updated' (nesta execução), 'scanned' e 'skipped' (True se nada havia a propagar)
+        """
+        if kind not in PROPAGATION_KINDS:
+            raise ValueError(f"Tipo de propagação desconhecido: {kind}")
+        if not source_id:
+            raise ValueError("ID da origem é necessário para propagar.")
+
+        plan = self._plan(kind, source_id)
+        if plan is None:
+            logger.info(f"Propagação {kind} de {source_id}: origem não encontrada, nada a propagar")
+            return {"updated": 0, "scanned": 0, "skipped": True}
+        value, steps = plan
+
+        key = f"{kind}_{source_id}"
+        checkpoint = self.repository.get_checkpoint(key) or {}
+        same_value = checkpoint.get("value") == value
+        if same_value and checkpoint.get("finished"):
+            return {"updated": 0, "scanned": 0, "skipped": True}
+
+        step_keys = [step.key for step in steps]
+        resume_step = checkpoint.get("step") if same_value else None
+        if resume_step in step_keys:
+            start_after_id = checkpoint.get("last_doc_id")
+            previously_updated = int(checkpoint.get("updated", 0))
+            logger.info(f"Retomando a propagação {kind} de {source_id} no passo {resume_step}")
+        else:
+            # Valor novo (ou passos diferentes, ex.: empresas do usuário alteradas): recomeça do início
+            resume_step, start_after_id, previously_updated = None, None, 0
+            self.repository.save_checkpoint(key, {
+                "kind": kind,
+                "source_id": source_id,
+                "value": value,
+                "finished": False,
+                "step": None,
+                "last_doc_id": None,
+                "updated": 0,
+                "started_at": datetime.now(UTC),
+            })
+
+        page_size = page_size or int(os.getenv('PROPAGATION_PAGE_SIZE', '500'))
+        if writes_per_second is None:
+            writes_per_second = float(os.getenv('PROPAGATION_WRITES_PER_SECOND', '250'))
+        throttle = WriteThrottle(writes_per_second)
+
+        updated = 0
+        scanned = 0
+        for step in steps[step_keys.index(resume_step) if resume_step else 0:]:
+            after_id = start_after_id if step.key == resume_step else None
+            for page in self.repository.iter_step_pages(step, page_size, start_after_id=after_id):
+                scanned += len(page)
+                changes = [(doc_id, fields) for doc_id, data in page if (fields := step.changes(data))]
+                for start in range(0, len(changes), MAX_WRITE_BATCH_SIZE):
+                    chunk = changes[start:start + MAX_WRITE_BATCH_SIZE]
+                    throttle.acquire(len(chunk))
+                    self.repository.update_documents(step, chunk)
+                updated += len(changes)
+                self.repository.save_checkpoint(key, {
+                    "step": step.key,
+                    "last_doc_id": page[-1][0],
+                    "updated": previously_updated + updated,
+                })
+                if changes and on_progress:
+                    on_progress(updated)
+
+        self.repository.save_checkpoint(key, {"finished": True, "finished_at": datetime.now(UTC)})
+        logger.info(f"Propagação {kind} de {source_id}: {updated} documento(s) atualizado(s) de {scanned} lido(s)")
+        return {"updated": updated, "scanned": scanned, "skipped": False}
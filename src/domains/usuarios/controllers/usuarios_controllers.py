@@ -12,22 +12,18 @@ from dotenv import load_dotenv
 from src.domains.shared.controllers.domain_exceptions import AuthenticationException, InvalidCredentialsException, UserNotFoundException
 from src.domains.usuarios.models.usuarios_model import Usuario
 from src.domains.shared import RegistrationStatus
+from src.domains.shared.models.denormalized_propagation import USUARIO_NAME
+from src.domains.shared.models.password import password_fingerprint
 from src.domains.usuarios.repositories.implementations.firebase_usuarios_repository import FirebaseUsuariosRepository
 from src.shared.config.get_app_colors import THEME_COLOR_NAMES
 from src.domains.usuarios.services.usuarios_services import UsuariosServices
-from src.services.emails.send_email import (
-    EmailAuthenticationError,
-    EmailConnectionError,
-    EmailMessage,
-    EmailRecipientError,
-    EmailSendError,
-    EmailValidationError,
-    ModernEmailSender,
-    create_email_config_from_env
-)
+from src.services.emails.send_email import EmailMessage
+from src.services.jobs import enqueue_denormalized_propagation, enqueue_email
+from src.shared.metrics import instrument_controller
 
 logger = logging.getLogger(__name__)
 
+@instrument_controller("usuarios")
 def handle_login(email: str, password: str) -> dict[str, Any]:
     response: dict[str, Any] = {}
 
@@ -63,6 +59,7 @@ def handle_login(email: str, password: str) -> dict[str, Any]:
 
     return response
 
+@instrument_controller("usuarios")
 def handle_update_user_password(user_id: str, new_password: str) -> dict[str, Any]:
 
     response: dict[str, Any] = {}
@@ -95,6 +92,7 @@ def handle_update_user_password(user_id: str, new_password: str) -> dict[str, An
     return response
 
 
+@instrument_controller("usuarios")
 def handle_save(usuario: Usuario) -> dict[str, Any]:
     """
     Manipula a operação de salvar usuário.
@@ -130,7 +128,15 @@ def handle_save(usuario: Usuario) -> dict[str, Any]:
 
         if usuario.id:
             # Alterar usuário existente
+            previous = usuarios_services.find_by_id(usuario.id)
             id = usuarios_services.update(usuario)
+            if previous and previous.name.nome_completo != usuario.name.nome_completo:
+                # Usuário renomeado: os campos '<prefixo>_by_name' são atualizados em segundo plano
+                try:
+                    enqueue_denormalized_propagation(USUARIO_NAME, usuario.id)
+                except Exception as e:
+                    # O salvamento já foi concluído: a propagação pode ser executada depois pelo script
+                    logger.error(f"Não foi possível enfileirar a propagação do nome do usuário {usuario.id}: {e}")
         else:
             # Criar novo usuário
             operation = "criado"
@@ -148,6 +154,7 @@ def handle_save(usuario: Usuario) -> dict[str, Any]:
 
     return response
 
+@instrument_controller("usuarios")
 def handle_update_photo(id: str, photo_url: str) -> dict[str, Any]:
     """
     Update no campo photo_url do usuário.
@@ -193,6 +200,7 @@ def handle_update_photo(id: str, photo_url: str) -> dict[str, Any]:
 
     return response
 
+@instrument_controller("usuarios")
 def handle_update_user_colors(id: str, theme_color: str) -> dict[str, Any]:
     """
     Update no campo colors do usuário.
@@ -264,6 +272,7 @@ def handle_update_user_colors(id: str, theme_color: str) -> dict[str, Any]:
 
     return response
 
+@instrument_controller("usuarios")
 def handle_update_user_companies(usuario_id: str, empresas: set, empresa_ativa_id: str|None = None) -> dict:
     """
     Update nos campos empresa_id e empresas do usuário.
@@ -323,6 +332,7 @@ def handle_update_user_companies(usuario_id: str, empresas: set, empresa_ativa_i
 
     return response
 
+@instrument_controller("usuarios")
 def handle_get_user_by_id(id: str) -> dict[str, Any]:
     """
     Manipula a operação de buscar usuário.
@@ -379,6 +389,7 @@ def handle_get_user_by_id(id: str) -> dict[str, Any]:
     return response
 
 
+@instrument_controller("usuarios")
 def handle_get_user_by_email(email: str) -> dict[str, Any]:
     """
     Manipula a operação de buscar usuário.
@@ -435,6 +446,7 @@ def handle_get_user_by_email(email: str) -> dict[str, Any]:
 
     return response
 
+@instrument_controller("usuarios")
 def handle_get_all(empresa_id: str, status_deleted: bool = False) -> dict[str, Any]:
     """
     Busca todos os usuários da empresa logada que sejam ativa ou não, dependendo do status_active desejado.
@@ -487,6 +499,7 @@ def handle_get_all(empresa_id: str, status_deleted: bool = False) -> dict[str, A
 
     return response
 
+@instrument_controller("usuarios")
 def handle_update_status(user_to_update: Usuario, current_user: Usuario, status: RegistrationStatus) -> dict[str, Any]:
     """Manipula o status para ativo, inativo ou deletado de um usuário."""
     response = {}
@@ -528,7 +541,15 @@ def handle_update_status(user_to_update: Usuario, current_user: Usuario, status:
 
     return response
 
+@instrument_controller("usuarios")
 def send_mail_password(user_to_email: Usuario) -> dict[str, Any]:
+    """
+    Enfileira o email com a senha temporária do usuário recém-cadastrado.
+
+    O envio roda em segundo plano (job email.send, com novas tentativas em falhas transitórias);
+    o cadastro não espera pelo servidor SMTP. A situação do envio pode ser consultada com
+    jobs_controllers.handle_get_job_status(job_id).
+    """
     load_dotenv()
     URL_LOGIN = os.environ.get("URL_LOGIN", "")
 
@@ -540,11 +561,8 @@ def send_mail_password(user_to_email: Usuario) -> dict[str, Any]:
         if not user_to_email.id:
             raise ValueError("ID da user_to_email não pode ser nulo ou vazio")
 
-        config = create_email_config_from_env()
-        email_sender = ModernEmailSender(config)
         senha_temp = user_to_email.password.decrypted # Acessa a property diretamente
 
-        # 1. Enviar email de forma síncrona
         mensagem = EmailMessage(
             subject="🔑 Sua senha temporária - Ação Necessária",
             recipients=[user_to_email.email],
@@ -556,53 +574,18 @@ def send_mail_password(user_to_email: Usuario) -> dict[str, Any]:
             """
         )
 
-        resultado = email_sender.send_email_sync_direct(mensagem)
-
-        if resultado['success']:
-            # 2. Só marca como "email enviado" se confirmou envio
-            # ToDo: marcar_usuario_email_enviado(user_to_email.id)
-            return {"success": True, "message": "Usuário criado e email enviado"}
-        else:
-            # 3. Se email falhou, pode reverter ou tentar novamente
-            return {"success": False, "error": "Usuário criado mas email falhou"}
+        # Um email por senha temporária, mesmo que o enfileiramento seja repetido
+        job_id = enqueue_email(mensagem,
+                               idempotency_key=f"user-credentials:{user_to_email.id}:{password_fingerprint(senha_temp)}")
+        logger.info(f"Email de credenciais enfileirado para {user_to_email.email} (job {job_id})")
+        return {"success": True, "message": "Usuário salvo. As credenciais serão enviadas por email.", "job_id": job_id}
 
-    except EmailValidationError as e:
+    except ValueError as e:
         # Erros de validação - dados incorretos
-        print(f"❌ Erro de validação: {e}")
-        if e.field == "email_format":
-            return {"success": False, "error": "Email inválido", "user_message": "Verifique o email digitado"}
-        elif e.field == "subject":
-            return {"success": False, "error": "Assunto inválido", "user_message": "Erro interno, tente novamente"}
-        else:
-            return {"success": False, "error": str(e), "user_message": "Dados inválidos"}
-
-    except EmailAuthenticationError as e:
-        # Problema de configuração do servidor
-        print(f"🔐 Erro de autenticação: {e}")
-        return {"success": False, "error": "Erro de configuração", "user_message": "Falha temporária, tente novamente"}
-
-    except EmailConnectionError as e:
-        # Problema de rede/servidor
-        print(f"🌐 Erro de conexão: {e}")
-        return {"success": False, "error": "Erro de conexão", "user_message": "Servidor indisponível, tente novamente"}
-
-    except EmailRecipientError as e:
-        # Email do destinatário rejeitado
-        print(f"📧 Erro de destinatário: {e}")
-        return {"success": False, "error": "Email rejeitado", "user_message": f"Email inválido: {', '.join(e.invalid_emails)}"}
-
-    except EmailSendError as e:
-        # Outros erros de envio
-        print(f"📤 Erro de envio: {e}")
-
-        if e.error_type == "QUOTA_EXCEEDED":
-            return {"success": False, "error": "Cota excedida", "user_message": "Limite de emails atingido, tente mais tarde"}
-        elif e.error_type == "SPAM_REJECTED":
-            return {"success": False, "error": "Spam detectado", "user_message": "Email rejeitado, entre em contato conosco"}
-        else:
-            return {"success": False, "error": str(e), "user_message": "Falha no envio, tente novamente"}
+        logger.error(f"Erro de validação: {e}")
+        return {"success": False, "error": str(e), "user_message": "Dados inválidos"}
 
     except Exception as e:
-        # Qualquer outro erro não previsto
-        print(f"💥 Erro inesperado: {e}")
+        # Qualquer outro erro não previsto (ex.: fila de jobs indisponível)
+        logger.error(f"Erro ao enfileirar email de credenciais: {e}")
         return {"success": False, "error": "Erro inesperado", "user_message": "Erro interno, entre em contato com suporte"}
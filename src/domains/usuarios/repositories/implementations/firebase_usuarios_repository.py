@@ -11,7 +11,7 @@ from src.domains.usuarios.models.usuarios_model import Usuario
 from src.domains.shared.models.registration_status import RegistrationStatus
 from src.domains.usuarios.repositories.contracts.usuarios_repository import UsuariosRepository
 from src.shared.utils import deepl_translator
-from storage.data import get_firebase_app
+from storage.data import get_firebase_app, get_firestore_client, record_returned
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +34,7 @@ class FirebaseUsuariosRepository(UsuariosRepository):
         """
         get_firebase_app()
 
-        self.db = firestore.client()
+        self.db = get_firestore_client()
         self.collection = self.db.collection('usuarios')
 
     def authentication(self, email, password) -> Usuario | None:
@@ -321,10 +321,11 @@ class FirebaseUsuariosRepository(UsuariosRepository):
             Exception: Em caso de erro na operação de banco de dados.
         """
         try:
-            query = (self.collection
-                     .where(filter=FieldFilter("empresas", "array_contains", empresa_id))
-                     .order_by("name.first_name_lower")
-                     .order_by("name.last_name_lower"))
+            query = self.collection.where(filter=FieldFilter("empresas", "array_contains", empresa_id))
+            if status_deleted:
+                # Lixeira: lê somente os deletados (índice empresas, status, nome — ver firestore.indexes.json)
+                query = query.where(filter=FieldFilter("status", "==", RegistrationStatus.DELETED.name))
+            query = query.order_by("name.first_name_lower").order_by("name.last_name_lower")
 
             docs = query.get()
 
@@ -352,6 +353,7 @@ class FirebaseUsuariosRepository(UsuariosRepository):
 
             # Modificação 2: Remover ordenação em memória, pois o Firestore já fez isso.
             # usuarios_result.sort(key=lambda usuario: usuario.categoria_name) # REMOVIDO
+            record_returned(len(usuarios_result))
             return usuarios_result, quantity_deleted
 
         except google_api_exceptions.FailedPrecondition as e:
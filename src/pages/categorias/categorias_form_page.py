@@ -38,7 +38,8 @@ class ProdutoCategoriaForm:
         self.image_uploader = ImageUploadHandler(
             page=self.page,
             image_frame=self.image_frame,
-            bucket_prefix=f"empresas/{self.empresa_logada['id']}/categorias"
+            bucket_prefix=f"empresas/{self.empresa_logada['id']}/categorias",
+            stream_to_bucket=True,
         )
         self.form = self.build_form()
         self.page.on_resized = self._page_resize
@@ -298,6 +299,8 @@ def show_category_form(page: ft.Page) -> ft.View:
                 page=page, message=result["message"], message_type=MessageType.ERROR)
             return
 
+        categorias_view.image_uploader.mark_saved()
+
         # Limpa o formulário salvo e volta para a página anterior que a invocou
         categorias_view.clear_form()
         page.back() # type: ignore [attr-defined]
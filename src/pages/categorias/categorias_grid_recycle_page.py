@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import traceback
 import datetime
@@ -6,9 +7,11 @@ import math # Adicionado para a função ceil (arredondar para cima)
 import flet as ft
 
 import src.domains.categorias.controllers.categorias_controllers as category_controllers
+from src.domains.shared import RegistrationStatus
+from src.domains.shared.context.session import get_current_user
 import src.pages.categorias.categorias_actions_page as category_actions
 from src.pages.partials.app_bars.appbar import create_appbar_back
-from src.pages.shared.components import create_recycle_bin_card
+from src.pages.shared.components import create_recycle_bin_card, create_recycle_bin_skeleton
 import src.pages.shared.recycle_bin_helpers as recycle_helpers
 
 from src.shared.utils import format_datetime_to_utc_minus_3
@@ -21,11 +24,10 @@ def show_categories_grid_trash(page: ft.Page):
     """Página de exibição das categorias da empresa logada que estão inativas ('DELETED')em formato Cards"""
     page.theme_mode = ft.ThemeMode.DARK
 
-    # --- Indicador de Carregamento (Spinner) ---
-    progress_ring = ft.ProgressRing(width=32, height=32, stroke_width=3)
+    # --- Indicador de Carregamento (Esqueleto dos cards) ---
     loading_container = ft.Container(
-        content=progress_ring,
-        alignment=ft.alignment.center,
+        content=create_recycle_bin_skeleton(),
+        alignment=ft.alignment.top_center,
         expand=True,  # Ocupa o espaço disponível enquanto carrega
         visible=True  # Começa visível
     )
@@ -134,6 +136,15 @@ def show_categories_grid_trash(page: ft.Page):
 
     # --- Função Assíncrona para Carregar Dados e Atualizar a UI ---
     async def load_data_and_update_ui():
+        # Recarga (após ações em lote): descarta os cards e a seleção anteriores
+        content_area.controls.clear()
+        selection.reset()
+        if content_area.visible:
+            # Recarga: volta ao esqueleto enquanto a lixeira é relida em segundo plano
+            loading_container.visible = True
+            content_area.visible = False
+            page.update()
+
         categorias_data = []
         categorias_inactivated = 0
 
@@ -141,12 +152,11 @@ def show_categories_grid_trash(page: ft.Page):
         empresa_id = page.app_state.empresa["id"] # type: ignore
 
         try:
-            # *** IMPORTANTE: Garanta que handle_get_all seja async ***
             if not empresa_id:  # Só busca as categorias da empresa logada, se houver ID
                 content_area.controls.append(empty_content_display)
                 return
 
-            result = category_controllers.handle_get_all(empresa_id=empresa_id, status_deleted=True)
+            result = await asyncio.to_thread(category_controllers.handle_get_all, empresa_id=empresa_id, status_deleted=True)
 
             if result["status"] == "error":
                 content_area.controls.append(empty_content_display)
@@ -188,6 +198,7 @@ def show_categories_grid_trash(page: ft.Page):
                         on_action_click=handle_action_click,
                         on_info_click=handle_info_click,
                         on_icon_hover=handle_icon_hover,
+                        selection_control=selection.checkbox(categoria.id),
                     ) for categoria in categorias_data
                 ],
                 columns=12,  # Total de colunas no sistema de grid
@@ -233,16 +244,29 @@ def show_categories_grid_trash(page: ft.Page):
             else:
                 logger.info("Contexto da página perdido, não foi possível atualizar.")
 
+    # --- Seleção múltipla: restaurar ou excluir definitivamente em lote ---
+    selection = recycle_helpers.RecycleBinSelection(
+        page=page,
+        entity_label="categorias",
+        restore=lambda ids, on_progress: category_controllers.handle_bulk_update_status(
+            empresa_id=page.app_state.empresa["id"], categoria_ids=ids, current_user=get_current_user(page), # type: ignore [attr-defined]
+            status=RegistrationStatus.ACTIVE, on_progress=on_progress),
+        purge=lambda ids, on_progress: category_controllers.handle_bulk_hard_delete(
+            empresa_id=page.app_state.empresa["id"], categoria_ids=ids, on_progress=on_progress), # type: ignore [attr-defined]
+        on_done=load_data_and_update_ui,
+    )
+
     # --- Disparar Carregamento dos Dados ---
-    # Executa a função async em background. A UI mostrará o spinner primeiro.
+    # Executa a função async em background. A UI mostrará o esqueleto primeiro.
     page.run_task(load_data_and_update_ui)
 
     # --- Retornar Estrutura Inicial da Página como ft.View ---
-    # A View inclui a AppBar e a área de conteúdo principal (que inicialmente mostra o spinner)
+    # A View inclui a AppBar e a área de conteúdo principal (que inicialmente mostra o esqueleto)
     return ft.View(
         route="/home/produtos/categorias/grid/lixeira",  # A rota que esta view corresponde
         controls=[
-            loading_container,  # Mostra o spinner inicialmente
+            selection.toolbar,  # Ações em lote sobre os itens selecionados
+            loading_container,  # Mostra o esqueleto inicialmente
             content_area       # Oculto inicialmente, populado por load_data_and_update_ui
         ],
         appbar=appbar,
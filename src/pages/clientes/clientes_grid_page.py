@@ -12,13 +12,16 @@ def show_clients_grid(page: ft.Page):
 
     async def handle_action(action: str, cliente: Cliente | None):
         """Handler unificado para todas as ações"""
-        if not cliente and action != "INSERT":
+        if not cliente and action not in ('INSERT', 'EXPORT'):
             return
 
         match action:
             case "INSERT":
                 page.app_state.clear_form_data() # type: ignore [attr-defined]
                 page.go('/home/clientes/form')
+            case "EXPORT":
+                from src.pages.shared.export_dialog import export_dataset
+                await export_dataset(page, ["clientes"])
             case "EDIT":
                 page.app_state.set_form_data(cliente.to_dict()) # type: ignore [attr-defined]
                 page.go('/home/clientes/form')
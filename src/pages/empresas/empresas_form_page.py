@@ -415,19 +415,10 @@ class EmpresaView:
 
             result = await consult_cnpj_api(self.cnpj.value)
 
-            if result['is_error']:
-                # Mostra erro
-                message_snackbar(
-                    page=self.page,
-                    message="Erro ao consultar CNPJ. Verifique o número e tente novamente.",
-                    message_type=MessageType.ERROR
-                )
-                return
-
             data = result['data']
-            response = result['response']
+            status = result['status']
 
-            if response.status in (200, 304):
+            if status == 200:
                 # Preenche os campos com os dados retornados
                 self.trade_name.value = data.get('nome_fantasia', '')
                 self.corporate_name.value = data.get('razao_social', '')
@@ -456,21 +447,20 @@ class EmpresaView:
                 # Mostra mensagem de sucesso
                 message_snackbar(
                     page=self.page, message="Dados do CNPJ carregados com sucesso!", message_type=MessageType.SUCCESS)
-            elif response.status == 400:
+            elif status in (400, 404):
                 message_snackbar(
                     page=self.page,
-                    message=f"Erro ao consultar CNPJ: CNPJ inválido",
+                    message=result['message'],
                     message_type=MessageType.WARNING
                 )
             else:
                 # Mostra erro
                 message_snackbar(
                     page=self.page,
-                    message=f"Erro ao consultar CNPJ. Status: {response.status}",
+                    message="Erro ao consultar CNPJ. Verifique o número e tente novamente.",
                     message_type=MessageType.ERROR
                 )
-                logger.error(
-                    f"Erro ao consultar CNPJ: {response.status} - {response.reason}")
+                logger.error(f"Erro ao consultar CNPJ: {status} - {result['message']}")
 
         except Exception as error:
             # Mostra erro genérico
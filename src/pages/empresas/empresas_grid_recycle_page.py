@@ -29,5 +29,5 @@ def show_companies_grid_trash(page: ft.Page):
     page.run_task(controller.load_data_and_update_ui)
 
     # 5. Retorna a View construída pela classe de UI.
-    # A UI é responsável por exibir o spinner de carregamento inicial.
+    # A UI é responsável por exibir o esqueleto de carregamento inicial.
     return ui.build()
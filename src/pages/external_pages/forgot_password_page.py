@@ -1,27 +1,18 @@
 import logging
-import asyncio
 import os
-from typing import Dict, Any
 
 import flet as ft
 
 from src.domains.shared.context import session
 from src.domains.shared.context.session import get_session_colors
+from src.domains.shared.models.password import password_fingerprint
 from src.pages.partials import get_responsive_sizes, build_input_field
 from src.services.states.app_state_manager import AppStateManager
 from src.shared.utils import MessageType, message_snackbar, validate_email
 
 # Importações para envio de email
-from src.services.emails.send_email import (
-    ModernEmailSender,
-    EmailMessage,
-    create_email_config_from_env,
-    EmailValidationError,
-    EmailAuthenticationError,
-    EmailConnectionError,
-    EmailRecipientError,
-    EmailSendError
-)
+from src.services.emails.send_email import EmailMessage
+from src.services.jobs import enqueue_email
 
 import src.domains.usuarios.controllers.usuarios_controllers as user_controllers
 
@@ -327,103 +318,6 @@ class ForgotPasswordView:
             body_html=html_body
         )
 
-    async def send_password_email_async(self, user_email: str, temp_password: str) -> Dict[str, Any]:
-        """
-        Envia email de recuperação de senha de forma assíncrona
-
-        Args:
-            user_email: Email do usuário
-            temp_password: Senha temporária
-
-        Returns:
-            Dict com resultado do envio
-        """
-        try:
-            # Cria configuração do email
-            config = create_email_config_from_env()
-            email_sender = ModernEmailSender(config)
-
-            # Cria a mensagem
-            email_message = self.create_password_reset_email(user_email, temp_password)
-
-            # Envia o email
-            await email_sender.send_email_async(email_message)
-
-            logger.info(f"Email de recuperação enviado para: {user_email}")
-            return {
-                "success": True,
-                "message": "Email enviado com sucesso",
-                "user_message": "Verifique seu email para obter a nova senha temporária"
-            }
-
-        except EmailValidationError as e:
-            logger.error(f"Erro de validação no email: {e}")
-            if e.field == "email_format":
-                return {
-                    "success": False,
-                    "error": "invalid_email",
-                    "user_message": "Email inválido. Verifique o endereço digitado."
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": "validation_error",
-                    "user_message": "Dados inválidos. Tente novamente."
-                }
-
-        except EmailAuthenticationError as e:
-            logger.error(f"Erro de autenticação no servidor de email: {e}")
-            return {
-                "success": False,
-                "error": "email_config_error",
-                "user_message": "Falha temporária no sistema. Tente novamente em alguns minutos."
-            }
-
-        except EmailConnectionError as e:
-            logger.error(f"Erro de conexão com servidor de email: {e}")
-            return {
-                "success": False,
-                "error": "connection_error",
-                "user_message": "Servidor de email indisponível. Tente novamente mais tarde."
-            }
-
-        except EmailRecipientError as e:
-            logger.error(f"Email do destinatário rejeitado: {e}")
-            return {
-                "success": False,
-                "error": "recipient_rejected",
-                "user_message": "Email rejeitado pelo servidor. Verifique se o endereço está correto."
-            }
-
-        except EmailSendError as e:
-            logger.error(f"Erro no envio de email: {e}")
-            if e.error_type == "QUOTA_EXCEEDED":
-                return {
-                    "success": False,
-                    "error": "quota_exceeded",
-                    "user_message": "Limite de emails atingido. Tente novamente em 1 hora."
-                }
-            elif e.error_type == "SPAM_REJECTED":
-                return {
-                    "success": False,
-                    "error": "spam_detected",
-                    "user_message": "Email rejeitado por filtro de spam. Entre em contato com suporte."
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": "send_error",
-                    "user_message": "Falha no envio. Tente novamente."
-                }
-
-        except Exception as e:
-            logger.error(f"Erro inesperado no envio de email: {e}")
-            return {
-                "success": False,
-                "error": "unexpected_error",
-                "user_message": "Erro interno do sistema. Entre em contato com suporte."
-            }
-
     def handle_send_password(self, _):
         """
         Manipula o clique no botão de envio de senha
@@ -491,44 +385,24 @@ class ForgotPasswordView:
                 )
                 return
 
-            # Envia email com nova senha (método síncrono para compatibility com Flet)
-            def run_async_email():
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        # Se já há um loop rodando, usa thread pool
-                        import concurrent.futures
-                        with concurrent.futures.ThreadPoolExecutor() as executor:
-                            future = executor.submit(
-                                lambda: asyncio.run(self.send_password_email_async(email, temp_password))
-                            )
-                            return future.result(timeout=30)  # Timeout de 30 segundos
-                    else:
-                        return asyncio.run(self.send_password_email_async(email, temp_password))
-                except RuntimeError:
-                    # Fallback para método síncrono direto
-                    return self.send_password_email_sync_direct(email, temp_password)
-
-            email_result = run_async_email()
-
-            if email_result["success"]:
-                logger.info(f"Senha temporária enviada com sucesso para: {email}")
-                message_snackbar(
-                    page=self.page,
-                    message=email_result["user_message"],
-                    message_type=MessageType.SUCCESS
-                )
+            # Enfileira o email com a nova senha: o envio (e suas novas tentativas) roda em
+            # segundo plano e a tela não espera pelo servidor SMTP
+            email_message = self.create_password_reset_email(email, temp_password)
+            job_id = enqueue_email(
+                email_message,
+                # Um envio por senha gerada, mesmo que o enfileiramento seja repetido
+                idempotency_key=f"password-reset:{user.id}:{password_fingerprint(temp_password)}",
+            )
+            logger.info(f"Email de recuperação de senha enfileirado para {email} (job {job_id})")
 
-                # Redireciona para login após sucesso
-                self.page.go('/login')
+            message_snackbar(
+                page=self.page,
+                message="Verifique seu email para obter a nova senha temporária",
+                message_type=MessageType.SUCCESS
+            )
 
-            else:
-                logger.error(f"Falha no envio de email: {email_result['error']}")
-                message_snackbar(
-                    page=self.page,
-                    message=email_result["user_message"],
-                    message_type=MessageType.ERROR
-                )
+            # Redireciona para login após sucesso
+            self.page.go('/login')
 
         except Exception as e:
             logger.error(f"Erro inesperado na recuperação de senha: {e}")
@@ -545,40 +419,6 @@ class ForgotPasswordView:
             self.send_button.content.controls[1].value = original_text # type: ignore
             self.send_button.update()
 
-    def send_password_email_sync_direct(self, user_email: str, temp_password: str) -> Dict[str, Any]:
-        """
-        Método de fallback síncrono direto para envio de email
-
-        Args:
-            user_email: Email do usuário
-            temp_password: Senha temporária
-
-        Returns:
-            Dict com resultado do envio
-        """
-        try:
-            config = create_email_config_from_env()
-            email_sender = ModernEmailSender(config)
-
-            email_message = self.create_password_reset_email(user_email, temp_password)
-
-            result = email_sender.send_email_sync_direct(email_message)
-
-            logger.info(f"Email de recuperação enviado (sync direct) para: {user_email}")
-            return {
-                "success": True,
-                "message": "Email enviado com sucesso",
-                "user_message": "Verifique seu email para obter a nova senha temporária"
-            }
-
-        except Exception as e:
-            logger.error(f"Erro no envio síncrono direto: {e}")
-            return {
-                "success": False,
-                "error": "sync_send_error",
-                "user_message": "Falha no envio. Tente novamente."
-            }
-
     def page_resize(self, e):
         """Manipula o redimensionamento da página"""
         self.page_width: int = session.get_current_page_width(e.page)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import traceback
 
@@ -6,11 +7,12 @@ import flet as ft
 from src.domains.formas_pagamento.controllers.formas_pagamento_controller import FormasPagamentoController
 from src.domains.formas_pagamento.repositories.implementations.firebase_formas_pagamento_repository import FirebaseFormasPagamentoRepository
 from src.domains.formas_pagamento.services.formas_pagamento_service import FormasPagamentoService
-from src.domains.shared.context.session import get_current_company
+from src.domains.shared import RegistrationStatus
+from src.domains.shared.context.session import get_current_company, get_current_user
 from src.pages.formas_pagamento.formas_pagamento_actions_page import restore_from_trash
 from src.pages.partials.app_bars.appbar import create_appbar_back
-from src.pages.shared.components import create_recycle_bin_card
-from src.pages.shared.recycle_bin_helpers import get_deleted_info_message
+from src.pages.shared.components import create_recycle_bin_card, create_recycle_bin_skeleton
+from src.pages.shared.recycle_bin_helpers import RecycleBinSelection, get_deleted_info_message
 from src.shared.utils.time_zone import format_datetime_to_utc_minus_3
 
 logger = logging.getLogger(__name__)
@@ -23,11 +25,10 @@ def show_formas_pagamento_grid_trash(page: ft.Page):
     """
     page.theme_mode = ft.ThemeMode.DARK
 
-    # --- Indicador de Carregamento (Spinner) ---
-    progress_ring = ft.ProgressRing(width=32, height=32, stroke_width=3)
+    # --- Indicador de Carregamento (Esqueleto dos cards) ---
     loading_container = ft.Container(
-        content=progress_ring,
-        alignment=ft.alignment.center,
+        content=create_recycle_bin_skeleton(),
+        alignment=ft.alignment.top_center,
         expand=True,  # Ocupa o espaço disponível enquanto carrega
         visible=True  # Começa visível
     )
@@ -134,11 +135,19 @@ def show_formas_pagamento_grid_trash(page: ft.Page):
 
     # --- Função Assíncrona para Carregar Dados e Atualizar a UI ---
     async def load_data_and_update_ui():
+        # Recarga (após ações em lote): descarta os cards e a seleção anteriores
+        content_area.controls.clear()
+        selection.reset()
+        if content_area.visible:
+            # Recarga: volta ao esqueleto enquanto a lixeira é relida em segundo plano
+            loading_container.visible = True
+            content_area.visible = False
+            page.update()
+
         # ID da empresa logada
         empresa_id = get_current_company(page)["id"]
 
         try:
-            # *** IMPORTANTE: Garanta que get_formas_pagamento seja async ***
             if not empresa_id:  # Só busca as formas de pagamento da empresa logada, se houver ID
                 content_area.controls.append(empty_content_display)
                 return
@@ -146,8 +155,8 @@ def show_formas_pagamento_grid_trash(page: ft.Page):
             service = FormasPagamentoService(repository)
             controllers = FormasPagamentoController(service)
 
-            formas_pagamentos_data, formas_pagamentos_inactivated = controllers.get_formas_pagamento(
-                empresa_id=empresa_id, status_deleted=True)
+            formas_pagamentos_data, formas_pagamentos_inactivated = await asyncio.to_thread(
+                controllers.get_formas_pagamento, empresa_id=empresa_id, status_deleted=True)
 
             if formas_pagamentos_inactivated == 0:
                 # Se formas_pagamentos_inactivated == 0, formas_pagamentos_data é vazio []
@@ -181,6 +190,7 @@ def show_formas_pagamento_grid_trash(page: ft.Page):
                         on_action_click=handle_action_click,
                         on_info_click=handle_info_click,
                         on_icon_hover=handle_icon_hover,
+                        selection_control=selection.checkbox(forma_pagamento.id),
                     ) for forma_pagamento in formas_pagamentos_data
                 ],
                 columns=12,  # Total de colunas no sistema de grid
@@ -228,16 +238,30 @@ def show_formas_pagamento_grid_trash(page: ft.Page):
                 logger.info(
                     "Contexto da página perdido, não foi possível atualizar.")
 
+    # --- Seleção múltipla: restaurar ou excluir definitivamente em lote ---
+    bulk_controllers = FormasPagamentoController(FormasPagamentoService(FirebaseFormasPagamentoRepository()))
+    selection = RecycleBinSelection(
+        page=page,
+        entity_label="formas de pagamento",
+        restore=lambda ids, on_progress: bulk_controllers.bulk_update_status(
+            empresa_id=get_current_company(page)["id"], forma_pagamento_ids=ids, current_user=get_current_user(page),
+            status=RegistrationStatus.ACTIVE, on_progress=on_progress),
+        purge=lambda ids, on_progress: bulk_controllers.bulk_hard_delete(
+            empresa_id=get_current_company(page)["id"], forma_pagamento_ids=ids, on_progress=on_progress),
+        on_done=load_data_and_update_ui,
+    )
+
     # --- Disparar Carregamento dos Dados ---
-    # Executa a função async em background. A UI mostrará o spinner primeiro.
+    # Executa a função async em background. A UI mostrará o esqueleto primeiro.
     page.run_task(load_data_and_update_ui)
 
     # --- Retornar Estrutura Inicial da Página como ft.View ---
-    # A View inclui a AppBar e a área de conteúdo principal (que inicialmente mostra o spinner)
+    # A View inclui a AppBar e a área de conteúdo principal (que inicialmente mostra o esqueleto)
     return ft.View(
         route="/home/produtos/grid/lixeira",  # A rota que esta view corresponde
         controls=[
-            loading_container,  # Mostra o spinner inicialmente
+            selection.toolbar,  # Ações em lote sobre os itens selecionados
+            loading_container,  # Mostra o esqueleto inicialmente
             content_area       # Oculto inicialmente, populado por load_data_and_update_ui
         ],
         appbar=appbar,
@@ -8,7 +8,10 @@ import src.controllers.bucket_controllers as bucket_controllers
 from src.domains.shared.context.session import get_current_user, get_current_company
 import src.domains.usuarios.controllers.usuarios_controllers as user_controllers
 from src.domains.usuarios.models.usuarios_model import Usuario
+from src.services.images import image_pipeline
 from src.services.states.app_state_manager import AppStateManager
+from src.services.upload.upload_files import FILE_LANDED_TIMEOUT
+from src.services.upload.upload_watcher import UPLOADS_DIR, upload_watcher
 from src.shared.utils.messages import message_snackbar, MessageType
 from src.shared.utils.file_helpers import generate_unique_bucket_filename
 
@@ -262,33 +265,41 @@ async def _handle_file_picker_result(e: ft.FilePickerResultEvent, page: ft.Page,
         file_name = e.files[0].name
         upload_url = page.get_upload_url(file_name, 60)
         upload_files = [ft.FilePickerUploadFile(name=file_name, upload_url=upload_url)]
-        upload_complete = False
+        # Sinalizado pelo callback de progresso, que roda em outra thread
+        loop = asyncio.get_running_loop()
+        upload_done = asyncio.Event()
+        upload_error: str | None = None
 
         def on_upload_completed(e: ft.FilePickerUploadEvent):
-            nonlocal upload_complete
-            if e.progress == 1:
-                upload_complete = True
+            nonlocal upload_error
+            if e.error:
+                upload_error = e.error
+                loop.call_soon_threadsafe(upload_done.set)
+            elif e.progress == 1:
+                loop.call_soon_threadsafe(upload_done.set)
 
         pick_files_dialog.on_upload = on_upload_completed  # type: ignore [attr-defined]
         pick_files_dialog.upload(upload_files)
 
-        while not upload_complete:
-            await asyncio.sleep(0.1)
+        await upload_done.wait()
+        if upload_error:
+            raise RuntimeError(f"Erro no envio do arquivo {file_name}: {upload_error}")
 
-        local_file = f"Uploads/{file_name}"
+        local_file = f"{UPLOADS_DIR}/{file_name}"
         file_name_bucket = generate_unique_bucket_filename(original_filename=local_file, prefix="usuarios")
 
-        max_retries = 10
-        retry_count = 0
-        while not os.path.exists(local_file) and retry_count < max_retries:
-            await asyncio.sleep(0.1)
-            retry_count += 1
+        if not await upload_watcher.wait_for_file(local_file, timeout=FILE_LANDED_TIMEOUT):
+            logger.debug(f"Arquivo {local_file} não foi encontrado após {FILE_LANDED_TIMEOUT} segundos")
+            raise FileNotFoundError(f"Arquivo {local_file} não foi encontrado após {FILE_LANDED_TIMEOUT} segundos")
 
-        if not os.path.exists(local_file):
-            logger.debug(f"Arquivo {local_file} não foi encontrado após {max_retries} tentativas")
-            raise FileNotFoundError(f"Arquivo {local_file} não foi encontrado após {max_retries} tentativas")
-
-        avatar_url = bucket_controllers.handle_upload_bucket(local_path=local_file, key=file_name_bucket)
+        # Gera as rendições da foto em um pool de processos (fora do event loop) e as envia ao bucket
+        renditions = await image_pipeline.process_and_upload_async(local_file, prefix="usuarios")
+        if renditions:
+            avatar_url = renditions["medium"]
+        else:
+            # Formato não suportado pelo pipeline (ex.: SVG): envia o arquivo original
+            avatar_url = await bucket_controllers.handle_upload_bucket_async(
+                local_path=local_file, key=file_name_bucket)
         if not avatar_url:
             page.close(dialog)
             message_snackbar(
@@ -307,9 +318,10 @@ async def _handle_file_picker_result(e: ft.FilePickerResultEvent, page: ft.Page,
         result = user_controllers.handle_update_photo(id=current_user.id, photo_url=avatar_url)
 
         # Se a atualização no banco de dados falhar, remove o arquivo recém-enviado do bucket.
-        if result.get("status") == "error":
+        # Rendições são compartilhadas por hash de conteúdo e não são removidas.
+        if result.get("status") == "error" and not renditions:
             try:
-                bucket_controllers.handle_delete_bucket(key=file_name_bucket)
+                await bucket_controllers.handle_delete_bucket_async(key=file_name_bucket)
             except Exception as exc_delete:
                 logger.error(f"Falha ao limpar arquivo do bucket após erro no DB: {exc_delete}")
 
@@ -376,9 +388,9 @@ def _handle_update_result(page: ft.Page, user_avatar: ft.Container, result: dict
         parts = previous_user_photo.split("public/")
         if len(parts) > 1:
             try:
-                bucket_controllers.handle_delete_bucket(parts[1])
+                bucket_controllers.handle_enqueue_delete_bucket(parts[1])
             except Exception as e:
-                logger.error(f"Erro ao deletar imagem antiga do bucket: {e}")
+                logger.error(f"Erro ao enfileirar a remoção da imagem antiga do bucket: {e}")
 
     page.close(dialog)
 
@@ -18,18 +18,26 @@ logger = logging.getLogger(__name__)
 class ImageUploadHandler:
     """
     Encapsula a lógica de upload e exibição de imagens para formulários.
+
+    Com stream_to_bucket=True, a imagem é enviada ao bucket assim que chega ao servidor
+    (sem cópia local até o salvamento); se o formulário for abandonado, cleanup_local_file
+    remove o objeto enviado. Isso vale também quando a imagem é trocada por uma URL ou por
+    outro arquivo e quando a view sai da página sem "Cancelar" (voltar, outra rota, sessão
+    encerrada): o image_frame chama cleanup_local_file ao ser desmontado.
     """
     def __init__(
         self,
         page: ft.Page,
         image_frame: ft.Container,
         bucket_prefix: str,
-        on_image_loaded: Callable[[], None] | None = None
+        on_image_loaded: Callable[[], None] | None = None,
+        stream_to_bucket: bool = False,
     ):
         self.page = page
         self.image_frame = image_frame
         self.bucket_prefix = bucket_prefix
         self.on_image_loaded = on_image_loaded
+        self.stream_to_bucket = stream_to_bucket
         self.app_colors = get_session_colors(page)
 
         # State
@@ -37,6 +45,16 @@ class ImageUploadHandler:
         self.is_web_url = False
         self.previous_image_url: str | None = None
         self.local_upload_path: str | None = None
+        self.streamed_key: str | None = None  # Chave no bucket de uma imagem enviada e ainda não salva
+
+        # O Flet chama will_unmount ao remover o controle (troca de view ou fim da sessão)
+        frame_will_unmount = image_frame.will_unmount
+
+        def on_frame_unmount():
+            self.cleanup_local_file()
+            frame_will_unmount()
+
+        image_frame.will_unmount = on_frame_unmount  # type: ignore [method-assign]
 
     async def open_dialog(self, e=None):
         """Abre o diálogo de upload e processa o resultado."""
@@ -47,11 +65,26 @@ class ImageUploadHandler:
             page=self.page,
             title_dialog="Selecionar Imagem",
             allowed_extensions=["png", "jpg", "jpeg", "svg"],
+            bucket_prefix=self.bucket_prefix if self.stream_to_bucket else None,
         )
 
         local_path = await upload_file_service.open_dialog()
 
+        if upload_file_service.bucket_key and local_path:
+            # Enviada direto ao bucket: substitui uma imagem enviada anteriormente e não salva
+            self._discard_streamed_upload()
+            self.streamed_key = upload_file_service.bucket_key
+            self.image_url = local_path
+            self.local_upload_path = None
+            self._display_image_from_url(local_path)
+            if self.on_image_loaded:
+                self.on_image_loaded()
+            return
+
         self.is_web_url = upload_file_service.is_url_web
+        if (self.is_web_url and upload_file_service.url_file) or local_path:
+            # Nova imagem (URL ou arquivo local) substitui a enviada ao bucket e ainda não salva
+            self._discard_streamed_upload()
         self.image_url = None # Reset image_url to prioritize new selection
 
         if self.is_web_url:
@@ -137,8 +170,22 @@ class ImageUploadHandler:
         finally:
             self.cleanup_local_file()
 
+    def mark_saved(self):
+        """Indica que a imagem enviada direto ao bucket foi salva no registro."""
+        self.streamed_key = None
+
+    def _discard_streamed_upload(self):
+        if not self.streamed_key:
+            return
+        try:
+            bucket_controllers.handle_enqueue_delete_bucket(self.streamed_key)
+        except Exception as e:
+            logger.warning(f"Erro ao enfileirar a remoção da imagem não salva {self.streamed_key}: {e}")
+        self.streamed_key = None
+
     def cleanup_local_file(self):
-        """Remove o arquivo local temporário."""
+        """Remove o arquivo local temporário e a imagem enviada ao bucket e não salva."""
+        self._discard_streamed_upload()
         if self.local_upload_path:
             try:
                 os.remove(self.local_upload_path)
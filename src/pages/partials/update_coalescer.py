@@ -0,0 +1,151 @@
+# update_coalescer.py
+"""
+Agrupamento (coalescência) de atualizações de controles Flet.
+
+Cada control.update() gera uma mensagem websocket para o cliente. Em handlers que
+alteram vários campos (ex.: seleção de produto no subformulário de itens do pedido),
+isso resulta em várias mensagens por ação do usuário.
+
+O UpdateCoalescer, anexado à página em `page.update_coalescer`, coleta os controles
+marcados como "sujos" e os envia juntos em um único page.update(*controles):
+- Dentro de um handler decorado com @coalesce_updates, o flush ocorre ao final do handler.
+- Fora de um handler decorado, o flush é agendado para o final do tick atual do event loop.
+
+Uso nas classes de formulário/subformulário (opt-in):
+
+    class MeuForm:
+        def __init__(self, page):
+            self.page = page
+            self.updates = get_update_coalescer(page)
+
+        @coalesce_updates
+        def _on_change(self, e):
+            self.campo_a.value = "..."
+            self.campo_b.value = "..."
+            self.updates.mark_dirty(self.campo_a, self.campo_b)
+"""
+import asyncio
+import functools
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import flet as ft
+
+from src.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# Coalescers com um batch ativo no contexto atual (thread do executor ou task asyncio)
+_active_batches: ContextVar[tuple] = ContextVar("active_update_batches", default=())
+
+_flushes_total = metrics_registry.counter(
+    "estoquerapido_ui_update_flushes_total",
+    "Chamadas page.update() emitidas pelo coalescedor de atualizações",
+)
+_controls_total = metrics_registry.counter(
+    "estoquerapido_ui_update_controls_total",
+    "Atualizações de controles solicitadas ao coalescedor (antes da coalescência)",
+)
+
+
+class UpdateCoalescer:
+    """Coleta controles alterados e os envia em um único page.update()."""
+
+    def __init__(self, page: ft.Page):
+        self.page = page
+        self._dirty: dict[int, ft.Control] = {}
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
+
+    def mark_dirty(self, *controls: ft.Control | None) -> None:
+        """
+        Marca controles para atualização no próximo flush.
+
+        Controles repetidos são enviados uma única vez; controles ainda não
+        adicionados à página (control.page is None) são ignorados no flush.
+        """
+        with self._lock:
+            for control in controls:
+                if control is not None:
+                    self._dirty[id(control)] = control
+                    _controls_total.inc()
+
+        if self in _active_batches.get():
+            return  # O flush ocorre ao final do batch ativo
+        self._schedule_flush()
+
+    @contextmanager
+    def batch(self):
+        """Adia os flushes até o final do bloco. Blocos aninhados fazem um único flush."""
+        active = _active_batches.get()
+        if self in active:
+            yield self
+            return
+
+        token = _active_batches.set(active + (self,))
+        try:
+            yield self
+        finally:
+            _active_batches.reset(token)
+            self.flush()
+
+    def flush(self) -> None:
+        """Envia todos os controles pendentes em uma única mensagem."""
+        with self._lock:
+            self._flush_scheduled = False
+            controls = [control for control in self._dirty.values() if control.page]
+            self._dirty.clear()
+
+        if not controls:
+            return
+
+        _flushes_total.inc()
+        try:
+            self.page.update(*controls)
+        except Exception as e:
+            logger.error(f"Erro ao atualizar {len(controls)} controle(s) da página: {e}")
+
+    def _schedule_flush(self) -> None:
+        """Agenda o flush para o final do tick atual do event loop da página."""
+        with self._lock:
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        loop: asyncio.AbstractEventLoop | None = getattr(self.page, "loop", None)
+        if loop is None or loop.is_closed():
+            self.flush()
+            return
+        loop.call_soon_threadsafe(self.flush)
+
+
+def get_update_coalescer(page: ft.Page) -> UpdateCoalescer:
+    """Retorna o coalescedor da página, criando-o na primeira chamada."""
+    coalescer = getattr(page, "update_coalescer", None)
+    if coalescer is None:
+        coalescer = UpdateCoalescer(page)
+        page.update_coalescer = coalescer  # type: ignore [attr-defined]
+    return coalescer
+
+
+def coalesce_updates(method):
+    """
+    Decorator para handlers de formulários (métodos de classes com `self.page`).
+
+    Todas as atualizações marcadas com mark_dirty durante o handler são enviadas
+    em um único page.update() ao final. Suporta handlers síncronos e assíncronos.
+    """
+    if asyncio.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            with get_update_coalescer(self.page).batch():
+                return await method(self, *args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with get_update_coalescer(self.page).batch():
+            return method(self, *args, **kwargs)
+    return wrapper
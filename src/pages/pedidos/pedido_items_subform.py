@@ -1,19 +1,30 @@
 import flet as ft
+from src.domains.pedidos.models import DraftLine, OrderDraft
+from src.domains.pedidos.models.order_draft import format_cents, parse_cents
+from src.domains.pedidos.models.pedidos_model import PedidoItem
 from src.pages.partials import build_input_field
+from src.pages.partials.update_coalescer import coalesce_updates, get_update_coalescer
 from src.pages.shared.dialog_search import DialogSearch
+from src.shared.utils.money_numpy import Money
 
 
 class PedidoItemsSubform:
     """Subformulário para gerenciar os itens do pedido"""
     def __init__(self, page: ft.Page, app_colors: dict, products: list, on_items_change=None):
         self.page = page
+        # Atualizações dos controles são agrupadas em um único page.update() por ação
+        self.updates = get_update_coalescer(page)
         self.app_colors = app_colors
         self.products = products
         self.on_items_change = on_items_change
         self.new_item_id = ''
         self.new_item_unit_of_measure = ""
         self.new_item_quantity_on_hand = 0
-        self.items: list[dict] = []
+        # Itens indexados pelo id do produto, com totais em centavos mantidos incrementalmente
+        self.draft = OrderDraft()
+        # Card de cada item na ListView, para atualizar somente o item afetado
+        self._cards: dict[str, ft.Card] = {}
+        self._products_by_id = {product["id"]: product for product in products}
 
         # Componentes do subformulário
         # self.items_container = ft.ListView(spacing=20, padding=ft.padding.all(20), expand=True)  # Usando ListView com spacing e expand
@@ -29,6 +40,7 @@ class PedidoItemsSubform:
         # Atualiza a exibição inicial
         self._update_items_display()
 
+    @coalesce_updates
     def _handle_product_selection(self, selected_item):
         """Callback para selecionar um produto"""
         #  print(selected_item):
@@ -40,11 +52,9 @@ class PedidoItemsSubform:
         self.new_item_unit_price.value = f"{selected_item['price']:.2f}".replace('.', ',')
         self.new_item_quantity_on_hand = selected_item["quantity_on_hand"]   # Quantidade disponível no estoque
         self.new_item_unit_of_measure = selected_item["unit_of_measure"]    # Unidade de Medida
-        self.new_item_description.update()
-        self.new_item_unit_price.update()
         self.new_item_quantity.value="1"
         self.new_item_quantity.counter_text=f"Estoque: {self.new_item_quantity_on_hand}"
-        self.new_item_quantity.update()
+        self.updates.mark_dirty(self.new_item_description, self.new_item_unit_price, self.new_item_quantity)
         # Define o foco para o campo de quantidade
         self.new_item_quantity.focus()
         self._calculate_item_total()
@@ -137,28 +147,25 @@ class PedidoItemsSubform:
             on_hover=lambda e: handle_button_hover(e, self.add_item_btn),
         )
 
+    @coalesce_updates
     def _calculate_item_total(self, e=None):
         """Calcula o total do item baseado na quantidade e valor unitário"""
-        _quantity = int(self.new_item_quantity.value or 0)
-        self.add_item_btn.disabled = _quantity > self.new_item_quantity_on_hand
+        try:
+            quantity = int(self.new_item_quantity.value or 0)
+            unit_price_cents = parse_cents(self.new_item_unit_price.value)
+        except ValueError:
+            quantity, unit_price_cents = 0, 0
+
+        self.add_item_btn.disabled = quantity > self.new_item_quantity_on_hand
         self.add_item_btn.bgcolor=ft.Colors.with_opacity(0.1, ft.Colors.RED_300) if self.add_item_btn.disabled else self.app_colors.get("primary", ft.Colors.BLUE)
 
         color = ft.Colors.RED if self.add_item_btn.disabled else ft.Colors.GREEN
         self.new_item_quantity.counter_style = ft.TextStyle(color=color, weight=ft.FontWeight.W_500)
-        self.new_item_quantity.update()
 
-        try:
-            quantity = float(self.new_item_quantity.value or 0)
-            _unit_price = self.new_item_unit_price.value or "0,00"
-            unit_price = float(_unit_price.replace(',', '.') or 0)
-            total = quantity * unit_price
-            self.new_item_total.value = f"{total:.2f}".replace('.', ',')
-        except ValueError:
-            self.new_item_total.value = "0,00"
-
-        self.new_item_total.update()
-        self.add_item_btn.update()
+        self.new_item_total.value = format_cents(quantity * unit_price_cents)
+        self.updates.mark_dirty(self.new_item_quantity, self.new_item_total, self.add_item_btn)
 
+    @coalesce_updates
     def _add_item(self, e):
         """Adiciona um novo item à lista"""
         # Validação básica
@@ -166,86 +173,93 @@ class PedidoItemsSubform:
             self._show_error("Descrição do produto é obrigatória")
             return
 
-        if not self.new_item_quantity.value or float(self.new_item_quantity.value) <= 0:
-            self._show_error("Quantidade deve ser maior que zero")
-            return
-
-        if not self.new_item_unit_price.value or float(self.new_item_unit_price.value.replace(',', '.')) <= 0:
-            self._show_error("Valor unitário deve ser maior que zero")
+        try:
+            quantity = int(float(self.new_item_quantity.value or 0))  # Garante que a quantidade seja sempre um inteiro
+            unit_price_cents = parse_cents(self.new_item_unit_price.value)
+        except ValueError:
+            self._show_error("Quantidade e valor unitário devem ser numéricos")
             return
 
-        # Verifica se o produto já foi adicionado em self.items
-        if any(item['id'] == self.new_item_id for item in self.items):
-            self._show_error("Produto já adicionado")
+        line = DraftLine(
+            product_id=self.new_item_id,
+            description=self.new_item_description.value,
+            quantity=quantity,
+            unit_price_cents=unit_price_cents,
+            unit_of_measure=self.new_item_unit_of_measure or "UN",
+        )
+        try:
+            # O rascunho valida quantidade, preço e produto repetido (busca O(1) pelo id)
+            self.draft.add(line)
+        except ValueError as error:
+            self._show_error(str(error))
             return
-        # Cria o item
-        item = {
-            'id': self.new_item_id,
-            'description': self.new_item_description.value,
-            'quantity': int(float(self.new_item_quantity.value or 0)),  # Garante que a quantidade seja sempre um inteiro
-            'quantity_on_hand': self.new_item_quantity_on_hand,    # Quantidade disponível no estoque
-            'unit_price': float(self.new_item_unit_price.value.replace(',', '.')),  # Preço de venda por unidade
-            'unit_of_measure': self.new_item_unit_of_measure,   # Unidade de Medida
-            'total': float(self.new_item_quantity.value) * float(self.new_item_unit_price.value.replace(',', '.'))
-        }
-
-        # Adiciona à lista
-        self.items.append(item)
 
         # Limpa os campos
         self._clear_new_item_fields()
 
-        # Atualiza a exibição
-        self._update_items_display()
+        # Renderiza somente o card do novo item
+        self._append_card(line)
         self._update_total()
 
         # Notifica sobre a mudança
         if self.on_items_change:
-            self.on_items_change(self.items)
+            self.on_items_change(self.draft)
 
     def _clear_new_item_fields(self):
         """Limpa os campos do novo item"""
+        self.new_item_id = ''
+        self.new_item_unit_of_measure = ""
         self.new_item_description.value = ""
         self.new_item_quantity.value = ""
         self.new_item_unit_price.value = ""
         self.new_item_total.value = "0,00"
         self.new_item_quantity_on_hand = 0
         self.new_item_quantity.counter_text=f"Estoque: {self.new_item_quantity_on_hand}"
-        self.page.update()
+        self.updates.mark_dirty(
+            self.new_item_description, self.new_item_quantity, self.new_item_unit_price, self.new_item_total
+        )
 
     def _remove_item(self, item_id):
         """Remove um item da lista"""
         def remove_handler(e):
-            self.items = [item for item in self.items if item['id'] != item_id]
-            self._update_items_display()
-            self._update_total()
-            if self.on_items_change:
-                self.on_items_change(self.items)
+            with self.updates.batch():
+                self.draft.remove(item_id)
+                self._remove_card(item_id)
+                self._update_total()
+                if self.on_items_change:
+                    self.on_items_change(self.draft)
         return remove_handler
 
     def _edit_item(self, item_id):
         """Edita um item existente"""
         def edit_handler(e):
-            # Encontra o item
-            item = next((item for item in self.items if item['id'] == item_id), None)
-            if not item:
+            # Remove o item do rascunho (será re-adicionado ao clicar em Adicionar Item)
+            line = self.draft.remove(item_id)
+            if not line:
                 return
 
-            # Preenche os campos com os dados do item
-            self.new_item_description.value = item['description']
-            self.new_item_quantity.value = str(item['quantity'])
-            self.new_item_unit_price.value = f"{item['unit_price']:.2f}".replace('.', ',')
-            self.new_item_total.value = f"{item['total']:.2f}".replace('.', ',')
-
-            # Remove o item da lista (será re-adicionado quando salvar)
-            self.items = [i for i in self.items if i['id'] != item_id]
-            self._update_items_display()
-            self._update_total()
-
-            self.page.update()
+            # Preenche os campos com os dados do item, inclusive o produto e o estoque disponível
+            product = self._products_by_id.get(item_id, {})
+            self.new_item_id = line.product_id
+            self.new_item_unit_of_measure = line.unit_of_measure
+            self.new_item_quantity_on_hand = product.get("quantity_on_hand", line.quantity)
+            self.new_item_quantity.counter_text = f"Estoque: {self.new_item_quantity_on_hand}"
+            self.new_item_description.value = line.description
+            self.new_item_quantity.value = str(line.quantity)
+            self.new_item_unit_price.value = format_cents(line.unit_price_cents)
+            self.new_item_total.value = format_cents(line.total_cents)
+
+            with self.updates.batch():
+                self.updates.mark_dirty(
+                    self.new_item_description, self.new_item_quantity, self.new_item_unit_price, self.new_item_total
+                )
+                self._remove_card(item_id)
+                self._update_total()
+                if self.on_items_change:
+                    self.on_items_change(self.draft)
         return edit_handler
 
-    def _create_item_card(self, item):
+    def _create_item_card(self, line: DraftLine):
         """Cria um card para exibir um item"""
         return ft.Card(
             content=ft.Container(
@@ -253,26 +267,26 @@ class PedidoItemsSubform:
                     controls=[
                         ft.Column(
                             controls=[
-                                ft.Text(item['description'], max_lines=2, no_wrap=False, weight=ft.FontWeight.BOLD, size=14),
-                                ft.Text(f"Qtd: {item['quantity']:.0f} | Unit: R$ {item['unit_price']:.2f}", size=12),
+                                ft.Text(line.description, max_lines=2, no_wrap=False, weight=ft.FontWeight.BOLD, size=14),
+                                ft.Text(f"Qtd: {line.quantity} | Unit: R$ {format_cents(line.unit_price_cents)}", size=12),
                             ],
                         ),
                         ft.Column(
                             controls=[
-                                ft.Text(f"R$ {item['total']:.2f}", weight=ft.FontWeight.BOLD, size=14),
+                                ft.Text(f"R$ {format_cents(line.total_cents)}", weight=ft.FontWeight.BOLD, size=14),
                                 ft.Row(
                                     controls=[
                                         ft.IconButton(
                                             icon=ft.Icons.EDIT,
                                             icon_size=16,
-                                            on_click=self._edit_item(item['id']),
+                                            on_click=self._edit_item(line.product_id),
                                             tooltip="Editar",
                                         ),
                                         ft.IconButton(
                                             icon=ft.Icons.DELETE,
                                             icon_size=16,
                                             icon_color=ft.Colors.RED,
-                                            on_click=self._remove_item(item['id']),
+                                            on_click=self._remove_item(line.product_id),
                                             tooltip="Remover",
                                         ),
                                     ],
@@ -294,11 +308,36 @@ class PedidoItemsSubform:
             elevation=5,  # Elevação para distinção visual
         )
 
+    def _append_card(self, line: DraftLine):
+        """Acrescenta o card de um item sem recriar os demais"""
+        if not self._cards:
+            # Primeiro item: sai o aviso de lista vazia e o container cresce
+            self.items_container.controls.clear()
+            self.items_container_container.height = 400
+            self.updates.mark_dirty(self.items_container_container)
+        card = self._create_item_card(line)
+        self._cards[line.product_id] = card
+        self.items_container.controls.append(card)
+        # A ListView envia ao cliente apenas o controle novo
+        self.updates.mark_dirty(self.items_container)
+
+    def _remove_card(self, item_id):
+        """Remove apenas o card do item informado"""
+        card = self._cards.pop(item_id, None)
+        if card is None:
+            return
+        self.items_container.controls.remove(card)
+        if not self._cards:
+            self._update_items_display()
+        else:
+            self.updates.mark_dirty(self.items_container)
+
     def _update_items_display(self):
-        """Atualiza a exibição dos itens"""
+        """Recria a exibição de todos os itens (carga do pedido ou lista vazia)"""
         self.items_container.controls.clear()
+        self._cards.clear()
 
-        if not self.items:
+        if not self.draft:
             self.items_container.controls.append(
                 ft.Container(
                     content=ft.Text(
@@ -311,23 +350,20 @@ class PedidoItemsSubform:
                 )
             )
         else:
-            for item in self.items:
-                self.items_container.controls.append(self._create_item_card(item))
+            for line in self.draft:
+                card = self._create_item_card(line)
+                self._cards[line.product_id] = card
+                self.items_container.controls.append(card)
 
         # Atualiza a altura do container pai
-        self.items_container_container.height = 100 if not self.items else 400
-        if self.items_container_container.page:
-            self.items_container_container.update()
-
-        if self.items_container.page:
-            self.items_container.update()
+        self.items_container_container.height = 100 if not self.draft else 400
+        # O container pai inclui a ListView; um único controle basta no flush
+        self.updates.mark_dirty(self.items_container_container)
 
     def _update_total(self):
-        """Atualiza o valor total dos itens"""
-        total = sum(item['total'] for item in self.items)
-        self.total_display.value = f"Total: R$ {total:.2f}"
-        if self.total_display.page:
-            self.total_display.update()
+        """Atualiza o valor total dos itens (mantido incrementalmente pelo rascunho)"""
+        self.total_display.value = f"Total: R$ {format_cents(self.draft.total_cents)}"
+        self.updates.mark_dirty(self.total_display)
 
     def _show_error(self, message):
         """Exibe uma mensagem de erro"""
@@ -412,34 +448,40 @@ class PedidoItemsSubform:
             ],
         )
 
-    def get_items(self) -> list[dict]:
-        """Retorna a lista de itens"""
-        return self.items.copy()
+    @property
+    def has_items(self) -> bool:
+        return len(self.draft) > 0
+
+    def get_pedido_items(self) -> list[PedidoItem]:
+        """Retorna os itens no formato do modelo Pedido, prontos para salvar"""
+        return self.draft.to_pedido_items()
 
-    def set_items(self, items: list[dict]):
-        """Define os itens do pedido"""
-        self.items = items.copy()
+    @coalesce_updates
+    def load_items(self, items: list):
+        """Carrega os itens de um pedido salvo (PedidoItem ou dicts)"""
+        self.draft.load(items)
         self._update_items_display()
         self._update_total()
 
+    @coalesce_updates
     def clear_items(self):
         """Limpa todos os itens"""
-        self.items.clear()
+        self.draft.clear()
         self._clear_new_item_fields()
         self._update_items_display()
         self._update_total()
 
-    def get_total_amount(self) -> float:
+    def get_total_amount(self) -> Money:
         """Retorna o valor total dos itens"""
-        return sum(item['total'] for item in self.items)
+        return self.draft.total
 
-    def get_total_quantity(self) -> float:
+    def get_total_quantity(self) -> int:
         """Retorna a quantidade total de itens"""
-        return len(self.items)
+        return self.draft.total_items
 
     def get_total_products(self) -> int:
         """Retorna o número total de produtos"""
-        return sum(item['quantity'] for item in self.items)
+        return self.draft.total_products
 
     def build(self) -> ft.Column:
         """Retorna o container do subformulário"""
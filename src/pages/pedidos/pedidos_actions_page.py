@@ -2,7 +2,7 @@ import logging
 import flet as ft
 import asyncio
 
-from src.domains.pedidos.models import Pedido
+from src.domains.pedidos.models import Pedido, PedidoHeader
 from src.domains.pedidos.models.pedidos_model import PedidoItem
 from src.domains.shared.context.session import get_current_user
 from src.shared.utils import MessageType, message_snackbar
@@ -13,7 +13,7 @@ from src.domains.pedidos.controllers import pedidos_controllers as order_control
 logger = logging.getLogger(__name__)
 
 
-async def send_to_trash(page: ft.Page, pedido: Pedido) -> bool:
+async def send_to_trash(page: ft.Page, pedido: Pedido | PedidoHeader) -> bool:
     operation_complete_future = asyncio.Future()
 
     def send_to_trash_client_async(e_trash):
@@ -135,7 +135,7 @@ async def send_to_trash(page: ft.Page, pedido: Pedido) -> bool:
     return await operation_complete_future
 
 
-def restore_from_trash(page: ft.Page, pedido: Pedido) -> bool:
+def restore_from_trash(page: ft.Page, pedido: Pedido | PedidoHeader) -> bool:
     logger.info(f"Restaurando pedido ID: {pedido.id} da lixeira")
 
     result = order_controllers.handle_restore_pedido_from_trash(pedido, get_current_user(page))
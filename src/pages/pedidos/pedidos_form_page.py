@@ -5,6 +5,7 @@ import asyncio
 import flet as ft
 
 from datetime import date, datetime, timedelta
+from decimal import Decimal
 from typing import Any
 
 from src.domains.clientes.controllers.clientes_controllers import handle_get_by_name_cpf_or_phone
@@ -20,6 +21,7 @@ from src.domains.shared.models.address import Address
 from src.pages.partials import build_input_field
 from src.pages.partials.app_bars.appbar import create_appbar_back
 from src.pages.partials.responsive_sizes import get_responsive_sizes
+from src.pages.partials.update_coalescer import coalesce_updates, get_update_coalescer
 from src.pages.pedidos.pedido_items_subform import PedidoItemsSubform
 
 import src.domains.pedidos.controllers.pedidos_controllers as order_controllers
@@ -39,6 +41,8 @@ class PedidoForm:
             products: Lista de produtos disponíveis.
         """
         self.page = page
+        # Atualizações dos controles são agrupadas em um único page.update() por ação
+        self.updates = get_update_coalescer(page)
         self.empresa_logada = page.app_state.empresa  # type: ignore [attr-defined]
         self.data = page.app_state.form_data  # type: ignore [attr-defined] dados do pedido, se houver.
         # Campos de redimencionamento do formulário
@@ -99,17 +103,16 @@ class PedidoForm:
 
         e.control.update()
 
-    def _on_items_change(self, items):
+    @coalesce_updates
+    def _on_items_change(self, draft):
         """Callback chamado quando os itens são alterados"""
-        # Atualiza os campos de totais automaticamente
-        self.total_amount.value = f"{self.items_subform.get_total_amount():.2f}"
-        self.quantity_items.value = str(int(self.items_subform.get_total_quantity()))
-        self.quantity_products.value = str(self.items_subform.get_total_products())
+        # Atualiza os campos de totais a partir dos totais mantidos pelo rascunho
+        self.total_amount.value = f"{draft.total.get_decimal():.2f}"
+        self.quantity_items.value = str(draft.total_items)
+        self.quantity_products.value = str(draft.total_products)
 
         # Atualiza a interface
-        self.total_amount.update()
-        self.quantity_items.update()
-        self.quantity_products.update()
+        self.updates.mark_dirty(self.total_amount, self.quantity_items, self.quantity_products)
 
     def _update_dropdown_tooltip(self, e: ft.ControlEvent):
         """Atualiza o tooltip do Dropdown com o texto da opção selecionada."""
@@ -703,8 +706,6 @@ class PedidoForm:
 
     def populate_form_fields(self):
         """Preenche os campos do formulário com os dados do pedido"""
-        from src.shared.utils.money_numpy import Money
-
         self.order_number.value = self.data["order_number"]
 
         if order_date := self.data.get("order_date"):
@@ -758,34 +759,8 @@ class PedidoForm:
                 self.client_state.value = address.state
                 self.client_postal_code.value = address.postal_code
 
-        items_data = []
-        for i, item in enumerate(self.data.get("items", [])):
-            # Converte unit_price e total de Money/dict para float
-            unit_price = item.get('unit_price')
-            total = item.get('total')
-
-            # Verifica se unit_price é um objeto Money ou um dict e converte para float
-            if isinstance(unit_price, Money):
-                unit_price = unit_price.get_decimal()
-            elif isinstance(unit_price, dict):
-                unit_price = Money.from_dict(unit_price).get_decimal()
-
-            # Verifica se total é um objeto Money ou um dict e converte para float
-            if isinstance(total, Money):
-                total = total.get_decimal()
-            elif isinstance(total, dict):
-                total = Money.from_dict(total).get_decimal()
-
-            items_data.append({
-                'id': item['id'],
-                'description': item.get('description', ''),
-                'quantity': item.get('quantity', 0),
-                'unit_price': float(unit_price),  # Garante que é float
-                'total': float(total),  # Garante que é float
-                'unit_of_measure': item.get('unit_of_measure', 'UN'),
-            })
-
-        self.items_subform.set_items(items_data)
+        # Money, dict ou float: o rascunho converte tudo para centavos
+        self.items_subform.load_items(self.data.get("items", []))
 
     def _is_valid_day_month(self, dd_mm_str: str) -> bool:
         """
@@ -853,26 +828,12 @@ class PedidoForm:
         if not self.data.get("empresa_id"):
             self.data["empresa_id"] = self.empresa_logada["id"]
 
-        items_data = []
-
-        for item in self.items_subform.get_items():
-            items_data.append({
-                'id': item['id'],
-                'description': item['description'],
-                'quantity': int(item['quantity']),
-                'unit_of_measure': item['unit_of_measure'] or 'UN',
-                'unit_price': item['unit_price'],   # float, em Pedido.from_dict() trata isto
-                'total': item['total'],   # float, em Pedido.from_dict() trata isto
-            })
-        self.data["items"] = items_data
-
-        # Atualiza o valor total baseado nos itens
-        total_amount = self.items_subform.get_total_amount()
-        self.data["total_amount"] = total_amount
-
-        # Atualiza as quantidades
-        self.data["total_items"] = int(self.items_subform.get_total_quantity())
-        self.data["total_products"] = self.items_subform.get_total_products()
+        # Itens e totais já no formato do modelo (Money em centavos), sem conversões via float
+        draft = self.items_subform.draft
+        self.data["items"] = draft.to_pedido_items()
+        self.data["total_amount"] = draft.total
+        self.data["total_items"] = draft.total_items
+        self.data["total_products"] = draft.total_products
 
         return Pedido.from_dict(self.data)
 
@@ -897,7 +858,7 @@ class PedidoForm:
             return "A data do pedido não pode ser mais de 30 dias no futuro."
 
         # Validação dos itens
-        if not self.items_subform.get_items():
+        if not self.items_subform.has_items:
             return "Adicione pelo menos um item ao pedido."
         if not self.forma_de_pagamento.value:
             return "Selecione uma forma de pagamento."
@@ -908,7 +869,7 @@ class PedidoForm:
         if selected_index in [1, 2]:
             # Pedido entregue, verifica se há itens e valor para faturamento
             qtty_items = self.items_subform.get_total_products()
-            qtty_products = int(self.items_subform.get_total_quantity())
+            qtty_products = self.items_subform.get_total_quantity()
             if qtty_items == 0 or qtty_products == 0:
                 return "O Pedido não pode estar em trânsito ou entregue sem itens."
 
@@ -1001,23 +962,25 @@ def show_pedido_form(page: ft.Page):
 
     # Busca os produtos da empresa logada
     empresa_id = page.app_state.empresa["id"]  # type: ignore [attr-defined]
-    result = product_controllers.handle_get_all(empresa_id)
+    # Projeção compacta (somente os campos usados na seleção), em cache por empresa
+    result = product_controllers.handle_get_projection(empresa_id)
 
     if result["status"] == "error":
         messages.message_snackbar(
             page=page, message=result["message"], message_type=messages.MessageType.ERROR)
         return
 
-    products = result["data"]["produtos"]
     product_list = [
         {
-            "id": prod.id,
-            "description": prod.name,
-            "sale_price": prod.sale_price.get_decimal(),
-            "quantity_on_hand": prod.quantity_on_hand,
-            "unit_of_measure": prod.unit_of_measure
+            "id": prod["id"],
+            "description": prod["name"],
+            "sale_price": Decimal(prod["sale_price_cents"]) / 100,
+            "quantity_on_hand": prod["quantity_on_hand"],
+            "unit_of_measure": prod["unit_of_measure"],
+            "ean_code": prod["ean_code"],
+            "internal_code": prod["internal_code"],
         }
-        for prod in products
+        for prod in result["data"]
     ]
 
     pedidos_view = PedidoForm(page=page, products=product_list)
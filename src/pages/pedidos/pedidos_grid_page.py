@@ -1,7 +1,10 @@
+import asyncio
+
 import flet as ft
 
+from src.domains.pedidos.controllers import pedidos_controllers as order_controllers
 from src.domains.pedidos.controllers.grid_controller import PedidoGridController
-from src.domains.pedidos.models import Pedido
+from src.domains.pedidos.models import PedidoHeader
 from src.domains.pedidos.models.pedidos_subclass import DeliveryStatus
 from src.domains.pedidos.views.pedidos_grid_ui import PedidoGridUI
 from src.shared.utils.messages import show_banner
@@ -10,23 +13,35 @@ from src.shared.utils.messages import show_banner
 def show_orders_grid(page: ft.Page):
     """Função coordenadora da página de Pedidos."""
 
-    async def handle_action(action: str, pedido: Pedido | None):
+    async def handle_action(action: str, pedido: PedidoHeader | None):
         """Handler unificado para todas as ações"""
-        if not pedido and action != "INSERT":
+        if not pedido and action not in ('INSERT', 'EXPORT'):
             return
 
         match action:
             case "INSERT":
                 page.app_state.clear_form_data() # type: ignore [attr-defined]
                 page.go('/home/pedidos/form')
+            case "EXPORT":
+                from src.pages.shared.export_dialog import export_dataset
+                await export_dataset(page, ["pedidos", "pedido_itens"])
             case "EDIT":
                 if pedido:
-                    page.app_state.set_form_data(pedido.to_dict()) # type: ignore [attr-defined]"
+                    # O grid só tem o cabeçalho: o pedido completo (com itens) é lido ao editar
+                    result = await asyncio.to_thread(order_controllers.handle_get_pedido_by_id, pedido.id)
+                    if result["status"] == "error":
+                        show_banner(page, result["message"])
+                        return
+                    page.app_state.set_form_data(result["data"].to_dict()) # type: ignore [attr-defined]"
                     page.go("/home/pedidos/form")
             case "ITEM_LIST":
                 if pedido:
+                    result = await asyncio.to_thread(order_controllers.handle_get_pedido_items, pedido.id)
+                    if result["status"] == "error":
+                        show_banner(page, result["message"])
+                        return
                     from src.pages.pedidos import pedidos_actions_page as order_actions
-                    order_actions.show_orders_items_grid(page, pedido.items)
+                    order_actions.show_orders_items_grid(page, result["data"])
             case "SOFT_DELETE":
                 if pedido:
                     if pedido.delivery_status == DeliveryStatus.DELIVERED:
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import traceback
 
@@ -5,10 +6,11 @@ import flet as ft
 
 import src.domains.pedidos.controllers.pedidos_controllers as order_controllers
 from src.domains.shared import RegistrationStatus
+from src.domains.shared.context.session import get_current_user
 from src.pages.partials.app_bars.appbar import create_appbar_back
 import src.pages.pedidos.pedidos_actions_page as order_actions
 import src.pages.shared.recycle_bin_helpers as recycle_helpers
-from src.pages.shared.components import create_recycle_bin_card
+from src.pages.shared.components import create_recycle_bin_card, create_recycle_bin_skeleton
 
 from src.shared.utils import format_datetime_to_utc_minus_3
 
@@ -20,11 +22,10 @@ def show_orders_grid_trash(page: ft.Page):
     """Página de exibição em formato Cards dos pedidos da empresa logada que estão 'DELETED'"""
     page.theme_mode = ft.ThemeMode.DARK
 
-    # --- Indicador de Carregamento (Spinner) ---
-    progress_ring = ft.ProgressRing(width=32, height=32, stroke_width=3)
+    # --- Indicador de Carregamento (Esqueleto dos cards) ---
     loading_container = ft.Container(
-        content=progress_ring,
-        alignment=ft.alignment.center,
+        content=create_recycle_bin_skeleton(),
+        alignment=ft.alignment.top_center,
         expand=True,  # Ocupa o espaço disponível enquanto carrega
         visible=True  # Começa visível
     )
@@ -133,6 +134,15 @@ def show_orders_grid_trash(page: ft.Page):
 
     # --- Função Assíncrona para Carregar Dados e Atualizar a UI --- #
     async def load_data_and_update_ui():
+        # Recarga (após ações em lote): descarta os cards e a seleção anteriores
+        content_area.controls.clear()
+        selection.reset()
+        if content_area.visible:
+            # Recarga: volta ao esqueleto enquanto a lixeira é relida em segundo plano
+            loading_container.visible = True
+            content_area.visible = False
+            page.update()
+
         pedidos_data = []
         pedidos_deleted_count = 0
 
@@ -144,7 +154,8 @@ def show_orders_grid_trash(page: ft.Page):
                 content_area.controls.append(empty_content_display)
                 return
 
-            result = order_controllers.handle_get_pedidos_by_empresa_id(empresa_id=empresa_id, status=RegistrationStatus.DELETED)
+            result = await asyncio.to_thread(order_controllers.handle_get_pedido_headers_by_empresa_id,
+                                             empresa_id=empresa_id, status=RegistrationStatus.DELETED)
 
             if result["status"] == "error":
                 content_area.controls.append(empty_content_display)
@@ -179,7 +190,8 @@ def show_orders_grid_trash(page: ft.Page):
                         on_action_click=handle_action_click,
                         on_info_click=handle_info_click,
                         on_icon_hover=handle_icon_hover,
-                        col_config={"xs": 12, "sm": 6, "md": 4, "lg": 4, "xl": 3}
+                        col_config={"xs": 12, "sm": 6, "md": 4, "lg": 4, "xl": 3},
+                        selection_control=selection.checkbox(pedido.id),
                     ) for pedido in pedidos_data
                 ],
                 columns=12,  # Total de colunas no sistema de grid
@@ -225,16 +237,29 @@ def show_orders_grid_trash(page: ft.Page):
             else:
                 logger.info("Contexto da página perdido, não foi possível atualizar.")
 
+    # --- Seleção múltipla: restaurar ou excluir definitivamente em lote ---
+    selection = recycle_helpers.RecycleBinSelection(
+        page=page,
+        entity_label="pedidos",
+        restore=lambda ids, on_progress: order_controllers.handle_bulk_update_status(
+            empresa_id=page.app_state.empresa["id"], pedido_ids=ids, current_user=get_current_user(page), # type: ignore [attr-defined]
+            status=RegistrationStatus.ACTIVE, on_progress=on_progress),
+        purge=lambda ids, on_progress: order_controllers.handle_bulk_hard_delete(
+            empresa_id=page.app_state.empresa["id"], pedido_ids=ids, on_progress=on_progress), # type: ignore [attr-defined]
+        on_done=load_data_and_update_ui,
+    )
+
     # --- Disparar Carregamento dos Dados ---
-    # Executa a função async em background. A UI mostrará o spinner primeiro.
+    # Executa a função async em background. A UI mostrará o esqueleto primeiro.
     page.run_task(load_data_and_update_ui)
 
     # --- Retornar Estrutura Inicial da Página como ft.View ---
-    # A View inclui a AppBar e a área de conteúdo principal (que inicialmente mostra o spinner)
+    # A View inclui a AppBar e a área de conteúdo principal (que inicialmente mostra o esqueleto)
     return ft.View(
         route="/home/pedidos/grid/lixeira",  # A rota que esta view corresponde
         controls=[
-            loading_container,  # Mostra o spinner inicialmente
+            selection.toolbar,  # Ações em lote sobre os itens selecionados
+            loading_container,  # Mostra o esqueleto inicialmente
             content_area       # Oculto inicialmente, populado por load_data_and_update_ui
         ],
         appbar=appbar,
@@ -20,6 +20,7 @@ from src.domains.produtos.models import Produto
 from src.domains.shared import RegistrationStatus
 from src.pages.partials import build_input_field
 from src.services import UploadFile, fetch_product_info_by_ean
+from src.services.images import image_pipeline
 from src.shared.utils import  show_banner, message_snackbar, MessageType, format_datetime_to_utc_minus_3
 from src.shared.utils.file_helpers import generate_unique_bucket_filename
 from src.shared.utils.find_project_path import find_project_root
@@ -38,6 +39,7 @@ class ProdutoForm:
         self.image_url: str | None = None
         self.is_image_url_web = False
         self.previous_image_url: str | None = None
+        self.image_renditions: dict[str, str] | None = None
         self.local_upload_file: str | None = None
         self.download_image_link: str | None = None
         # Campos de redimencionamento do formulário
@@ -624,10 +626,11 @@ class ProdutoForm:
             # vars, não são fields do formulário
             self.image_url = self.data["image_url"]
             self.previous_image_url = self.data["image_url"]
+            self.image_renditions = self.data.get("image_renditions")
 
             # Monta a imagem e associa ao campo do formulário
             categoria_img = ft.Image(
-                src=self.image_url,
+                src=(self.image_renditions or {}).get("medium") or self.image_url,
                 error_content=ft.Text("Erro!"),
                 repeat=ft.ImageRepeat.NO_REPEAT,
                 fit=ft.ImageFit.CONTAIN,
@@ -704,6 +707,9 @@ class ProdutoForm:
 
         if self.image_url:
             self.data['image_url'] = self.image_url
+        if self.is_image_url_web:
+            # Imagem externa (URL informada pelo usuário) não possui rendições
+            self.data['image_renditions'] = None
 
         # Converte os níveis de estoque para int, tratando valores vazios como 0
         try:
@@ -736,15 +742,24 @@ class ProdutoForm:
 
         try:
             prefix = f"empresas/{self.empresa_logada['id']}/produtos"
-            file_name_bucket = generate_unique_bucket_filename(
-                original_filename=self.local_upload_file, prefix=prefix)
-            self.image_url = bucket_controllers.handle_upload_bucket(
-                local_path=self.local_upload_file, key=file_name_bucket)
+            # Gera as rendições (thumb, medium, large) em um pool de processos e as envia ao bucket
+            # Apenas a rendição exibida no formulário é aguardada; as demais seguem pela fila de jobs
+            self.image_renditions = image_pipeline.process_and_upload(self.local_upload_file, prefix,
+                                                                      wait_for=("medium",))
+
+            if self.image_renditions:
+                self.image_url = self.image_renditions["large"]
+            else:
+                # Formato não suportado pelo pipeline (ex.: SVG): envia o arquivo original
+                file_name_bucket = generate_unique_bucket_filename(
+                    original_filename=self.local_upload_file, prefix=prefix)
+                self.image_url = bucket_controllers.handle_upload_bucket(
+                    local_path=self.local_upload_file, key=file_name_bucket)
 
             if self.image_url:
                 # Atualiza logo na tela
                 produto_img = ft.Image(
-                    src=self.image_url,
+                    src=(self.image_renditions or {}).get("medium") or self.image_url,
                     error_content=ft.Text("Erro!"),
                     repeat=ft.ImageRepeat.NO_REPEAT,
                     fit=ft.ImageFit.CONTAIN,
@@ -757,6 +772,7 @@ class ProdutoForm:
             # A Imagem não é válida, URL não foi gerada, mantém a imagem anterior se houver
             if self.previous_image_url:
                 self.image_url = self.previous_image_url
+                self.image_renditions = self.data.get("image_renditions")
 
             message_snackbar(
                 page=self.page, message="Não foi possível carregar imagem do produto de produtos!", message_type=MessageType.ERROR)
@@ -832,6 +848,7 @@ def show_product_form(page: ft.Page) -> ft.View:
             # Envia o arquivo de imagem para o bucket
             if produtos_view.send_to_bucket():
                 produto.image_url = produtos_view.image_url
+                produto.image_renditions = produtos_view.image_renditions
             else:
                 message_snackbar(
                     page=page, message="Erro ao enviar imagem para o bucket", message_type=MessageType.WARNING)
@@ -12,13 +12,20 @@ def show_products_grid(page: ft.Page):
 
     async def handle_action(action: str, produto: Produto | None):
         """Handler unificado para todas as ações"""
-        if not produto and action != 'INSERT':
+        if not produto and action not in ('INSERT', 'IMPORT', 'EXPORT'):
             return
 
         match action:
             case "INSERT":
                 page.app_state.clear_form_data() # type: ignore [attr-defined]
                 page.go('/home/produtos/form')
+            case "IMPORT":
+                from src.pages.produtos.produtos_import_page import import_produtos
+                if await import_produtos(page):
+                    await controller.load_produtos()
+            case "EXPORT":
+                from src.pages.shared.export_dialog import export_dataset
+                await export_dataset(page, ["produtos"])
             case "EDIT":
                 if produto:
                     page.app_state.set_form_data(produto.to_dict()) # type: ignore [attr-defined]
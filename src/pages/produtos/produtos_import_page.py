@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import os
+import tempfile
+import time
+
+import flet as ft
+
+import src.controllers.bucket_controllers as bucket_controllers
+import src.domains.produtos.controllers.produtos_controllers as product_controllers
+from src.domains.produtos.models.produto_import import ImportReport
+from src.domains.produtos.services.produtos_import_services import IMPORT_EXTENSIONS, count_data_rows
+from src.domains.shared.context.session import get_current_user
+from src.services.upload.upload_files import UploadFile
+from src.shared.utils import MessageType, get_uuid, message_snackbar
+
+logger = logging.getLogger(__name__)
+
+# Linhas rejeitadas exibidas no diálogo; a lista completa fica no relatório CSV
+MAX_ERRORS_SHOWN = 20
+
+
+async def import_produtos(page: ft.Page) -> bool:
+    """
+    Importa produtos de uma planilha CSV/XLSX enviada pelo usuário, com progresso e relatório de erros.
+
+    Returns:
+        bool: True se algum produto foi importado (o grid deve ser recarregado).
+    """
+    upload = UploadFile(page=page, title_dialog="Importar produtos (CSV ou XLSX)",
+                        allowed_extensions=list(IMPORT_EXTENSIONS), upload_timeout=600)
+    file_path = await upload.open_dialog()
+    if not file_path:
+        if upload.message_error:
+            message_snackbar(page=page, message=upload.message_error, message_type=MessageType.WARNING)
+        return False
+    if upload.is_url_web:
+        message_snackbar(page=page, message="Envie a planilha como arquivo (URL não suportada na importação).",
+                         message_type=MessageType.WARNING)
+        return False
+
+    empresa_id = page.app_state.empresa['id']  # type: ignore [attr-defined]
+    current_user = get_current_user(page)
+
+    progress_bar = ft.ProgressBar(value=None, width=500)
+    progress_text = ft.Text("Lendo a planilha...")
+    dlg_progress = ft.AlertDialog(
+        modal=True,
+        title=ft.Text("Importando produtos"),
+        content=ft.Column([progress_bar, progress_text], tight=True, width=500, spacing=10),
+    )
+    page.open(dlg_progress)
+
+    try:
+        total = await asyncio.to_thread(count_data_rows, file_path)
+    except Exception as e:
+        logger.warning(f"Não foi possível contar as linhas da planilha {file_path}: {e}")
+        total = 0
+
+    last_update = 0.0
+
+    def on_progress(processed: int, imported: int) -> None:
+        # Chamado pela thread da importação a cada lote gravado
+        nonlocal last_update
+        now = time.monotonic()
+        if now - last_update < 0.25 and processed < total:
+            return
+        last_update = now
+        progress_bar.value = min(processed / total, 1) if total else None
+        progress_text.value = f"{processed:,} de {total:,} linha(s) processada(s), {imported:,} produto(s) gravado(s)".replace(",", ".")
+        page.update()
+
+    try:
+        result = await asyncio.to_thread(
+            product_controllers.handle_import_produtos,
+            file_path=file_path,
+            empresa_id=empresa_id,
+            current_user=current_user,
+            on_progress=on_progress,
+        )
+    finally:
+        page.close(dlg_progress)
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+
+    if result["status"] == "error":
+        message_snackbar(page=page, message=result["message"], message_type=MessageType.ERROR)
+        return False
+
+    report: ImportReport = result["data"]
+    errors_url = None
+    if report.errors:
+        errors_url = await asyncio.to_thread(_upload_errors_report, report, empresa_id)
+    _show_report(page, report, errors_url)
+    return report.imported > 0
+
+
+def _upload_errors_report(report: ImportReport, empresa_id: str) -> str | None:
+    """
+    Grava o relatório CSV das linhas rejeitadas em um arquivo temporário e o envia à área privada
+    do bucket, como as exportações (o relatório tem dados da empresa). Retorna a url temporária de
+    download, ou None se o envio falhou (o resumo continua sendo exibido).
+    """
+    filename = f"importacao_produtos_erros_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+    fd, path = tempfile.mkstemp(prefix="importacao_produtos_erros_", suffix=".csv")
+    os.close(fd)
+    try:
+        report.write_errors_csv(path)
+        return bucket_controllers.handle_upload_private_bucket(
+            local_path=path,
+            key=f"{empresa_id}/imports/{get_uuid()}/{filename}",
+            download_name=filename,
+            content_type="text/csv; charset=utf-8",
+            expires_in=int(os.getenv('EXPORT_URL_EXPIRES_SECONDS', '3600')),
+        )
+    except Exception as e:
+        logger.error(f"Erro ao enviar o relatório de erros da importação: {e}")
+        return None
+    finally:
+        os.remove(path)
+
+
+def _show_report(page: ft.Page, report: ImportReport, errors_url: str | None = None) -> None:
+    """Exibe o resumo da importação e, se houver linhas rejeitadas, o link de download do relatório CSV."""
+    controls: list[ft.Control] = [
+        ft.Text(f"Linhas lidas: {report.total_rows}"),
+        ft.Text(f"Produtos importados: {report.imported}", color=ft.Colors.GREEN),
+    ]
+
+    if report.errors:
+        controls.append(ft.Text(f"Linhas rejeitadas: {report.rejected}", color=ft.Colors.ORANGE))
+        controls.append(ft.ListView(
+            controls=[ft.Text(f"Linha {error.line}: {error.message}", size=12, selectable=True)
+                      for error in report.errors[:MAX_ERRORS_SHOWN]],
+            height=200,
+            spacing=2,
+        ))
+        if report.rejected > MAX_ERRORS_SHOWN:
+            controls.append(ft.Text(f"... e mais {report.rejected - MAX_ERRORS_SHOWN} linha(s).", size=12))
+        if errors_url:
+            controls.append(ft.TextButton("Baixar relatório completo (CSV)", icon=ft.Icons.DOWNLOAD,
+                                          on_click=lambda _: page.launch_url(errors_url)))
+        else:
+            controls.append(ft.Text("Não foi possível gerar o relatório completo para download.", size=12))
+
+    dlg_report = ft.AlertDialog(
+        title=ft.Text("Importação concluída"),
+        content=ft.Column(controls, tight=True, width=500, spacing=8),
+        actions=[ft.TextButton("OK", on_click=lambda _: page.close(dlg_report))],
+        actions_alignment=ft.MainAxisAlignment.END,
+    )
+    page.open(dlg_report)
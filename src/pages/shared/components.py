@@ -14,7 +14,8 @@ def create_recycle_bin_card(
     on_action_click: Callable,
     on_info_click: Callable,
     on_icon_hover: Callable,
-    col_config: dict = {"xs": 12, "sm": 6, "md": 4, "lg": 3}
+    col_config: dict = {"xs": 12, "sm": 6, "md": 4, "lg": 3},
+    selection_control: ft.Control | None = None,
 ) -> ft.Card:
     """
     Cria um ft.Card genérico para itens na lixeira.
@@ -31,6 +32,7 @@ def create_recycle_bin_card(
         on_info_click: Callback para o botão de informações.
         on_icon_hover: Callback para o evento de hover nos ícones.
         col_config: Configuração de responsividade para o ResponsiveRow.
+        selection_control: Controle de seleção múltipla (checkbox) exibido antes do top_content.
 
     Returns:
         Um objeto ft.Card configurado.
@@ -41,6 +43,7 @@ def create_recycle_bin_card(
             content=ft.Column([
                 ft.Row(
                     controls=[
+                        *([selection_control] if selection_control else []),
                         top_content,
                         ft.Container(expand=True),
                         status_icon,
@@ -105,4 +108,49 @@ def create_recycle_bin_card(
         col=col_config,
         tooltip=tooltip_text,
         expand=True,
-    )
\ No newline at end of file
+    )
+
+def create_recycle_bin_skeleton(
+    count: int = 8,
+    col_config: dict = {"xs": 12, "sm": 6, "md": 4, "lg": 3},
+) -> ft.Column:
+    """
+    Cria o esqueleto da lixeira: cards vazios com o mesmo layout de create_recycle_bin_card,
+    exibidos enquanto os itens são carregados em segundo plano.
+
+    Args:
+        count: Quantidade de cards do esqueleto.
+        col_config: Configuração de responsividade para o ResponsiveRow.
+
+    Returns:
+        Uma ft.Column (sem barra de rolagem) com os cards do esqueleto.
+    """
+    def bar(width: int | None, height: int = 12) -> ft.Container:
+        return ft.Container(
+            width=width, height=height,
+            bgcolor=ft.Colors.with_opacity(0.08, ft.Colors.WHITE),
+            border_radius=ft.border_radius.all(6),
+        )
+
+    grid = ft.ResponsiveRow(
+        controls=[
+            ft.Card(
+                content=ft.Container(
+                    padding=15,
+                    content=ft.Column([
+                        bar(100, 100),
+                        bar(None, 16),
+                        bar(180),
+                        ft.Row([bar(140), bar(60, 24)], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                    ], spacing=10),
+                ),
+                margin=ft.margin.all(5),
+                col=col_config,
+            ) for _ in range(count)
+        ],
+        columns=12,
+        spacing=10,
+        run_spacing=10,
+    )
+    # Em telas pequenas os cards excedem a altura da tela: o excedente fica oculto
+    return ft.Column(controls=[grid], scroll=ft.ScrollMode.HIDDEN, expand=True)
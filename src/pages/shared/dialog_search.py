@@ -1,9 +1,13 @@
 import flet as ft
 
+from src.shared.utils.search_index import SearchIndex
+
 class DialogSearch:
     def __init__(self, page: ft.Page, items: list[dict], hint_text: str = "Digite para buscar...", on_select_callback=None):
         self.page = page
         self.original_items = items
+        # Índice construído uma única vez para a lista de itens
+        self.search_index = SearchIndex(items)
         self.on_select_callback = on_select_callback
         self.hint_text = hint_text
 
@@ -27,8 +31,8 @@ class DialogSearch:
             height=200
         )
 
-        # Mostra todos os itens inicialmente
-        self.update_results_list(results_column, self.original_items)
+        # Mostra os primeiros itens inicialmente
+        self.update_results_list(results_column, *self.search_index.search(""))
 
         # Dialog de busca
         search_dialog = ft.AlertDialog(
@@ -60,21 +64,11 @@ class DialogSearch:
 
     def on_search_change(self, e):
         """Busca em tempo real conforme o usuário digita"""
-        search_text = e.control.value.lower().strip()
-
-        if not search_text:
-            filtered_items = self.original_items
-        else:
-            # Busca por correspondência parcial
-            filtered_items = [
-                item for item in self.original_items
-                if search_text in item["description"].lower()
-            ]
+        filtered_items, total_found = self.search_index.search(e.control.value or "")
+        self.update_results_list(self.results_column, filtered_items, total_found)
 
-        self.update_results_list(self.results_column, filtered_items)
-
-    def update_results_list(self, results_column, items):
-        """Atualiza a lista de resultados"""
+    def update_results_list(self, results_column, items, total_found: int | None = None):
+        """Atualiza a lista de resultados (limitada aos itens mais relevantes)"""
         results_column.controls.clear()
 
         if not items:
@@ -102,6 +96,14 @@ class DialogSearch:
                     )
                 )
 
+        if total_found and total_found > len(items):
+            results_column.controls.append(
+                ft.Text(f"Mais {total_found - len(items)} itens encontrados. Refine a busca.",
+                        color=ft.Colors.GREY_600,
+                        italic=True,
+                        size=12)
+            )
+
         if results_column.page:
             results_column.update()
 
@@ -121,17 +123,13 @@ class DialogSearch:
 
     def on_search_submit(self, e):
         """Quando o usuário pressiona Enter na busca"""
-        search_text = e.control.value.lower().strip()
+        search_text = (e.control.value or "").strip()
 
         if search_text:
-            # Busca o primeiro item correspondente
-            filtered_items = [
-                item for item in self.original_items
-                if search_text in item["description"].lower()
-            ]
-
-            if filtered_items:
-                first_item = filtered_items[0]
+            # Seleciona o item mais relevante
+            first_item = self.search_index.first_match(search_text)
+
+            if first_item:
                 self.select_item(first_item["id"], first_item["description"], first_item["sale_price"], first_item["quantity_on_hand"], first_item["unit_of_measure"])
 
     def close_dialog(self, e):
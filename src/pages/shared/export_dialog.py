@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+import flet as ft
+
+import src.controllers.export_controllers as export_controllers
+from src.services.export import EXPORT_DATASETS
+from src.shared.utils import MessageType, message_snackbar
+
+
+async def export_dataset(page: ft.Page, dataset_names: list[str]) -> None:
+    """
+    Diálogo de exportação: escolhe o conjunto de dados e o formato, exporta com progresso e
+    oferece o link temporário de download.
+
+    Args:
+        page (ft.Page): Página atual
+        dataset_names (list[str]): Conjuntos de dados oferecidos (chaves de EXPORT_DATASETS)
+    """
+    datasets = [EXPORT_DATASETS[name] for name in dataset_names]
+    dataset_radio = ft.RadioGroup(
+        value=datasets[0].name,
+        content=ft.Column([ft.Radio(value=dataset.name, label=dataset.label) for dataset in datasets], tight=True),
+    )
+    format_radio = ft.RadioGroup(
+        value="csv",
+        content=ft.Row([
+            ft.Radio(value="csv", label="CSV (Excel)"),
+            ft.Radio(value="parquet", label="Parquet"),
+        ]),
+    )
+    chosen = asyncio.get_running_loop().create_future()
+
+    def close(confirmed: bool):
+        page.close(dlg_options)
+        if not chosen.done():
+            chosen.set_result(confirmed)
+
+    controls: list[ft.Control] = [ft.Text("Formato do arquivo:"), format_radio]
+    if len(datasets) > 1:
+        controls[:0] = [ft.Text("Exportar:"), dataset_radio]
+
+    dlg_options = ft.AlertDialog(
+        modal=True,
+        title=ft.Text(f"Exportar {datasets[0].label.lower()}" if len(datasets) == 1 else "Exportar"),
+        content=ft.Column(controls, tight=True, width=400, spacing=10),
+        actions=[
+            ft.TextButton("Cancelar", on_click=lambda _: close(False)),
+            ft.ElevatedButton("Exportar", icon=ft.Icons.DOWNLOAD, on_click=lambda _: close(True)),
+        ],
+        actions_alignment=ft.MainAxisAlignment.END,
+    )
+    page.open(dlg_options)
+    if not await chosen:
+        return
+
+    dataset = EXPORT_DATASETS[dataset_radio.value or datasets[0].name]
+    progress_text = ft.Text("Lendo os registros...")
+    dlg_progress = ft.AlertDialog(
+        modal=True,
+        title=ft.Text(f"Exportando {dataset.label.lower()}"),
+        content=ft.Column([ft.ProgressBar(value=None, width=400), progress_text], tight=True, width=400, spacing=10),
+    )
+    page.open(dlg_progress)
+
+    last_update = 0.0
+
+    def on_progress(rows: int) -> None:
+        # Chamado pela thread da exportação a cada página gravada
+        nonlocal last_update
+        now = time.monotonic()
+        if now - last_update < 0.25:
+            return
+        last_update = now
+        progress_text.value = f"{rows:,} linha(s) gravada(s)".replace(",", ".")
+        page.update()
+
+    try:
+        result = await asyncio.to_thread(
+            export_controllers.handle_export,
+            dataset_name=dataset.name,
+            empresa_id=page.app_state.empresa['id'],  # type: ignore [attr-defined]
+            export_format=format_radio.value or "csv",
+            on_progress=on_progress,
+        )
+    finally:
+        page.close(dlg_progress)
+
+    if result["status"] == "error":
+        message_snackbar(page=page, message=result["message"], message_type=MessageType.ERROR)
+        return
+
+    data = result["data"]
+    page.launch_url(data["url"])
+
+    dlg_done = ft.AlertDialog(
+        title=ft.Text("Exportação concluída"),
+        content=ft.Column([
+            ft.Text(f"{data['rows']:,} linha(s) exportada(s) em {data['filename']}.".replace(",", ".")),
+            ft.Text("Se o download não começou, use o link abaixo (válido por tempo limitado).", size=12),
+            ft.TextButton("Baixar arquivo", icon=ft.Icons.DOWNLOAD, url=data["url"]),
+        ], tight=True, width=400, spacing=8),
+        actions=[ft.TextButton("OK", on_click=lambda _: page.close(dlg_done))],
+        actions_alignment=ft.MainAxisAlignment.END,
+    )
+    page.open(dlg_done)
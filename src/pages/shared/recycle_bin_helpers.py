@@ -1,6 +1,14 @@
+import asyncio
 import datetime
 import math
-from typing import Any
+from typing import Any, Awaitable, Callable
+
+import flet as ft
+
+from src.shared.utils import MessageType, message_snackbar
+
+# (IDs selecionados, on_progress) -> resposta do controller ('data' = quantidade processada)
+BulkAction = Callable[[list[str], Callable[[int], None]], dict]
 
 
 def get_deleted_info_message(entity: Any) -> str:
@@ -40,4 +48,134 @@ def get_deleted_info_message(entity: Any) -> str:
             return f"A exclusão automática e permanente do banco de dados ocorrerá em {days_left} dias."
     else:
         # Caso deleted_at não esteja definido
-        return "Este registro está na lixeira, mas a data de início da contagem para exclusão não foi registrada."
\ No newline at end of file
+        return "Este registro está na lixeira, mas a data de início da contagem para exclusão não foi registrada."
+
+
+class RecycleBinSelection:
+    """
+    Seleção múltipla na lixeira: um checkbox por card e uma barra com "Selecionar todos",
+    "Restaurar" e "Excluir definitivamente", aplicados em lote com indicador de progresso.
+
+    `restore` e `purge` rodam em uma thread e recebem os IDs selecionados e um callback de
+    progresso; ao final, `on_done` recarrega a lista uma única vez (e com ela os contadores).
+    """
+
+    def __init__(self, page: ft.Page, entity_label: str, restore: BulkAction, purge: BulkAction | None,
+                 on_done: Callable[[], Awaitable[None]]):
+        self.page = page
+        self.entity_label = entity_label  # Plural, ex.: "produtos"
+        self.restore = restore
+        self.purge = purge
+        self.on_done = on_done
+        self._checkboxes: dict[str, ft.Checkbox] = {}
+
+        self.select_all = ft.Checkbox(label="Selecionar todos", on_change=self._on_select_all)
+        self.count_text = ft.Text("", theme_style=ft.TextThemeStyle.BODY_SMALL)
+        self.restore_button = ft.OutlinedButton(
+            "Restaurar", icon=ft.Icons.RESTORE, disabled=True, on_click=self._on_restore_click)
+        self.purge_button = ft.OutlinedButton(
+            "Excluir definitivamente", icon=ft.Icons.DELETE_FOREVER, disabled=True, visible=purge is not None,
+            style=ft.ButtonStyle(color=ft.Colors.RED), on_click=self._on_purge_click)
+        self.toolbar = ft.Row(
+            controls=[self.select_all, self.count_text, ft.Container(expand=True), self.restore_button, self.purge_button],
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            visible=False,
+            wrap=True,
+        )
+
+    @property
+    def selected_ids(self) -> list[str]:
+        return [item_id for item_id, checkbox in self._checkboxes.items() if checkbox.value]
+
+    def reset(self) -> None:
+        """Descarta a seleção e os checkboxes; chamado antes de reconstruir os cards."""
+        self._checkboxes.clear()
+        self.select_all.value = False
+        self.toolbar.visible = False
+        self._refresh()
+
+    def checkbox(self, item_id: str) -> ft.Checkbox:
+        """Checkbox de seleção do card do item."""
+        checkbox = ft.Checkbox(value=False, data=item_id, on_change=self._on_item_change)
+        self._checkboxes[item_id] = checkbox
+        self.toolbar.visible = True
+        return checkbox
+
+    def _refresh(self) -> None:
+        selected = len(self.selected_ids)
+        self.count_text.value = f"{selected} de {len(self._checkboxes)} selecionado(s)" if selected else ""
+        self.restore_button.disabled = self.purge_button.disabled = not selected
+
+    def _on_select_all(self, e) -> None:
+        for checkbox in self._checkboxes.values():
+            checkbox.value = bool(self.select_all.value)
+        self._refresh()
+        self.page.update()
+
+    def _on_item_change(self, e) -> None:
+        self.select_all.value = bool(self._checkboxes) and all(cb.value for cb in self._checkboxes.values())
+        self._refresh()
+        self.page.update()
+
+    async def _on_restore_click(self, e) -> None:
+        await self._run(self.restore, f"Restaurando {self.entity_label}", "{count} item(ns) restaurado(s).")
+
+    async def _on_purge_click(self, e) -> None:
+        if not self.purge:
+            return
+        total = len(self.selected_ids)
+        confirmed = asyncio.get_running_loop().create_future()
+
+        def close(answer: bool):
+            self.page.close(dlg_confirm)
+            if not confirmed.done():
+                confirmed.set_result(answer)
+
+        dlg_confirm = ft.AlertDialog(
+            modal=True,
+            title=ft.Text("Excluir definitivamente?"),
+            content=ft.Text(f"{total} item(ns) serão excluídos permanentemente do banco de dados. "
+                            "Esta operação não pode ser desfeita."),
+            actions=[
+                ft.TextButton("Cancelar", on_click=lambda _: close(False)),
+                ft.TextButton("Excluir", style=ft.ButtonStyle(color=ft.Colors.RED), on_click=lambda _: close(True)),
+            ],
+            actions_alignment=ft.MainAxisAlignment.END,
+        )
+        self.page.open(dlg_confirm)
+        if await confirmed:
+            await self._run(self.purge, f"Excluindo {self.entity_label}", "{count} item(ns) excluído(s) definitivamente.")
+
+    async def _run(self, action: BulkAction, title: str, done_message: str) -> None:
+        """Executa a ação em lote em uma thread, com progresso, e recarrega a lista uma única vez ao final."""
+        ids = self.selected_ids
+        if not ids:
+            return
+        total = len(ids)
+
+        progress_bar = ft.ProgressBar(value=0, width=400)
+        progress_text = ft.Text(f"0 de {total}")
+        dlg_progress = ft.AlertDialog(
+            modal=True,
+            title=ft.Text(title),
+            content=ft.Column([progress_bar, progress_text], tight=True, width=400, spacing=10),
+        )
+        self.page.open(dlg_progress)
+
+        def on_progress(processed: int) -> None:
+            # Chamado pela thread da operação a cada lote gravado
+            progress_bar.value = min(processed / total, 1)
+            progress_text.value = f"{processed} de {total}"
+            self.page.update()
+
+        try:
+            result = await asyncio.to_thread(action, ids, on_progress)
+        finally:
+            self.page.close(dlg_progress)
+
+        if result["status"] == "error":
+            message_snackbar(page=self.page, message=result["message"], message_type=MessageType.ERROR)
+        else:
+            message_snackbar(page=self.page, message=done_message.format(count=result["data"]),
+                             message_type=MessageType.SUCCESS)
+        await self.on_done()
@@ -20,6 +20,7 @@ from src.domains.usuarios.models import Usuario
 from src.pages.partials import build_input_field
 from src.pages.partials.app_bars.appbar import create_appbar_back
 from src.services import UploadFile
+from src.services.images import image_pipeline
 from src.shared.utils import  message_snackbar, gerar_senha, MessageType, ProgressiveMessage
 from src.shared.utils.file_helpers import generate_unique_bucket_filename
 from src.shared.utils.find_project_path import find_project_root
@@ -601,10 +602,18 @@ class UsuarioForm:
             return False
 
         try:
-            file_name_bucket = generate_unique_bucket_filename(
-                original_filename=self.local_upload_file, prefix="usuarios")
-            self.photo_url = bucket_controllers.handle_upload_bucket(
-                local_path=self.local_upload_file, key=file_name_bucket)
+            # Gera as rendições da foto em um pool de processos e as envia ao bucket
+            # Apenas a rendição exibida (medium) é aguardada; as demais seguem pela fila de jobs
+            renditions = image_pipeline.process_and_upload(self.local_upload_file, prefix="usuarios",
+                                                           wait_for=("medium",))
+            if renditions:
+                self.photo_url = renditions["medium"]
+            else:
+                # Formato não suportado pelo pipeline (ex.: SVG): envia o arquivo original
+                file_name_bucket = generate_unique_bucket_filename(
+                    original_filename=self.local_upload_file, prefix="usuarios")
+                self.photo_url = bucket_controllers.handle_upload_bucket(
+                    local_path=self.local_upload_file, key=file_name_bucket)
 
             if self.photo_url:
                 # Atualiza logo na tela
@@ -715,9 +724,8 @@ def show_user_form(page: ft.Page) -> ft.View:
                     usuario.photo_url = usuarios_view.photo_url
                     # Apaga a foto anterior do usuário no bucket se existir
                     if usuarios_view.previous_photo_url:
-                        progress_msg.update_progress("Deletando imagem anterior do servidor...")
-                        bucket_controllers.handle_delete_bucket(
-                            usuarios_view.previous_photo_url)
+                        # A remoção roda em segundo plano pela fila de jobs
+                        bucket_controllers.handle_enqueue_delete_bucket(usuarios_view.previous_photo_url)
                 else:
                     progress_msg.show_error("Erro ao enviar imagem para o bucket")
                     save_btn.disabled = False
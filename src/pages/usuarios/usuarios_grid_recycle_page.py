@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import traceback
 import datetime
@@ -10,7 +11,7 @@ from src.domains.shared import RegistrationStatus
 from src.pages.partials.app_bars.appbar import create_appbar_back
 import src.pages.usuarios.usuarios_actions_page as users_actions
 import src.pages.shared.recycle_bin_helpers as recycle_helpers
-from src.pages.shared.components import create_recycle_bin_card
+from src.pages.shared.components import create_recycle_bin_card, create_recycle_bin_skeleton
 
 from src.shared.utils import format_datetime_to_utc_minus_3
 
@@ -22,11 +23,10 @@ def show_users_grid_trash(page: ft.Page):
     """Página de exibição dos usuários da empresa logada que estão 'DELETED' em formato Cards"""
     page.theme_mode = ft.ThemeMode.DARK
 
-    # --- Indicador de Carregamento (Spinner) ---
-    progress_ring = ft.ProgressRing(width=32, height=32, stroke_width=3)
+    # --- Indicador de Carregamento (Esqueleto dos cards) ---
     loading_container = ft.Container(
-        content=progress_ring,
-        alignment=ft.alignment.center,
+        content=create_recycle_bin_skeleton(),
+        alignment=ft.alignment.top_center,
         expand=True,  # Ocupa o espaço disponível enquanto carrega
         visible=True  # Começa visível
     )
@@ -135,6 +135,14 @@ def show_users_grid_trash(page: ft.Page):
 
     # --- Função Assíncrona para Carregar Dados e Atualizar a UI ---
     async def load_data_and_update_ui():
+        # Recarga (após restaurar): descarta os cards anteriores
+        content_area.controls.clear()
+        if content_area.visible:
+            # Recarga: volta ao esqueleto enquanto a lixeira é relida em segundo plano
+            loading_container.visible = True
+            content_area.visible = False
+            page.update()
+
         usuarios_data = []
         usuarios_inactivated = 0
 
@@ -142,12 +150,11 @@ def show_users_grid_trash(page: ft.Page):
         empresa_id = page.app_state.empresa["id"] # type: ignore
 
         try:
-            # *** IMPORTANTE: Garanta que handle_get_all seja async ***
             if not empresa_id:  # Só busca as usuários da empresa logada, se houver ID
                 content_area.controls.append(empty_content_display)
                 return
 
-            result = user_controllers.handle_get_all(empresa_id=empresa_id, status_deleted=True)
+            result = await asyncio.to_thread(user_controllers.handle_get_all, empresa_id=empresa_id, status_deleted=True)
 
             if result["status"] == "error":
                 content_area.controls.append(empty_content_display)
@@ -242,15 +249,15 @@ def show_users_grid_trash(page: ft.Page):
                 logger.info("Contexto da página perdido, não foi possível atualizar.")
 
     # --- Disparar Carregamento dos Dados ---
-    # Executa a função async em background. A UI mostrará o spinner primeiro.
+    # Executa a função async em background. A UI mostrará o esqueleto primeiro.
     page.run_task(load_data_and_update_ui)
 
     # --- Retornar Estrutura Inicial da Página como ft.View ---
-    # A View inclui a AppBar e a área de conteúdo principal (que inicialmente mostra o spinner)
+    # A View inclui a AppBar e a área de conteúdo principal (que inicialmente mostra o esqueleto)
     return ft.View(
         route="/home/usuarios/grid/lixeira",  # A rota que esta view corresponde
         controls=[
-            loading_container,  # Mostra o spinner inicialmente
+            loading_container,  # Mostra o esqueleto inicialmente
             content_area       # Oculto inicialmente, populado por load_data_and_update_ui
         ],
         appbar=appbar,
@@ -1,5 +1,5 @@
 from .apis.cnpj_api import consult_cnpj_api
-from .apis.cosmos_api import fetch_product_info_by_ean
+from .apis.cosmos_api import cosmos_client, fetch_product_info_by_ean, fetch_product_info_by_ean_async
 from .aws.s3_file_manager import S3FileManager
 from .buckets.bucket_services import BucketServices
 from .gateways.asaas_payment_gateway import AsaasPaymentGateway
@@ -8,4 +8,5 @@ from .states.state_validator import StateValidator
 from .upload.upload_files import UploadFile
 
 __all__ = ['AppStateManager', 'AsaasPaymentGateway', 'StateValidator', 'consult_cnpj_api',
-           'UploadFile', 'S3FileManager', 'BucketServices']
+           'UploadFile', 'S3FileManager', 'BucketServices', 'cosmos_client', 'fetch_product_info_by_ean',
+           'fetch_product_info_by_ean_async']
@@ -1,75 +1,31 @@
 import logging
 from typing import Any
-import aiohttp
+
+from src.services.apis.cnpj_lookup import cnpj_lookup_service
 
 logger = logging.getLogger(__name__)
 
 
-async def consult_cnpj_api(cnpj) -> dict[str, Any]:
+async def consult_cnpj_api(cnpj, force_refresh: bool = False) -> dict[str, Any]:
+    """
+    Consulta os dados de um CNPJ (BrasilAPI, ReceitaWS e Nuvem Fiscal, nesta ordem por padrão).
 
-    # Remove caracteres especiais do CNPJ
-    cnpj_clean = ''.join(filter(str.isdigit, cnpj))
+    As respostas ficam em cache local e são normalizadas no formato da BrasilAPI
+    (ver src/services/apis/cnpj_lookup.py).
 
+    Returns:
+        dict: {'is_error': bool, 'status': int, 'data': dict | None, 'provider': str | None,
+               'from_cache': bool, 'message': str}
     """
-    url = www.receitaws.com.br/v1/cnpj: 3 consultas por minuto
-    # 3 consultas por minuto
-    url = f"https://www.receitaws.com.br/v1/cnpj/{cnpj_clean}"
-    # 50.000 consultas por mês
-    url = f"https://api.nuvemfiscal.com.br/cnpj/{cnpj_clean}"
-        token = "SEU_TOKEN"
-        headers = {
-            "Accept": "*/*",
-            "Authorization": f"Bearer {token}"
-        }
-        response = requests.get(url, headers=headers)
-    """
-
     try:
-        # Faz a consulta à API
-        url = f"https://brasilapi.com.br/api/cnpj/v1/{cnpj_clean}"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                return {
-                    'is_error': False,
-                    'response': response,
-                    'data': await response.json()
-                }
-
+        return await cnpj_lookup_service.lookup(cnpj, force_refresh=force_refresh)
     except Exception as error:
         logger.error(f"Erro ao consultar CNPJ: {str(error)}")
-        # Mostra erro genérico
-        if "400" in str(error):
-            return {
-                'is_error': True,
-                'message': "Erro ao consultar CNPJ: CNPJ inválido."
-            }
-        elif "403" in str(error):
-            return {
-                'is_error': True,
-                'message': "Erro ao consultar CNPJ: Acesso negado."
-            }
-        elif "404" in str(error):
-            return {
-                'is_error': True,
-                'message': "Erro ao consultar CNPJ: CNPJ não encontrado."
-            }
-        elif "500" in str(error):
-            return {
-                'is_error': True,
-                'message': "Erro ao consultar CNPJ: Erro interno do servidor."
-            }
-        elif "503" in str(error):
-            return {
-                'is_error': True,
-                'message': "Erro ao consultar CNPJ: Serviço temporariamente indisponível."
-            }
-        elif "timeout" in str(error):
-            return {
-                'is_error': True,
-                'message': "Erro ao consultar CNPJ: Tempo de resposta excedido."
-            }
         return {
             'is_error': True,
+            'status': 500,
+            'data': None,
+            'provider': None,
+            'from_cache': False,
             'message': f"Erro ao consultar CNPJ: {str(error)}"
         }
@@ -0,0 +1,116 @@
+# cnpj_cache.py
+"""
+Cache persistente (SQLite) das consultas de CNPJ, já normalizadas (ver cnpj_lookup.py).
+
+Política de frescor:
+- até CNPJ_CACHE_FRESH_DAYS, a entrada é servida sem consultar os provedores;
+- até CNPJ_CACHE_MAX_STALE_DAYS, só é servida se todos os provedores falharem;
+- CNPJs não encontrados (404 em todos os provedores) valem CNPJ_CACHE_NOT_FOUND_HOURS.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cnpj_cache (
+    cnpj TEXT PRIMARY KEY,
+    status_code INTEGER NOT NULL,
+    provider TEXT,
+    payload TEXT,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+class CnpjCacheEntry:
+    __slots__ = ("status_code", "provider", "data", "age_seconds")
+
+    def __init__(self, status_code: int, provider: str | None, data: dict[str, Any] | None, age_seconds: float):
+        self.status_code = status_code
+        self.provider = provider
+        self.data = data
+        self.age_seconds = age_seconds
+
+
+class CnpjCache:
+    """Cache de CNPJs em SQLite, seguro para uso por várias threads."""
+
+    def __init__(self, path: str | None = None):
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def fresh_seconds(self) -> int:
+        return int(os.getenv('CNPJ_CACHE_FRESH_DAYS', '30')) * 86400
+
+    @property
+    def max_stale_seconds(self) -> int:
+        return int(os.getenv('CNPJ_CACHE_MAX_STALE_DAYS', '365')) * 86400
+
+    @property
+    def not_found_seconds(self) -> int:
+        return int(os.getenv('CNPJ_CACHE_NOT_FOUND_HOURS', '24')) * 3600
+
+    def _connection(self) -> sqlite3.Connection:
+        # Chamado com self._lock adquirido
+        if self._conn is None:
+            path = self._path or os.getenv('CNPJ_CACHE_PATH', os.path.join('cache', 'cnpj.sqlite3'))
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+            logger.info(f"Cache de CNPJs aberto em {path}")
+        return self._conn
+
+    def get(self, cnpj: str) -> CnpjCacheEntry | None:
+        """Retorna a entrada do CNPJ (mesmo que vencida), ou None se não houver."""
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT status_code, provider, payload, fetched_at FROM cnpj_cache WHERE cnpj = ?", (cnpj,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Erro ao ler o cache de CNPJs: {e}")
+            return None
+        if row is None:
+            return None
+        status_code, provider, payload, fetched_at = row
+        return CnpjCacheEntry(status_code, provider, json.loads(payload) if payload else None, time.time() - fetched_at)
+
+    def is_fresh(self, entry: CnpjCacheEntry) -> bool:
+        limit = self.fresh_seconds if entry.status_code == 200 else self.not_found_seconds
+        return entry.age_seconds < limit
+
+    def is_usable_stale(self, entry: CnpjCacheEntry) -> bool:
+        return entry.status_code == 200 and entry.age_seconds < self.max_stale_seconds
+
+    def put(self, cnpj: str, status_code: int, provider: str | None, data: dict[str, Any] | None = None) -> None:
+        payload = json.dumps(data, ensure_ascii=False) if data is not None else None
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cnpj_cache (cnpj, status_code, provider, payload, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (cnpj, status_code, provider, payload, time.time()),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Erro ao gravar o CNPJ {cnpj} no cache: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
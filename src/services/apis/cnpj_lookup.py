@@ -0,0 +1,314 @@
+# cnpj_lookup.py
+"""
+Serviço de consulta de CNPJ com cache, limites por provedor e fallback entre provedores.
+
+Provedores (ordem em CNPJ_PROVIDERS, padrão "brasilapi,receitaws,nuvemfiscal"):
+- brasilapi:   https://brasilapi.com.br/api/cnpj/v1/{cnpj}
+- receitaws:   https://www.receitaws.com.br/v1/cnpj/{cnpj} (3 consultas por minuto)
+- nuvemfiscal: https://api.nuvemfiscal.com.br/cnpj/{cnpj} (OAuth, 50.000 consultas por mês)
+
+As respostas são normalizadas no formato da BrasilAPI (ver _normalize_*), que é o formato
+consumido pelo formulário de empresas, e gravadas no CnpjCache. Timeouts, erros de conexão,
+429 e 5xx passam ao próximo provedor; 404 também (as bases diferem), e só é registrado como
+"não encontrado" se nenhum provedor encontrar o CNPJ.
+
+A sessão aiohttp é de longa duração (keep-alive) e, como sessões e semáforos do asyncio
+pertencem a um event loop, é mantida uma por loop.
+"""
+import asyncio
+import logging
+import os
+import re
+import weakref
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+
+from src.services.apis.cnpj_cache import CnpjCache
+from src.services.providers.nuvemfiscal_token_manager import nuvemfiscal_token_manager
+from src.shared.metrics import metrics_registry
+from src.shared.utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROVIDERS = "brasilapi,receitaws,nuvemfiscal"
+
+# Espera máxima por um token do limitador antes de passar ao próximo provedor (consulta interativa)
+MAX_RATE_WAIT_SECONDS = 2.0
+
+_lookups_total = metrics_registry.counter(
+    "estoquerapido_cnpj_lookups_total",
+    "Consultas de CNPJ por provedor e resultado (found, not_found, invalid, error, rate_limited, skipped, cache_hit, stale)",
+    ("provider", "result"),
+)
+
+TokenGetter = Callable[[], Awaitable[str | None]]
+
+
+@dataclass(frozen=True)
+class CnpjProvider:
+    name: str
+    url: str
+    max_concurrency: int
+    rate_per_minute: float | None = None
+
+
+PROVIDERS: dict[str, CnpjProvider] = {
+    "brasilapi": CnpjProvider("brasilapi", "https://brasilapi.com.br/api/cnpj/v1/{cnpj}", max_concurrency=4),
+    "receitaws": CnpjProvider("receitaws", "https://www.receitaws.com.br/v1/cnpj/{cnpj}",
+                              max_concurrency=1, rate_per_minute=3),
+    "nuvemfiscal": CnpjProvider("nuvemfiscal", "https://api.nuvemfiscal.com.br/cnpj/{cnpj}", max_concurrency=2),
+}
+
+
+def _digits(value: Any) -> str:
+    return re.sub(r"\D", "", str(value or ""))
+
+
+def _porte_code(descricao: str | None) -> int:
+    """Código de porte no padrão da BrasilAPI: 1 micro, 3 pequeno porte, 5 demais."""
+    text = (descricao or "").upper()
+    if "MICRO" in text or text in ("ME", "01"):
+        return 1
+    if "PEQUENO" in text or text in ("EPP", "03"):
+        return 3
+    return 5
+
+
+def _normalize_brasilapi(data: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "cnpj": _digits(data.get("cnpj")),
+        "razao_social": data.get("razao_social") or "",
+        "nome_fantasia": data.get("nome_fantasia") or "",
+        "ddd_telefone_1": data.get("ddd_telefone_1") or "",
+        "email": data.get("email") or "",
+        "logradouro": data.get("logradouro") or "",
+        "numero": data.get("numero") or "",
+        "complemento": data.get("complemento") or "",
+        "bairro": data.get("bairro") or "",
+        "municipio": data.get("municipio") or "",
+        "uf": data.get("uf") or "",
+        "cep": _digits(data.get("cep")),
+        "codigo_porte": data.get("codigo_porte") or _porte_code(data.get("porte")),
+        "descricao_situacao_cadastral": data.get("descricao_situacao_cadastral") or "",
+    }
+
+
+def _normalize_receitaws(data: dict[str, Any]) -> dict[str, Any]:
+    telefone = (data.get("telefone") or "").split("/")[0]
+    return {
+        "cnpj": _digits(data.get("cnpj")),
+        "razao_social": data.get("nome") or "",
+        "nome_fantasia": data.get("fantasia") or "",
+        "ddd_telefone_1": _digits(telefone),
+        "email": data.get("email") or "",
+        "logradouro": data.get("logradouro") or "",
+        "numero": data.get("numero") or "",
+        "complemento": data.get("complemento") or "",
+        "bairro": data.get("bairro") or "",
+        "municipio": data.get("municipio") or "",
+        "uf": data.get("uf") or "",
+        "cep": _digits(data.get("cep")),
+        "codigo_porte": _porte_code(data.get("porte")),
+        "descricao_situacao_cadastral": data.get("situacao") or "",
+    }
+
+
+def _normalize_nuvemfiscal(data: dict[str, Any]) -> dict[str, Any]:
+    endereco = data.get("endereco") or {}
+    municipio = endereco.get("municipio") or {}
+    telefones = data.get("telefones") or []
+    telefone = telefones[0] if telefones else {}
+    porte = data.get("porte") or {}
+    situacao = data.get("situacao_cadastral") or {}
+    return {
+        "cnpj": _digits(data.get("cnpj")),
+        "razao_social": data.get("razao_social") or "",
+        "nome_fantasia": data.get("nome_fantasia") or "",
+        "ddd_telefone_1": f"{telefone.get('ddd', '')}{telefone.get('numero', '')}",
+        "email": data.get("email") or "",
+        "logradouro": " ".join(filter(None, (endereco.get("tipo_logradouro"), endereco.get("logradouro")))),
+        "numero": endereco.get("numero") or "",
+        "complemento": endereco.get("complemento") or "",
+        "bairro": endereco.get("bairro") or "",
+        "municipio": municipio.get("descricao") if isinstance(municipio, dict) else str(municipio),
+        "uf": endereco.get("uf") or "",
+        "cep": _digits(endereco.get("cep")),
+        "codigo_porte": _porte_code(porte.get("descricao") if isinstance(porte, dict) else str(porte)),
+        "descricao_situacao_cadastral": situacao.get("descricao") if isinstance(situacao, dict) else str(situacao),
+    }
+
+
+_NORMALIZERS = {
+    "brasilapi": _normalize_brasilapi,
+    "receitaws": _normalize_receitaws,
+    "nuvemfiscal": _normalize_nuvemfiscal,
+}
+
+
+class _LoopState:
+    """Sessão aiohttp e semáforos de concorrência de um event loop."""
+
+    def __init__(self, timeout: aiohttp.ClientTimeout):
+        self.session = aiohttp.ClientSession(
+            timeout=timeout,
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+            headers={"Accept": "application/json", "User-Agent": "EstoqueRapidoApp/1.0 CNPJ-Client"},
+        )
+        self.semaphores = {name: asyncio.Semaphore(p.max_concurrency) for name, p in PROVIDERS.items()}
+
+
+class CnpjLookupService:
+    """Consulta de CNPJ compartilhada pelo processo (cache + limites + fallback)."""
+
+    def __init__(self, cache: CnpjCache | None = None, nuvemfiscal_token_getter: TokenGetter | None = None):
+        self.cache = cache or CnpjCache()
+        # Sem token getter, o provedor nuvemfiscal é ignorado
+        self.nuvemfiscal_token_getter = nuvemfiscal_token_getter
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+        self._limiters = {
+            name: TokenBucket.per_minute(p.rate_per_minute, burst=1)
+            for name, p in PROVIDERS.items() if p.rate_per_minute
+        }
+
+    @property
+    def provider_order(self) -> list[str]:
+        names = [n.strip().lower() for n in os.getenv('CNPJ_PROVIDERS', DEFAULT_PROVIDERS).split(",")]
+        return [n for n in names if n in PROVIDERS]
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None or state.session.closed:
+            timeout = aiohttp.ClientTimeout(
+                total=float(os.getenv('CNPJ_TIMEOUT_SECONDS', '8')),
+                connect=3,
+            )
+            state = _LoopState(timeout)
+            self._states[loop] = state
+        return state
+
+    async def lookup(self, cnpj: str, force_refresh: bool = False) -> dict[str, Any]:
+        """
+        Consulta um CNPJ.
+
+        Args:
+            cnpj (str): CNPJ com ou sem máscara.
+            force_refresh (bool): Ignora uma entrada fresca do cache e consulta os provedores.
+
+        Returns:
+            dict: {'is_error': bool, 'status': 200|400|404|503, 'data': dict | None,
+                   'provider': str | None, 'from_cache': bool, 'message': str}
+        """
+        cnpj_clean = _digits(cnpj)
+        if len(cnpj_clean) != 14:
+            return self._result(400, message="Erro ao consultar CNPJ: CNPJ inválido.")
+
+        cached = self.cache.get(cnpj_clean)
+        if cached and not force_refresh and self.cache.is_fresh(cached):
+            _lookups_total.inc((cached.provider or "", "cache_hit"))
+            if cached.status_code == 200:
+                return self._result(200, cached.data, cached.provider, from_cache=True)
+            return self._result(404, message="Erro ao consultar CNPJ: CNPJ não encontrado.", from_cache=True)
+
+        not_found = 0
+        attempted = 0
+        for name in self.provider_order:
+            outcome, data = await self._query_provider(name, cnpj_clean)
+            if outcome == "skipped":
+                continue
+            attempted += 1
+            if outcome == "found":
+                self.cache.put(cnpj_clean, 200, name, data)
+                return self._result(200, data, name)
+            if outcome == "invalid":
+                return self._result(400, message="Erro ao consultar CNPJ: CNPJ inválido.")
+            if outcome == "not_found":
+                not_found += 1
+
+        if attempted and not_found == attempted:
+            self.cache.put(cnpj_clean, 404, None)
+            return self._result(404, message="Erro ao consultar CNPJ: CNPJ não encontrado.")
+
+        # Todos os provedores falharam: recorre a uma entrada vencida, se houver
+        if cached and self.cache.is_usable_stale(cached):
+            _lookups_total.inc((cached.provider or "", "stale"))
+            logger.warning(f"Provedores de CNPJ indisponíveis. Usando dados em cache de {cnpj_clean}.")
+            return self._result(200, cached.data, cached.provider, from_cache=True)
+
+        return self._result(503, message="Erro ao consultar CNPJ: Serviço temporariamente indisponível.")
+
+    async def _query_provider(self, name: str, cnpj: str) -> tuple[str, dict[str, Any] | None]:
+        provider = PROVIDERS[name]
+        headers = {}
+        if name == "nuvemfiscal":
+            token = await self.nuvemfiscal_token_getter() if self.nuvemfiscal_token_getter else None
+            if not token:
+                _lookups_total.inc((name, "skipped"))
+                return "skipped", None
+            headers["Authorization"] = f"Bearer {token}"
+
+        limiter = self._limiters.get(name)
+        if limiter and not await limiter.try_acquire_async(MAX_RATE_WAIT_SECONDS):
+            _lookups_total.inc((name, "rate_limited"))
+            logger.info(f"Limite de consultas do provedor de CNPJ '{name}' atingido. Tentando o próximo.")
+            return "skipped", None
+
+        state = self._state()
+        try:
+            async with state.semaphores[name]:
+                async with state.session.get(provider.url.format(cnpj=cnpj), headers=headers) as response:
+                    status = response.status
+                    payload = await response.json(content_type=None) if status == 200 else None
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            _lookups_total.inc((name, "error"))
+            logger.warning(f"Erro ao consultar CNPJ no provedor '{name}': {type(e).__name__} {e}")
+            return "error", None
+
+        if status == 200 and isinstance(payload, dict):
+            # ReceitaWS responde 200 com {"status": "ERROR", "message": ...} para CNPJs inválidos/inexistentes
+            if name == "receitaws" and payload.get("status") == "ERROR":
+                _lookups_total.inc((name, "not_found"))
+                return "not_found", None
+            _lookups_total.inc((name, "found"))
+            return "found", _NORMALIZERS[name](payload)
+        if status == 400:
+            _lookups_total.inc((name, "invalid"))
+            return "invalid", None
+        if status == 404:
+            _lookups_total.inc((name, "not_found"))
+            return "not_found", None
+        if status == 401 and name == "nuvemfiscal":
+            # Token rejeitado: a próxima consulta obtém um novo
+            nuvemfiscal_token_manager.invalidate()
+        if status == 429:
+            if limiter:
+                limiter.penalize(60)
+            _lookups_total.inc((name, "rate_limited"))
+        else:
+            _lookups_total.inc((name, "error"))
+        logger.warning(f"Provedor de CNPJ '{name}' respondeu com status {status}")
+        return "error", None
+
+    @staticmethod
+    def _result(status: int, data: dict[str, Any] | None = None, provider: str | None = None,
+                from_cache: bool = False, message: str = "") -> dict[str, Any]:
+        return {
+            "is_error": status != 200,
+            "status": status,
+            "data": data,
+            "provider": provider,
+            "from_cache": from_cache,
+            "message": message,
+        }
+
+    async def close(self) -> None:
+        """Fecha a sessão do event loop atual."""
+        state = self._states.pop(asyncio.get_running_loop(), None)
+        if state is not None and not state.session.closed:
+            await state.session.close()
+
+
+# Serviço global do processo, compartilhado por todas as sessões Flet
+cnpj_lookup_service = CnpjLookupService(nuvemfiscal_token_getter=nuvemfiscal_token_manager.get_token)
@@ -1,26 +1,263 @@
-import requests
+import asyncio
 import json
-import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.services.apis.cosmos_cache import GtinCache, normalize_gtin
+from src.shared.env import env_float, env_int, env_str
+from src.shared.metrics import metrics_registry
+from src.shared.utils.rate_limiter import TokenBucket
 
 # Configurar o logger
 logger = logging.getLogger(__name__)
 
-# É uma boa prática carregar configurações sensíveis de variáveis de ambiente
-# Você precisaria ter COSMOS_API_TOKEN definido no seu .env e carregado adequadamente
-# (ex: usando python-dotenv na inicialização da sua aplicação)
-COSMOS_API_TOKEN = os.getenv("COSMOS_API_TOKEN")
+# Token, conexões e limite de taxa vêm do .env (COSMOS_*) na primeira consulta
 COSMOS_BASE_URL = "https://api.cosmos.bluesoft.com.br/gtins"
 
-HEADERS = {
-    'X-Cosmos-Token': COSMOS_API_TOKEN,
-    'Content-Type': 'application/json',
-    'User-Agent': 'EstoqueRapidoApp/1.0 Cosmos-API-Client'
-}
+# Espera padrão após um 429 sem header Retry-After
+DEFAULT_RETRY_AFTER_SECONDS = 60
+
+_requests_total = metrics_registry.counter(
+    "estoquerapido_cosmos_requests_total",
+    "Consultas de EAN/GTIN por resultado (cache_hit, cache_not_found, found, not_found, rate_limited, error)",
+    ("result",),
+)
+
+
+class CosmosClient:
+    """
+    Cliente da API Cosmos (Bluesoft) compartilhado pelo processo.
+
+    - Cache persistente por GTIN (GtinCache), com TTLs para encontrados e não encontrados.
+    - requests.Session com pool de conexões keep-alive e retentativas para falhas transitórias.
+    - Token bucket (COSMOS_RATE_PER_MINUTE, COSMOS_RATE_BURST): consultas acima da taxa
+      aguardam a vez em vez de receberem 429 da API.
+    - Interface síncrona (handlers síncronos do Flet) e assíncrona, e prefetch em lote.
+    """
+
+    def __init__(self, cache: GtinCache | None = None, limiter: TokenBucket | None = None,
+                 max_connections: int | None = None):
+        self.cache = cache or GtinCache()
+        self._limiter = limiter
+        self._max_connections = max_connections
+        self._session: requests.Session | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def token(self) -> str | None:
+        return env_str("COSMOS_API_TOKEN") or None
+
+    @property
+    def max_connections(self) -> int:
+        if self._max_connections is None:
+            self._max_connections = env_int('COSMOS_MAX_CONNECTIONS', 4)
+        return self._max_connections
+
+    @property
+    def limiter(self) -> TokenBucket:
+        with self._lock:
+            if self._limiter is None:
+                self._limiter = TokenBucket.per_minute(
+                    env_float('COSMOS_RATE_PER_MINUTE', 30),
+                    burst=env_int('COSMOS_RATE_BURST', 5),
+                )
+            return self._limiter
+
+    def _get_session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=("GET",),
+                    respect_retry_after_header=True,
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_connections,
+                                      pool_block=True, max_retries=retry)
+                session.mount("https://", adapter)
+                session.headers.update({
+                    'Content-Type': 'application/json',
+                    'User-Agent': 'EstoqueRapidoApp/1.0 Cosmos-API-Client',
+                })
+                self._session = session
+            return self._session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_connections, thread_name_prefix="cosmos")
+            return self._executor
+
+    @staticmethod
+    def _from_cache(entry: tuple[int, Any]) -> dict | None:
+        status_code, data = entry
+        if status_code == 200:
+            _requests_total.inc(("cache_hit",))
+            return {"status_code": status_code, "data": data, "from_cache": True}
+        _requests_total.inc(("cache_not_found",))
+        return None
+
+    def fetch(self, ean: str) -> dict | None:
+        """
+        Consulta informações de um produto pelo código EAN (versão síncrona).
+
+        Args:
+            ean: O código EAN (GTIN) do produto a ser consultado.
+
+        Returns:
+            {"status_code": 200, "data": {...}} se encontrado, {"status_code": 429, "message": ...}
+            se o limite da API foi excedido, None se não encontrado ou em caso de erro.
+        """
+        if entry := self.cache.get(ean):
+            return self._from_cache(entry)
+        if not self._check_token():
+            return None
+        self.limiter.acquire()
+        return self._request(ean)
+
+    async def fetch_async(self, ean: str) -> dict | None:
+        """Versão assíncrona de fetch: a espera do limitador e a requisição não bloqueiam o event loop."""
+        if entry := self.cache.get(ean):
+            return self._from_cache(entry)
+        if not self._check_token():
+            return None
+        await self.limiter.acquire_async()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self._request, ean)
+
+    def prefetch(self, eans: list[str]) -> dict[str, dict | None]:
+        """
+        Consulta uma lista de EANs: os que estão no cache são lidos em uma única consulta ao SQLite
+        e os demais são buscados na API em paralelo (até COSMOS_MAX_CONNECTIONS), respeitando o
+        limitador. Um 429 interrompe as consultas restantes.
+
+        Returns:
+            dict[str, dict | None]: Resultado de fetch para cada EAN informado.
+        """
+        by_gtin: dict[str, list[str]] = {}
+        for ean in eans:
+            if gtin := normalize_gtin(ean):
+                by_gtin.setdefault(gtin, []).append(ean)
+
+        results: dict[str, dict | None] = {ean: None for ean in eans}
+        cached = self.cache.get_many(list(by_gtin))
+        for gtin, entry in cached.items():
+            result = self._from_cache(entry)
+            for ean in by_gtin[gtin]:
+                results[ean] = result
+
+        missing = [gtin for gtin in by_gtin if gtin not in cached]
+        if not missing or not self._check_token():
+            return results
+
+        rate_limited = threading.Event()
+
+        def fetch_one(gtin: str) -> dict | None:
+            if rate_limited.is_set():
+                return None
+            self.limiter.acquire()
+            if rate_limited.is_set():
+                return None
+            result = self._request(by_gtin[gtin][0])
+            if result and result.get("status_code") == 429:
+                rate_limited.set()
+            return result
+
+        executor = self._get_executor()
+        futures = {gtin: executor.submit(fetch_one, gtin) for gtin in missing}
+        for gtin, future in futures.items():
+            result = future.result()
+            for ean in by_gtin[gtin]:
+                results[ean] = result
+
+        if rate_limited.is_set():
+            logger.warning("Prefetch de EANs interrompido: limite de requisições da API Cosmos excedido (429)")
+        return results
+
+    async def prefetch_async(self, eans: list[str]) -> dict[str, dict | None]:
+        """Versão assíncrona de prefetch."""
+        return await asyncio.to_thread(self.prefetch, eans)
+
+    def _check_token(self) -> bool:
+        if not self.token:
+            logger.error("Token da API Cosmos não configurado. Verifique a variável de ambiente COSMOS_API_TOKEN.")
+            return False
+        return True
+
+    def _request(self, ean: str) -> dict | None:
+        """Requisição à API (o token do limitador já foi obtido pelo chamador)."""
+        url = f"{COSMOS_BASE_URL}/{ean}.json"
+
+        try:
+            response = self._get_session().get(url, headers={'X-Cosmos-Token': self.token}, timeout=10)
+            response.raise_for_status()  # Levanta uma exceção para respostas de erro HTTP (4xx ou 5xx)
+            data = response.json()
+            self.cache.put(ean, response.status_code, data)
+            _requests_total.inc(("found",))
+            logger.info(f"Dados do produto EAN {ean} obtidos com sucesso.")
+            return {"status_code": response.status_code, "data": data}
+
+        except requests.exceptions.HTTPError as http_err:
+            status_code = http_err.response.status_code
+            response_text = http_err.response.text
+            if status_code == 401:
+                logger.error(f"Erro de autenticação (401) ao consultar API Cosmos para EAN {ean}. Verifique o COSMOS_API_TOKEN. Detalhes: {response_text}")
+            elif status_code == 403:
+                logger.error(f"Acesso negado (403) ao consultar API Cosmos para EAN {ean}. Verifique as permissões do token. Detalhes: {response_text}")
+            elif status_code == 404:
+                logger.warning(f"Recurso não encontrado (404) na API Cosmos para EAN {ean}. O produto pode não existir. Detalhes: {response_text}")
+                self.cache.put(ean, status_code)
+                _requests_total.inc(("not_found",))
+                return None
+            elif status_code == 422:
+                logger.error(f"Erro de negócio/validação (422) ao consultar API Cosmos para EAN {ean}. Verifique os dados enviados. Detalhes: {response_text}")
+            elif status_code == 429:
+                logger.warning(f"Limite de requisições excedido (429) para a API Cosmos ao consultar EAN {ean}. Tente novamente mais tarde. Detalhes: {response_text}")
+                self.limiter.penalize(self._retry_after(http_err.response))
+                _requests_total.inc(("rate_limited",))
+                return {"status_code": status_code, "message": response_text}
+            elif 400 <= status_code < 500:
+                logger.error(f"Erro do cliente HTTP ({status_code}) ao consultar API Cosmos para EAN {ean}: {http_err} - Response: {response_text}")
+            elif 500 <= status_code < 600:
+                logger.error(f"Erro de servidor HTTP ({status_code}) da API Cosmos ao consultar EAN {ean}: {http_err} - Response: {response_text}")
+            else:
+                logger.error(f"Erro HTTP inesperado ({status_code}) ao consultar API Cosmos para EAN {ean}: {http_err} - Response: {response_text}")
+        except requests.exceptions.ConnectionError as conn_err:
+            logger.error(f"Erro de conexão ao tentar acessar API Cosmos para EAN {ean}: {conn_err}")
+        except requests.exceptions.Timeout as timeout_err:
+            logger.error(f"Timeout ao tentar acessar API Cosmos para EAN {ean}: {timeout_err}")
+        except requests.exceptions.RequestException as req_err:
+            logger.error(f"Erro geral na requisição para API Cosmos para EAN {ean}: {req_err}")
+        except json.JSONDecodeError as json_err:
+            logger.error(f"Erro ao decodificar JSON da resposta da API Cosmos para EAN {ean}: {json_err} - Response: {response.text if 'response' in locals() else 'N/A'}")
+
+        _requests_total.inc(("error",))
+        return None
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        try:
+            return float(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER_SECONDS))
+        except (TypeError, ValueError):
+            return DEFAULT_RETRY_AFTER_SECONDS
+
+
+# Cliente global do processo, compartilhado por todas as sessões Flet
+cosmos_client = CosmosClient()
+
 
 def fetch_product_info_by_ean(ean: str) -> dict | None:
     """
-    Consulta informações de um produto pelo código EAN na API Cosmos.
+    Consulta informações de um produto pelo código EAN na API Cosmos (com cache).
 
     Args:
         ean: O código EAN (GTIN) do produto a ser consultado.
@@ -28,49 +265,13 @@ def fetch_product_info_by_ean(ean: str) -> dict | None:
     Returns:
         Um dicionário com os dados do produto se encontrado, None caso contrário ou em caso de erro.
     """
-    if not COSMOS_API_TOKEN:
-        logger.error("Token da API Cosmos não configurado. Verifique a variável de ambiente COSMOS_API_TOKEN.")
-        return None
+    return cosmos_client.fetch(ean)
+
+
+async def fetch_product_info_by_ean_async(ean: str) -> dict | None:
+    """Versão assíncrona de fetch_product_info_by_ean."""
+    return await cosmos_client.fetch_async(ean)
 
-    url = f"{COSMOS_BASE_URL}/{ean}.json"
-
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=10) # Adicionado timeout
-        response.raise_for_status()  # Levanta uma exceção para respostas de erro HTTP (4xx ou 5xx)
-        result = {"status_code": response.status_code, "data": response.json()}
-        logger.info(f"Dados do produto EAN {ean} obtidos com sucesso.")
-        return result
-
-    except requests.exceptions.HTTPError as http_err:
-        status_code = http_err.response.status_code
-        response_text = http_err.response.text
-        if status_code == 401:
-            logger.error(f"Erro de autenticação (401) ao consultar API Cosmos para EAN {ean}. Verifique o COSMOS_API_TOKEN. Detalhes: {response_text}")
-        elif status_code == 403:
-            logger.error(f"Acesso negado (403) ao consultar API Cosmos para EAN {ean}. Verifique as permissões do token. Detalhes: {response_text}")
-        elif status_code == 404:
-            logger.warning(f"Recurso não encontrado (404) na API Cosmos para EAN {ean}. O produto pode não existir. Detalhes: {response_text}")
-        elif status_code == 422:
-            logger.error(f"Erro de negócio/validação (422) ao consultar API Cosmos para EAN {ean}. Verifique os dados enviados. Detalhes: {response_text}")
-        elif status_code == 429:
-            logger.warning(f"Limite de requisições excedido (429) para a API Cosmos ao consultar EAN {ean}. Tente novamente mais tarde. Detalhes: {response_text}")
-            return {"status_code": status_code, "message": response_text}
-        elif 400 <= status_code < 500:
-            logger.error(f"Erro do cliente HTTP ({status_code}) ao consultar API Cosmos para EAN {ean}: {http_err} - Response: {response_text}")
-        elif 500 <= status_code < 600:
-            logger.error(f"Erro de servidor HTTP ({status_code}) da API Cosmos ao consultar EAN {ean}: {http_err} - Response: {response_text}")
-        else:
-            logger.error(f"Erro HTTP inesperado ({status_code}) ao consultar API Cosmos para EAN {ean}: {http_err} - Response: {response_text}")
-    except requests.exceptions.ConnectionError as conn_err:
-        logger.error(f"Erro de conexão ao tentar acessar API Cosmos para EAN {ean}: {conn_err}")
-    except requests.exceptions.Timeout as timeout_err:
-        logger.error(f"Timeout ao tentar acessar API Cosmos para EAN {ean}: {timeout_err}")
-    except requests.exceptions.RequestException as req_err:
-        logger.error(f"Erro geral na requisição para API Cosmos para EAN {ean}: {req_err}")
-    except json.JSONDecodeError as json_err:
-        logger.error(f"Erro ao decodificar JSON da resposta da API Cosmos para EAN {ean}: {json_err} - Response: {response.text if 'response' in locals() else 'N/A'}")
-
-    return None
 
 # if __name__ == '__main__':
 #     # Exemplo de uso (apenas para teste direto do script)
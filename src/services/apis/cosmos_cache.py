@@ -0,0 +1,147 @@
+# cosmos_cache.py
+"""
+Cache persistente (SQLite) das consultas de GTIN/EAN na API Cosmos.
+
+Compartilhado por todas as empresas: os dados de um GTIN (descrição, marca, NCM) são
+públicos e não dependem do tenant. Resultados encontrados e não encontrados (404) têm
+TTLs distintos; erros e 429 não são armazenados.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from src.shared.env import env_int, env_str
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS gtin_cache (
+    gtin TEXT PRIMARY KEY,
+    status_code INTEGER NOT NULL,
+    payload TEXT,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+def normalize_gtin(ean: str) -> str:
+    """Chave do cache: somente dígitos, completado com zeros à esquerda até 14 (GTIN-14)."""
+    digits = "".join(ch for ch in str(ean) if ch.isdigit())
+    return digits.zfill(14) if digits else ""
+
+
+class GtinCache:
+    """Cache de GTINs em SQLite, seguro para uso por várias threads."""
+
+    def __init__(self, path: str | None = None, found_ttl_seconds: int | None = None,
+                 not_found_ttl_seconds: int | None = None):
+        # None: COSMOS_CACHE_PATH e os TTLs vêm do .env ao abrir o banco / no primeiro get
+        self._path = path
+        self._found_ttl_seconds = found_ttl_seconds
+        self._not_found_ttl_seconds = not_found_ttl_seconds
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def found_ttl_seconds(self) -> int:
+        if self._found_ttl_seconds is None:
+            self._found_ttl_seconds = env_int('COSMOS_CACHE_FOUND_TTL_DAYS', 30) * 86400
+        return self._found_ttl_seconds
+
+    @property
+    def not_found_ttl_seconds(self) -> int:
+        if self._not_found_ttl_seconds is None:
+            self._not_found_ttl_seconds = env_int('COSMOS_CACHE_NOT_FOUND_TTL_HOURS', 24) * 3600
+        return self._not_found_ttl_seconds
+
+    def _connection(self) -> sqlite3.Connection:
+        # Chamado com self._lock adquirido
+        if self._conn is None:
+            path = self._path or env_str('COSMOS_CACHE_PATH', os.path.join('cache', 'cosmos_gtin.sqlite3'))
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+            logger.info(f"Cache de GTINs da API Cosmos aberto em {path}")
+        return self._conn
+
+    def get_many(self, gtins: list[str]) -> dict[str, tuple[int, Any]]:
+        """
+        Retorna as entradas válidas (não expiradas) dos GTINs informados.
+
+        Returns:
+            dict[str, tuple[int, Any]]: gtin -> (status_code, dados); dados é None para 404.
+        """
+        keys = list(dict.fromkeys(normalize_gtin(g) for g in gtins if normalize_gtin(g)))
+        if not keys:
+            return {}
+
+        found: dict[str, tuple[int, Any]] = {}
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                # Limite de variáveis do SQLite: consulta em blocos
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT gtin, status_code, payload FROM gtin_cache "
+                        f"WHERE gtin IN ({placeholders}) AND expires_at > ?",
+                        (*chunk, now),
+                    ).fetchall()
+                    for gtin, status_code, payload in rows:
+                        found[gtin] = (status_code, json.loads(payload) if payload else None)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Erro ao ler o cache de GTINs: {e}")
+        return found
+
+    def get(self, gtin: str) -> tuple[int, Any] | None:
+        return self.get_many([gtin]).get(normalize_gtin(gtin))
+
+    def put(self, gtin: str, status_code: int, data: Any = None) -> None:
+        """Armazena o resultado de uma consulta (200 com dados ou 404)."""
+        key = normalize_gtin(gtin)
+        if not key:
+            return
+        ttl = self.found_ttl_seconds if status_code == 200 else self.not_found_ttl_seconds
+        now = time.time()
+        payload = json.dumps(data, ensure_ascii=False) if data is not None else None
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO gtin_cache (gtin, status_code, payload, fetched_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, status_code, payload, now, now + ttl),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Erro ao gravar o GTIN {key} no cache: {e}")
+
+    def purge_expired(self) -> int:
+        """Remove as entradas expiradas. Retorna a quantidade removida."""
+        try:
+            with self._lock:
+                conn = self._connection()
+                cursor = conn.execute("DELETE FROM gtin_cache WHERE expires_at <= ?", (time.time(),))
+                conn.commit()
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Erro ao limpar o cache de GTINs: {e}")
+            return 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
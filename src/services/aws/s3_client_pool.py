@@ -0,0 +1,121 @@
+# s3_client_pool.py
+"""
+Cliente S3 compartilhado por todo o processo.
+
+Clientes boto3 são thread-safe e mantêm um pool de conexões HTTP (keep-alive): criar um
+cliente por operação refaz a resolução de credenciais, a carga dos modelos do botocore e
+o handshake TLS a cada upload. Aqui o cliente é criado uma única vez, com pool de conexões
+dimensionado para os uploads concorrentes, e reaproveitado por todas as sessões Flet.
+
+Também ficam aqui a TransferConfig (multipart e envio concorrente das partes) e o
+executor dedicado às operações assíncronas do S3FileManager.
+
+Variáveis do .env (lidas ao criar o cliente, a TransferConfig e o executor; ver src.shared.env):
+- AWS_S3_ENDPOINT_URL: endpoint alternativo (MinIO, moto server); vazio usa a AWS.
+- S3_MAX_POOL_CONNECTIONS: conexões HTTP do pool do cliente (padrão 32).
+- S3_MULTIPART_THRESHOLD_MB / S3_MULTIPART_CHUNKSIZE_MB: multipart a partir de / tamanho
+  das partes (padrão 8 MB / 8 MB).
+- S3_TRANSFER_MAX_CONCURRENCY: partes enviadas em paralelo por arquivo (padrão 8).
+- S3_EXECUTOR_WORKERS: threads do executor das operações assíncronas (padrão 16).
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+from src.shared.env import env_int, env_str
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+_lock = threading.Lock()
+_client = None
+_transfer_config: TransferConfig | None = None
+_executor: ThreadPoolExecutor | None = None
+
+
+def get_endpoint_url() -> str | None:
+    """Endpoint S3 alternativo (AWS_S3_ENDPOINT_URL), ou None para a AWS."""
+    return env_str('AWS_S3_ENDPOINT_URL') or None
+
+
+def get_s3_client():
+    """Retorna o cliente S3 do processo, criando-o na primeira chamada."""
+    global _client
+    if _client is not None:
+        return _client
+
+    with _lock:
+        if _client is None:
+            max_pool_connections = env_int('S3_MAX_POOL_CONNECTIONS', 32)
+            config = Config(
+                max_pool_connections=max_pool_connections,
+                retries={"max_attempts": 5, "mode": "adaptive"},
+                connect_timeout=5,
+                read_timeout=60,
+                tcp_keepalive=True,
+            )
+            _client = boto3.client(
+                's3',
+                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+                region_name=os.getenv('AWS_DEFAULT_REGION'),
+                endpoint_url=get_endpoint_url(),
+                config=config,
+            )
+            logger.info(f"Cliente S3 compartilhado criado (max_pool_connections={max_pool_connections})")
+        return _client
+
+
+def get_transfer_config() -> TransferConfig:
+    """TransferConfig usada nos uploads: multipart e envio concorrente das partes."""
+    global _transfer_config
+    if _transfer_config is not None:
+        return _transfer_config
+
+    with _lock:
+        if _transfer_config is None:
+            _transfer_config = TransferConfig(
+                multipart_threshold=env_int('S3_MULTIPART_THRESHOLD_MB', 8) * MB,
+                multipart_chunksize=env_int('S3_MULTIPART_CHUNKSIZE_MB', 8) * MB,
+                max_concurrency=env_int('S3_TRANSFER_MAX_CONCURRENCY', 8),
+                use_threads=True,
+            )
+        return _transfer_config
+
+
+def get_s3_executor() -> ThreadPoolExecutor:
+    """
+    Executor dedicado às operações assíncronas do S3.
+
+    Separado do executor padrão do event loop (usado pelo Flet para os handlers síncronos),
+    para que uploads em lote não deixem as sessões sem threads.
+    """
+    global _executor
+    if _executor is not None:
+        return _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=env_int('S3_EXECUTOR_WORKERS', 16),
+                thread_name_prefix="s3",
+            )
+        return _executor
+
+
+def reset_s3_client() -> None:
+    """Descarta o cliente, a TransferConfig e o executor (ex.: após trocar as credenciais no .env)."""
+    global _client, _transfer_config, _executor
+    with _lock:
+        executor = _executor
+        _client = None
+        _transfer_config = None
+        _executor = None
+    if executor is not None:
+        executor.shutdown(wait=True)
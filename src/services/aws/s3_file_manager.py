@@ -1,9 +1,18 @@
-import boto3
+import asyncio
+import functools
 import os
 
 # import boto3.exceptions
 from botocore.exceptions import ClientError
-from dotenv import load_dotenv
+
+from src.services.aws.s3_client_pool import get_endpoint_url, get_s3_client, get_s3_executor, get_transfer_config
+
+# Limite de chaves por requisição do DeleteObjects
+DELETE_BATCH_SIZE = 1000
+
+# Prefixos do bucket: público (imagens, logos) e privado (acesso somente por URL pré-assinada)
+PUBLIC_PREFIX = 'estoquerapido/public'
+PRIVATE_PREFIX = 'estoquerapido/private'
 
 
 class S3FileManager:
@@ -13,39 +22,40 @@ class S3FileManager:
     Esta classe fornece métodos para gerenciar operações básicas de arquivos no Amazon S3,
     incluindo upload, deleção e verificação de existência de arquivos.
 
+    O cliente boto3 é compartilhado pelo processo (ver s3_client_pool.py); instanciar
+    esta classe é barato. Os métodos *_async executam a operação no executor dedicado ao S3.
+
     Attributes:
-        s3_client: Cliente boto3 para interação com o S3.
+        s3_client: Cliente boto3 compartilhado para interação com o S3.
         bucket (str): Nome do bucket S3 onde os arquivos serão armazenados.
         prefix (str): Prefixo padrão para todas as operações no bucket.
     """
 
-    def __init__(self):
+    def __init__(self, prefix: str = PUBLIC_PREFIX):
         """
         Inicializa o gerenciador de arquivos S3 com as configurações padrão.
 
-        O cliente S3 é configurado usando as credenciais padrão do ambiente.
-        O bucket e o prefixo são definidos com valores predeterminados.
-        """
-        load_dotenv()
+        O cliente S3 é o cliente compartilhado do processo, configurado com as credenciais
+        do .env (carregado pelo main.py). O bucket vem do .env; o prefixo padrão é o público.
 
+        Args:
+            prefix (str): Prefixo das chaves (PUBLIC_PREFIX ou PRIVATE_PREFIX).
+        """
         self.region_name = os.getenv('AWS_DEFAULT_REGION')
         self.bucket = os.getenv('AWS_S3_BUCKET_NAME')
+        self.endpoint_url = get_endpoint_url()
 
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-            region_name=self.region_name,
-        )
+        self.s3_client = get_s3_client()
 
-        self.prefix = 'estoquerapido/public'
+        self.prefix = prefix
         self._relativ_key = ''
 
-    def get_url(self) -> str:
+    def get_url(self, key: str | None = None) -> str:
         """
         Constrói a url completa do arquivo no S3.
 
-        Args: None
+        Args:
+            key (str | None): Chave relativa do arquivo. Se omitida, usa a chave da última operação.
 
         Returns:
             str: URL completa.
@@ -54,7 +64,25 @@ class S3FileManager:
             Para key="pasta/arquivo.txt" e prefix="estoquerapido/public",
             retorna "https://<bucket>.s3.<region>.amazonaws.com/estoquerapido/public/pasta/arquivo.txt"
         """
-        return f"https://{self.bucket}.s3.{self.region_name}.amazonaws.com/{self._relativ_key}"
+        full_key = self._get_full_key(key) if key is not None else self._relativ_key
+        if self.endpoint_url:
+            # Endpoint alternativo (MinIO, moto server): url no estilo path
+            return f"{self.endpoint_url.rstrip('/')}/{self.bucket}/{full_key}"
+        return f"https://{self.bucket}.s3.{self.region_name}.amazonaws.com/{full_key}"
+
+    def get_presigned_url(self, key: str, expires_in: int = 3600, download_name: str | None = None) -> str:
+        """
+        Gera uma URL temporária (pré-assinada) para baixar o arquivo, válida por `expires_in` segundos.
+
+        Args:
+            key (str): Chave relativa do arquivo.
+            expires_in (int): Validade da URL em segundos.
+            download_name (str | None): Nome sugerido ao navegador (Content-Disposition: attachment).
+        """
+        params = {"Bucket": self.bucket, "Key": self._get_full_key(key)}
+        if download_name:
+            params["ResponseContentDisposition"] = f'attachment; filename="{download_name}"'
+        return self.s3_client.generate_presigned_url("get_object", Params=params, ExpiresIn=expires_in)
 
     def _get_full_key(self, key: str) -> str:
         """
@@ -74,13 +102,15 @@ class S3FileManager:
         self._relativ_key = f"{self.prefix}/{clean_key}"
         return self._relativ_key
 
-    def upload(self, local_path: str, key: str):
+    def upload(self, local_path: str, key: str, content_type: str | None = None, cache_control: str | None = None):
         """
         Faz upload de um arquivo local para o S3.
 
         Args:
             local_path (str): Caminho completo do arquivo local a ser enviado.
             key (str): Chave relativa onde o arquivo será armazenado no S3.
+            content_type (str | None): Content-Type do objeto (ex.: "image/webp").
+            cache_control (str | None): Header Cache-Control servido pelo S3.
 
         Raises:
             boto3.exceptions.S3UploadFailedError: Se o upload falhar.
@@ -91,7 +121,13 @@ class S3FileManager:
             >>> s3_manager.upload('/path/local/arquivo.txt', 'pasta/arquivo.txt')
         """
         full_key = self._get_full_key(key)
-        self.s3_client.upload_file(local_path, self.bucket, full_key)
+        extra_args = {}
+        if content_type:
+            extra_args['ContentType'] = content_type
+        if cache_control:
+            extra_args['CacheControl'] = cache_control
+        self.s3_client.upload_file(
+            local_path, self.bucket, full_key, ExtraArgs=extra_args or None, Config=get_transfer_config())
 
     def delete(self, key: str) -> bool:
         """
@@ -147,6 +183,68 @@ class S3FileManager:
                 return False
             raise
 
+    def delete_many(self, keys: list[str]) -> dict[str, bool]:
+        """
+        Remove vários arquivos do S3 com DeleteObjects (até 1000 chaves por requisição).
+
+        Args:
+            keys (list[str]): Chaves relativas dos arquivos a serem removidos.
+
+        Returns:
+            dict[str, bool]: Para cada chave relativa, True se foi removida.
+
+        Example:
+            >>> s3_manager = S3FileManager()
+            >>> s3_manager.delete_many(['pasta/a.webp', 'pasta/b.webp'])
+        """
+        full_keys = {f"{self.prefix}/{key.lstrip('/')}": key for key in dict.fromkeys(keys)}
+        results = {key: False for key in full_keys.values()}
+        pending = list(full_keys)
+
+        for start in range(0, len(pending), DELETE_BATCH_SIZE):
+            chunk = pending[start:start + DELETE_BATCH_SIZE]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={"Objects": [{"Key": full_key} for full_key in chunk], "Quiet": False},
+                )
+            except ClientError:
+                continue
+            for deleted in response.get('Deleted', []):
+                key = full_keys.get(deleted.get('Key'))
+                if key is not None:
+                    results[key] = True
+
+        return results
+
+    @staticmethod
+    async def _run(func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_s3_executor(), functools.partial(func, *args, **kwargs))
+
+    async def upload_async(self, local_path: str, key: str, content_type: str | None = None,
+                           cache_control: str | None = None) -> str:
+        """
+        Versão assíncrona de upload, executada no executor do S3.
+
+        Returns:
+            str: URL completa do arquivo enviado.
+        """
+        await self._run(self.upload, local_path, key, content_type=content_type, cache_control=cache_control)
+        return self.get_url(key)
+
+    async def delete_async(self, key: str) -> bool:
+        """Versão assíncrona de delete, executada no executor do S3."""
+        return await self._run(self.delete, key)
+
+    async def exists_async(self, key: str) -> bool:
+        """Versão assíncrona de exists, executada no executor do S3."""
+        return await self._run(self.exists, key)
+
+    async def delete_many_async(self, keys: list[str]) -> dict[str, bool]:
+        """Versão assíncrona de delete_many, executada no executor do S3."""
+        return await self._run(self.delete_many, keys)
+
 
 # Exemplo de uso
 """
@@ -5,8 +5,32 @@ class BucketServices:
     def __init__(self, adapter: BucketStorage):
         self.adapter = adapter
 
-    def upload(self, local_path: str, key: str) -> str:
-        return self.adapter.upload(local_path, key)
+    def upload(self, local_path: str, key: str, content_type: str | None = None, cache_control: str | None = None) -> str:
+        return self.adapter.upload(local_path, key, content_type=content_type, cache_control=cache_control)
 
     def delete(self, key: str) -> bool:
         return self.adapter.delete(key)
+
+    def delete_many(self, keys: list[str]) -> dict[str, bool]:
+        return self.adapter.delete_many(keys)
+
+    def exists(self, key: str) -> bool:
+        return self.adapter.exists(key)
+
+    def get_url(self, key: str) -> str:
+        return self.adapter.get_url(key)
+
+    def get_download_url(self, key: str, expires_in: int = 3600, download_name: str | None = None) -> str:
+        return self.adapter.get_download_url(key, expires_in=expires_in, download_name=download_name)
+
+    async def upload_async(self, local_path: str, key: str, content_type: str | None = None, cache_control: str | None = None) -> str:
+        return await self.adapter.upload_async(local_path, key, content_type=content_type, cache_control=cache_control)
+
+    async def delete_async(self, key: str) -> bool:
+        return await self.adapter.delete_async(key)
+
+    async def delete_many_async(self, keys: list[str]) -> dict[str, bool]:
+        return await self.adapter.delete_many_async(keys)
+
+    async def exists_async(self, key: str) -> bool:
+        return await self.adapter.exists_async(key)
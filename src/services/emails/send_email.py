@@ -9,16 +9,39 @@ from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
 import smtplib # Adicionado para o método síncrono direto
-from tenacity import retry, stop_after_attempt, wait_exponential
+import time
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 import aiosmtplib
 from dotenv import load_dotenv
 from pathlib import Path
 
+from src.services.emails.smtp_pool import SmtpConnectionPool, get_smtp_pool
+from src.shared.metrics import metrics_registry
+
 # Configuração de logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_email_messages_total = metrics_registry.counter(
+    "estoquerapido_email_messages_total",
+    "Emails processados pelo ModernEmailSender, por resultado.",
+    ("outcome",),
+)
+_email_send_seconds = metrics_registry.histogram(
+    "estoquerapido_email_send_seconds",
+    "Tempo de envio de cada email (incluindo novas tentativas) em segundos.",
+    (),
+)
+_email_bulk_throughput = metrics_registry.gauge(
+    "estoquerapido_email_bulk_throughput_per_second",
+    "Vazão (emails/s) do último envio em lote.",
+    (),
+)
+
+# Tipos de erro que justificam nova tentativa (falhas de rede e respostas 4xx do servidor)
+TRANSIENT_ERROR_TYPES = {"CONNECTION_ERROR", "TEMPORARY_FAILURE"}
+
 
 @dataclass
 class EmailConfig:
@@ -30,6 +53,7 @@ class EmailConfig:
     sender_email: str
     use_tls: bool = True
     timeout: int = 30
+    use_auth: bool = True  # False para servidores locais sem AUTH (ex.: aiosmtpd em testes)
 
 @dataclass
 class EmailMessage:
@@ -93,15 +117,18 @@ class ModernEmailSender:
     múltiplas cartas simultaneamente e com diferentes formatos
     """
 
-    def __init__(self, config: EmailConfig):
+    def __init__(self, config: EmailConfig, pool: Optional[SmtpConnectionPool] = None):
         self.config = config
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self._validate_config()
+        # Conexões autenticadas compartilhadas por todos os senders com a mesma configuração
+        self.pool = pool or get_smtp_pool(config)
 
     def _validate_config(self) -> None:
         """Valida a configuração do email"""
-        required_fields = ['smtp_server', 'smtp_port',
-                           'username', 'password', 'sender_email']
+        required_fields = ['smtp_server', 'smtp_port', 'sender_email']
+        if self.config.use_auth:
+            required_fields += ['username', 'password']
         for field in required_fields:
             if not getattr(self.config, field):
                 raise EmailValidationError(
@@ -193,14 +220,18 @@ class ModernEmailSender:
 
         return all_recipients
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def send_email_async(self, message: EmailMessage) -> Dict[str, Any]:
+    async def send_email_async(self, message: EmailMessage, max_attempts: Optional[int] = None) -> Dict[str, Any]:
         """
         Envia email de forma assíncrona com tratamento robusto de erros
 
+        A conexão SMTP vem do pool (sem novo connect/STARTTLS/LOGIN por mensagem). Falhas
+        transitórias (conexão, respostas 4xx) são repetidas com backoff exponencial; erros de
+        validação, autenticação e destinatário falham na hora.
+
         Returns:
             Dict com status do envio e informações
         """
+        started = time.perf_counter()
         try:
             # Validação prévia
             self._validate_email_message(message)
@@ -209,123 +240,136 @@ class ModernEmailSender:
             mime_msg = self._create_mime_message(message)
             all_recipients = self._get_all_recipients(message)
 
-            # Tentativa de conexão e envio
-            async with aiosmtplib.SMTP(
-                hostname=self.config.smtp_server,
-                port=self.config.smtp_port,
-                timeout=self.config.timeout
-            ) as smtp_client:
-
-                try:
-                    # Conectar ao servidor
-                    await smtp_client.connect()
-
-                    if self.config.use_tls:
-                        await smtp_client.starttls()
-
-                    # Autenticar
-                    await smtp_client.login(
-                        self.config.username,
-                        self.config.password
-                    )
-
-                    # Enviar o email
-                    await smtp_client.send_message(
-                        mime_msg,
-                        sender=self.config.sender_email,
-                        recipients=all_recipients
-                    )
-
-                    await smtp_client.quit()
-
-                except aiosmtplib.SMTPConnectError as e:
-                    raise EmailConnectionError(
-                        f"Não foi possível conectar ao servidor SMTP {self.config.smtp_server}:{self.config.smtp_port}",
-                        original_error=e
-                    )
-
-                except aiosmtplib.SMTPAuthenticationError as e:
-                    raise EmailAuthenticationError(
-                        "Falha na autenticação. Verifique usuário e senha",
-                        original_error=e
-                    )
-
-                except aiosmtplib.SMTPRecipientsRefused as e:
-                    # Extrair emails que foram rejeitados
-                    rejected_emails = list(e.recipients.keys()) if hasattr(  # type: ignore [Stubs de tipo incompletos ou desatualizados]
-                        e, 'recipients') else []
-                    raise EmailRecipientError(
-                        f"Destinatários rejeitados pelo servidor: {', '.join(rejected_emails)}",
-                        invalid_emails=rejected_emails,
-                        original_error=e
-                    )
-
-                except aiosmtplib.SMTPDataError as e:
-                    error_msg = str(e)
-                    if "quota" in error_msg.lower():
-                        raise EmailSendError(
-                            "Cota de email excedida. Tente novamente mais tarde",
-                            error_type="QUOTA_EXCEEDED",
-                            original_error=e
-                        )
-                    elif "spam" in error_msg.lower():
-                        raise EmailSendError(
-                            "Email rejeitado por filtro anti-spam",
-                            error_type="SPAM_REJECTED",
-                            original_error=e
-                        )
-                    else:
-                        raise EmailSendError(
-                            f"Erro no conteúdo do email: {error_msg}",
-                            error_type="DATA_ERROR",
-                            original_error=e
-                        )
-
-                except aiosmtplib.SMTPServerDisconnected as e:
-                    raise EmailConnectionError(
-                        "Conexão com servidor perdida durante o envio",
-                        original_error=e
-                    )
+            attempts = 0
+            async for attempt in self._retrying(max_attempts):
+                with attempt:
+                    attempts = attempt.retry_state.attempt_number
+                    await self._send_once(mime_msg, all_recipients)
 
-                except asyncio.TimeoutError as e:
-                    raise EmailConnectionError(
-                        f"Timeout na conexão ({self.config.timeout}s). Servidor pode estar sobrecarregado",
-                        original_error=e
-                    )
+            self.logger.info(
+                f"Email enviado com sucesso para {len(all_recipients)} destinatários")
+            _email_messages_total.inc(("success",))
 
-                except Exception as e:
-                    # Captura outros erros não específicos
-                    raise EmailSendError(
-                        f"Erro inesperado no envio: {str(e)}",
-                        error_type="UNEXPECTED_ERROR",
-                        original_error=e
-                    )
-
-                self.logger.info(
-                    f"Email enviado com sucesso para {len(all_recipients)} destinatários")
-
-                return {
-                    'success': True,
-                    'message': 'Email enviado com sucesso',
-                    'recipients_count': len(all_recipients),
-                    'subject': message.subject
-                }
+            return {
+                'success': True,
+                'message': 'Email enviado com sucesso',
+                'recipients_count': len(all_recipients),
+                'subject': message.subject,
+                'attempts': attempts
+            }
 
         except EmailValidationError as e:
             self.logger.error(f"Erro de validação: {e}")
+            _email_messages_total.inc(("invalid",))
             raise
 
         except (EmailConnectionError, EmailAuthenticationError, EmailRecipientError, EmailSendError) as e:
             self.logger.error(f"Erro no envio de email: {e}")
+            _email_messages_total.inc(("error",))
             raise
 
         except Exception as e:
             self.logger.error(f"Erro inesperado: {e}")
+            _email_messages_total.inc(("error",))
             raise EmailSendError(
                 f"Erro inesperado no sistema de email: {str(e)}",
                 error_type="SYSTEM_ERROR",
                 original_error=e
             )
+        finally:
+            _email_send_seconds.observe((), time.perf_counter() - started)
+
+    def _retrying(self, max_attempts: Optional[int] = None) -> AsyncRetrying:
+        attempts = max_attempts or int(os.getenv('EMAIL_MAX_ATTEMPTS', '3'))
+        return AsyncRetrying(
+            stop=stop_after_attempt(attempts),
+            wait=wait_exponential_jitter(initial=1, max=10),
+            retry=retry_if_exception(
+                lambda e: isinstance(e, EmailSendError) and e.error_type in TRANSIENT_ERROR_TYPES),
+            reraise=True,
+        )
+
+    async def _send_once(self, mime_msg: MIMEMultipart, all_recipients: List[str]) -> None:
+        """Uma tentativa de envio pelo pool, convertendo erros do aiosmtplib nas exceções de domínio"""
+        try:
+            await self.pool.send_message(
+                mime_msg,
+                sender=self.config.sender_email,
+                recipients=all_recipients
+            )
+
+        except aiosmtplib.SMTPAuthenticationError as e:
+            raise EmailAuthenticationError(
+                "Falha na autenticação. Verifique usuário e senha",
+                original_error=e
+            )
+
+        except aiosmtplib.SMTPRecipientsRefused as e:
+            # Extrair emails que foram rejeitados
+            rejected_emails = [getattr(r, 'recipient', str(r)) for r in e.recipients]
+            raise EmailRecipientError(
+                f"Destinatários rejeitados pelo servidor: {', '.join(rejected_emails)}",
+                invalid_emails=rejected_emails,
+                original_error=e
+            )
+
+        except aiosmtplib.SMTPDataError as e:
+            error_msg = str(e)
+            if "quota" in error_msg.lower():
+                raise EmailSendError(
+                    "Cota de email excedida. Tente novamente mais tarde",
+                    error_type="QUOTA_EXCEEDED",
+                    original_error=e
+                )
+            elif "spam" in error_msg.lower():
+                raise EmailSendError(
+                    "Email rejeitado por filtro anti-spam",
+                    error_type="SPAM_REJECTED",
+                    original_error=e
+                )
+            elif 400 <= e.code < 500:
+                raise EmailSendError(
+                    f"Falha temporária no servidor: {error_msg}",
+                    error_type="TEMPORARY_FAILURE",
+                    original_error=e
+                )
+            else:
+                raise EmailSendError(
+                    f"Erro no conteúdo do email: {error_msg}",
+                    error_type="DATA_ERROR",
+                    original_error=e
+                )
+
+        except (aiosmtplib.SMTPConnectError, aiosmtplib.SMTPServerDisconnected) as e:
+            raise EmailConnectionError(
+                f"Conexão com servidor SMTP {self.config.smtp_server}:{self.config.smtp_port} falhou ou foi perdida",
+                original_error=e
+            )
+
+        except (asyncio.TimeoutError, aiosmtplib.SMTPTimeoutError) as e:
+            raise EmailConnectionError(
+                f"Timeout na conexão ({self.config.timeout}s). Servidor pode estar sobrecarregado",
+                original_error=e
+            )
+
+        except aiosmtplib.SMTPResponseException as e:
+            if 400 <= e.code < 500:
+                raise EmailSendError(
+                    f"Falha temporária no servidor: {e}",
+                    error_type="TEMPORARY_FAILURE",
+                    original_error=e
+                )
+            raise EmailSendError(
+                f"Erro inesperado no envio: {str(e)}",
+                error_type="UNEXPECTED_ERROR",
+                original_error=e
+            )
+
+        except OSError as e:
+            raise EmailConnectionError(
+                f"Não foi possível conectar ao servidor SMTP {self.config.smtp_server}:{self.config.smtp_port}",
+                original_error=e
+            )
 
     def send_email_sync(self, message: EmailMessage) -> Dict[str, Any]:
         """
@@ -333,7 +377,14 @@ class ModernEmailSender:
 
         Útil quando você não está em contexto assíncrono
         """
-        return asyncio.run(self.send_email_async(message))
+        async def send_and_close() -> Dict[str, Any]:
+            try:
+                return await self.send_email_async(message)
+            finally:
+                # As conexões pertencem ao loop criado por asyncio.run, que será encerrado
+                await self.pool.close()
+
+        return asyncio.run(send_and_close())
 
     def send_email_sync_direct(self, message: EmailMessage) -> Dict[str, Any]:
         """
@@ -389,28 +440,51 @@ class ModernEmailSender:
             self.logger.error(f"Erro inesperado no envio síncrono direto: {e}", exc_info=True)
             raise EmailSendError(f"Erro inesperado no envio síncrono direto: {str(e)}", error_type="SYSTEM_ERROR_SYNC_DIRECT", original_error=e)
 
-    async def send_bulk_emails_async(self, messages: List[EmailMessage]) -> List[Dict[str, Any]]:
+    async def send_bulk_emails_async(self, messages: List[EmailMessage], concurrency: Optional[int] = None,
+                                     max_attempts: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Envia múltiplos emails simultaneamente
+        Envia múltiplos emails com concorrência limitada
 
         Analogia: Como uma máquina de franquear cartas que processa
-        várias correspondências ao mesmo tempo
+        várias correspondências ao mesmo tempo, sem abrir um guichê por carta
+
+        Apenas `concurrency` envios (padrão: SMTP_BULK_CONCURRENCY ou o tamanho do pool) ficam
+        em andamento; cada mensagem tem suas próprias novas tentativas. Os resultados seguem a
+        ordem de `messages`.
         """
-        tasks = [self.send_email_async(msg) for msg in messages]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append({
-                    'success': False,
-                    'error': str(result),
-                    'message_index': i
-                })
-            else:
-                processed_results.append(result)
+        if not messages:
+            return []
+
+        workers = min(len(messages), concurrency or int(os.getenv('SMTP_BULK_CONCURRENCY', str(self.pool.max_size))))
+        results: List[Dict[str, Any]] = [{} for _ in messages]
+        pending = iter(enumerate(messages))
+        started = time.perf_counter()
+
+        async def worker() -> None:
+            # Um iterador compartilhado funciona como fila: cada worker pega a próxima mensagem
+            for i, msg in pending:
+                try:
+                    result = await self.send_email_async(msg, max_attempts=max_attempts)
+                    results[i] = {**result, 'message_index': i}
+                except Exception as e:
+                    results[i] = {
+                        'success': False,
+                        'error': str(e),
+                        'error_type': getattr(e, 'error_type', 'VALIDATION_ERROR'),
+                        'message_index': i
+                    }
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        elapsed = time.perf_counter() - started
+        sent = sum(1 for r in results if r.get('success'))
+        throughput = sent / elapsed if elapsed > 0 else 0.0
+        _email_bulk_throughput.set((), throughput)
+        self.logger.info(
+            f"Envio em lote: {sent}/{len(messages)} emails em {elapsed:.2f}s "
+            f"({throughput:.1f} emails/s, {workers} envios simultâneos)")
 
-        return processed_results
+        return results
 
     def _validate_email_message(self, message: EmailMessage) -> None:
         """Valida a mensagem de email com tratamento específico de erros"""
@@ -506,7 +580,8 @@ def create_email_config_from_env() -> EmailConfig:
             '"').removesuffix('"'),
         sender_email=os.getenv('EMAIL_FROM', ''),
         use_tls=os.getenv('EMAIL_USE_TLS', 'true').lower() == 'true',
-        timeout=int(os.getenv('EMAIL_TIMEOUT', '30'))
+        timeout=int(os.getenv('EMAIL_TIMEOUT', '30')),
+        use_auth=os.getenv('EMAIL_USE_AUTH', 'true').lower() == 'true'
     )
 
 # ---------------------------------------------------------------------------------
@@ -0,0 +1,196 @@
+# smtp_pool.py
+"""
+Pool de conexões SMTP autenticadas (aiosmtplib) reaproveitadas entre envios.
+
+- Cada conexão faz connect/STARTTLS/LOGIN uma única vez e envia várias mensagens.
+- Conexões ociosas por mais de SMTP_HEALTH_CHECK_AFTER_SECONDS recebem um NOOP antes do
+  reuso; ociosas por mais de SMTP_MAX_IDLE_SECONDS são fechadas (o servidor já pode tê-las
+  derrubado).
+- Após SMTP_MAX_MESSAGES_PER_CONNECTION mensagens a conexão é reciclada (muitos provedores
+  limitam mensagens por sessão).
+- No máximo SMTP_POOL_SIZE sessões simultâneas por event loop; os demais envios aguardam.
+
+Conexões aiosmtplib pertencem ao event loop que as criou, por isso o pool guarda um
+conjunto de conexões por loop.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+from contextlib import suppress
+from email.message import Message
+from typing import Any
+
+import aiosmtplib
+
+from src.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_connections_opened_total = metrics_registry.counter(
+    "estoquerapido_smtp_connections_opened_total",
+    "Conexões SMTP abertas (connect + STARTTLS + LOGIN).",
+    ("server",),
+)
+_connections_closed_total = metrics_registry.counter(
+    "estoquerapido_smtp_connections_closed_total",
+    "Conexões SMTP fechadas pelo pool, por motivo.",
+    ("server", "reason"),
+)
+_connections_reused_total = metrics_registry.counter(
+    "estoquerapido_smtp_connections_reused_total",
+    "Envios que reaproveitaram uma conexão SMTP já autenticada.",
+    ("server",),
+)
+
+
+class _PooledConnection:
+    __slots__ = ("client", "messages_sent", "last_used")
+
+    def __init__(self, client: aiosmtplib.SMTP):
+        self.client = client
+        self.messages_sent = 0
+        self.last_used = time.monotonic()
+
+
+class _LoopPool:
+    """Conexões ociosas e semáforo de sessões de um event loop."""
+
+    def __init__(self, max_size: int):
+        self.idle: list[_PooledConnection] = []
+        self.semaphore = asyncio.Semaphore(max_size)
+
+
+class SmtpConnectionPool:
+    """
+    Pool de conexões SMTP para uma configuração (servidor, porta, usuário).
+
+    Args:
+        config (EmailConfig): Configuração do servidor.
+        max_size (int | None): Sessões simultâneas por event loop (SMTP_POOL_SIZE).
+        max_messages_per_connection (int | None): Mensagens por conexão antes de reciclar.
+        max_idle_seconds (float | None): Tempo ocioso máximo antes de descartar a conexão.
+        health_check_after_seconds (float | None): Tempo ocioso a partir do qual um NOOP é feito.
+    """
+
+    def __init__(self, config: Any, max_size: int | None = None, max_messages_per_connection: int | None = None,
+                 max_idle_seconds: float | None = None, health_check_after_seconds: float | None = None):
+        self.config = config
+        self.max_size = max_size or int(os.getenv('SMTP_POOL_SIZE', '4'))
+        self.max_messages_per_connection = (
+            max_messages_per_connection or int(os.getenv('SMTP_MAX_MESSAGES_PER_CONNECTION', '100'))
+        )
+        self.max_idle_seconds = max_idle_seconds or float(os.getenv('SMTP_MAX_IDLE_SECONDS', '60'))
+        self.health_check_after_seconds = (
+            health_check_after_seconds if health_check_after_seconds is not None
+            else float(os.getenv('SMTP_HEALTH_CHECK_AFTER_SECONDS', '10'))
+        )
+        self._label = f"{config.smtp_server}:{config.smtp_port}"
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPool]" = weakref.WeakKeyDictionary()
+
+    def _state(self) -> _LoopPool:
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = _LoopPool(self.max_size)
+            self._states[loop] = state
+        return state
+
+    async def send_message(self, message: Message, sender: str, recipients: list[str]) -> Any:
+        """
+        Envia a mensagem por uma conexão do pool.
+
+        Exceções do aiosmtplib são propagadas; a conexão volta ao pool quando o servidor
+        respondeu (ex.: destinatário recusado) e é descartada em erros de conexão.
+        """
+        state = self._state()
+        async with state.semaphore:
+            conn = await self._checkout(state)
+            reusable = False
+            try:
+                result = await conn.client.send_message(message, sender=sender, recipients=recipients)
+                reusable = True
+                return result
+            except (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPSenderRefused, aiosmtplib.SMTPDataError):
+                # O servidor respondeu à transação: a sessão continua utilizável
+                reusable = True
+                raise
+            finally:
+                conn.messages_sent += 1
+                conn.last_used = time.monotonic()
+                if not reusable:
+                    await self._close(conn, "error")
+                elif conn.messages_sent >= self.max_messages_per_connection:
+                    await self._close(conn, "recycled")
+                else:
+                    state.idle.append(conn)
+
+    async def _checkout(self, state: _LoopPool) -> _PooledConnection:
+        # LIFO: a conexão usada mais recentemente é a que tem menos chance de ter caído
+        while state.idle:
+            conn = state.idle.pop()
+            idle_for = time.monotonic() - conn.last_used
+            if idle_for > self.max_idle_seconds or not conn.client.is_connected:
+                await self._close(conn, "idle")
+                continue
+            if idle_for > self.health_check_after_seconds:
+                try:
+                    await conn.client.noop()
+                except (aiosmtplib.SMTPException, OSError, asyncio.TimeoutError):
+                    await self._close(conn, "unhealthy")
+                    continue
+            _connections_reused_total.inc((self._label,))
+            return conn
+        return await self._open()
+
+    async def _open(self) -> _PooledConnection:
+        client = aiosmtplib.SMTP(
+            hostname=self.config.smtp_server,
+            port=self.config.smtp_port,
+            timeout=self.config.timeout,
+            start_tls=self.config.use_tls,
+        )
+        await client.connect()
+        try:
+            if self.config.use_auth:
+                await client.login(self.config.username, self.config.password)
+        except BaseException:
+            client.close()
+            raise
+        _connections_opened_total.inc((self._label,))
+        logger.debug(f"Conexão SMTP aberta com {self._label}")
+        return _PooledConnection(client)
+
+    async def _close(self, conn: _PooledConnection, reason: str) -> None:
+        _connections_closed_total.inc((self._label, reason))
+        if conn.client.is_connected:
+            try:
+                await asyncio.wait_for(conn.client.quit(), timeout=5)
+            except (aiosmtplib.SMTPException, OSError, asyncio.TimeoutError):
+                conn.client.close()
+
+    async def close(self) -> None:
+        """Fecha as conexões ociosas do event loop atual (ex.: antes de encerrar o loop)."""
+        state = self._states.pop(asyncio.get_running_loop(), None)
+        if state is None:
+            return
+        while state.idle:
+            with suppress(Exception):
+                await self._close(state.idle.pop(), "shutdown")
+
+
+_pools: dict[tuple, SmtpConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_smtp_pool(config: Any) -> SmtpConnectionPool:
+    """Retorna o pool do processo para a configuração (um por servidor/porta/usuário)."""
+    key = (config.smtp_server, config.smtp_port, config.username, config.use_tls, config.use_auth)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SmtpConnectionPool(config)
+            _pools[key] = pool
+        return pool
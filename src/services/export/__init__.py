@@ -0,0 +1,3 @@
+from .export_datasets import EXPORT_DATASETS, ExportColumn, ExportDataset
+from .export_services import ExportServices
+from .tabular_writers import EXPORT_FORMATS
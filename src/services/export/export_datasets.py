@@ -0,0 +1,228 @@
+"""
+Definições das exportações: colunas de cada conjunto de dados e como extraí-las dos
+documentos brutos do Firestore (sem montar os objetos de domínio).
+
+Valores monetários são exportados em duas colunas: '<nome>' (decimal) e '<nome>_cents' (inteiro).
+As colunas da exportação de produtos usam os mesmos nomes aceitos pela importação, para que
+a planilha exportada possa ser reimportada em outra empresa.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Iterable
+
+# (ID do documento, dados) -> valor
+Getter = Callable[[str, dict[str, Any]], Any]
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    name: str
+    type: str  # Um de tabular_writers.COLUMN_TYPES
+    get: Getter
+
+
+@dataclass(frozen=True)
+class ExportDataset:
+    """
+    Conjunto de dados exportável.
+
+    `records` transforma um documento em zero ou mais registros (ex.: um pedido em uma linha
+    por item); por padrão cada documento é um registro.
+    """
+    name: str
+    label: str
+    source: str  # Coleção lida: 'produtos', 'clientes' ou 'pedidos'
+    columns: tuple[ExportColumn, ...]
+    records: Callable[[str, dict[str, Any]], Iterable[tuple[str, dict[str, Any]]]] = lambda doc_id, data: ((doc_id, data),)
+
+    @property
+    def schema(self) -> list[tuple[str, str]]:
+        return [(column.name, column.type) for column in self.columns]
+
+    def rows(self, page: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Converte uma página de documentos nas linhas da exportação."""
+        return [
+            {column.name: column.get(record_id, record) for column in self.columns}
+            for doc_id, data in page
+            for record_id, record in self.records(doc_id, data)
+        ]
+
+
+def _path(data: dict[str, Any], path: str) -> Any:
+    for key in path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)  # type: ignore [assignment]
+    return data
+
+
+def _cents(value: Any) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        value = value.get("amount_cents")
+    if isinstance(value, (int, float)):
+        return int(value)
+    return None
+
+
+def _str(path: str) -> Getter:
+    return lambda _, data: None if (value := _path(data, path)) is None else str(value)
+
+
+def _int(path: str) -> Getter:
+    def get(_, data):
+        value = _path(data, path)
+        try:
+            return int(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+    return get
+
+
+def _bool(path: str) -> Getter:
+    return lambda _, data: None if (value := _path(data, path)) is None else bool(value)
+
+
+def _datetime(path: str) -> Getter:
+    return lambda _, data: value if isinstance(value := _path(data, path), datetime) else None
+
+
+def _date(path: str) -> Getter:
+    def get(_, data):
+        value = _path(data, path)
+        if isinstance(value, datetime):
+            return value.date()
+        return value if isinstance(value, date) else None
+    return get
+
+
+def _money(name: str, path: str) -> tuple[ExportColumn, ExportColumn]:
+    """Colunas '<name>' (decimal) e '<name>_cents' (inteiro) de um campo Money."""
+    def get_decimal(_, data):
+        cents = _cents(_path(data, path))
+        return None if cents is None else (Decimal(cents) / 100).quantize(Decimal("0.01"))
+    return (
+        ExportColumn(name, "decimal", get_decimal),
+        ExportColumn(f"{name}_cents", "int", lambda _, data: _cents(_path(data, path))),
+    )
+
+
+def _doc_id(doc_id: str, _) -> str:
+    return doc_id
+
+
+def _audit_columns() -> tuple[ExportColumn, ...]:
+    return (
+        ExportColumn("status", "str", _str("status")),
+        ExportColumn("criado_em", "datetime", _datetime("created_at")),
+        ExportColumn("criado_por", "str", _str("created_by_name")),
+        ExportColumn("atualizado_em", "datetime", _datetime("updated_at")),
+    )
+
+
+def _cliente_nome(_, data) -> str | None:
+    name = data.get("name")
+    if isinstance(name, dict):
+        return " ".join(part for part in (name.get("first_name"), name.get("last_name")) if part) or None
+    return name
+
+
+PRODUTOS = ExportDataset(
+    name="produtos",
+    label="Produtos",
+    source="produtos",
+    columns=(
+        ExportColumn("id", "str", _doc_id),
+        ExportColumn("nome", "str", _str("name")),
+        ExportColumn("categoria", "str", _str("categoria_name")),
+        *_money("preco_venda", "sale_price"),
+        *_money("preco_custo", "cost_price"),
+        ExportColumn("estoque", "int", _int("quantity_on_hand")),
+        ExportColumn("unidade", "str", _str("unit_of_measure")),
+        ExportColumn("ean", "str", _str("ean_code")),
+        ExportColumn("codigo", "str", _str("internal_code")),
+        ExportColumn("marca", "str", _str("brand")),
+        ExportColumn("descricao", "str", _str("description")),
+        ExportColumn("ncm", "str", _str("ncm.code")),
+        ExportColumn("estoque_minimo", "int", _int("minimum_stock_level")),
+        ExportColumn("estoque_maximo", "int", _int("maximum_stock_level")),
+        *_audit_columns(),
+    ),
+)
+
+CLIENTES = ExportDataset(
+    name="clientes",
+    label="Clientes",
+    source="clientes",
+    columns=(
+        ExportColumn("id", "str", _doc_id),
+        ExportColumn("nome", "str", _cliente_nome),
+        ExportColumn("cpf", "str", _str("cpf")),
+        ExportColumn("telefone", "str", _str("phone")),
+        ExportColumn("whatsapp", "bool", _bool("is_whatsapp")),
+        ExportColumn("email", "str", _str("email")),
+        ExportColumn("aniversario", "date", _date("birthday")),
+        ExportColumn("logradouro", "str", _str("delivery_address.street")),
+        ExportColumn("numero", "str", _str("delivery_address.number")),
+        ExportColumn("complemento", "str", _str("delivery_address.complement")),
+        ExportColumn("bairro", "str", _str("delivery_address.neighborhood")),
+        ExportColumn("cidade", "str", _str("delivery_address.city")),
+        ExportColumn("uf", "str", _str("delivery_address.state")),
+        ExportColumn("cep", "str", _str("delivery_address.postal_code")),
+        *_audit_columns(),
+    ),
+)
+
+PEDIDOS = ExportDataset(
+    name="pedidos",
+    label="Pedidos",
+    source="pedidos",
+    columns=(
+        ExportColumn("id", "str", _doc_id),
+        ExportColumn("numero", "str", _str("order_number")),
+        ExportColumn("data", "date", _date("order_date")),
+        ExportColumn("cliente", "str", _str("client.name")),
+        ExportColumn("cliente_telefone", "str", _str("client.phone")),
+        ExportColumn("cliente_cpf", "str", _str("client.cpf")),
+        ExportColumn("forma_pagamento_id", "str", _str("forma_pagamento_id")),
+        *_money("total", "total_amount"),
+        ExportColumn("itens", "int", _int("total_items")),
+        ExportColumn("quantidade", "int", _int("total_products")),
+        ExportColumn("entrega", "str", _str("delivery_status")),
+        ExportColumn("baixa_estoque", "bool", _bool("stock_reduction")),
+        *_audit_columns(),
+    ),
+)
+
+
+def _pedido_items(doc_id: str, data: dict[str, Any]) -> Iterable[tuple[str, dict[str, Any]]]:
+    parent = {key: data.get(key) for key in ("order_number", "order_date", "status", "delivery_status")}
+    for item in data.get("items") or []:
+        yield doc_id, {**parent, **item, "product_id": item.get("id")}
+
+
+PEDIDO_ITENS = ExportDataset(
+    name="pedido_itens",
+    label="Itens vendidos",
+    source="pedidos",
+    columns=(
+        ExportColumn("pedido_id", "str", _doc_id),
+        ExportColumn("numero", "str", _str("order_number")),
+        ExportColumn("data", "date", _date("order_date")),
+        ExportColumn("produto_id", "str", _str("product_id")),
+        ExportColumn("descricao", "str", _str("description")),
+        ExportColumn("quantidade", "int", _int("quantity")),
+        ExportColumn("unidade", "str", _str("unit_of_measure")),
+        *_money("preco_unitario", "unit_price"),
+        *_money("total", "total"),
+        ExportColumn("status", "str", _str("status")),
+        ExportColumn("entrega", "str", _str("delivery_status")),
+    ),
+    records=_pedido_items,
+)
+
+EXPORT_DATASETS: dict[str, ExportDataset] = {
+    dataset.name: dataset for dataset in (PRODUTOS, CLIENTES, PEDIDOS, PEDIDO_ITENS)
+}
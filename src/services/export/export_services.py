@@ -0,0 +1,50 @@
+import logging
+import os
+from typing import Any, Callable, Iterable
+
+from src.services.export.export_datasets import ExportDataset
+from src.services.export.tabular_writers import open_writer
+
+logger = logging.getLogger(__name__)
+
+
+class ExportServices:
+    """
+    Exportação em streaming: as páginas de documentos são convertidas e gravadas uma a uma,
+    de modo que a memória usada não depende do tamanho da empresa.
+    """
+
+    def export(self, dataset: ExportDataset, pages: Iterable[list[tuple[str, dict[str, Any]]]], export_format: str,
+               path: str, on_progress: Callable[[int], None] | None = None) -> int:
+        """
+        Grava o conjunto de dados no arquivo `path`.
+
+        Args:
+            dataset (ExportDataset): Definição da exportação (colunas)
+            pages (Iterable): Páginas de (ID, documento bruto) lidas do repositório
+            export_format (str): 'csv' ou 'parquet'
+            path (str): Arquivo de destino
+            on_progress (Callable | None): Recebe o total de linhas gravadas após cada página
+
+        Returns:
+            int: Quantidade de linhas gravadas
+
+        Raises:
+            ValueError: Formato inválido ou dependência do formato ausente.
+        """
+        writer = open_writer(path, export_format, dataset.schema)
+        rows_written = 0
+        try:
+            for page in pages:
+                rows = dataset.rows(page)
+                writer.write(rows)
+                rows_written += len(rows)
+                if on_progress:
+                    on_progress(rows_written)
+        except Exception:
+            writer.close()
+            os.remove(path)  # Não deixa um arquivo parcial para trás
+            raise
+        writer.close()
+        logger.info(f"Exportação '{dataset.name}' ({export_format}): {rows_written} linha(s) gravada(s) em {path}")
+        return rows_written
@@ -0,0 +1,87 @@
+"""
+Escritores incrementais de arquivos tabulares (CSV e Parquet) para a exportação.
+
+Os dois recebem as linhas em blocos (uma página do Firestore por vez) e gravam no arquivo
+sem acumular o conjunto inteiro na memória: o CSV escreve linha a linha e o Parquet grava
+cada bloco como um row group.
+"""
+import csv
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+# Tipos de coluna aceitos nas definições de exportação
+COLUMN_TYPES = ("str", "int", "decimal", "bool", "date", "datetime")
+
+EXPORT_FORMATS = ("csv", "parquet")
+
+
+class CsvExportWriter:
+    """
+    CSV no padrão do Excel em português: separador ';', decimais com vírgula e UTF-8 com BOM
+    (o mesmo formato aceito pela importação de produtos).
+    """
+
+    def __init__(self, path: str, columns: list[tuple[str, str]]):
+        self.columns = columns
+        self._file = open(path, "w", newline="", encoding="utf-8-sig")
+        self._writer = csv.writer(self._file, delimiter=";")
+        self._writer.writerow([name for name, _ in columns])
+
+    @staticmethod
+    def _format(value: Any) -> Any:
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "sim" if value else "não"
+        if isinstance(value, Decimal):
+            return f"{value:.2f}".replace(".", ",")
+        if isinstance(value, datetime):
+            return value.isoformat(timespec="seconds")
+        if isinstance(value, date):
+            return value.isoformat()
+        return value
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._writer.writerows([self._format(row.get(name)) for name, _ in self.columns] for row in rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetExportWriter:
+    """Parquet tipado (pyarrow): um row group por bloco recebido. Valores monetários em decimal(18,2)."""
+
+    def __init__(self, path: str, columns: list[tuple[str, str]]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Exportação em Parquet indisponível: instale o pacote 'pyarrow' ou exporte em CSV.")
+        types = {
+            "str": pa.string(),
+            "int": pa.int64(),
+            "decimal": pa.decimal128(18, 2),
+            "bool": pa.bool_(),
+            "date": pa.date32(),
+            "datetime": pa.timestamp("us", tz="UTC"),
+        }
+        self._pa = pa
+        self.schema = pa.schema([(name, types[column_type]) for name, column_type in columns])
+        self._writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        if rows:
+            self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self.schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def open_writer(path: str, export_format: str, columns: list[tuple[str, str]]) -> CsvExportWriter | ParquetExportWriter:
+    """Abre o escritor do formato informado ('csv' ou 'parquet')."""
+    if export_format == "csv":
+        return CsvExportWriter(path, columns)
+    if export_format == "parquet":
+        return ParquetExportWriter(path, columns)
+    raise ValueError(f"Formato de exportação não suportado: {export_format}")
@@ -0,0 +1,2 @@
+from .image_pipeline import ImagePipeline, image_pipeline
+from .image_processing import RENDITION_SIZES
@@ -0,0 +1,149 @@
+# image_pipeline.py
+"""
+Pipeline de imagens de produtos e fotos de usuários.
+
+Antes do envio ao bucket, a imagem escolhida pelo usuário é normalizada (orientação
+EXIF) e convertida nas rendições de RENDITION_SIZES (thumb, medium, large) em WebP
+(ou JPEG, se o Pillow não suportar WebP). O processamento roda em um pool de processos,
+fora do event loop do Flet e sem disputar o GIL com as sessões.
+
+As chaves no bucket são derivadas do hash do conteúdo (<prefix>/img_<hash>_<rendição>.<ext>):
+a mesma imagem enviada duas vezes é armazenada uma única vez.
+"""
+import asyncio
+import logging
+import os
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import src.controllers.bucket_controllers as bucket_controllers
+from src.services.images.image_processing import RENDITION_SIZES, is_supported_image, render_image
+from src.shared.env import env_int
+
+logger = logging.getLogger(__name__)
+
+# Chaves endereçadas por conteúdo nunca mudam: o navegador pode manter a imagem em cache
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+RENDITIONS_DIR = os.path.join("uploads", "renditions")
+
+
+class ImagePipeline:
+    """Processa imagens em um pool de processos e envia as rendições ao bucket."""
+
+    def __init__(self, max_workers: int | None = None):
+        # None: IMAGE_PIPELINE_WORKERS ao criar o pool de processos (no primeiro envio)
+        self._max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                max_workers = self._max_workers or env_int('IMAGE_PIPELINE_WORKERS', 2)
+                self._executor = ProcessPoolExecutor(max_workers=max_workers)
+            return self._executor
+
+    def process_and_upload(self, local_path: str, prefix: str,
+                           wait_for: tuple[str, ...] | None = None) -> dict[str, str] | None:
+        """
+        Gera as rendições da imagem e as envia ao bucket (versão síncrona, para handlers
+        síncronos do Flet, que já rodam fora do event loop).
+
+        Args:
+            local_path (str): Caminho da imagem enviada pelo usuário (em uploads/).
+            prefix (str): Prefixo das chaves no bucket (ex.: 'empresas/<id>/produtos').
+            wait_for (tuple[str, ...] | None): Rendições enviadas antes de retornar (ex.: a exibida
+                no formulário). As demais vão para a fila de jobs e suas URLs, já definitivas,
+                respondem quando o upload concluir. Com None, todas são enviadas na hora.
+
+        Returns:
+            dict[str, str] | None: URL de cada rendição ({'thumb': ..., 'medium': ..., 'large': ...}),
+                                   ou None se o formato não for suportado (ex.: SVG).
+
+        Raises:
+            RuntimeError: Se o processamento ou o upload falhar.
+        """
+        if not is_supported_image(local_path):
+            return None
+        try:
+            result = self._get_executor().submit(render_image, local_path, RENDITIONS_DIR).result()
+        except Exception as e:
+            raise RuntimeError(f"Erro ao processar a imagem {local_path}: {e}")
+        return self._upload_renditions(result, prefix, wait_for)
+
+    async def process_and_upload_async(self, local_path: str, prefix: str) -> dict[str, str] | None:
+        """Versão assíncrona de process_and_upload, para handlers async do Flet."""
+        if not is_supported_image(local_path):
+            return None
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(self._get_executor(), render_image, local_path, RENDITIONS_DIR)
+        except Exception as e:
+            raise RuntimeError(f"Erro ao processar a imagem {local_path}: {e}")
+        return await self._upload_renditions_async(result, prefix)
+
+    @staticmethod
+    def _rendition_key(result: dict, prefix: str, name: str) -> str:
+        return f"{prefix}/img_{result['hash'][:32]}_{name}.{result['renditions'][name]['ext']}"
+
+    @staticmethod
+    def _remove_local_renditions(result: dict) -> None:
+        for rendition in result["renditions"].values():
+            try:
+                os.remove(rendition["path"])
+            except OSError:
+                pass
+
+    @classmethod
+    def _upload_renditions(cls, result: dict, prefix: str, wait_for: tuple[str, ...] | None = None) -> dict[str, str]:
+        urls: dict[str, str] = {}
+        try:
+            for name, rendition in result["renditions"].items():
+                upload = (bucket_controllers.handle_upload_bucket if wait_for is None or name in wait_for
+                          else bucket_controllers.handle_enqueue_upload_bucket)
+                urls[name] = upload(
+                    local_path=rendition["path"],
+                    key=cls._rendition_key(result, prefix, name),
+                    content_type=result["content_type"],
+                    cache_control=IMMUTABLE_CACHE_CONTROL,
+                    skip_if_exists=True,
+                )
+        finally:
+            # As rendições enfileiradas já foram movidas para a fila de jobs
+            cls._remove_local_renditions(result)
+        return urls
+
+    @classmethod
+    async def _upload_renditions_async(cls, result: dict, prefix: str) -> dict[str, str]:
+        # As rendições são enviadas em paralelo pelo executor do S3
+        names = list(result["renditions"])
+        try:
+            urls = await asyncio.gather(*(
+                bucket_controllers.handle_upload_bucket_async(
+                    local_path=result["renditions"][name]["path"],
+                    key=cls._rendition_key(result, prefix, name),
+                    content_type=result["content_type"],
+                    cache_control=IMMUTABLE_CACHE_CONTROL,
+                    skip_if_exists=True,
+                )
+                for name in names
+            ))
+        finally:
+            cls._remove_local_renditions(result)
+        return dict(zip(names, urls))
+
+    def shutdown(self) -> None:
+        """Encerra o pool de processos e remove rendições temporárias."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+        shutil.rmtree(RENDITIONS_DIR, ignore_errors=True)
+
+
+# Pool global do processo, compartilhado por todas as sessões Flet
+image_pipeline = ImagePipeline()
+
+__all__ = ["ImagePipeline", "image_pipeline", "RENDITION_SIZES"]
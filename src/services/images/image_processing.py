@@ -0,0 +1,90 @@
+# image_processing.py
+"""
+Processamento de imagens executado nos workers do pool de processos (ver image_pipeline.py).
+
+As funções deste módulo recebem e retornam apenas tipos simples (str, dict), para que
+possam ser serializadas entre processos, e não dependem do Flet nem do boto3.
+"""
+import hashlib
+import os
+
+from PIL import Image, ImageOps, features
+
+# Lado maior (em pixels) de cada rendição. "large" substitui o original enviado pelo usuário.
+RENDITION_SIZES: dict[str, int] = {
+    "thumb": 200,
+    "medium": 800,
+    "large": 1600,
+}
+
+WEBP_QUALITY = 80
+JPEG_QUALITY = 85
+
+# Extensões que o Pillow consegue abrir; SVG e demais seguem sem processamento
+SUPPORTED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".tif", ".tiff"}
+
+
+def is_supported_image(local_path: str) -> bool:
+    _, ext = os.path.splitext(local_path)
+    return ext.lower() in SUPPORTED_EXTENSIONS
+
+
+def content_hash(local_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Retorna o SHA-256 (hex) do conteúdo do arquivo."""
+    digest = hashlib.sha256()
+    with open(local_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _output_format() -> tuple[str, str, str]:
+    """Formato das rendições: WebP quando suportado pelo Pillow instalado, senão JPEG."""
+    if features.check("webp"):
+        return "WEBP", "webp", "image/webp"
+    return "JPEG", "jpg", "image/jpeg"
+
+
+def render_image(local_path: str, output_dir: str) -> dict:
+    """
+    Gera as rendições de uma imagem.
+
+    A orientação EXIF é aplicada aos pixels (fotos de celular não ficam deitadas) e os
+    metadados são descartados. Rendições nunca ampliam a imagem original.
+
+    Args:
+        local_path (str): Caminho da imagem original.
+        output_dir (str): Diretório onde as rendições serão gravadas.
+
+    Returns:
+        dict: {"hash": <sha256 do original>, "content_type": <mime>,
+               "renditions": {<nome>: {"path": <arquivo>, "ext": <extensão>, "width": int, "height": int}}}
+    """
+    image_hash = content_hash(local_path)
+    image_format, ext, content_type = _output_format()
+    os.makedirs(output_dir, exist_ok=True)
+
+    with Image.open(local_path) as original:
+        image = ImageOps.exif_transpose(original)
+
+        has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        if image_format == "JPEG" or not has_alpha:
+            image = image.convert("RGB")
+        else:
+            image = image.convert("RGBA")
+
+        renditions: dict[str, dict] = {}
+        # Do maior para o menor: cada rendição é reduzida a partir da anterior (mais rápido)
+        for name, max_side in sorted(RENDITION_SIZES.items(), key=lambda item: item[1], reverse=True):
+            if max(image.size) > max_side:
+                image.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+
+            path = os.path.join(output_dir, f"{image_hash[:32]}_{name}.{ext}")
+            if image_format == "WEBP":
+                image.save(path, image_format, quality=WEBP_QUALITY, method=4)
+            else:
+                image.save(path, image_format, quality=JPEG_QUALITY, optimize=True, progressive=True)
+
+            renditions[name] = {"path": path, "ext": ext, "width": image.width, "height": image.height}
+
+    return {"hash": image_hash, "content_type": content_type, "renditions": renditions}
@@ -0,0 +1,12 @@
+from .job_store import JobStore
+from .job_runner import JobRunner, PermanentJobError, job_runner, start_job_runner
+from .handlers import (
+    BUCKET_DELETE, BUCKET_UPLOAD, DENORMALIZED_PROPAGATE, EMAIL_SEND, enqueue_bucket_delete, enqueue_bucket_upload,
+    enqueue_denormalized_propagation, enqueue_email, register_default_handlers,
+)
+
+register_default_handlers(job_runner)
+
+__all__ = ['JobStore', 'JobRunner', 'PermanentJobError', 'job_runner', 'start_job_runner', 'EMAIL_SEND',
+           'BUCKET_UPLOAD', 'BUCKET_DELETE', 'DENORMALIZED_PROPAGATE', 'enqueue_email', 'enqueue_bucket_upload',
+           'enqueue_bucket_delete', 'enqueue_denormalized_propagation']
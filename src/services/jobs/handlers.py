@@ -0,0 +1,152 @@
+# handlers.py
+"""
+Tipos de job padrão do sistema e funções para enfileirá-los.
+
+- email.send: envio de email pelo ModernEmailSender (pool SMTP no event loop do runner).
+- bucket.upload: upload de um arquivo ao bucket. O arquivo é movido para JOBS_FILES_DIR
+  (fora de uploads/, onde o janitor o removeria) e apagado após o envio.
+- bucket.delete: remoção de um arquivo do bucket (ex.: imagem substituída).
+- denormalized.propagate: regrava campos desnormalizados após renomear a origem (nome da
+  categoria nos produtos, nome do usuário nos campos de auditoria). Um job por vez: a
+  propagação tem o próprio limite de escritas por segundo.
+"""
+import logging
+import os
+import shutil
+from typing import Any
+
+from src.services.jobs.job_runner import JobRunner, PermanentJobError, job_runner
+from src.shared.utils import get_uuid
+
+logger = logging.getLogger(__name__)
+
+EMAIL_SEND = "email.send"
+BUCKET_UPLOAD = "bucket.upload"
+BUCKET_DELETE = "bucket.delete"
+DENORMALIZED_PROPAGATE = "denormalized.propagate"
+
+JOBS_FILES_DIR = os.path.join("cache", "jobs", "files")
+
+# Erros de email que não se resolvem com nova tentativa
+_PERMANENT_EMAIL_ERRORS = {"RECIPIENT_ERROR", "SPAM_REJECTED", "DATA_ERROR"}
+
+
+async def send_email_job(payload: dict[str, Any]) -> dict[str, Any]:
+    # Imports tardios: o envio só carrega o aiosmtplib quando há emails na fila
+    from src.services.emails.send_email import (
+        EmailMessage, EmailRecipientError, EmailSendError, EmailValidationError, ModernEmailSender,
+        create_email_config_from_env,
+    )
+
+    try:
+        message = EmailMessage(**payload)
+        sender = ModernEmailSender(create_email_config_from_env())
+        result = await sender.send_email_async(message)
+    except (ValueError, EmailValidationError, EmailRecipientError) as e:
+        raise PermanentJobError(str(e)) from e
+    except EmailSendError as e:
+        if e.error_type in _PERMANENT_EMAIL_ERRORS:
+            raise PermanentJobError(str(e)) from e
+        raise
+    return {"recipients_count": result["recipients_count"], "attempts": result["attempts"]}
+
+
+def upload_bucket_job(payload: dict[str, Any]) -> dict[str, Any]:
+    import src.controllers.bucket_controllers as bucket_controllers
+
+    local_path = payload["local_path"]
+    if not os.path.exists(local_path):
+        raise PermanentJobError(f"Arquivo do upload não encontrado: {local_path}")
+
+    url = bucket_controllers.handle_upload_bucket(
+        local_path=local_path,
+        key=payload["key"],
+        content_type=payload.get("content_type"),
+        cache_control=payload.get("cache_control"),
+        skip_if_exists=payload.get("skip_if_exists", False),
+    )
+    try:
+        os.remove(local_path)
+    except OSError as e:
+        logger.warning(f"Não foi possível remover o arquivo {local_path} após o upload: {e}")
+    return {"url": url}
+
+
+def delete_bucket_job(payload: dict[str, Any]) -> dict[str, Any]:
+    import src.controllers.bucket_controllers as bucket_controllers
+
+    if not bucket_controllers.handle_delete_bucket(payload["key"]):
+        raise RuntimeError(f"O arquivo {payload['key']} não pode ser deletado do bucket")
+    return {"key": payload["key"]}
+
+
+def propagate_denormalized_job(payload: dict[str, Any]) -> dict[str, Any]:
+    # Imports tardios: o Firestore só é carregado quando há propagações na fila
+    from src.domains.shared.repositories.implementations.firebase_propagation_repository import FirebasePropagationRepository
+    from src.domains.shared.services.propagation_services import PropagationServices
+
+    try:
+        # Falhas no meio da varredura são repetidas pelo runner; o checkpoint evita recomeçar do zero
+        return PropagationServices(FirebasePropagationRepository()).propagate(payload["kind"], payload["source_id"])
+    except ValueError as e:
+        raise PermanentJobError(str(e)) from e
+
+
+def register_default_handlers(runner: JobRunner) -> None:
+    """Registra os tipos de job padrão (a concorrência pode ser ajustada por JOBS_CONCURRENCY_<TIPO>)."""
+    runner.register(EMAIL_SEND, send_email_job, concurrency=2, max_attempts=8)
+    runner.register(BUCKET_UPLOAD, upload_bucket_job, concurrency=4, max_attempts=8)
+    runner.register(BUCKET_DELETE, delete_bucket_job, concurrency=2, max_attempts=5)
+    runner.register(DENORMALIZED_PROPAGATE, propagate_denormalized_job, concurrency=1, max_attempts=10)
+
+
+def enqueue_email(message: Any, idempotency_key: str | None = None) -> str:
+    """
+    Enfileira o envio de um EmailMessage. Retorna o id do job.
+
+    Anexos não são suportados na fila (o arquivo poderia não existir na hora do envio).
+    """
+    if message.attachments:
+        raise ValueError("Emails com anexos não podem ser enfileirados")
+    payload = {
+        "subject": message.subject,
+        "recipients": list(message.recipients),
+        "body_text": message.body_text,
+        "body_html": message.body_html,
+        "cc": message.cc,
+        "bcc": message.bcc,
+    }
+    return job_runner.enqueue(EMAIL_SEND, payload, idempotency_key=idempotency_key)
+
+
+def enqueue_bucket_upload(local_path: str, key: str, content_type: str | None = None,
+                          cache_control: str | None = None, skip_if_exists: bool = False) -> str:
+    """
+    Move o arquivo para a área dos jobs e enfileira o upload. Retorna o id do job.
+    """
+    os.makedirs(JOBS_FILES_DIR, exist_ok=True)
+    spooled = os.path.join(JOBS_FILES_DIR, get_uuid() + os.path.splitext(key)[1])
+    shutil.move(local_path, spooled)
+    payload = {
+        "local_path": spooled,
+        "key": key,
+        "content_type": content_type,
+        "cache_control": cache_control,
+        "skip_if_exists": skip_if_exists,
+    }
+    return job_runner.enqueue(BUCKET_UPLOAD, payload)
+
+
+def enqueue_bucket_delete(key: str) -> str:
+    """Enfileira a remoção de um arquivo do bucket. Retorna o id do job."""
+    return job_runner.enqueue(BUCKET_DELETE, {"key": key})
+
+
+def enqueue_denormalized_propagation(kind: str, source_id: str) -> str:
+    """
+    Enfileira a propagação de um campo desnormalizado (ver denormalized_propagation.py). Retorna o id do job.
+
+    O payload leva somente a origem: o valor é lido na execução, então renomear várias vezes
+    seguidas não regrava um nome antigo.
+    """
+    return job_runner.enqueue(DENORMALIZED_PROPAGATE, {"kind": kind, "source_id": source_id})
@@ -0,0 +1,266 @@
+# job_runner.py
+"""
+Executor de jobs em segundo plano sobre a fila persistente (job_store.py).
+
+Os handlers da UI enfileiram o trabalho lento (emails, uploads, remoções no bucket) e
+retornam na hora; o runner executa os jobs em threads, respeitando o limite de concorrência
+de cada tipo de job, e repete as falhas com backoff exponencial até max_attempts.
+
+- Handlers síncronos rodam em um ThreadPoolExecutor; handlers async (coroutines) rodam em um
+  event loop dedicado do runner, o que permite reaproveitar pools ligados ao loop (ex.: SMTP).
+- PermanentJobError encerra o job sem novas tentativas (ex.: email com formato inválido).
+- Jobs com a mesma idempotency_key são enfileirados uma única vez.
+"""
+import asyncio
+import dataclasses
+import inspect
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from src.services.jobs.job_store import JobStore
+from src.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_jobs_total = metrics_registry.counter(
+    "estoquerapido_jobs_total",
+    "Jobs em segundo plano por tipo e resultado (enqueued, deduplicated, succeeded, retried, dead).",
+    ("job_type", "outcome"),
+)
+_jobs_in_flight = metrics_registry.gauge(
+    "estoquerapido_jobs_in_flight",
+    "Jobs em execução por tipo.",
+    ("job_type",),
+)
+_job_duration_seconds = metrics_registry.histogram(
+    "estoquerapido_job_duration_seconds",
+    "Duração de cada execução de job em segundos.",
+    ("job_type",),
+)
+
+# Intervalo máximo entre verificações da fila (jobs agendados por outro processo, novas tentativas)
+POLL_SECONDS = 5
+PURGE_INTERVAL_SECONDS = 3600
+
+
+class PermanentJobError(Exception):
+    """Erro que não se resolve com nova tentativa: o job é encerrado como dead."""
+
+
+@dataclass(frozen=True)
+class _Handler:
+    func: Callable[[dict[str, Any]], Any]
+    concurrency: int
+    max_attempts: int
+    is_async: bool
+
+
+class JobRunner:
+    """Registro de handlers e despachante dos jobs da fila."""
+
+    def __init__(self, store: JobStore | None = None):
+        self.store = store or JobStore()
+        self._handlers: dict[str, _Handler] = {}
+        self._inflight: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._dispatcher: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._last_purge = 0.0
+
+    def register(self, job_type: str, handler: Callable[[dict[str, Any]], Any],
+                 concurrency: int = 1, max_attempts: int = 5) -> None:
+        """
+        Registra o handler de um tipo de job.
+
+        Args:
+            job_type (str): Nome do tipo (ex.: 'email.send').
+            handler (Callable): Recebe o payload (dict) e retorna um resultado serializável em JSON.
+                                Pode ser uma função comum ou async.
+            concurrency (int): Máximo de jobs deste tipo executando ao mesmo tempo. Pode ser
+                               sobrescrito por JOBS_CONCURRENCY_<TIPO> (ex.: JOBS_CONCURRENCY_EMAIL_SEND).
+            max_attempts (int): Tentativas antes de o job ser encerrado como dead.
+        """
+        self._handlers[job_type] = _Handler(handler, max(1, concurrency), max(1, max_attempts),
+                                            inspect.iscoroutinefunction(handler))
+        self._inflight.setdefault(job_type, 0)
+
+    def enqueue(self, job_type: str, payload: dict[str, Any], idempotency_key: str | None = None,
+                delay_seconds: float = 0) -> str:
+        """
+        Enfileira um job e retorna o seu id (o id do job existente, se a idempotency_key já foi usada).
+
+        Raises:
+            ValueError: Se não houver handler registrado para job_type.
+        """
+        handler = self._handlers.get(job_type)
+        if handler is None:
+            raise ValueError(f"Tipo de job sem handler registrado: {job_type}")
+
+        job_id, created = self.store.enqueue(job_type, payload, handler.max_attempts,
+                                             idempotency_key=idempotency_key, delay_seconds=delay_seconds)
+        _jobs_total.inc((job_type, "enqueued" if created else "deduplicated"))
+        if created:
+            self._wakeup.set()
+        return job_id
+
+    def status(self, job_id: str) -> dict[str, Any] | None:
+        """Situação do job: status, tentativas, último erro e resultado."""
+        return self.store.get(job_id)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Quantidade de jobs por tipo e estado."""
+        return self.store.counts()
+
+    @property
+    def running(self) -> bool:
+        return self._dispatcher is not None and self._dispatcher.is_alive()
+
+    def start(self) -> None:
+        """Inicia o despachante, o pool de threads e o event loop dos handlers async."""
+        if self.running:
+            return
+        self._stopping.clear()
+
+        for job_type, handler in list(self._handlers.items()):
+            override = os.getenv(f"JOBS_CONCURRENCY_{job_type.upper().replace('.', '_')}")
+            if override:
+                self._handlers[job_type] = dataclasses.replace(handler, concurrency=max(1, int(override)))
+
+        requeued = self.store.requeue_interrupted()
+        if requeued:
+            logger.warning(f"{requeued} job(s) interrompido(s) na execução anterior voltaram para a fila")
+
+        sync_slots = sum(h.concurrency for h in self._handlers.values() if not h.is_async)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, sync_slots), thread_name_prefix="job-worker")
+
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="job-loop", daemon=True).start()
+
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="job-dispatcher", daemon=True)
+        self._dispatcher.start()
+        logger.info(f"Runner de jobs iniciado: {', '.join(f'{t}={h.concurrency}' for t, h in self._handlers.items())}")
+
+    def stop(self, timeout: float = 10) -> None:
+        """Para de despachar e aguarda os jobs em execução (os pendentes ficam na fila)."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._dispatcher is not None:
+            self._dispatcher.join(timeout)
+            self._dispatcher = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+    def _dispatch_loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                self._dispatch_ready()
+                self._purge_if_due()
+                timeout = self._next_wait()
+            except Exception as e:
+                logger.error(f"Erro no despachante de jobs: {e}")
+                timeout = POLL_SECONDS
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+
+    def _dispatch_ready(self) -> None:
+        for job_type, handler in self._handlers.items():
+            with self._lock:
+                free = handler.concurrency - self._inflight[job_type]
+            for job_id, payload, attempt in self.store.claim(job_type, free):
+                with self._lock:
+                    self._inflight[job_type] += 1
+                _jobs_in_flight.inc((job_type,))
+                self._submit(job_type, handler, job_id, payload, attempt)
+
+    def _next_wait(self) -> float:
+        next_at = self.store.next_run_after(list(self._handlers))
+        now = time.time()
+        if next_at is None or next_at <= now:
+            # Sem jobs ou sem vagas: o término de um job acorda o despachante
+            return POLL_SECONDS
+        return min(next_at - now, POLL_SECONDS)
+
+    def _submit(self, job_type: str, handler: _Handler, job_id: str, payload: dict[str, Any], attempt: int) -> None:
+        started = time.perf_counter()
+        future: Future
+        if handler.is_async:
+            future = asyncio.run_coroutine_threadsafe(handler.func(payload), self._loop)  # type: ignore [arg-type]
+        else:
+            future = self._executor.submit(handler.func, payload)  # type: ignore [union-attr]
+        future.add_done_callback(lambda f: self._finish(job_type, handler, job_id, attempt, started, f))
+
+    def _finish(self, job_type: str, handler: _Handler, job_id: str, attempt: int, started: float,
+                future: Future) -> None:
+        _job_duration_seconds.observe((job_type,), time.perf_counter() - started)
+        try:
+            if future.cancelled():
+                # Runner parado antes de o job começar: volta para a fila
+                self.store.mark_retry(job_id, "Cancelado na parada do runner", 0)
+                return
+            error = future.exception()
+            if error is None:
+                self.store.mark_succeeded(job_id, future.result())
+                _jobs_total.inc((job_type, "succeeded"))
+            elif isinstance(error, PermanentJobError) or attempt >= handler.max_attempts:
+                self.store.mark_dead(job_id, str(error))
+                _jobs_total.inc((job_type, "dead"))
+                logger.error(f"Job {job_type} {job_id} encerrado após {attempt} tentativa(s): {error}")
+            else:
+                delay = self._backoff(attempt)
+                self.store.mark_retry(job_id, str(error), delay)
+                _jobs_total.inc((job_type, "retried"))
+                logger.warning(f"Job {job_type} {job_id} falhou (tentativa {attempt}), "
+                               f"nova tentativa em {delay:.0f}s: {error}")
+        except Exception as e:
+            logger.error(f"Erro ao registrar o resultado do job {job_id}: {e}")
+        finally:
+            with self._lock:
+                self._inflight[job_type] -= 1
+            _jobs_in_flight.dec((job_type,))
+            self._wakeup.set()
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        base = float(os.getenv('JOBS_BACKOFF_BASE_SECONDS', '5'))
+        maximum = float(os.getenv('JOBS_BACKOFF_MAX_SECONDS', '900'))
+        delay = min(maximum, base * 2 ** (attempt - 1))
+        # Jitter: evita que jobs que falharam juntos voltem todos ao mesmo tempo
+        return delay * random.uniform(0.5, 1.0)
+
+    def _purge_if_due(self) -> None:
+        now = time.time()
+        if now - self._last_purge < PURGE_INTERVAL_SECONDS:
+            return
+        self._last_purge = now
+        removed = self.store.purge_finished(float(os.getenv('JOBS_RETENTION_DAYS', '7')) * 86400)
+        if removed:
+            logger.info(f"{removed} job(s) concluído(s) removido(s) da fila")
+
+
+# Runner global do processo, compartilhado por todas as sessões Flet
+job_runner = JobRunner()
+
+
+def start_job_runner() -> JobRunner | None:
+    """
+    Inicia o runner global, a menos que JOBS_ENABLED=false (ex.: instância só de leitura).
+    Os jobs enfileirados continuam persistidos e são executados quando um runner iniciar.
+    """
+    if os.getenv('JOBS_ENABLED', 'true').lower() != 'true':
+        logger.info("JOBS_ENABLED=false. Runner de jobs desabilitado.")
+        return None
+    job_runner.start()
+    return job_runner
@@ -0,0 +1,230 @@
+# job_store.py
+"""
+Fila persistente (SQLite) dos jobs em segundo plano.
+
+Os jobs sobrevivem a reinícios do processo: um job que estava em execução quando o processo
+caiu volta para a fila na inicialização (requeue_interrupted). O payload é gravado cifrado com
+a FERNET_KEY do sistema, pois pode conter dados sensíveis (ex.: senha temporária no email).
+
+Estados: pending -> running -> succeeded | pending (nova tentativa) | dead (tentativas esgotadas
+ou erro permanente).
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from src.shared.utils import get_uuid
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+DEAD = "dead"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    job_type TEXT NOT NULL,
+    idempotency_key TEXT UNIQUE,
+    payload BLOB NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    run_after REAL NOT NULL,
+    last_error TEXT,
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, job_type, run_after);
+"""
+
+_COLUMNS = ("id", "job_type", "idempotency_key", "status", "attempts", "max_attempts",
+            "run_after", "last_error", "result", "created_at", "updated_at")
+
+
+class _PayloadCodec:
+    """Cifra o payload com a FERNET_KEY; sem a chave, grava em texto (com aviso)."""
+
+    def __init__(self):
+        self._fernet: Any = None
+        self._loaded = False
+
+    def _get_fernet(self) -> Any:
+        if not self._loaded:
+            self._loaded = True
+            key = os.getenv("FERNET_KEY")
+            if key:
+                from cryptography.fernet import Fernet
+                self._fernet = Fernet(key.encode())
+            else:
+                logger.warning("FERNET_KEY não encontrada. Payloads dos jobs serão gravados sem criptografia.")
+        return self._fernet
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        data = json.dumps(payload, ensure_ascii=False).encode()
+        fernet = self._get_fernet()
+        return fernet.encrypt(data) if fernet else data
+
+    def decode(self, blob: bytes) -> dict[str, Any]:
+        fernet = self._get_fernet()
+        return json.loads(fernet.decrypt(blob) if fernet else blob)
+
+
+class JobStore:
+    """Fila de jobs em SQLite, segura para uso por várias threads."""
+
+    def __init__(self, path: str | None = None):
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._codec = _PayloadCodec()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Chamado com self._lock adquirido
+        if self._conn is None:
+            path = self._path or os.getenv('JOBS_DB_PATH', os.path.join('cache', 'jobs.sqlite3'))
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+            logger.info(f"Fila de jobs aberta em {path}")
+        return self._conn
+
+    def enqueue(self, job_type: str, payload: dict[str, Any], max_attempts: int,
+                idempotency_key: str | None = None, delay_seconds: float = 0) -> tuple[str, bool]:
+        """
+        Insere um job na fila.
+
+        Returns:
+            tuple[str, bool]: (id do job, True se foi criado agora). Com uma idempotency_key já
+                              existente, nada é inserido e o id do job existente é retornado.
+        """
+        now = time.time()
+        job_id = get_uuid()
+        with self._lock:
+            conn = self._connection()
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO jobs (id, job_type, idempotency_key, payload, status, max_attempts, "
+                "run_after, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, job_type, idempotency_key, self._codec.encode(payload), PENDING, max_attempts,
+                 now + delay_seconds, now, now),
+            )
+            conn.commit()
+            if cursor.rowcount:
+                return job_id, True
+            row = conn.execute("SELECT id FROM jobs WHERE idempotency_key = ?", (idempotency_key,)).fetchone()
+        return row[0], False
+
+    def claim(self, job_type: str, limit: int) -> list[tuple[str, dict[str, Any], int]]:
+        """Marca como running até `limit` jobs prontos do tipo. Retorna (id, payload, tentativa)."""
+        if limit <= 0:
+            return []
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            rows = conn.execute(
+                "SELECT id, payload, attempts FROM jobs WHERE status = ? AND job_type = ? AND run_after <= ? "
+                "ORDER BY run_after LIMIT ?",
+                (PENDING, job_type, now, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                [(RUNNING, now, row[0]) for row in rows],
+            )
+            conn.commit()
+
+        claimed = []
+        for job_id, blob, attempts in rows:
+            try:
+                claimed.append((job_id, self._codec.decode(blob), attempts + 1))
+            except Exception as e:
+                # Payload ilegível (ex.: FERNET_KEY trocada): não adianta tentar de novo
+                self.mark_dead(job_id, f"Payload ilegível: {e}")
+        return claimed
+
+    def mark_succeeded(self, job_id: str, result: Any = None) -> None:
+        self._update(job_id, status=SUCCEEDED, result=json.dumps(result, ensure_ascii=False, default=str),
+                     last_error=None)
+
+    def mark_retry(self, job_id: str, error: str, delay_seconds: float) -> None:
+        self._update(job_id, status=PENDING, last_error=error, run_after=time.time() + delay_seconds)
+
+    def mark_dead(self, job_id: str, error: str) -> None:
+        self._update(job_id, status=DEAD, last_error=error)
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            conn = self._connection()
+            conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+            conn.commit()
+
+    def requeue_interrupted(self) -> int:
+        """Devolve à fila os jobs que estavam em execução quando o processo anterior terminou."""
+        with self._lock:
+            conn = self._connection()
+            cursor = conn.execute("UPDATE jobs SET status = ?, updated_at = ? WHERE status = ?",
+                                  (PENDING, time.time(), RUNNING))
+            conn.commit()
+        return cursor.rowcount
+
+    def next_run_after(self, job_types: list[str]) -> float | None:
+        """Horário do próximo job pendente dos tipos informados, ou None se não houver."""
+        if not job_types:
+            return None
+        placeholders = ", ".join("?" for _ in job_types)
+        with self._lock:
+            row = self._connection().execute(
+                f"SELECT MIN(run_after) FROM jobs WHERE status = ? AND job_type IN ({placeholders})",
+                (PENDING, *job_types),
+            ).fetchone()
+        return row[0] if row else None
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """Situação do job (sem o payload)."""
+        with self._lock:
+            row = self._connection().execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        job = dict(zip(_COLUMNS, row))
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def counts(self) -> dict[str, dict[str, int]]:
+        """Quantidade de jobs por tipo e estado."""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT job_type, status, COUNT(*) FROM jobs GROUP BY job_type, status"
+            ).fetchall()
+        counts: dict[str, dict[str, int]] = {}
+        for job_type, status, total in rows:
+            counts.setdefault(job_type, {})[status] = total
+        return counts
+
+    def purge_finished(self, older_than_seconds: float) -> int:
+        """Remove jobs concluídos ou mortos há mais de `older_than_seconds`."""
+        with self._lock:
+            conn = self._connection()
+            cursor = conn.execute("DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                                  (SUCCEEDED, DEAD, time.time() - older_than_seconds))
+            conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,16 +1,14 @@
-import os
-import urllib.parse
 import logging
-from typing import Any, Optional
+from typing import Any
 import aiohttp
-from datetime import datetime, timedelta, UTC
+from datetime import datetime
 
-import src.domains.app_config.controllers.app_config_controllers as app_controllers
 from src.domains.empresas import Environment
 from src.domains.empresas.models.certificate_a1 import CertificateA1
 from src.domains.empresas.models.empresas_model import Empresa
 from src.domains.shared.models.password import Password
 from src.services.contracts.dfe_provider import DFeProvider
+from src.services.providers.nuvemfiscal_token_manager import nuvemfiscal_token_manager
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +16,9 @@ logger = logging.getLogger(__name__)
 class NuvemFiscalDFeProvider(DFeProvider):
     """Um Provider para gerenciar a integração com a API da Nuvem Fiscal"""
 
-    async def __init__(self, ambiente: Environment):
-        self.token = None
-        self.token_expires_in = None
-        self.settings = None
-        await self._token_get()
+    def __init__(self, ambiente: Environment):
+        # O token é obtido do nuvemfiscal_token_manager (em memória) a cada operação
+        self.token: str | None = None
 
         # Verifica se o ambiente é do tipo correto
         if not isinstance(ambiente, Environment):
@@ -50,6 +46,7 @@ class NuvemFiscalDFeProvider(DFeProvider):
         Returns:
             CertificateA1: Objeto com as informações do certificado ou None em caso de erro
         """
+        self.token = await nuvemfiscal_token_manager.get_token()
         if not self.token:
             logger.error("Token não disponível para upload do certificado")
             result = {
@@ -120,6 +117,10 @@ class NuvemFiscalDFeProvider(DFeProvider):
 
                         return result
                     else:
+                        if response.status == 401:
+                            # Token rejeitado: a próxima operação obtém um novo
+                            nuvemfiscal_token_manager.invalidate()
+
                         # Verifica o content-type da resposta para processar adequadamente
                         content_type = response.headers.get('Content-Type', '')
 
@@ -183,103 +184,3 @@ class NuvemFiscalDFeProvider(DFeProvider):
     async def company_delete(self, cpf_cnpj: str) -> bool:
         """Exclui uma empresa (emitente/prestador) no Provedor de DFe."""
         raise NotImplementedError("Módulo aguardando implementação")
-
-    async def _token_get(self) -> None:
-        # Acessa o database para consultar informações do token, o id do documento é 'settings'
-        response: dict = app_controllers.handle_get_config("app_settings")
-
-        if response["status"] == "success":
-            # Verifica se o token expirou
-            self.settings = response['data']['settings']
-            self.token = self.settings.dfe_api_token
-            self.token_expires_in = self.settings.dfe_api_token_expires_in
-            self.settings.dfe_api_token = self.token
-            self.settings.dfe_api_token_expires_in = self.token_expires_in
-
-        # Obtem a data e hora do servidor em UTC
-        agora_utc = datetime.now(UTC)
-
-        if self.token_expires_in and (self.token_expires_in > agora_utc):
-            # Se encontrou o token e ainda não expirou, retorna
-            return None
-
-        # Validade do Token expirou ou token não encontrado, obtem novo token da API da Nuvemfiscal
-        token_data: dict[str, Any]|None = await self._new_token_get()
-
-        if token_data:
-            # Campo 'expires_in' é retornado em segundos
-            expires_in: int = token_data['expires_in']
-            date_now = datetime.fromisoformat(token_data['create_at'])
-            date_expiration = date_now + timedelta(seconds=expires_in)
-
-            self.token = token_data['access_token']
-            self.token_expires_in = date_expiration
-            if not self.settings:
-                return None
-
-            self.settings.dfe_api_token = self.token
-            self.settings.dfe_api_token_expires_in = date_expiration
-
-            # Atualiza a nova configuração no database coleção app_config id: settings
-            response = app_controllers.handle_save_config(settings=self.settings, create_new=False)
-            if response["status"] == "error":
-                logger.error(
-                    f"Erro ao salvar settings no db: Mensagem {response['message']}")
-                return None
-
-    async def _new_token_get(self) -> dict[str, Any]|None:
-        """
-        Obtém um novo token de acesso usando o fluxo OAuth 2.0 client_credentials.
-
-        Returns:
-            dict: Dicionário contendo o token e informações relacionadas ou None em caso de erro
-        """
-        try:
-            # Configuração do endpoint e headers
-            token_url = "https://auth.nuvemfiscal.com.br/oauth/token"
-            headers = {
-                "Content-Type": "application/x-www-form-urlencoded"
-            }
-
-            # Obtém as credenciais das variáveis de ambiente
-            client_id = os.getenv("NUVEMFISCAL_CLIENT_ID")
-            client_secret = os.getenv("NUVEMFISCAL_CLIENT_SECRET")
-
-            if not client_id or not client_secret:
-                logger.error(
-                    "Credenciais da Nuvem Fiscal não encontradas nas variáveis de ambiente")
-                return None
-
-            # Prepara os parâmetros da requisição com percent-encoding
-            params = {
-                "client_id": client_id,
-                "client_secret": client_secret,
-                "grant_type": "client_credentials",
-                "scope": "conta empresa cep cnpj nfce"
-            }
-
-            # Codifica os parâmetros no formato correto
-            encoded_params = urllib.parse.urlencode(params)
-
-            # Realiza a requisição POST
-            async with aiohttp.ClientSession() as session:
-                async with session.post(token_url,
-                                        headers=headers,
-                                        data=encoded_params) as response:
-
-                    if response.status != 200:
-                        logger.error(
-                            f"Erro ao obter token: Status {response.status}")
-                        return None
-
-                    token_data = await response.json()
-
-                    # Adiciona timestamp da criação do token
-                    token_data['created_at'] = datetime.now(UTC).isoformat()
-
-                    logger.info("Token obtido com sucesso")
-                    return token_data
-
-        except Exception as e:
-            logger.error(f"Erro ao obter token: {str(e)}")
-            return None
@@ -0,0 +1,252 @@
+# nuvemfiscal_token_manager.py
+"""
+Token OAuth 2.0 (client_credentials) da Nuvem Fiscal mantido em memória.
+
+- get_token() não acessa o banco de dados: o token fica em memória e só é renovado
+  perto do vencimento (NUVEMFISCAL_TOKEN_REFRESH_MARGIN_SECONDS).
+- Dentro da margem de renovação o token atual ainda é devolvido e a renovação roda em
+  segundo plano; apenas um token vencido faz o chamador aguardar.
+- Uma única renovação por vez (single-flight), compartilhada por todos os chamadores,
+  inclusive de event loops diferentes.
+- O Firestore (app_config/app_settings) é lido uma vez, para reaproveitar um token ainda
+  válido após reiniciar o processo, e gravado (em transação) somente quando um novo token
+  é obtido. Tokens renovados por outras instâncias são adotados via app_config_cache.
+- Uma falha ao gravar o token é registrada no log e na métrica
+  estoquerapido_nuvemfiscal_token_persist_total; a gravação é refeita na próxima renovação.
+"""
+import asyncio
+import logging
+import os
+import threading
+import urllib.parse
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import aiohttp
+
+from src.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+TOKEN_URL = "https://auth.nuvemfiscal.com.br/oauth/token"
+TOKEN_SCOPE = "conta empresa cep cnpj nfce"
+SETTINGS_ID = "app_settings"
+
+_persist_total = metrics_registry.counter(
+    "estoquerapido_nuvemfiscal_token_persist_total",
+    "Gravações do token da Nuvem Fiscal nas configurações do sistema por resultado (success, error).",
+    ("outcome",),
+)
+
+
+@dataclass(frozen=True)
+class _Token:
+    access_token: str
+    expires_at: datetime
+
+
+class NuvemFiscalTokenManager:
+    """Gerenciador do token da Nuvem Fiscal compartilhado pelo processo."""
+
+    def __init__(self, refresh_margin_seconds: int | None = None):
+        self._refresh_margin_seconds = refresh_margin_seconds
+        self._token: _Token | None = None
+        self._persisted_token: str | None = None
+        self._settings_loaded = False
+        self._inflight: Future | None = None
+        self._lock = threading.Lock()
+        self._background: set[asyncio.Task] = set()
+        self._missing_credentials_logged = False
+
+    @property
+    def refresh_margin(self) -> timedelta:
+        if self._refresh_margin_seconds is None:
+            self._refresh_margin_seconds = int(os.getenv('NUVEMFISCAL_TOKEN_REFRESH_MARGIN_SECONDS', '300'))
+        return timedelta(seconds=self._refresh_margin_seconds)
+
+    async def get_token(self) -> str | None:
+        """
+        Retorna um token de acesso válido, ou None se não for possível obtê-lo.
+
+        Returns:
+            str | None: O access_token.
+        """
+        token = self._token
+        now = datetime.now(UTC)
+
+        if token and now < token.expires_at - self.refresh_margin:
+            return token.access_token
+
+        if token and now < token.expires_at:
+            # Ainda válido: renova em segundo plano e devolve o token atual
+            self._refresh_in_background()
+            return token.access_token
+
+        token = await self._refresh()
+        return token.access_token if token else None
+
+    def invalidate(self) -> None:
+        """Descarta o token em memória (ex.: a API respondeu 401)."""
+        with self._lock:
+            self._token = None
+            # Força nova obtenção, sem reaproveitar o token persistido que foi rejeitado
+            self._settings_loaded = True
+
+    def _refresh_in_background(self) -> None:
+        task = asyncio.get_running_loop().create_task(self._refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _refresh(self) -> _Token | None:
+        # Single-flight: o primeiro chamador executa a renovação, os demais aguardam o mesmo Future
+        with self._lock:
+            inflight = self._inflight
+            leader = inflight is None
+            if leader:
+                inflight = self._inflight = Future()
+
+        if not leader:
+            return await asyncio.wrap_future(inflight)  # type: ignore [arg-type]
+
+        token: _Token | None = None
+        try:
+            token = await self._obtain_token()
+            with self._lock:
+                if token:
+                    self._token = token
+            inflight.set_result(token)  # type: ignore [union-attr]
+        except Exception as e:
+            logger.error(f"Erro ao renovar o token da Nuvem Fiscal: {e}")
+            inflight.set_result(None)  # type: ignore [union-attr]
+        finally:
+            with self._lock:
+                self._inflight = None
+        return token
+
+    async def _obtain_token(self) -> _Token | None:
+        if not self._settings_loaded:
+            self._settings_loaded = True
+            persisted = await asyncio.to_thread(self._load_persisted_token)
+            if persisted and datetime.now(UTC) < persisted.expires_at - self.refresh_margin:
+                logger.info("Token da Nuvem Fiscal reaproveitado das configurações do sistema")
+                return persisted
+
+        token_data = await self._request_new_token()
+        if not token_data:
+            return None
+
+        token = _Token(
+            access_token=token_data['access_token'],
+            expires_at=datetime.now(UTC) + timedelta(seconds=int(token_data.get('expires_in', 0))),
+        )
+        if token.access_token != self._persisted_token:
+            # Gravação fora do caminho crítico: o token já está disponível em memória
+            persist = asyncio.get_running_loop().create_task(asyncio.to_thread(self._persist_token, token))
+            self._background.add(persist)
+            persist.add_done_callback(self._background.discard)
+            persist.add_done_callback(self._on_persist_done)
+        return token
+
+    @staticmethod
+    def _on_persist_done(task: asyncio.Task) -> None:
+        # Recupera a exceção da gravação em segundo plano (senão ela só apareceria ao coletar a task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        _persist_total.inc(("error" if error else "success",))
+        if error:
+            logger.error(f"Token da Nuvem Fiscal não foi salvo nas configurações do sistema: {error}")
+
+    async def _request_new_token(self) -> dict[str, Any] | None:
+        """Obtém um novo token de acesso usando o fluxo OAuth 2.0 client_credentials."""
+        client_id = os.getenv("NUVEMFISCAL_CLIENT_ID")
+        client_secret = os.getenv("NUVEMFISCAL_CLIENT_SECRET")
+        if not client_id or not client_secret:
+            if not self._missing_credentials_logged:
+                logger.error("Credenciais da Nuvem Fiscal não encontradas nas variáveis de ambiente")
+                self._missing_credentials_logged = True
+            return None
+
+        params = {
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "grant_type": "client_credentials",
+            "scope": TOKEN_SCOPE,
+        }
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        timeout = aiohttp.ClientTimeout(total=15, connect=5)
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.post(TOKEN_URL, headers=headers, data=urllib.parse.urlencode(params)) as response:
+                if response.status != 200:
+                    logger.error(f"Erro ao obter token: Status {response.status}")
+                    return None
+                token_data = await response.json()
+
+        logger.info("Token da Nuvem Fiscal obtido com sucesso")
+        return token_data
+
+    def _load_persisted_token(self) -> _Token | None:
+        # Import tardio: evita carregar o Firestore ao importar os provedores
+        import src.domains.app_config.controllers.app_config_controllers as app_controllers
+
+        from src.domains.app_config.services.app_config_cache import app_config_cache
+
+        response = app_controllers.handle_get_config(SETTINGS_ID)
+        # Token renovado por outra instância chega pelo listener das configurações
+        app_config_cache.subscribe(SETTINGS_ID, self._on_settings_changed)
+        if response["status"] != "success":
+            logger.warning(f"Token da Nuvem Fiscal não reaproveitado das configurações: {response['message']}")
+            return None
+        settings = response["data"]["settings"]
+        self._persisted_token = settings.dfe_api_token
+        return self._token_from_settings(settings)
+
+    @staticmethod
+    def _token_from_settings(settings: Any) -> _Token | None:
+        expires_at = settings.dfe_api_token_expires_in
+        if not settings.dfe_api_token or not isinstance(expires_at, datetime):
+            return None
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=UTC)
+        return _Token(settings.dfe_api_token, expires_at)
+
+    def _on_settings_changed(self, settings: Any) -> None:
+        # Adota o token gravado em outro lugar se ele vencer depois do atual
+        token = self._token_from_settings(settings) if settings is not None else None
+        if token is None:
+            return
+        with self._lock:
+            self._persisted_token = token.access_token
+            if self._token is None or token.expires_at > self._token.expires_at:
+                self._token = token
+
+    def _persist_token(self, token: _Token) -> None:
+        """
+        Grava o token nas configurações do sistema (em transação).
+
+        Raises:
+            RuntimeError: Se a gravação falhar; o token continua válido em memória.
+        """
+        import dataclasses
+
+        import src.domains.app_config.controllers.app_config_controllers as app_controllers
+        from src.domains.app_config.models.app_config_model import AppConfig
+
+        def mutator(current: AppConfig | None) -> AppConfig:
+            # Leitura-modificação-escrita em transação: não sobrescreve alterações concorrentes
+            if current is None:
+                return AppConfig(dfe_api_token=token.access_token, dfe_api_token_expires_in=token.expires_at,
+                                 id=SETTINGS_ID)
+            return dataclasses.replace(current, dfe_api_token=token.access_token,
+                                       dfe_api_token_expires_in=token.expires_at)
+
+        response = app_controllers.handle_update_config(SETTINGS_ID, mutator)
+        if response["status"] == "error":
+            raise RuntimeError(f"Erro ao salvar settings no db: Mensagem {response['message']}")
+        self._persisted_token = token.access_token
+
+# Gerenciador global do processo, compartilhado por todas as sessões Flet
+nuvemfiscal_token_manager = NuvemFiscalTokenManager()
@@ -4,18 +4,37 @@ import os
 from typing import Optional
 import flet as ft
 
+from src.services.upload.upload_watcher import UPLOADS_DIR, upload_watcher
+
 logger = logging.getLogger(__name__)
 
+# Tempo máximo entre o fim do envio (progresso 1) e o arquivo aparecer em uploads/
+FILE_LANDED_TIMEOUT = 10
+
 
 class UploadFile:
-    def __init__(self, page: ft.Page, title_dialog: str, allowed_extensions: list, upload_timeout: int = 60) -> None:
+    """
+    Diálogo de seleção de arquivo (upload para uploads/) ou de URL.
+
+    Com bucket_prefix, o arquivo recebido é enviado direto ao bucket e a cópia local
+    removida: url_file passa a ser a URL no bucket (bucket_key guarda a chave). Um objeto enviado
+    que não chega ao chamador (troca para URL, tempo limite) é removido do bucket (discard_bucket_upload).
+    """
+
+    def __init__(self, page: ft.Page, title_dialog: str, allowed_extensions: list, upload_timeout: int = 60,
+                 bucket_prefix: str | None = None) -> None:
         self.page = page
         self.title_dialog = title_dialog
         self.allowed_extensions = allowed_extensions
         self.upload_timeout = upload_timeout
+        self.bucket_prefix = bucket_prefix
+        self.bucket_key: str | None = None
         self.is_url_web = False
         self.url_file = None
         self.upload_completed = False
+        self._upload_done: asyncio.Event | None = None  # Sinalizado pelo callback de progresso
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._upload_error: str | None = None
         self.progress_bar:ft.ProgressBar = ft.ProgressBar(visible=False)
         self.picker_dialog:ft.FilePicker = ft.FilePicker(
             on_result=self._pick_files_result, # type: ignore
@@ -69,6 +88,8 @@ class UploadFile:
     def _on_source_change(self, e):
         """Atualiza a interface com base na fonte selecionada (arquivo ou URL)."""
         self.is_url_web = e.control.value == "url"
+        if self.is_url_web:
+            self.discard_bucket_upload()
         self.dialog.content.controls[1].visible = self.is_url_web # type: ignore
         self.page.update()
 
@@ -109,6 +130,9 @@ class UploadFile:
         await self._upload_files(e.files)
         if self.future and not self.future.done(): # Garante que o future só seja definido uma vez
             self.future.set_result(self.url_file) # type: ignore
+        else:
+            # O chamador já desistiu (tempo limite ou cancelamento): o objeto no bucket ficaria órfão
+            self.discard_bucket_upload()
         self.close_dialog()
 
     async def _upload_files(self, files: list) -> None:
@@ -117,6 +141,12 @@ class UploadFile:
             self.progress_bar.value = 0
             self.progress_bar.update()
 
+            # O callback de progresso roda em outra thread (handler síncrono do Flet)
+            self._loop = asyncio.get_running_loop()
+            self._upload_done = asyncio.Event()
+            self._upload_error = None
+            self.upload_completed = False
+
             file_name = files[0].name
             upload_url = self.page.get_upload_url(file_name, 60)
             upload_files = [
@@ -126,26 +156,68 @@ class UploadFile:
                 )
             ]
             self.picker_dialog.upload(upload_files)
-            while not self.upload_completed:
-                await asyncio.sleep(0.1)
-            self.url_file = f"uploads/{file_name}"
+            await self._upload_done.wait()
+            if self._upload_error:
+                raise RuntimeError(self._upload_error)
+
+            self.url_file = f"{UPLOADS_DIR}/{file_name}"
             self.is_url_web = False
-            max_retries = 10
-            retry_count = 0
-            while not os.path.exists(self.url_file) and retry_count < max_retries:
-                await asyncio.sleep(1)
-                retry_count += 1
-            if not os.path.exists(self.url_file):
-                self.message_error = f"Arquivo {self.url_file} não foi encontrado após {max_retries} tentativas"
+            if not await upload_watcher.wait_for_file(self.url_file, timeout=FILE_LANDED_TIMEOUT):
+                self.message_error = f"Arquivo {self.url_file} não foi encontrado após {FILE_LANDED_TIMEOUT} segundos"
                 raise FileNotFoundError(self.message_error)
+
+            if self.bucket_prefix:
+                await self._stream_to_bucket()
         except Exception as e:
             self.message_error = f"Erro ao fazer upload do arquivo: {str(e)}"
             logger.error(self.message_error)
 
+    async def _stream_to_bucket(self) -> None:
+        """Envia o arquivo recebido ao bucket (multipart, executor do S3) e remove a cópia local."""
+        # Import tardio: bucket_controllers depende de src.services, que importa este módulo
+        import src.controllers.bucket_controllers as bucket_controllers
+        from src.shared.utils.file_helpers import generate_unique_bucket_filename
+
+        local_path = self.url_file
+        key = generate_unique_bucket_filename(original_filename=local_path, prefix=self.bucket_prefix)  # type: ignore [arg-type]
+        try:
+            self.url_file = await bucket_controllers.handle_upload_bucket_async(local_path=local_path, key=key)
+            self.bucket_key = key
+        except Exception:
+            self.url_file = None
+            raise
+        finally:
+            try:
+                os.remove(local_path)  # type: ignore [arg-type]
+            except OSError:
+                pass
+
+    def discard_bucket_upload(self) -> None:
+        """Enfileira a remoção do objeto enviado ao bucket (bucket_key) e limpa a referência."""
+        if not self.bucket_key:
+            return
+        import src.controllers.bucket_controllers as bucket_controllers
+
+        key, self.bucket_key = self.bucket_key, None
+        self.url_file = None
+        try:
+            bucket_controllers.handle_enqueue_delete_bucket(key)
+        except Exception as e:
+            logger.warning(f"Erro ao enfileirar a remoção do arquivo descartado {key}: {e}")
+
+    def _signal_upload_done(self) -> None:
+        if self._loop is not None and self._upload_done is not None:
+            self._loop.call_soon_threadsafe(self._upload_done.set)
+
     def _pick_files_progress(self, e: ft.FilePickerUploadEvent) -> None:
-        if e.progress == 1:
+        if e.error:
+            self._upload_error = e.error
+            self.progress_bar.visible = False
+            self._signal_upload_done()
+        elif e.progress == 1:
             self.upload_completed = True
             self.progress_bar.visible = False
+            self._signal_upload_done()
         else:
             self.upload_completed = False
             self.progress_bar.visible = True
@@ -0,0 +1,136 @@
+# upload_janitor.py
+"""
+Limpeza periódica do diretório de uploads do Flet.
+
+Arquivos enviados pelos usuários ficam em uploads/ até serem enviados ao bucket; uploads
+abandonados (formulário fechado sem salvar, erro no meio do fluxo) se acumulavam para sempre.
+O janitor remove, a cada UPLOADS_JANITOR_INTERVAL_SECONDS:
+1. arquivos mais antigos que UPLOADS_MAX_AGE_SECONDS;
+2. se o diretório ainda ultrapassar UPLOADS_MAX_BYTES, os arquivos mais antigos até voltar
+   ao limite, preservando os enviados há menos de UPLOADS_MIN_AGE_SECONDS (formulários abertos).
+"""
+import logging
+import os
+import threading
+import time
+
+from src.shared.metrics import metrics_registry
+from src.services.upload.upload_watcher import UPLOADS_DIR
+
+logger = logging.getLogger(__name__)
+
+_purged_files_total = metrics_registry.counter(
+    "estoquerapido_uploads_purged_files_total",
+    "Arquivos removidos do diretório de uploads pelo janitor, por motivo (age, budget)",
+    ("reason",),
+)
+_purged_bytes_total = metrics_registry.counter(
+    "estoquerapido_uploads_purged_bytes_total",
+    "Bytes removidos do diretório de uploads pelo janitor",
+)
+
+
+def _list_files(directory: str) -> list[tuple[str, float, int]]:
+    files = []
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # Removido por outra sessão durante a varredura
+            files.append((path, stat.st_mtime, stat.st_size))
+    return files
+
+
+def _remove(path: str, size: int, reason: str) -> bool:
+    try:
+        os.remove(path)
+    except OSError as e:
+        logger.warning(f"Não foi possível remover o upload {path}: {e}")
+        return False
+    _purged_files_total.inc((reason,))
+    _purged_bytes_total.inc(amount=size)
+    return True
+
+
+def purge_stale_uploads(directory: str = UPLOADS_DIR, max_age_seconds: int | None = None,
+                        max_total_bytes: int | None = None, min_age_seconds: int | None = None) -> dict[str, int]:
+    """
+    Remove uploads antigos e mantém o diretório dentro do limite de tamanho.
+
+    Args:
+        directory (str): Diretório de uploads.
+        max_age_seconds (int | None): Idade máxima de um arquivo (padrão: UPLOADS_MAX_AGE_SECONDS).
+        max_total_bytes (int | None): Tamanho máximo do diretório (padrão: UPLOADS_MAX_BYTES).
+        min_age_seconds (int | None): Arquivos mais novos nunca são removidos por tamanho
+                                      (padrão: UPLOADS_MIN_AGE_SECONDS).
+
+    Returns:
+        dict[str, int]: {"removed": arquivos removidos, "freed_bytes": bytes liberados, "remaining_bytes": ...}
+    """
+    if max_age_seconds is None:
+        max_age_seconds = int(os.getenv('UPLOADS_MAX_AGE_SECONDS', '86400'))
+    if max_total_bytes is None:
+        max_total_bytes = int(os.getenv('UPLOADS_MAX_BYTES', str(500 * 1024 * 1024)))
+    if min_age_seconds is None:
+        min_age_seconds = int(os.getenv('UPLOADS_MIN_AGE_SECONDS', '900'))
+
+    now = time.time()
+    removed = 0
+    freed = 0
+    kept: list[tuple[str, float, int]] = []
+
+    for path, mtime, size in _list_files(directory):
+        if now - mtime > max_age_seconds and _remove(path, size, "age"):
+            removed += 1
+            freed += size
+        else:
+            kept.append((path, mtime, size))
+
+    total = sum(size for _, _, size in kept)
+    if total > max_total_bytes:
+        # Mais antigos primeiro
+        for path, mtime, size in sorted(kept, key=lambda f: f[1]):
+            if total <= max_total_bytes:
+                break
+            if now - mtime < min_age_seconds:
+                continue
+            if _remove(path, size, "budget"):
+                removed += 1
+                freed += size
+                total -= size
+
+    if removed:
+        logger.info(f"Janitor de uploads: {removed} arquivo(s) removido(s), {freed / 1024 / 1024:.1f} MB liberados")
+    if total > max_total_bytes:
+        logger.warning(f"Diretório '{directory}' acima do limite ({total} > {max_total_bytes} bytes) "
+                       f"apenas com uploads recentes")
+    return {"removed": removed, "freed_bytes": freed, "remaining_bytes": total}
+
+
+def start_upload_janitor(directory: str = UPLOADS_DIR, interval_seconds: int | None = None) -> threading.Thread | None:
+    """
+    Inicia o janitor em uma thread daemon.
+
+    Returns:
+        threading.Thread | None: A thread do janitor, ou None se UPLOADS_JANITOR_INTERVAL_SECONDS for 0.
+    """
+    if interval_seconds is None:
+        interval_seconds = int(os.getenv('UPLOADS_JANITOR_INTERVAL_SECONDS', '3600') or 0)
+    if not interval_seconds:
+        logger.info("UPLOADS_JANITOR_INTERVAL_SECONDS=0. Janitor de uploads desabilitado.")
+        return None
+
+    def run() -> None:
+        while True:
+            try:
+                purge_stale_uploads(directory)
+            except Exception as e:
+                logger.error(f"Erro no janitor de uploads: {e}")
+            time.sleep(interval_seconds)
+
+    thread = threading.Thread(target=run, name="upload-janitor", daemon=True)
+    thread.start()
+    logger.info(f"Janitor de uploads iniciado (a cada {interval_seconds}s em '{directory}')")
+    return thread
@@ -0,0 +1,131 @@
+# upload_watcher.py
+"""
+Aguarda a chegada de arquivos no diretório de uploads do Flet sem polling.
+
+Um único observer do watchdog (instalado junto com o flet-cli) observa o diretório de
+uploads. Cada espera registra um asyncio.Event para o caminho esperado, que é sinalizado
+pela thread do observer via call_soon_threadsafe assim que o arquivo é criado, gravado
+ou movido para o diretório. Sem o watchdog, a espera recorre a polling com intervalo
+crescente.
+"""
+import asyncio
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+UPLOADS_DIR = "uploads"
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog ausente: espera por polling
+    FileSystemEventHandler = object  # type: ignore [assignment, misc]
+    Observer = None  # type: ignore [assignment, misc]
+
+
+class _Handler(FileSystemEventHandler):  # type: ignore [misc, valid-type]
+    def __init__(self, watcher: "UploadWatcher"):
+        super().__init__()
+        self._watcher = watcher
+
+    def on_any_event(self, event) -> None:
+        if event.is_directory:
+            return
+        self._watcher._notify(event.src_path)
+        if dest_path := getattr(event, "dest_path", None):
+            self._watcher._notify(dest_path)
+
+
+class UploadWatcher:
+    """Observer do diretório de uploads compartilhado pelas sessões do processo."""
+
+    def __init__(self, directory: str = UPLOADS_DIR):
+        self.directory = directory
+        self._waiters: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._lock = threading.Lock()
+        self._observer = None
+
+    def _ensure_observer(self) -> bool:
+        if Observer is None:
+            return False
+        with self._lock:
+            if self._observer is None:
+                try:
+                    os.makedirs(self.directory, exist_ok=True)
+                    observer = Observer()
+                    observer.schedule(_Handler(self), self.directory, recursive=False)
+                    observer.daemon = True
+                    observer.start()
+                    self._observer = observer
+                    logger.info(f"Observer do diretório '{self.directory}' iniciado")
+                except Exception as e:
+                    logger.warning(f"Não foi possível observar '{self.directory}', usando polling: {e}")
+                    return False
+            return True
+
+    def _notify(self, path: str) -> None:
+        with self._lock:
+            waiters = self._waiters.get(os.path.abspath(path), [])
+            for loop, event in waiters:
+                loop.call_soon_threadsafe(event.set)
+
+    async def wait_for_file(self, path: str, timeout: float = 10.0) -> bool:
+        """
+        Aguarda até que o arquivo exista, sem bloquear o event loop.
+
+        Args:
+            path (str): Caminho do arquivo (ex.: 'uploads/foto.jpg').
+            timeout (float): Tempo máximo de espera, em segundos.
+
+        Returns:
+            bool: True se o arquivo existe, False se o tempo esgotou.
+        """
+        if os.path.exists(path):
+            return True
+        if not self._ensure_observer():
+            return await self._poll(path, timeout)
+
+        key = os.path.abspath(path)
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        with self._lock:
+            self._waiters.setdefault(key, []).append((loop, event))
+        try:
+            # O arquivo pode ter chegado entre a primeira verificação e o registro do evento
+            if os.path.exists(path):
+                return True
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return os.path.exists(path)
+        except asyncio.TimeoutError:
+            return os.path.exists(path)
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(key, [])
+                if (loop, event) in waiters:
+                    waiters.remove((loop, event))
+                if not waiters:
+                    self._waiters.pop(key, None)
+
+    @staticmethod
+    async def _poll(path: str, timeout: float) -> bool:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.02
+        while not os.path.exists(path):
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+        return True
+
+    def stop(self) -> None:
+        with self._lock:
+            observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+
+
+# Observer global do processo, compartilhado por todas as sessões Flet
+upload_watcher = UploadWatcher()
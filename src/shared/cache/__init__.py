@@ -0,0 +1 @@
+from .reference_data_cache import ReferenceDataCache
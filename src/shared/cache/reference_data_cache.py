@@ -0,0 +1,205 @@
+# reference_data_cache.py
+"""
+Cache de dados de referência (categorias, formas de pagamento, ...) compartilhado por
+todas as sessões Flet do processo, indexado por empresa_id.
+
+Modos (REFERENCE_CACHE_MODE no .env):
+- "ttl" (padrão): o valor é lido via loader e expira após REFERENCE_CACHE_TTL_SECONDS.
+- "snapshot": um listener do Firestore (on_snapshot) mantém o valor sempre atualizado;
+  o loader só é usado se o primeiro snapshot não chegar a tempo. O listener é vigiado: se a
+  stream for encerrada (ex.: exceção na thread do listener), a chave volta ao modo TTL por
+  REFERENCE_CACHE_TTL_SECONDS e o listener é registrado de novo depois; um valor sem snapshot há
+  mais de REFERENCE_CACHE_SNAPSHOT_MAX_AGE_SECONDS é relido pelo loader.
+
+Sessões simultâneas da mesma empresa disparam uma única leitura (single-flight).
+Alterações feitas pelo próprio processo chamam invalidate(empresa_id).
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from src.shared.env import env_float, env_int, env_str
+from src.shared.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# Tempo máximo de espera pelo primeiro snapshot antes de recorrer ao loader
+SNAPSHOT_WAIT_SECONDS = 10
+
+_requests_total = metrics_registry.counter(
+    "estoquerapido_reference_cache_requests_total",
+    "Consultas ao cache de dados de referência por resultado (hit, miss, wait)",
+    ("cache", "result"),
+)
+
+Loader = Callable[[], Any]
+# Recebe um callback(valor) e retorna o handle do listener (com unsubscribe())
+Watcher = Callable[[Callable[[Any], None]], Any]
+
+
+class _Entry:
+    __slots__ = ("lock", "value", "expires_at", "watch", "snapshot_ready", "snapshot_at", "watch_retry_at")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.value: Any = None
+        self.expires_at = 0.0
+        self.watch: Any = None
+        self.snapshot_ready = threading.Event()
+        self.snapshot_at = 0.0      # Último valor entregue pelo listener (ou relido pelo loader)
+        self.watch_retry_at = 0.0   # Após um listener encerrado, modo TTL até este instante
+
+
+class ReferenceDataCache:
+    """Cache por empresa com carregamento single-flight, TTL e modo snapshot listener."""
+
+    def __init__(self, name: str, ttl_seconds: int | None = None, mode: str | None = None):
+        self.name = name
+        # None: REFERENCE_CACHE_TTL_SECONDS / REFERENCE_CACHE_MODE, compartilhados pelos caches de referência
+        self._ttl_seconds = ttl_seconds
+        self._mode = mode
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ttl_seconds(self) -> int:
+        if self._ttl_seconds is None:
+            self._ttl_seconds = env_int('REFERENCE_CACHE_TTL_SECONDS', 300)
+        return self._ttl_seconds
+
+    @property
+    def mode(self) -> str:
+        if self._mode is None:
+            self._mode = env_str('REFERENCE_CACHE_MODE', 'ttl').lower()
+        return self._mode
+
+    @property
+    def snapshot_max_age(self) -> float:
+        return env_float('REFERENCE_CACHE_SNAPSHOT_MAX_AGE_SECONDS', 3600)
+
+    def _get_entry(self, key: str) -> _Entry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry()
+                self._entries[key] = entry
+            return entry
+
+    def get(self, key: str, loader: Loader, watcher: Watcher | None = None) -> Any:
+        """
+        Retorna o valor em cache para a chave, carregando-o se necessário.
+
+        Args:
+            key (str): Chave do cache (empresa_id).
+            loader (Callable): Função que lê o valor do banco de dados.
+            watcher (Callable | None): Função que registra um listener de snapshot (modo "snapshot").
+
+        Returns:
+            Any: O valor em cache (listas são devolvidas como cópia rasa).
+        """
+        entry = self._get_entry(key)
+
+        if self.mode == "snapshot" and watcher is not None and time.monotonic() >= entry.watch_retry_at:
+            value = self._get_from_snapshot(key, entry, loader, watcher)
+            if value is not None:
+                return self._copy(value)
+
+        if entry.value is not None and time.monotonic() < entry.expires_at:
+            _requests_total.inc((self.name, "hit"))
+            return self._copy(entry.value)
+
+        # Single-flight: apenas uma sessão executa o loader; as demais aguardam o lock
+        # e reaproveitam o valor carregado.
+        waited = entry.lock.locked()
+        with entry.lock:
+            if entry.value is not None and time.monotonic() < entry.expires_at:
+                _requests_total.inc((self.name, "wait" if waited else "hit"))
+                return self._copy(entry.value)
+
+            _requests_total.inc((self.name, "miss"))
+            value = loader()
+            entry.value = value
+            entry.expires_at = time.monotonic() + self.ttl_seconds
+            return self._copy(value)
+
+    def _get_from_snapshot(self, key: str, entry: _Entry, loader: Loader, watcher: Watcher) -> Any:
+        with entry.lock:
+            if entry.watch is not None and not self._watch_active(entry.watch):
+                # Stream encerrada: o valor deixou de ser atualizado. Modo TTL até a próxima tentativa
+                logger.warning(f"Listener de snapshot '{self.name}' de {key} encerrado. "
+                               f"Usando leitura com TTL por {self.ttl_seconds}s.")
+                self._drop_watch(entry)
+                entry.watch_retry_at = time.monotonic() + self.ttl_seconds
+                return None
+
+            if entry.watch is None:
+                def on_value(value: Any) -> None:
+                    entry.value = value
+                    entry.expires_at = 0.0  # Mantido pelo listener; o TTL só vale sem listener
+                    entry.snapshot_at = time.monotonic()
+                    entry.snapshot_ready.set()
+
+                try:
+                    entry.watch = watcher(on_value)
+                    logger.info(f"Listener de snapshot '{self.name}' registrado para {key}")
+                except Exception as e:
+                    logger.error(f"Erro ao registrar listener de snapshot '{self.name}' para {key}: {e}")
+                    return None
+
+        if entry.snapshot_ready.wait(SNAPSHOT_WAIT_SECONDS):
+            if time.monotonic() - entry.snapshot_at <= self.snapshot_max_age:
+                _requests_total.inc((self.name, "hit"))
+                return entry.value
+            # Sem snapshot há muito tempo: confirma o valor com uma leitura (single-flight)
+            with entry.lock:
+                if time.monotonic() - entry.snapshot_at > self.snapshot_max_age:
+                    _requests_total.inc((self.name, "miss"))
+                    entry.value = loader()
+                    entry.snapshot_at = time.monotonic()
+            return entry.value
+
+        logger.warning(f"Primeiro snapshot '{self.name}' de {key} não chegou em {SNAPSHOT_WAIT_SECONDS}s. Usando leitura direta.")
+        return None
+
+    @staticmethod
+    def _watch_active(watch: Any) -> bool:
+        """False se a stream do listener foi encerrada (Watch.is_active do SDK do Firestore)."""
+        return bool(getattr(watch, "is_active", True))
+
+    def _drop_watch(self, entry: _Entry) -> None:
+        """Descarta o listener da entrada (chamado com entry.lock)."""
+        try:
+            entry.watch.unsubscribe()
+        except Exception as e:
+            logger.warning(f"Erro ao cancelar listener de snapshot '{self.name}': {e}")
+        entry.watch = None
+        entry.snapshot_ready.clear()
+        entry.value = None
+        entry.expires_at = 0.0
+
+    def invalidate(self, key: str) -> None:
+        """Descarta o valor da chave. Com listener ativo, o próprio snapshot traz a alteração."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry.watch is not None:
+            return
+        with entry.lock:
+            entry.value = None
+            entry.expires_at = 0.0
+
+    def close(self) -> None:
+        """Cancela os listeners de snapshot e limpa o cache."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            if entry.watch is not None:
+                try:
+                    entry.watch.unsubscribe()
+                except Exception as e:
+                    logger.warning(f"Erro ao cancelar listener de snapshot '{self.name}': {e}")
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        return list(value) if isinstance(value, list) else value
@@ -0,0 +1,45 @@
+"""
+Leitura de configurações do .env.
+
+O main.py importa as páginas, serviços e repositórios antes de chamar load_dotenv(): um
+os.getenv no nível de módulo (ou no __init__ de um singleton criado na importação) lê o
+ambiente sem o .env e fica com o valor padrão. Por isso, configurações de módulos com
+objetos compartilhados são lidas por estas funções no primeiro uso (propriedade que guarda
+o valor, ou dentro da função que o utiliza), e não na importação.
+
+Valor ausente ou vazio usa o padrão; valor numérico inválido também, com um aviso no log.
+"""
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def env_str(name: str, default: str = "") -> str:
+    """Texto do .env, sem espaços nas pontas."""
+    value = os.getenv(name, "").strip()
+    return value or default
+
+
+def env_int(name: str, default: int) -> int:
+    """Inteiro do .env."""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Valor inválido para {name} no .env. Usando {default}.")
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    """Número decimal do .env."""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Valor inválido para {name} no .env. Usando {default}.")
+        return default
@@ -0,0 +1,2 @@
+from .registry import metrics_registry, empresa_label_limiter, Counter, Gauge, Histogram, LabelLimiter
+from .controller_metrics import instrument_controller
@@ -0,0 +1,134 @@
+# controller_metrics.py
+"""
+Instrumentação dos controllers (handle_*): latência, sucesso/erro e chamadas em andamento.
+
+Uso:
+    from src.shared.metrics import instrument_controller
+
+    @instrument_controller("produtos")
+    def handle_get_all(empresa_id: str, status_deleted: bool = False) -> dict[str, Any]:
+        ...
+
+O resultado é classificado como:
+    - "success": retorno normal;
+    - "error": dict de resposta com {"status": "error"} ou {"is_error": True};
+    - "exception": exceção propagada pelo controller (é re-lançada sem alteração).
+"""
+import functools
+import inspect
+import time
+
+from .registry import metrics_registry, empresa_label_limiter
+
+CONTROLLER_LABELS = ("controller", "function", "empresa")
+
+controller_requests_total = metrics_registry.counter(
+    "estoquerapido_controller_requests_total",
+    "Total de chamadas aos controllers por resultado (success, error, exception).",
+    CONTROLLER_LABELS + ("outcome",),
+)
+controller_latency_seconds = metrics_registry.histogram(
+    "estoquerapido_controller_latency_seconds",
+    "Latência das chamadas aos controllers em segundos.",
+    CONTROLLER_LABELS,
+)
+controller_in_flight = metrics_registry.gauge(
+    "estoquerapido_controller_in_flight",
+    "Chamadas aos controllers em andamento.",
+    ("controller", "function"),
+)
+
+
+def _response_outcome(result) -> str:
+    """Classifica o retorno do controller segundo o padrão de resposta dict do projeto."""
+    if isinstance(result, dict):
+        if result.get("status") == "error" or result.get("is_error") is True:
+            return "error"
+    return "success"
+
+
+def _empresa_resolver(func):
+    """
+    Monta, uma única vez por função, um extrator do empresa_id dos argumentos da chamada.
+
+    Procura um parâmetro chamado 'empresa_id' (ou 'empresa_logada'); na ausência dele,
+    usa o atributo 'empresa_id' do primeiro argumento (Produto, Pedido, Cliente...).
+    """
+    params = list(inspect.signature(func).parameters)
+    if params and params[0] == "self":
+        params = params[1:]
+        offset = 1
+    else:
+        offset = 0
+
+    for name in ("empresa_id", "empresa_logada"):
+        if name in params:
+            position = params.index(name) + offset
+
+            def from_param(args, kwargs, name=name, position=position):
+                if name in kwargs:
+                    return kwargs[name]
+                return args[position] if len(args) > position else None
+            return from_param
+
+    def from_first_arg(args, kwargs):
+        if len(args) > offset:
+            return getattr(args[offset], "empresa_id", None)
+        return None
+    return from_first_arg
+
+
+def instrument_controller(controller: str):
+    """
+    Decorator que registra métricas de latência, resultado e concorrência de um controller.
+
+    Funciona com funções síncronas e assíncronas (async def) e com métodos de classe.
+
+    Args:
+        controller (str): Nome lógico do controller (ex.: "produtos", "pedidos").
+    """
+    def decorator(func):
+        function_name = func.__name__
+        in_flight_labels = (controller, function_name)
+        resolve_empresa = _empresa_resolver(func)
+
+        def record(args, kwargs, started: float, outcome: str) -> None:
+            elapsed = time.perf_counter() - started
+            try:
+                empresa = empresa_label_limiter(resolve_empresa(args, kwargs))
+            except Exception:
+                empresa = ""
+            labels = (controller, function_name, empresa)
+            controller_latency_seconds.observe(labels, elapsed)
+            controller_requests_total.inc(labels + (outcome,))
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                controller_in_flight.inc(in_flight_labels)
+                started = time.perf_counter()
+                outcome = "exception"
+                try:
+                    result = await func(*args, **kwargs)
+                    outcome = _response_outcome(result)
+                    return result
+                finally:
+                    controller_in_flight.dec(in_flight_labels)
+                    record(args, kwargs, started, outcome)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            controller_in_flight.inc(in_flight_labels)
+            started = time.perf_counter()
+            outcome = "exception"
+            try:
+                result = func(*args, **kwargs)
+                outcome = _response_outcome(result)
+                return result
+            finally:
+                controller_in_flight.dec(in_flight_labels)
+                record(args, kwargs, started, outcome)
+        return wrapper
+
+    return decorator
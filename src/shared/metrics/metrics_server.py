@@ -0,0 +1,66 @@
+# metrics_server.py
+"""
+Endpoint HTTP /metrics (formato Prometheus) servido ao lado do app Flet.
+
+O ft.app() controla o próprio servidor web, então o endpoint roda em um uvicorn
+separado, numa thread daemon, na porta definida por METRICS_PORT. Sem METRICS_PORT
+no .env o servidor não é iniciado. Se METRICS_TOKEN estiver definido, o scrape deve
+enviar o header 'Authorization: Bearer <METRICS_TOKEN>'.
+"""
+import logging
+import os
+import threading
+
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+import uvicorn
+
+from .registry import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def create_metrics_app(token: str | None = None) -> FastAPI:
+    """Cria o app FastAPI com as rotas /metrics e /health."""
+    app = FastAPI(title="EstoqueRápido - Métricas", docs_url=None, redoc_url=None, openapi_url=None)
+
+    @app.get("/metrics")
+    def metrics(authorization: str | None = Header(default=None)):
+        if token and authorization != f"Bearer {token}":
+            raise HTTPException(status_code=401, detail="Não autorizado")
+        return PlainTextResponse(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok"}
+
+    return app
+
+
+def start_metrics_server(host: str | None = None, port: int | None = None) -> threading.Thread | None:
+    """
+    Inicia o servidor de métricas em uma thread daemon.
+
+    Returns:
+        threading.Thread | None: A thread do servidor, ou None se METRICS_PORT não estiver configurado.
+    """
+    port = port or int(os.getenv('METRICS_PORT', '0') or 0)
+    if not port:
+        logger.info("METRICS_PORT não configurado. Endpoint /metrics desabilitado.")
+        return None
+
+    host = host or os.getenv('METRICS_HOST', '0.0.0.0')
+    app = create_metrics_app(os.getenv('METRICS_TOKEN'))
+
+    # log_config=None preserva a configuração de logging do EstoqueRápido
+    config = uvicorn.Config(app, host=host, port=port, log_config=None, access_log=False)
+    # Fora da thread principal o uvicorn não instala handlers de sinal, preservando
+    # o shutdown gracioso configurado em s3_logging_handler.
+    server = uvicorn.Server(config)
+
+    thread = threading.Thread(target=server.run, name="metrics-server", daemon=True)
+    thread.start()
+    logger.info(f"Endpoint de métricas disponível em http://{host}:{port}/metrics")
+    return thread
@@ -0,0 +1,231 @@
+# registry.py
+"""
+Registro de métricas em memória no formato de exposição do Prometheus.
+
+Implementação mínima de Counter, Gauge e Histogram, thread-safe, sem dependências
+externas. Todas as métricas são registradas no `metrics_registry` global do processo
+e renderizadas em texto pelo endpoint /metrics (ver metrics_server.py).
+"""
+from bisect import bisect_left
+from threading import Lock
+
+from src.shared.env import env_int
+
+# Buckets padrão de latência em segundos (de 5ms a 10s)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Valor usado quando o limite de cardinalidade de um label é atingido
+OVERFLOW_LABEL_VALUE = "__outros__"
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(label_names: tuple[str, ...], label_values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base comum: nome, descrição, nomes dos labels e um lock por métrica."""
+    metric_type = "untyped"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._lock = Lock()
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.metric_type}"]
+
+    def render(self) -> list[str]:
+        raise NotImplementedError("Este método deve ser implementado pela subclasse")
+
+
+class Counter(_Metric):
+    """Contador monotônico (só incrementa)."""
+    metric_type = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...] = ()):
+        super().__init__(name, help_text, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, label_values: tuple[str, ...] = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def get(self, label_values: tuple[str, ...] = ()) -> float:
+        return self._values.get(label_values, 0)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        with self._lock:
+            items = list(self._values.items())
+        for label_values, value in items:
+            lines.append(f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Valor instantâneo que pode subir e descer (ex.: chamadas em andamento)."""
+    metric_type = "gauge"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...] = ()):
+        super().__init__(name, help_text, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, label_values: tuple[str, ...] = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def dec(self, label_values: tuple[str, ...] = (), amount: float = 1) -> None:
+        self.inc(label_values, -amount)
+
+    def set(self, label_values: tuple[str, ...], value: float) -> None:
+        with self._lock:
+            self._values[label_values] = value
+
+    def get(self, label_values: tuple[str, ...] = ()) -> float:
+        return self._values.get(label_values, 0)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        with self._lock:
+            items = list(self._values.items())
+        for label_values, value in items:
+            lines.append(f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Histograma com buckets fixos; guarda contagem por bucket, soma e total."""
+    metric_type = "histogram"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # label_values -> [contagens por bucket (+Inf no final), soma, total]
+        self._values: dict[tuple[str, ...], list] = {}
+
+    def observe(self, label_values: tuple[str, ...], value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            data = self._values.get(label_values)
+            if data is None:
+                data = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._values[label_values] = data
+            data[0][index] += 1
+            data[1] += value
+            data[2] += 1
+
+    def get_count(self, label_values: tuple[str, ...] = ()) -> int:
+        data = self._values.get(label_values)
+        return data[2] if data else 0
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        with self._lock:
+            items = [(k, (list(v[0]), v[1], v[2])) for k, v in self._values.items()]
+        for label_values, (bucket_counts, total_sum, count) in items:
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets + (float("inf"),), bucket_counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(upper_bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, label_values, le)} {cumulative}")
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total_sum)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class LabelLimiter:
+    """
+    Limita a cardinalidade de um label (ex.: empresa_id).
+
+    Os primeiros `max_values` valores distintos são aceitos; os seguintes são agrupados
+    em OVERFLOW_LABEL_VALUE para não explodir o número de séries no Prometheus.
+    """
+
+    def __init__(self, max_values: int | None = None, env_var: str | None = None, default: int = 50):
+        # Sem max_values, o limite vem de env_var no primeiro valor observado (padrão: default)
+        self._max_values = max_values
+        self._env_var = env_var
+        self._default = default
+        self._seen: set[str] = set()
+        self._lock = Lock()
+
+    @property
+    def max_values(self) -> int:
+        if self._max_values is None:
+            self._max_values = env_int(self._env_var, self._default) if self._env_var else self._default
+        return self._max_values
+
+    def __call__(self, value: str | None) -> str:
+        if not value:
+            return ""
+        if value in self._seen:
+            return value
+        with self._lock:
+            if value in self._seen:
+                return value
+            if len(self._seen) >= self.max_values:
+                return OVERFLOW_LABEL_VALUE
+            self._seen.add(value)
+            return value
+
+
+class MetricsRegistry:
+    """Registro de métricas do processo. Métricas com o mesmo nome são reaproveitadas."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = Lock()
+
+    def _get_or_create(self, cls, name: str, help_text: str, label_names: tuple[str, ...], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, help_text, label_names, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Métrica '{name}' já registrada com outro tipo ({metric.metric_type})")
+            return metric
+
+    def counter(self, name: str, help_text: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, label_names)
+
+    def gauge(self, name: str, help_text: str, label_names: tuple[str, ...] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, label_names)
+
+    def histogram(self, name: str, help_text: str, label_names: tuple[str, ...] = (),
+                  buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, label_names, buckets=buckets)
+
+    def render(self) -> str:
+        """Renderiza todas as métricas no formato texto de exposição do Prometheus (v0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Registro global do processo, compartilhado por todas as sessões Flet
+metrics_registry = MetricsRegistry()
+
+# Limite de valores distintos de empresa_id nos labels (configurável via .env)
+empresa_label_limiter = LabelLimiter(env_var='METRICS_MAX_EMPRESA_LABELS')
@@ -5,4 +5,6 @@ from .messages import message_snackbar, show_banner, MessageType, ProgressiveMes
 from .tools import get_first_and_last_name, initials
 from .time_zone import format_datetime_to_utc_minus_3
 from .money_numpy import Money
-from .gerador_senha import gerar_senha
\ No newline at end of file
+from .gerador_senha import gerar_senha
+from .search_index import SearchIndex, fold_text
+from .rate_limiter import TokenBucket
@@ -0,0 +1,84 @@
+# rate_limiter.py
+"""
+Limitador de taxa (token bucket) para clientes de APIs externas.
+
+O limitador enfileira em vez de falhar: cada chamada reserva um token e, se o balde estiver
+vazio, aguarda a sua vez. As reservas são feitas sob lock e permitem saldo negativo, de modo
+que chamadas simultâneas recebem horários de liberação sucessivos (ordem de chegada).
+
+Funciona com threads (acquire) e com asyncio (acquire_async), compartilhando o mesmo balde.
+"""
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket com reposição contínua.
+
+    Args:
+        rate (float): Tokens repostos por segundo.
+        capacity (int): Tamanho do balde (rajada máxima sem espera).
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("rate deve ser maior que zero")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, burst: int = 1) -> "TokenBucket":
+        return cls(rate=requests_per_minute / 60.0, capacity=burst)
+
+    def _reserve(self, tokens: float = 1, max_wait: float | None = None) -> float | None:
+        """
+        Reserva os tokens e retorna quantos segundos o chamador deve aguardar.
+        Com max_wait, não reserva e retorna None se a espera for maior que max_wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            wait = max(0.0, (tokens - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= tokens
+            return wait
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Aguarda (bloqueando a thread) até haver token disponível. Retorna o tempo esperado."""
+        wait = self._reserve(tokens) or 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """Aguarda (sem bloquear o event loop) até haver token disponível. Retorna o tempo esperado."""
+        wait = self._reserve(tokens) or 0.0
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    async def try_acquire_async(self, max_wait: float, tokens: float = 1) -> bool:
+        """
+        Como acquire_async, mas desiste (sem consumir tokens) se a espera passar de max_wait.
+        Útil para consultas interativas com fontes alternativas.
+        """
+        wait = self._reserve(tokens, max_wait=max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def penalize(self, seconds: float) -> None:
+        """Esvazia o balde por `seconds` segundos (ex.: após um 429 com Retry-After)."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+            self._updated_at = now
@@ -0,0 +1,151 @@
+# search_index.py
+"""
+Índice de busca em memória para listas de itens exibidas nos componentes de busca
+(DialogSearch, DropdownSearch).
+
+- Acentos e caixa são ignorados ("Sabão" casa com "sabao").
+- Cada palavra da descrição é inserida em uma trie de prefixos; a consulta exige que
+  todas as palavras digitadas sejam prefixo de alguma palavra do item.
+- Sem resultados por prefixo, cai para busca por trecho (substring) na descrição.
+- Consultas que estendem a anterior (usuário continuou digitando) filtram apenas o
+  resultado anterior em vez de percorrer todo o catálogo.
+- Os resultados são ordenados por relevância e limitados a `top_k` itens.
+"""
+import heapq
+import re
+import unicodedata
+from typing import Any
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def fold_text(text: str) -> str:
+    """Remove acentos e normaliza a caixa para comparação."""
+    normalized = unicodedata.normalize("NFKD", text or "")
+    return "".join(ch for ch in normalized if not unicodedata.combining(ch)).casefold().strip()
+
+
+def tokenize(text: str) -> list[str]:
+    """Retorna as palavras de um texto já normalizado por fold_text."""
+    return _TOKEN_PATTERN.findall(text)
+
+
+class _TrieNode:
+    __slots__ = ("children", "item_indexes")
+
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        # Índices dos itens que possuem alguma palavra passando por este nó
+        self.item_indexes: set[int] = set()
+
+
+class SearchIndex:
+    """Índice de prefixos construído uma vez por lista de itens."""
+
+    def __init__(self, items: list[dict[str, Any]], key: str = "description", top_k: int = 50):
+        self.items = items
+        self.key = key
+        self.top_k = top_k
+        self._folded: list[str] = []
+        self._root = _TrieNode()          # Todas as palavras de cada item
+        self._first_root = _TrieNode()    # Apenas a primeira palavra de cada item
+
+        for index, item in enumerate(items):
+            folded = fold_text(str(item.get(key) or ""))
+            tokens = tokenize(folded)
+            self._folded.append(folded)
+            for token in set(tokens):
+                self._insert(self._root, token, index)
+            if tokens:
+                self._insert(self._first_root, tokens[0], index)
+
+        # Desempate: descrições mais curtas primeiro, depois ordem alfabética
+        by_relevance = sorted(range(len(items)), key=lambda i: (len(self._folded[i]), self._folded[i]))
+        self._order = [0] * len(items)
+        for position, index in enumerate(by_relevance):
+            self._order[index] = position
+
+        # Estado da última consulta, usado para o estreitamento incremental
+        self._last_query: str | None = None
+        self._last_matches: set[int] = set()
+        self._last_by_prefix = True
+
+    @staticmethod
+    def _insert(root: _TrieNode, token: str, index: int) -> None:
+        node = root
+        for ch in token:
+            node = node.children.setdefault(ch, _TrieNode())
+            node.item_indexes.add(index)
+
+    @staticmethod
+    def _prefix_lookup(root: _TrieNode, prefix: str) -> set[int]:
+        node = root
+        for ch in prefix:
+            node = node.children.get(ch)  # type: ignore [assignment]
+            if node is None:
+                return set()
+        return node.item_indexes
+
+    def _find_matches(self, query: str, query_tokens: list[str]) -> tuple[set[int], bool]:
+        """Retorna (índices encontrados, se casaram por prefixo)."""
+        previous = self._last_query
+        narrowing = bool(previous) and query.startswith(previous)  # type: ignore [arg-type]
+
+        if narrowing and not self._last_by_prefix:
+            # A consulta anterior já caiu na busca por trecho: a nova é um subconjunto dela
+            return {i for i in self._last_matches if query in self._folded[i]}, False
+
+        postings = [self._prefix_lookup(self._root, q) for q in query_tokens]
+        if narrowing:
+            # Interseção a partir do resultado anterior, em geral bem menor que o catálogo
+            found = self._last_matches.intersection(*postings)
+        else:
+            postings.sort(key=len)
+            found = postings[0].intersection(*postings[1:])
+        if found:
+            return found, True
+
+        return {i for i, folded in enumerate(self._folded) if query in folded}, False
+
+    def _top(self, candidates: set[int], limit: int) -> list[int]:
+        return heapq.nsmallest(limit, candidates, key=self._order.__getitem__)
+
+    def search(self, text: str) -> tuple[list[dict[str, Any]], int]:
+        """
+        Busca itens pelo texto digitado.
+
+        Itens cuja primeira palavra começa com a primeira palavra digitada vêm antes
+        dos demais; em cada grupo, descrições mais curtas primeiro.
+
+        Args:
+            text (str): Texto digitado pelo usuário.
+
+        Returns:
+            tuple[list[dict], int]: Os `top_k` itens mais relevantes e o total de itens encontrados.
+        """
+        query = fold_text(text)
+        if not query:
+            self._last_query = None
+            return self.items[:self.top_k], len(self.items)
+
+        query_tokens = tokenize(query) or [query]
+        matches, by_prefix = self._find_matches(query, query_tokens)
+
+        self._last_query = query
+        self._last_matches = matches
+        self._last_by_prefix = by_prefix
+
+        if by_prefix:
+            first_word = matches & self._prefix_lookup(self._first_root, query_tokens[0])
+            best = self._top(first_word, self.top_k)
+            if len(best) < self.top_k:
+                best += self._top(matches - first_word, self.top_k - len(best))
+        else:
+            best = self._top(matches, self.top_k)
+
+        return [self.items[i] for i in best], len(matches)
+
+    def first_match(self, text: str) -> dict[str, Any] | None:
+        """Retorna o item mais relevante para o texto, ou None."""
+        results, _ = self.search(text)
+        return results[0] if results else None
@@ -1,10 +1,11 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 
 class BucketStorage(ABC):
 
     @abstractmethod
-    def upload(self, local_path: str, key: str) -> str:
+    def upload(self, local_path: str, key: str, content_type: str | None = None, cache_control: str | None = None) -> str:
         """Retorna a url completa do arquivo no bucket"""
         raise NotImplementedError("Este método deve ser implementado pela subclasse")
 
@@ -12,3 +13,38 @@ class BucketStorage(ABC):
     def delete(self, key: str) -> bool:
         """Retorna True se sucesso ao deletar, False caso contrário"""
         raise NotImplementedError("Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def delete_many(self, keys: list[str]) -> dict[str, bool]:
+        """Remove vários arquivos em lote. Retorna, para cada chave, True se foi deletada"""
+        raise NotImplementedError("Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Retorna True se o arquivo existe no bucket"""
+        raise NotImplementedError("Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def get_url(self, key: str) -> str:
+        """Retorna a url completa do arquivo no bucket, sem verificar se ele existe"""
+        raise NotImplementedError("Este método deve ser implementado pela subclasse")
+
+    @abstractmethod
+    def get_download_url(self, key: str, expires_in: int = 3600, download_name: str | None = None) -> str:
+        """Retorna uma url temporária (válida por expires_in segundos) para baixar o arquivo"""
+        raise NotImplementedError("Este método deve ser implementado pela subclasse")
+
+    # Versões assíncronas: por padrão executam o método síncrono em uma thread.
+    # Implementações com executor próprio devem sobrescrevê-las.
+
+    async def upload_async(self, local_path: str, key: str, content_type: str | None = None, cache_control: str | None = None) -> str:
+        return await asyncio.to_thread(self.upload, local_path, key, content_type, cache_control)
+
+    async def delete_async(self, key: str) -> bool:
+        return await asyncio.to_thread(self.delete, key)
+
+    async def delete_many_async(self, keys: list[str]) -> dict[str, bool]:
+        return await asyncio.to_thread(self.delete_many, keys)
+
+    async def exists_async(self, key: str) -> bool:
+        return await asyncio.to_thread(self.exists, key)
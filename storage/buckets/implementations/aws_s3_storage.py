@@ -1,14 +1,40 @@
 from src.services import S3FileManager
+from src.services.aws.s3_file_manager import PUBLIC_PREFIX
 from storage.buckets import BucketStorage
 
 
 class AmazonS3Adapter(BucketStorage):
-    def __init__(self):
-        self.bucket_s3 = S3FileManager()
+    def __init__(self, prefix: str = PUBLIC_PREFIX):
+        # Barato: o cliente boto3 é compartilhado pelo processo
+        self.bucket_s3 = S3FileManager(prefix)
 
-    def upload(self, local_path: str, key: str) -> str:
-        self.bucket_s3.upload(local_path, key)
-        return self.bucket_s3.get_url()
+    def upload(self, local_path: str, key: str, content_type: str | None = None, cache_control: str | None = None) -> str:
+        self.bucket_s3.upload(local_path, key, content_type=content_type, cache_control=cache_control)
+        return self.bucket_s3.get_url(key)
 
     def delete(self, key: str) -> bool:
         return self.bucket_s3.delete(key)
+
+    def delete_many(self, keys: list[str]) -> dict[str, bool]:
+        return self.bucket_s3.delete_many(keys)
+
+    def exists(self, key: str) -> bool:
+        return self.bucket_s3.exists(key)
+
+    def get_url(self, key: str) -> str:
+        return self.bucket_s3.get_url(key)
+
+    def get_download_url(self, key: str, expires_in: int = 3600, download_name: str | None = None) -> str:
+        return self.bucket_s3.get_presigned_url(key, expires_in=expires_in, download_name=download_name)
+
+    async def upload_async(self, local_path: str, key: str, content_type: str | None = None, cache_control: str | None = None) -> str:
+        return await self.bucket_s3.upload_async(local_path, key, content_type=content_type, cache_control=cache_control)
+
+    async def delete_async(self, key: str) -> bool:
+        return await self.bucket_s3.delete_async(key)
+
+    async def delete_many_async(self, keys: list[str]) -> dict[str, bool]:
+        return await self.bucket_s3.delete_many_async(keys)
+
+    async def exists_async(self, key: str) -> bool:
+        return await self.bucket_s3.exists_async(key)
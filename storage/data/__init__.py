@@ -1 +1,3 @@
-from .firebase.firebase_initialize import get_firebase_app
+from .firebase.firebase_initialize import get_firebase_app, get_firestore_client
+from .firebase.firestore_cost import firestore_cost_scope, record_returned, get_session_cost, clear_session_cost
+from .firebase.firestore_paging import iter_query_pages
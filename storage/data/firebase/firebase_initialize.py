@@ -1,9 +1,10 @@
 import logging
 import os
 import firebase_admin
-from firebase_admin import credentials
+from firebase_admin import credentials, firestore
 
 from src.shared.utils.find_project_path import find_project_root
+from storage.data.firebase.firestore_cost import install_firestore_cost_tracking
 
 # Obtém o caminho absoluto para o arquivo de credenciais
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -25,3 +26,13 @@ def get_firebase_app():
         except FileNotFoundError:
             logger.error(f"INTERFACE: Erro: Arquivo de credenciais não encontrado em {CREDENTIALS_PATH}")
     return firebase_admin.get_app()
+
+
+def get_firestore_client():
+    """
+    Retorna o cliente do Firestore, garantindo o app Firebase inicializado e a
+    contabilização de custo (leituras/escritas por call site, rota e sessão) instalada.
+    """
+    get_firebase_app()
+    install_firestore_cost_tracking()
+    return firestore.client()
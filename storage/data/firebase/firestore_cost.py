@@ -0,0 +1,420 @@
+# firestore_cost.py
+"""
+Contabilização de custo do Firestore: leituras, escritas, queries e bytes.
+
+A instrumentação é instalada uma única vez por processo (ver get_firestore_client em
+firebase_initialize.py) e envolve os pontos do SDK google-cloud-firestore que geram
+cobrança: DocumentReference.get, Client.get_all, Query.stream, AggregationQuery.stream
+e os commits de WriteBatch/Transaction/BulkWriteBatch.
+
+Cada operação é atribuída:
+    - ao call site: primeiro frame do projeto fora do SDK (ex.: firebase_produtos_repository.get_all);
+    - à rota e à sessão Flet ativas, definidas por `firestore_cost_scope` em main.route_change;
+    - aos totais da sessão, consultáveis com `get_session_cost(session_id)`.
+
+Repositórios que descartam documentos em Python (ex.: filtro de deletados) informam
+quantos documentos realmente devolveram com `record_returned(n)`; call sites com baixa
+razão devolvidos/lidos são sinalizados no relatório de cada page view.
+
+Desative com FIRESTORE_COST_TRACKING=0 no .env.
+"""
+import contextvars
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from src.shared.env import env_float, env_int, env_str
+from src.shared.metrics import metrics_registry
+from src.shared.utils.find_project_path import find_project_root
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_ROOT = str(find_project_root(__file__))
+_THIS_FILE = os.path.abspath(__file__)
+
+MAX_TRACKED_SESSIONS = 500
+
+_firestore_reads_total = metrics_registry.counter(
+    "estoquerapido_firestore_reads_total",
+    "Documentos lidos no Firestore por rota e call site.",
+    ("route", "call_site"),
+)
+_firestore_writes_total = metrics_registry.counter(
+    "estoquerapido_firestore_writes_total",
+    "Documentos escritos no Firestore por rota e call site.",
+    ("route", "call_site"),
+)
+_firestore_queries_total = metrics_registry.counter(
+    "estoquerapido_firestore_queries_total",
+    "Queries e leituras pontuais executadas no Firestore por rota e call site.",
+    ("route", "call_site"),
+)
+_firestore_bytes_total = metrics_registry.counter(
+    "estoquerapido_firestore_bytes_total",
+    "Bytes estimados trafegados no Firestore por rota e call site.",
+    ("route", "call_site"),
+)
+_firestore_page_view_reads = metrics_registry.histogram(
+    "estoquerapido_firestore_page_view_reads",
+    "Documentos lidos no Firestore por page view (route_change).",
+    ("route",),
+    buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000),
+)
+_firestore_low_return_total = metrics_registry.counter(
+    "estoquerapido_firestore_low_return_total",
+    "Page views em que um call site devolveu poucos documentos em relação aos lidos.",
+    ("route", "call_site"),
+)
+
+
+@dataclass
+class CallSiteCost:
+    """Custo acumulado de um call site."""
+    reads: int = 0
+    writes: int = 0
+    queries: int = 0
+    bytes: int = 0
+    returned: int = 0
+    has_returned: bool = False  # True se o repositório informou record_returned()
+
+    def add(self, other: "CallSiteCost") -> None:
+        self.reads += other.reads
+        self.writes += other.writes
+        self.queries += other.queries
+        self.bytes += other.bytes
+        self.returned += other.returned
+        self.has_returned = self.has_returned or other.has_returned
+
+    @property
+    def return_ratio(self) -> float | None:
+        if not self.has_returned or not self.reads:
+            return None
+        return self.returned / self.reads
+
+
+@dataclass
+class CostScope:
+    """Custo de uma unidade de trabalho (uma page view), por call site."""
+    route: str
+    session_id: str
+    call_sites: dict[str, CallSiteCost] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def site(self, call_site: str) -> CallSiteCost:
+        cost = self.call_sites.get(call_site)
+        if cost is None:
+            cost = self.call_sites[call_site] = CallSiteCost()
+        return cost
+
+    def totals(self) -> CallSiteCost:
+        total = CallSiteCost()
+        for cost in self.call_sites.values():
+            total.add(cost)
+        return total
+
+    def low_return_sites(self) -> list[tuple[str, CallSiteCost]]:
+        # Razão devolvidos/lidos abaixo da qual um call site é sinalizado, e o mínimo de leituras para avaliar
+        low_return_ratio = env_float('FIRESTORE_LOW_RETURN_RATIO', 0.5)
+        low_return_min_reads = env_int('FIRESTORE_LOW_RETURN_MIN_READS', 20)
+        return [
+            (call_site, cost) for call_site, cost in self.call_sites.items()
+            if cost.reads >= low_return_min_reads
+            and cost.return_ratio is not None
+            and cost.return_ratio < low_return_ratio
+        ]
+
+
+_current_scope: contextvars.ContextVar[CostScope | None] = contextvars.ContextVar(
+    "firestore_cost_scope", default=None)
+
+# Evita contagem dupla quando um método instrumentado chama outro (ex.: Transaction.get -> get_all)
+_reentrancy = threading.local()
+
+_session_totals: "OrderedDict[str, CallSiteCost]" = OrderedDict()
+_session_lock = threading.Lock()
+
+_installed = False
+_install_lock = threading.Lock()
+
+
+def _call_site(depth: int = 2) -> str:
+    """Retorna 'modulo.funcao' do primeiro frame do projeto fora do SDK e deste módulo."""
+    frame = sys._getframe(depth)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (filename.startswith(_PROJECT_ROOT) and filename != _THIS_FILE
+                and 'site-packages' not in filename):
+            module = os.path.splitext(os.path.basename(filename))[0]
+            return f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "desconhecido"
+
+
+def _estimate_size(value) -> int:
+    """Estimativa do tamanho armazenado, segundo as regras de tamanho de documento do Firestore."""
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, float)):
+        return 8
+    if isinstance(value, str):
+        return len(value) + 1
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(len(key) + 1 + _estimate_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_size(item) for item in value)
+    return 16  # Timestamp, GeoPoint, DocumentReference
+
+
+def _snapshot_size(snapshot) -> int:
+    # _data evita a cópia profunda feita por to_dict()
+    data = getattr(snapshot, '_data', None)
+    return _estimate_size(data) + 16 if data else 16
+
+
+def _record(call_site: str, reads: int = 0, writes: int = 0, queries: int = 0, size: int = 0) -> None:
+    scope = _current_scope.get()
+    route = scope.route if scope else ""
+    if reads:
+        _firestore_reads_total.inc((route, call_site), reads)
+    if writes:
+        _firestore_writes_total.inc((route, call_site), writes)
+    if queries:
+        _firestore_queries_total.inc((route, call_site), queries)
+    if size:
+        _firestore_bytes_total.inc((route, call_site), size)
+
+    if scope is None:
+        return
+    with scope._lock:
+        cost = scope.site(call_site)
+        cost.reads += reads
+        cost.writes += writes
+        cost.queries += queries
+        cost.bytes += size
+    if scope.session_id:
+        with _session_lock:
+            total = _session_totals.get(scope.session_id)
+            if total is None:
+                total = _session_totals[scope.session_id] = CallSiteCost()
+                while len(_session_totals) > MAX_TRACKED_SESSIONS:
+                    _session_totals.popitem(last=False)
+            else:
+                _session_totals.move_to_end(scope.session_id)
+            total.reads += reads
+            total.writes += writes
+            total.queries += queries
+            total.bytes += size
+
+
+def record_returned(count: int) -> None:
+    """
+    Informa quantos documentos o repositório efetivamente devolveu ao chamador.
+
+    Deve ser chamado pelo método do repositório que fez a leitura (mesmo call site),
+    tipicamente quando parte dos documentos lidos é descartada em Python.
+    """
+    scope = _current_scope.get()
+    if scope is None:
+        return
+    call_site = _call_site(depth=2)
+    with scope._lock:
+        cost = scope.site(call_site)
+        cost.returned += count
+        cost.has_returned = True
+
+
+def get_session_cost(session_id: str) -> dict[str, int]:
+    """Retorna os totais acumulados (reads, writes, queries, bytes) de uma sessão Flet."""
+    with _session_lock:
+        total = _session_totals.get(session_id)
+        if total is None:
+            return {"reads": 0, "writes": 0, "queries": 0, "bytes": 0}
+        return {"reads": total.reads, "writes": total.writes, "queries": total.queries, "bytes": total.bytes}
+
+
+def clear_session_cost(session_id: str) -> None:
+    """Descarta os totais de uma sessão (ex.: no logout)."""
+    with _session_lock:
+        _session_totals.pop(session_id, None)
+
+
+def _log_report(scope: CostScope) -> None:
+    totals = scope.totals()
+    _firestore_page_view_reads.observe((scope.route,), totals.reads)
+
+    if not scope.call_sites:
+        return
+
+    details = "; ".join(
+        f"{call_site}: r={cost.reads} w={cost.writes} q={cost.queries} b={cost.bytes}"
+        for call_site, cost in sorted(scope.call_sites.items(), key=lambda item: -item[1].reads)
+    )
+    logger.info(
+        f"Custo Firestore da page view '{scope.route}' (sessão {scope.session_id or '-'}): "
+        f"reads={totals.reads} writes={totals.writes} queries={totals.queries} bytes={totals.bytes} | {details}"
+    )
+
+    for call_site, cost in scope.low_return_sites():
+        _firestore_low_return_total.inc((scope.route, call_site))
+        logger.warning(
+            f"Firestore: '{call_site}' leu {cost.reads} documentos e devolveu apenas {cost.returned} "
+            f"({cost.return_ratio:.0%}) na rota '{scope.route}'. Considere filtrar na query."
+        )
+
+
+@contextmanager
+def firestore_cost_scope(route: str, session_id: str | None = None):
+    """
+    Abre um escopo de contabilização (uma page view). Ao sair, publica o relatório
+    de custo nos logs e nas métricas.
+
+    Exemplo:
+        >>> with firestore_cost_scope(route=e.route, session_id=page.session_id):
+        ...     pg_view = handler(page)
+    """
+    scope = CostScope(route=route, session_id=session_id or "")
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        try:
+            _log_report(scope)
+        except Exception as e:
+            logger.error(f"Erro ao gerar relatório de custo do Firestore: {e}")
+
+
+def _guarded(func):
+    """Executa func com a marca de reentrância ativa; retorna (já_dentro, resultado)."""
+    def call(*args, **kwargs):
+        if getattr(_reentrancy, 'active', False):
+            return True, func(*args, **kwargs)
+        _reentrancy.active = True
+        try:
+            return False, func(*args, **kwargs)
+        finally:
+            _reentrancy.active = False
+    return call
+
+
+def _wrap_document_get(original):
+    guarded = _guarded(original)
+
+    def get(self, *args, **kwargs):
+        call_site = _call_site()
+        nested, snapshot = guarded(self, *args, **kwargs)
+        if not nested:
+            # Leituras de documentos inexistentes também são cobradas
+            _record(call_site, reads=1, queries=1, size=_snapshot_size(snapshot))
+        return snapshot
+    return get
+
+
+def _wrap_get_all(original):
+    def get_all(self, *args, **kwargs):
+        if getattr(_reentrancy, 'active', False):
+            yield from original(self, *args, **kwargs)
+            return
+        call_site = _call_site()
+        reads = size = 0
+        try:
+            for snapshot in original(self, *args, **kwargs):
+                reads += 1
+                size += _snapshot_size(snapshot)
+                yield snapshot
+        finally:
+            _record(call_site, reads=reads, queries=1, size=size)
+    return get_all
+
+
+def _wrap_query_stream(original):
+    def stream(self, *args, **kwargs):
+        call_site = _call_site()
+        iterator = original(self, *args, **kwargs)
+
+        def counted():
+            reads = size = 0
+            try:
+                for snapshot in iterator:
+                    reads += 1
+                    size += _snapshot_size(snapshot)
+                    yield snapshot
+            finally:
+                # Uma query sem resultados é cobrada como uma leitura
+                _record(call_site, reads=max(reads, 1), queries=1, size=size)
+        return counted()
+    return stream
+
+
+def _wrap_aggregation_stream(original):
+    def stream(self, *args, **kwargs):
+        # count()/sum()/avg() custam 1 leitura a cada 1000 entradas de índice; contamos o mínimo
+        _record(_call_site(), reads=1, queries=1)
+        return original(self, *args, **kwargs)
+    return stream
+
+
+def _write_batch_size(batch) -> tuple[int, int]:
+    write_pbs = getattr(batch, '_write_pbs', None) or []
+    size = 0
+    for write_pb in write_pbs:
+        try:
+            size += type(write_pb).pb(write_pb).ByteSize()
+        except Exception:
+            pass
+    return len(write_pbs), size
+
+
+def _wrap_commit(original):
+    def commit(self, *args, **kwargs):
+        call_site = _call_site()
+        writes, size = _write_batch_size(self)
+        result = original(self, *args, **kwargs)
+        if writes:
+            _record(call_site, writes=writes, size=size)
+        return result
+    return commit
+
+
+def install_firestore_cost_tracking() -> bool:
+    """
+    Instala a instrumentação no SDK do Firestore (idempotente).
+
+    Returns:
+        bool: True se a instrumentação está ativa.
+    """
+    global _installed
+    if _installed:
+        return True
+    if env_str('FIRESTORE_COST_TRACKING', '1').lower() in ('0', 'false', 'no'):
+        return False
+
+    with _install_lock:
+        if _installed:
+            return True
+        try:
+            from google.cloud.firestore_v1 import aggregation, batch, client, document, query, transaction
+
+            document.DocumentReference.get = _wrap_document_get(document.DocumentReference.get)
+            client.Client.get_all = _wrap_get_all(client.Client.get_all)
+            query.Query.stream = _wrap_query_stream(query.Query.stream)
+            aggregation.AggregationQuery.stream = _wrap_aggregation_stream(aggregation.AggregationQuery.stream)
+            batch.WriteBatch.commit = _wrap_commit(batch.WriteBatch.commit)
+            transaction.Transaction._commit = _wrap_commit(transaction.Transaction._commit)
+            try:
+                from google.cloud.firestore_v1 import bulk_batch
+                bulk_batch.BulkWriteBatch.commit = _wrap_commit(bulk_batch.BulkWriteBatch.commit)
+            except ImportError:
+                pass
+            _installed = True
+            logger.info("Contabilização de custo do Firestore ativada.")
+        except Exception as e:
+            # A instrumentação nunca deve impedir o acesso ao banco
+            logger.error(f"Não foi possível instalar a contabilização de custo do Firestore: {e}")
+    return _installed
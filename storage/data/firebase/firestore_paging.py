@@ -0,0 +1,38 @@
+# firestore_paging.py
+"""
+Leitura paginada de queries do Firestore, para varreduras completas (exportação, migrações).
+
+Cada página é uma query com limit() e start_after() no último documento da página anterior,
+ordenada pelo ID do documento: a memória usada é a de uma página, qualquer que seja o
+tamanho da coleção, e nenhuma query fica aberta por minutos (o stream de uma query longa
+pode expirar no servidor).
+"""
+from typing import Any, Iterator
+
+from google.cloud.firestore_v1.field_path import FieldPath
+
+
+def iter_query_pages(query, page_size: int = 500,
+                     start_after_id: str | None = None) -> Iterator[list[tuple[str, dict[str, Any]]]]:
+    """
+    Percorre a query em páginas de até `page_size` documentos.
+
+    Args:
+        query: Query do Firestore (filtros de igualdade, sem order_by)
+        page_size (int): Documentos por página
+        start_after_id (str | None): Retoma a varredura após este ID de documento (checkpoint)
+
+    Yields:
+        list[tuple[str, dict]]: (ID do documento, dados) de cada documento da página
+    """
+    query = query.order_by(FieldPath.document_id())
+    last_snapshot: Any = {"__name__": start_after_id} if start_after_id else None
+    while True:
+        page_query = query.start_after(last_snapshot) if last_snapshot is not None else query
+        snapshots = list(page_query.limit(page_size).stream())
+        if not snapshots:
+            return
+        yield [(snapshot.id, snapshot.to_dict() or {}) for snapshot in snapshots]
+        if len(snapshots) < page_size:
+            return
+        last_snapshot = snapshots[-1]